@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+"""
+Benchmark .idx conversion: legacy CSV path vs direct Arrow/Parquet path
+
+The legacy path converts every quarterly index with ``convert_idx_to_csv``
+and reads the CSVs back the way ``merge_idx_files`` does. The direct path
+reads each index with ``read_idx_table`` and writes one Parquet file per
+quarter with ``convert_idx_to_parquet``.
+
+Index files are copied to a temporary directory first, so the data
+directory is never modified. Without --idx-dir, synthetic master.idx files
+are generated.
+
+Usage:
+    python scripts/benchmark_idx_conversion.py                         # 8 synthetic quarters
+    python scripts/benchmark_idx_conversion.py --quarters 120 --rows 50000
+    python scripts/benchmark_idx_conversion.py --idx-dir C:\\sec_data\\Archives\\edgar\\full-index
+"""
+
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from py_sec_edgar.feeds.idx import convert_idx_to_csv, convert_idx_to_parquet
+
+IDX_HEADER = """Description:           Master Index of EDGAR Dissemination Feed
+Last Data Received:    March 31, 2024
+Comments:              webmaster@sec.gov
+Anonymous FTP:         ftp://ftp.sec.gov/edgar/
+Cloud HTTP:            https://www.sec.gov/Archives/
+
+
+
+
+CIK|Company Name|Form Type|Date Filed|Filename
+--------------------------------------------------------------------------------
+"""
+
+FORMS = ["10-K", "10-Q", "8-K", "4", "3", "13F-HR", "SC 13G/A", "S-1", "DEF 14A"]
+
+
+def generate_idx_files(directory: Path, quarters: int, rows: int) -> list[Path]:
+    """Write synthetic master.idx files laid out as YEAR/QTRn/master.idx."""
+    rng = random.Random(0)
+    paths = []
+    for index in range(quarters):
+        year, qtr = 1994 + index // 4, index % 4 + 1
+        path = directory / str(year) / f"QTR{qtr}" / "master.idx"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = []
+        for row in range(rows):
+            cik = rng.randint(1000, 1999999)
+            lines.append(
+                f"{cik}|Company {cik} Holdings Inc|{rng.choice(FORMS)}|"
+                f"{year}-{qtr * 3:02d}-{rng.randint(10, 28)}|"
+                f"edgar/data/{cik}/{cik:010d}-{year % 100:02d}-{row:06d}.txt\n"
+            )
+        path.write_text(IDX_HEADER + "".join(lines), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def copy_idx_files(source: Path, directory: Path) -> list[Path]:
+    """Copy every .idx file under source into the benchmark directory."""
+    paths = []
+    for path in sorted(source.rglob("*.idx")):
+        target = directory / path.relative_to(source)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(path, target)
+        paths.append(target)
+    return paths
+
+
+def legacy_path(paths: list[Path]) -> int:
+    """convert_idx_to_csv for every file, then read the CSVs back."""
+    for path in paths:
+        convert_idx_to_csv(path, skip_if_exists=False)
+    frames = [
+        pd.read_csv(
+            str(path).replace(".idx", ".csv"),
+            dtype={
+                "CIK": "int64",
+                "Company Name": "string",
+                "Form Type": "string",
+                "Date Filed": "string",
+                "Filename": "string",
+            },
+        )
+        for path in paths
+    ]
+    return len(pd.concat(frames, ignore_index=True))
+
+
+def direct_path(paths: list[Path]) -> int:
+    """convert_idx_to_parquet for every file, then read the Parquet back."""
+    outputs = [convert_idx_to_parquet(path, skip_if_exists=False) for path in paths]
+    frames = [pd.read_parquet(output) for output in outputs if output]
+    return len(pd.concat(frames, ignore_index=True))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--idx-dir", type=Path, help="Directory of real .idx files")
+    parser.add_argument("--quarters", type=int, default=8, help="Synthetic quarters")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per quarter")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = Path(temp_dir)
+        if args.idx_dir:
+            paths = copy_idx_files(args.idx_dir, directory)
+        else:
+            paths = generate_idx_files(directory, args.quarters, args.rows)
+        if not paths:
+            print("No .idx files found")
+            return 1
+
+        print(f"Benchmarking {len(paths)} index files...")
+        results = {}
+        for name, func in (("csv (legacy)", legacy_path), ("parquet", direct_path)):
+            start = time.perf_counter()
+            rows = func(paths)
+            results[name] = time.perf_counter() - start
+            print(f"  {name:<14} {results[name]:8.2f}s  {rows:,} rows")
+
+        speedup = results["csv (legacy)"] / results["parquet"]
+        print(f"Speedup: {speedup:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
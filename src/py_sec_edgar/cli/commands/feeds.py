@@ -581,6 +581,115 @@ def health_check(fix_issues: bool) -> None:
         raise click.ClickException(str(e))
 
 
+@feeds_group.command("changes")
+@click.option(
+    "--consumer",
+    type=str,
+    help="Name whose watermark tracks what has already been seen",
+)
+@click.option(
+    "--since",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="Reset the watermark to report filings dated on or after YYYY-MM-DD",
+)
+@click.option(
+    "--ack/--no-ack",
+    default=True,
+    show_default=True,
+    help="Advance the watermark after listing the new filings",
+)
+@click.option("--save-csv", type=click.Path(), help="Save new filings to CSV file")
+@click.option(
+    "--show-samples",
+    type=int,
+    default=10,
+    show_default=True,
+    help="Number of new filings to display",
+)
+@click.option("--list", "list_all", is_flag=True, help="List consumer watermarks")
+@click.option("--quiet", "-q", is_flag=True, help="Suppress detailed output")
+def changes(
+    consumer: str | None,
+    since: Any,
+    ack: bool,
+    save_csv: str | None,
+    show_samples: int,
+    list_all: bool,
+    quiet: bool,
+) -> None:
+    """List index filings added since a consumer's last run.
+
+    Each consumer keeps its own watermark next to the index dataset, so
+    several jobs can follow the index independently.
+
+    Examples:
+
+      # New filings since the last call, then advance the watermark
+      py-sec-edgar feeds changes --consumer my-loader
+
+      # Start following the index from a date
+      py-sec-edgar feeds changes --consumer my-loader --since 2024-10-01
+    """
+    from py_sec_edgar.feeds.index_changes import ChangeFeed, list_consumers
+
+    if list_all:
+        table = Table(title="🔖 Change Feed Consumers")
+        table.add_column("Consumer", style="cyan")
+        table.add_column("Last Filed", style="yellow")
+        table.add_column("Updated", style="white")
+        for watermark in list_consumers():
+            table.add_row(
+                watermark.consumer, watermark.max_date or "-", watermark.updated or "-"
+            )
+        console.print(table)
+        return
+    if not consumer:
+        raise click.UsageError("--consumer is required")
+
+    try:
+        feed = ChangeFeed(consumer)
+        if since:
+            feed.reset(since=since.date())
+        result = feed.changes()
+    except (ValueError, FileNotFoundError) as e:
+        logger.error(f"Change feed failed: {e}")
+        raise click.ClickException(str(e))
+
+    df = result.to_pandas()
+    if not quiet:
+        console.print(
+            f"📊 {len(df)} new filings for '{consumer}' "
+            f"({result.files_read} index files read)"
+        )
+        if show_samples > 0 and len(df):
+            table = Table(
+                title=f"📄 New Filings (showing {min(show_samples, len(df))} of {len(df)})"
+            )
+            table.add_column("CIK", style="cyan", width=10)
+            table.add_column("Company", style="blue", width=30)
+            table.add_column("Form", style="green", width=10)
+            table.add_column("Filed", style="yellow", width=12)
+            for _, row in df.head(show_samples).iterrows():
+                table.add_row(
+                    str(row["CIK"]),
+                    str(row["Company Name"])[:29],
+                    str(row["Form Type"]),
+                    f"{row['Date Filed']:%Y-%m-%d}",
+                )
+            console.print(table)
+
+    if save_csv and len(df):
+        csv_path = Path(save_csv)
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(csv_path, index=False)
+        console.print(f"📊 Saved to CSV: {csv_path}")
+
+    if ack:
+        watermark = feed.acknowledge(result)
+        if not quiet:
+            console.print(f"🔖 Watermark advanced to {watermark.max_date}")
+
+
 # For backward compatibility, provide aliases for common commands
 @feeds_group.command("rss")
 def rss_alias():
@@ -13,11 +13,12 @@ from urllib.parse import urljoin
 import click
 import feedparser
 import pandas as pd
-import pyarrow.parquet as pq
 
 import py_sec_edgar.feeds.daily
 import py_sec_edgar.feeds.monthly
 from py_sec_edgar.cli.common import standard_form_options, standard_ticker_options
+from py_sec_edgar.core.identifiers import load_identifier_index
+from py_sec_edgar.feeds.index_dataset import load_idx_frame
 from py_sec_edgar.settings import settings
 from py_sec_edgar.utilities import cik_column_to_list
 
@@ -117,7 +118,7 @@ def filter_daily(
     )
 
     # Load CIK mapping
-    df_cik_tickers = pd.read_csv(str(settings.cik_tickers_csv))
+    df_cik_tickers = load_identifier_index().to_frame()
 
     # Collect daily data
     from py_sec_edgar.feeds.daily import generate_daily_index_urls_and_filepaths
@@ -260,12 +261,8 @@ def filter_full_index(
     logger.info("📊 Loading full index data...")
 
     # Load data
-    df_cik_tickers = pd.read_csv(str(settings.cik_tickers_csv))
-    df_idx = (
-        pq.read_table(str(settings.merged_idx_filepath))
-        .to_pandas()
-        .sort_values("Date Filed", ascending=False)
-    )
+    df_cik_tickers = load_identifier_index().to_frame()
+    df_idx = load_idx_frame().sort_values("Date Filed", ascending=False)
 
     logger.info(f"📈 Loaded {len(df_idx)} full index records")
 
@@ -384,7 +381,7 @@ def filter_monthly_xbrl(
     py_sec_edgar.feeds.monthly.download_and_flatten_monthly_xbrl_filings_list()
 
     # Load data
-    df_cik_tickers = pd.read_csv(str(settings.cik_tickers_csv))
+    df_cik_tickers = load_identifier_index().to_frame()
 
     from py_sec_edgar.feeds.monthly import generate_monthly_index_url_and_filepaths
 
@@ -186,3 +186,400 @@ def process_monthly_xbrl(
     except Exception as e:
         logger.error(f"❌ Failed to process monthly XBRL filings: {e}")
         raise click.ClickException(str(e))
+
+
+@process_group.command("verify-extractions")
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    help="Filing data root laid out as CIK/FOLDER (defaults to settings)",
+)
+@click.option(
+    "--repair/--no-repair",
+    default=False,
+    show_default=True,
+    help="Re-extract filings that are incomplete, stale or corrupt",
+)
+@click.option(
+    "--deep/--no-deep",
+    default=False,
+    show_default=True,
+    help="Re-hash every extracted document instead of checking sizes only",
+)
+@click.option(
+    "--adopt/--no-adopt",
+    default=False,
+    show_default=True,
+    help="Write manifests for complete extractions made before manifests existed",
+)
+def verify_extractions_command(
+    root: Path | None, repair: bool, deep: bool, adopt: bool
+) -> None:
+    """Verify extracted filings against their manifests."""
+    from collections import Counter
+
+    from py_sec_edgar.extract import verify_extractions
+    from py_sec_edgar.settings import settings
+
+    root = root or settings.filings_data_dir
+    logger.info(f"Verifying extractions under {root}...")
+
+    try:
+        results = verify_extractions(root, repair=repair, deep=deep, adopt=adopt)
+    except Exception as e:
+        logger.error(f"❌ Failed to verify extractions: {e}")
+        raise click.ClickException(str(e))
+
+    counts = Counter(result["status"] for result in results)
+    repaired = sum(1 for result in results if result.get("repaired"))
+    adopted = sum(1 for result in results if result.get("adopted"))
+
+    for result in results:
+        if result["status"] != "complete":
+            click.echo(
+                f"  {result['status']:<16} {result['directory']}  {result['reason']}"
+            )
+
+    click.echo(f"📁 Checked {len(results)} extracted filings")
+    for status, count in sorted(counts.items()):
+        click.echo(f"   {status}: {count}")
+    if adopt:
+        click.echo(f"📝 Adopted: {adopted}")
+    if repair:
+        click.echo(f"🔧 Repaired: {repaired}")
+
+
+@process_group.command("text-layer")
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    help="Filing data root laid out as CIK/FOLDER (defaults to settings)",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of worker processes (defaults to CPUs - 1)",
+)
+@click.option(
+    "--force/--no-force",
+    default=False,
+    show_default=True,
+    help="Reconvert documents that already have cached text",
+)
+def build_text_layer_command(
+    root: Path | None, workers: int | None, force: bool
+) -> None:
+    """Convert extracted HTML/text documents to a cached plain-text layer."""
+    from py_sec_edgar.corpus.text import build_text_layer
+    from py_sec_edgar.settings import settings
+
+    root = root or settings.filings_data_dir
+    logger.info(f"Building text layer under {root}...")
+
+    try:
+        summary = build_text_layer(
+            root, max_workers=workers, force=force, show_progress=True
+        )
+    except Exception as e:
+        logger.error(f"❌ Failed to build text layer: {e}")
+        raise click.ClickException(str(e))
+
+    click.echo(f"📁 Filings: {summary['filings']}")
+    click.echo(f"   Converted: {summary['converted']}")
+    click.echo(f"   Cached: {summary['cached']}")
+    click.echo(f"   Skipped (non-text): {summary['skipped']}")
+    if summary["failed"]:
+        click.echo(f"   ⚠️  Failed: {summary['failed']}")
+
+
+@process_group.command("section-index")
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    help="Filing data root laid out as CIK/FOLDER (defaults to settings)",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of worker processes (defaults to CPUs - 1)",
+)
+@click.option(
+    "--force/--no-force",
+    default=False,
+    show_default=True,
+    help="Re-segment filings that are already indexed",
+)
+def build_section_index_command(
+    root: Path | None, workers: int | None, force: bool
+) -> None:
+    """Index Item section offsets for extracted 10-K/10-Q filings."""
+    from py_sec_edgar.corpus.sections import (
+        build_section_index,
+        default_section_index_path,
+    )
+    from py_sec_edgar.settings import settings
+
+    root = root or settings.filings_data_dir
+    logger.info(f"Building section index under {root}...")
+
+    try:
+        summary = build_section_index(
+            root, max_workers=workers, force=force, show_progress=True
+        )
+    except Exception as e:
+        logger.error(f"❌ Failed to build section index: {e}")
+        raise click.ClickException(str(e))
+
+    click.echo(f"📁 Filings scanned: {summary['filings']}")
+    click.echo(f"   Indexed: {summary['indexed']} ({summary['sections']} sections)")
+    click.echo(f"   Skipped: {summary['skipped']}")
+    if summary["failed"]:
+        click.echo(f"   ⚠️  Failed: {summary['failed']}")
+    click.echo(f"💾 Index: {default_section_index_path()}")
+
+
+@process_group.command("fulltext-index")
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    help="Filing data root laid out as CIK/FOLDER (defaults to settings)",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of worker processes for text conversion",
+)
+@click.option(
+    "--force/--no-force",
+    default=False,
+    show_default=True,
+    help="Re-index filings that are already indexed",
+)
+@click.option(
+    "--optimize/--no-optimize",
+    default=False,
+    show_default=True,
+    help="Merge the whole index into one b-tree after updating (slow)",
+)
+def build_fulltext_index_command(
+    root: Path | None, workers: int | None, force: bool, optimize: bool
+) -> None:
+    """Add extracted filings to the local full-text search index."""
+    from py_sec_edgar.corpus.fulltext import FullTextIndex
+    from py_sec_edgar.settings import settings
+
+    root = root or settings.filings_data_dir
+    logger.info(f"Updating full-text index under {root}...")
+
+    try:
+        with FullTextIndex() as index:
+            summary = index.update(
+                root, max_workers=workers, force=force, show_progress=True
+            )
+            if optimize:
+                logger.info("Optimizing full-text index...")
+                index.optimize()
+            stats = index.stats()
+    except Exception as e:
+        logger.error(f"❌ Failed to update full-text index: {e}")
+        raise click.ClickException(str(e))
+
+    click.echo(f"📁 Filings scanned: {summary['filings']}")
+    click.echo(f"   Indexed: {summary['indexed']} ({summary['documents']} documents)")
+    click.echo(f"   Unchanged: {summary['skipped']}")
+    click.echo(
+        f"🔍 Index holds {stats['filings']} filings / {stats['documents']} documents"
+    )
+
+
+@process_group.command("xbrl-facts")
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    help="Filing data root laid out as CIK/FOLDER (defaults to settings)",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of worker processes (defaults to CPUs - 1)",
+)
+@click.option(
+    "--include-text/--numeric-only",
+    default=False,
+    show_default=True,
+    help="Also store non-numeric facts (text blocks, dei fields)",
+)
+@click.option(
+    "--force/--no-force",
+    default=False,
+    show_default=True,
+    help="Rewrite facts for filings that are already stored",
+)
+def build_facts_store_command(
+    root: Path | None, workers: int | None, include_text: bool, force: bool
+) -> None:
+    """Extract XBRL facts from extracted filings into a Parquet store."""
+    from py_sec_edgar.corpus.xbrl import build_facts_store, default_facts_store_path
+    from py_sec_edgar.settings import settings
+
+    root = root or settings.filings_data_dir
+    logger.info(f"Extracting XBRL facts under {root}...")
+
+    try:
+        summary = build_facts_store(
+            root,
+            max_workers=workers,
+            include_text=include_text,
+            force=force,
+            show_progress=True,
+        )
+    except Exception as e:
+        logger.error(f"❌ Failed to extract XBRL facts: {e}")
+        raise click.ClickException(str(e))
+
+    click.echo(f"📁 Filings scanned: {summary['filings']}")
+    click.echo(f"   With new facts: {summary['with_facts']}")
+    click.echo(f"   Facts written: {summary['facts']:,}")
+    if summary["failed"]:
+        click.echo(f"   ⚠️  Failed: {summary['failed']}")
+    click.echo(f"💾 Store: {default_facts_store_path()}")
+
+
+@process_group.command("forms")
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    help="Filing data root laid out as CIK/<accession>.txt (defaults to settings)",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of worker processes (defaults to CPUs - 1)",
+)
+@click.option(
+    "--force/--no-force",
+    default=False,
+    show_default=True,
+    help="Re-parse submissions already present in the tables",
+)
+def build_forms_tables_command(
+    root: Path | None, workers: int | None, force: bool
+) -> None:
+    """Parse Form 4 and 13F-HR XML into transactions/holdings tables."""
+    from py_sec_edgar.corpus.forms import build_forms_tables, default_forms_store_path
+    from py_sec_edgar.settings import settings
+
+    root = root or settings.filings_data_dir
+    logger.info(f"Parsing Form 4 / 13F-HR submissions under {root}...")
+
+    try:
+        summary = build_forms_tables(
+            root, max_workers=workers, force=force, show_progress=True
+        )
+    except Exception as e:
+        logger.error(f"❌ Failed to parse structured forms: {e}")
+        raise click.ClickException(str(e))
+
+    click.echo(f"📁 Submissions scanned: {summary['submissions']}")
+    click.echo(f"   Form 4 transactions: {summary['transactions']:,}")
+    click.echo(f"   13F holdings: {summary['holdings']:,}")
+    if summary["failed"]:
+        click.echo(f"   ⚠️  Failed submissions: {summary['failed']}")
+    click.echo(f"💾 Tables: {default_forms_store_path()}")
+
+
+@process_group.command("similarity-index")
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    help="Filing data root laid out as CIK/FOLDER (defaults to settings)",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of worker processes (defaults to CPUs - 1)",
+)
+@click.option(
+    "--force/--no-force",
+    default=False,
+    show_default=True,
+    help="Recompute signatures for filings that are already indexed",
+)
+def build_similarity_index_command(
+    root: Path | None, workers: int | None, force: bool
+) -> None:
+    """Compute MinHash signatures of documents and sections for LSH lookups."""
+    from py_sec_edgar.corpus.similarity import (
+        build_similarity_index,
+        default_similarity_index_path,
+    )
+    from py_sec_edgar.settings import settings
+
+    root = root or settings.filings_data_dir
+    logger.info(f"Computing similarity signatures under {root}...")
+
+    try:
+        summary = build_similarity_index(
+            root, max_workers=workers, force=force, show_progress=True
+        )
+    except Exception as e:
+        logger.error(f"❌ Failed to build similarity index: {e}")
+        raise click.ClickException(str(e))
+
+    click.echo(f"📁 Filings scanned: {summary['filings']}")
+    click.echo(f"   Indexed: {summary['indexed']}")
+    click.echo(f"   Skipped (unchanged): {summary['skipped']}")
+    click.echo(f"   Signatures: {summary['signatures']:,}")
+    if summary["failed"]:
+        click.echo(f"   ⚠️  Failed: {summary['failed']}")
+    click.echo(f"💾 Index: {default_similarity_index_path()}")
+
+
+@process_group.command("tables")
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    help="Filing data root laid out as CIK/FOLDER (defaults to settings)",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of worker processes (defaults to CPUs - 1)",
+)
+@click.option(
+    "--force/--no-force",
+    default=False,
+    show_default=True,
+    help="Re-extract documents that already have cached tables",
+)
+def build_table_cache_command(
+    root: Path | None, workers: int | None, force: bool
+) -> None:
+    """Extract HTML tables of extracted filings into a Parquet cache."""
+    from py_sec_edgar.corpus.tables import build_table_cache
+    from py_sec_edgar.settings import settings
+
+    root = root or settings.filings_data_dir
+    logger.info(f"Extracting tables under {root}...")
+
+    try:
+        summary = build_table_cache(
+            root, max_workers=workers, force=force, show_progress=True
+        )
+    except Exception as e:
+        logger.error(f"❌ Failed to extract tables: {e}")
+        raise click.ClickException(str(e))
+
+    click.echo(f"📁 Filings scanned: {summary['filings']}")
+    click.echo(f"   Documents extracted: {summary['extracted']}")
+    click.echo(f"   Already cached: {summary['cached']}")
+    click.echo(f"   Tables: {summary['tables']:,}")
+    if summary["failed"]:
+        click.echo(f"   ⚠️  Failed: {summary['failed']}")
@@ -16,6 +16,8 @@ Commands:
     search filings: Primary filing search and download interface
     search analyze: AI-powered analysis of downloaded filings
     search interactive: Start conversational AI session for filing analysis
+    search text: Full-text search across downloaded filings
+    search similar: Near-duplicate and year-over-year change detection
 
 Examples:
     Basic filing search:
@@ -360,6 +362,11 @@ def search_group():
 @click.option(
     "--json", is_flag=True, help="Output results in JSON format for programmatic use"
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Search the index even when cached results for the query exist",
+)
 def filings(
     ticker: str,
     form_type: str,
@@ -370,6 +377,7 @@ def filings(
     download: bool,
     download_all: bool,
     json: bool,
+    no_cache: bool,
 ):
     """
     Search SEC filings for a company ticker
@@ -411,10 +419,35 @@ def filings(
             download,
             download_all,
             json,
+            not no_cache,
         )
     )
 
 
+def _search_with_cache(
+    engine: FilingSearchEngine,
+    ticker: str,
+    form_type: str,
+    limit: int,
+    use_cache: bool,
+) -> list:
+    """Search filings, reusing results cached on disk until the index changes"""
+    from py_sec_edgar.core.query_cache import QueryCache
+    from py_sec_edgar.settings import settings
+
+    form_types = [form_type] if form_type else None
+
+    def search():
+        return engine.search(ticker=ticker, form_types=form_types, limit=limit)
+
+    if not use_cache:
+        return search().filings
+
+    cache = QueryCache(settings.query_cache_size, cache_dir=settings.query_cache_dir)
+    query = {"tickers": ticker, "form_types": form_types, "limit": limit}
+    return cache.get_or_search(query, search).filings
+
+
 async def _search_filings_async(
     ticker: str,
     form_type: str,
@@ -425,6 +458,7 @@ async def _search_filings_async(
     download: bool,
     download_all: bool,
     json: bool,
+    use_cache: bool = True,
 ):
     """Async implementation of filing search"""
 
@@ -460,10 +494,8 @@ async def _search_filings_async(
         if json:
             # For JSON output, suppress progress indicators to avoid piping issues
             engine = FilingSearchEngine()
-            filings = engine.search_by_ticker(
-                ticker=ticker,
-                form_types=[form_type] if form_type else None,
-                limit=search_limit,
+            filings = _search_with_cache(
+                engine, ticker, form_type, search_limit, use_cache
             )
 
             # Apply total limit if using new behavior
@@ -481,10 +513,8 @@ async def _search_filings_async(
                 )
 
                 engine = FilingSearchEngine()
-                filings = engine.search_by_ticker(
-                    ticker=ticker,
-                    form_types=[form_type] if form_type else None,
-                    limit=search_limit,
+                filings = _search_with_cache(
+                    engine, ticker, form_type, search_limit, use_cache
                 )
 
                 # Apply total limit if using new behavior
@@ -1231,5 +1261,177 @@ def summary(ticker: str):
         raise click.Abort()
 
 
+@search_group.command()
+@click.argument("query")
+@click.option("--cik", type=str, help="Restrict to a company CIK")
+@click.option("--form-type", type=str, help="Restrict to a form type (e.g. 10-K)")
+@click.option("--doc-type", type=str, help="Restrict to a document type (e.g. EX-21)")
+@click.option("--date-from", type=str, help="Earliest filing date (YYYY-MM-DD)")
+@click.option("--date-to", type=str, help="Latest filing date (YYYY-MM-DD)")
+@click.option("--limit", type=int, default=20, show_default=True, help="Max hits")
+@click.option("--json", "output_json", is_flag=True, help="Output results as JSON")
+def text(
+    query: str,
+    cik: str | None,
+    form_type: str | None,
+    doc_type: str | None,
+    date_from: str | None,
+    date_to: str | None,
+    limit: int,
+    output_json: bool,
+):
+    """Full-text search across downloaded filings.
+
+    QUERY uses FTS5 syntax: "exact phrase", AND / OR / NOT, prefix*.
+    Build the index first with `py-sec-edgar process fulltext-index`.
+    """
+    from py_sec_edgar.corpus.fulltext import (
+        FullTextIndex,
+        FullTextSearchError,
+        default_fulltext_db_path,
+    )
+
+    if not default_fulltext_db_path().exists():
+        console.print(
+            "[yellow]No full-text index found. "
+            "Run: py-sec-edgar process fulltext-index[/yellow]"
+        )
+        return
+
+    try:
+        with FullTextIndex() as index:
+            hits = index.search(
+                query,
+                cik=cik,
+                form_type=form_type,
+                doc_type=doc_type,
+                date_from=date_from,
+                date_to=date_to,
+                limit=limit,
+            )
+    except FullTextSearchError as e:
+        console.print(f"[red]❌ Search Error: {e}[/red]")
+        raise click.Abort()
+
+    if output_json:
+        click.echo(json_module.dumps(hits, indent=2))
+        return
+
+    if not hits:
+        console.print(f"[yellow]No documents match {query!r}[/yellow]")
+        return
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Filed", width=10)
+    table.add_column("CIK", width=10)
+    table.add_column("Form", width=8)
+    table.add_column("Document", width=12)
+    table.add_column("Accession", width=20)
+    table.add_column("Snippet", overflow="fold")
+
+    for hit in hits:
+        table.add_row(
+            hit["filing_date"] or "",
+            hit["cik"] or "",
+            hit["form_type"] or "",
+            hit["doc_type"] or "",
+            hit["accession_number"],
+            hit["snippet"].replace("\n", " "),
+        )
+
+    console.print(table)
+    console.print(f"\n[green]✅ {len(hits)} matching documents[/green]")
+
+
+@search_group.command()
+@click.argument("accession")
+@click.option("--key", type=str, help="Section item (e.g. 1A) or document sequence")
+@click.option(
+    "--scope",
+    type=click.Choice(["section", "document"]),
+    default="section",
+    show_default=True,
+    help="Compare Item sections or whole documents",
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=0.8,
+    show_default=True,
+    help="Minimum estimated similarity for near-duplicates",
+)
+@click.option(
+    "--previous",
+    is_flag=True,
+    help="Compare with the company's previous filing of the same form instead",
+)
+def similar(
+    accession: str, key: str | None, scope: str, threshold: float, previous: bool
+):
+    """Find near-duplicates of a filing's sections or documents.
+
+    Build the signature index first with `py-sec-edgar process similarity-index`.
+    """
+    from py_sec_edgar.corpus.similarity import (
+        compare_with_previous,
+        default_similarity_index_path,
+        find_near_duplicates,
+    )
+
+    if not default_similarity_index_path().exists():
+        console.print(
+            "[yellow]No similarity index found. "
+            "Run: py-sec-edgar process similarity-index[/yellow]"
+        )
+        return
+
+    if previous:
+        changes = compare_with_previous(accession, key=key, scope=scope)
+        if changes.empty:
+            console.print(
+                f"[yellow]No previous filing indexed for {accession}[/yellow]"
+            )
+            return
+
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Key", width=8)
+        table.add_column("Previous Accession", width=20)
+        table.add_column("Filed", width=10)
+        table.add_column("Similarity", justify="right")
+        for row in changes.itertuples():
+            table.add_row(
+                row.key,
+                row.previous_accession,
+                row.previous_date_filed,
+                f"{row.similarity:.2f}",
+            )
+        console.print(table)
+        return
+
+    matches = find_near_duplicates(accession, key=key, scope=scope, threshold=threshold)
+    if matches.empty:
+        console.print(f"[yellow]No near-duplicates found for {accession}[/yellow]")
+        return
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Key", width=8)
+    table.add_column("Accession", width=20)
+    table.add_column("CIK", width=10)
+    table.add_column("Form", width=8)
+    table.add_column("Match", width=8)
+    table.add_column("Similarity", justify="right")
+    for row in matches.itertuples():
+        table.add_row(
+            row.query_key,
+            row.accession_number,
+            row.cik,
+            row.form_type or "",
+            row.key,
+            f"{row.similarity:.2f}",
+        )
+    console.print(table)
+    console.print(f"\n[green]✅ {len(matches)} near-duplicates[/green]")
+
+
 # Add the search group to make it available for import
 __all__ = ["search_group"]
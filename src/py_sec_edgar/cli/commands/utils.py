@@ -55,6 +55,7 @@ def status() -> None:
         ("CIK Tickers", settings.cik_tickers_csv),
         ("Ticker List", settings.ticker_list_filepath),
         ("Merged Index", settings.merged_idx_filepath),
+        ("Index Dataset", settings.idx_dataset_dir),
     ]
 
     for name, path in files:
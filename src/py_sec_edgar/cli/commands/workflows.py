@@ -8,7 +8,14 @@ from pathlib import Path
 import click
 
 from ...settings import settings
-from ..common import common_filter_options, parse_forms, parse_tickers
+from ..common import (
+    common_filter_options,
+    extraction_args,
+    extraction_options,
+    parse_document_filter,
+    parse_forms,
+    parse_tickers,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +55,7 @@ def workflows_group() -> None:
     show_default=True,
     help="Extract filing contents",
 )
+@extraction_options
 def full_index_workflow(
     tickers: list[str],
     ticker_file: Path | None,
@@ -60,6 +68,12 @@ def full_index_workflow(
     limit: int | None,
     download: bool,
     extract: bool,
+    container_layout: str | None,
+    include_types: tuple[str, ...],
+    exclude_types: tuple[str, ...],
+    include_filenames: tuple[str, ...],
+    exclude_filenames: tuple[str, ...],
+    max_document_bytes: int | None,
 ) -> None:
     """
     Run the full index workflow (quarterly processing).
@@ -126,6 +140,14 @@ def full_index_workflow(
             log_level="INFO",  # Standard log level
             download=download,  # Pass download parameter
             extract=extract,  # Pass extract parameter
+            container_layout=container_layout,  # Pass container layout
+            document_filter=parse_document_filter(
+                include_types,
+                exclude_types,
+                include_filenames,
+                exclude_filenames,
+                max_document_bytes,
+            ),
             start_date=start_date_obj,  # Pass start date
             end_date=end_date_obj,  # Pass end date
         )
@@ -191,6 +213,14 @@ def full_index_workflow(
     show_default=True,
     help="Extract filing contents",
 )
+@extraction_options
+@click.option(
+    "--consumer",
+    type=str,
+    default=None,
+    help="Only process filings added to the index since this consumer's last run "
+    "(filings excluded by the ticker or form filters are acknowledged as seen)",
+)
 @click.option(
     "--skip-if-exists/--no-skip-if-exists",
     default=True,
@@ -210,6 +240,13 @@ def daily_workflow(
     limit: int | None,
     download: bool,
     extract: bool,
+    container_layout: str | None,
+    include_types: tuple[str, ...],
+    exclude_types: tuple[str, ...],
+    include_filenames: tuple[str, ...],
+    exclude_filenames: tuple[str, ...],
+    max_document_bytes: int | None,
+    consumer: str | None,
     skip_if_exists: bool,
 ) -> None:
     """
@@ -298,6 +335,19 @@ def daily_workflow(
             args.append("--no-download")
         if extract:
             args.append("--extract")
+        args.extend(
+            extraction_args(
+                container_layout,
+                include_types,
+                exclude_types,
+                include_filenames,
+                exclude_filenames,
+                max_document_bytes,
+            )
+        )
+
+        if consumer:
+            args.extend(["--consumer", consumer])
 
         # Handle limit
         if limit:
@@ -469,6 +519,7 @@ def monthly_workflow(
     show_default=True,
     help="Extract filing contents",
 )
+@extraction_options
 @click.option(
     "--list-only",
     is_flag=True,
@@ -506,6 +557,12 @@ def rss_workflow(
     count: int,
     download: bool,
     extract: bool,
+    container_layout: str | None,
+    include_types: tuple[str, ...],
+    exclude_types: tuple[str, ...],
+    include_filenames: tuple[str, ...],
+    exclude_filenames: tuple[str, ...],
+    max_document_bytes: int | None,
     list_only: bool,
     save_to_file: str | None,
     load_from_file: str | None,
@@ -605,6 +662,16 @@ def rss_workflow(
             args.append("--no-download")
         if extract:
             args.append("--extract")
+        args.extend(
+            extraction_args(
+                container_layout,
+                include_types,
+                exclude_types,
+                include_filenames,
+                exclude_filenames,
+                max_document_bytes,
+            )
+        )
 
         # Handle list-only flag
         if list_only:
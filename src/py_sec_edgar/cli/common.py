@@ -105,6 +105,47 @@ def standard_output_options(func):
     return func
 
 
+def extraction_options(func):
+    """Options controlling which documents are extracted and how they are stored."""
+    func = click.option(
+        "--max-document-bytes",
+        type=int,
+        default=None,
+        help="Skip documents larger than this many bytes",
+    )(func)
+    func = click.option(
+        "--exclude-filename",
+        "exclude_filenames",
+        multiple=True,
+        help="Skip documents whose filename matches this glob (repeatable), e.g. '*.jpg'",
+    )(func)
+    func = click.option(
+        "--include-filename",
+        "include_filenames",
+        multiple=True,
+        help="Only extract documents whose filename matches this glob (repeatable)",
+    )(func)
+    func = click.option(
+        "--exclude-type",
+        "exclude_types",
+        multiple=True,
+        help="Skip documents of this TYPE glob (repeatable), e.g. GRAPHIC or 'EX-101.*'",
+    )(func)
+    func = click.option(
+        "--include-type",
+        "include_types",
+        multiple=True,
+        help="Only extract documents of this TYPE glob (repeatable), e.g. 10-K",
+    )(func)
+    func = click.option(
+        "--container-layout",
+        type=click.Choice(["cik", "quarter"]),
+        default=None,
+        help="Extract into per-CIK or per-quarter document containers instead of one file per document",
+    )(func)
+    return func
+
+
 # Combined decorators for common use cases
 def common_filter_options(func):
     """Combined ticker and form filtering options."""
@@ -168,6 +209,73 @@ def parse_tickers(
     return None
 
 
+def parse_document_filter(
+    include_types: list[str] | tuple[str, ...] = (),
+    exclude_types: list[str] | tuple[str, ...] = (),
+    include_filenames: list[str] | tuple[str, ...] = (),
+    exclude_filenames: list[str] | tuple[str, ...] = (),
+    max_document_bytes: int | None = None,
+):
+    """
+    Build the document filter for the extraction options.
+
+    Args:
+        include_types: Document TYPE globs to extract
+        exclude_types: Document TYPE globs to skip
+        include_filenames: Filename globs to extract
+        exclude_filenames: Filename globs to skip
+        max_document_bytes: Skip documents larger than this
+
+    Returns:
+        DocumentFilter, or None if no option was given
+    """
+    from ..extract import DocumentFilter
+
+    if not (
+        include_types
+        or exclude_types
+        or include_filenames
+        or exclude_filenames
+        or max_document_bytes is not None
+    ):
+        return None
+    return DocumentFilter(
+        include_types=list(include_types),
+        exclude_types=list(exclude_types),
+        include_filenames=list(include_filenames),
+        exclude_filenames=list(exclude_filenames),
+        max_size_bytes=max_document_bytes,
+    )
+
+
+def extraction_args(
+    container_layout: str | None = None,
+    include_types: list[str] | tuple[str, ...] = (),
+    exclude_types: list[str] | tuple[str, ...] = (),
+    include_filenames: list[str] | tuple[str, ...] = (),
+    exclude_filenames: list[str] | tuple[str, ...] = (),
+    max_document_bytes: int | None = None,
+) -> list[str]:
+    """
+    Command-line arguments that pass extraction options on to a workflow
+    command invoked by another command.
+    """
+    args = []
+    if container_layout:
+        args.extend(["--container-layout", container_layout])
+    for option, values in (
+        ("--include-type", include_types),
+        ("--exclude-type", exclude_types),
+        ("--include-filename", include_filenames),
+        ("--exclude-filename", exclude_filenames),
+    ):
+        for value in values:
+            args.extend([option, value])
+    if max_document_bytes is not None:
+        args.extend(["--max-document-bytes", str(max_document_bytes)])
+    return args
+
+
 def parse_forms(
     forms: list[str] | None = None,
     form: str | None = None,
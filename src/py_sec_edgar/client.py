@@ -31,9 +31,11 @@ from pathlib import Path
 
 from .core.downloader import FilingDownloader
 from .core.models import FilingInfo
+from .core.query_cache import CacheStats, QueryCache, default_query_cache
 from .core.search_results import SearchResults
 from .core.smart_router import SmartFeedRouter
 from .search_engine import FilingSearchEngine
+from .settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -56,13 +58,19 @@ class SecEdgarClient:
         Initialize SEC EDGAR client.
 
         Args:
-            cache_dir: Optional custom cache directory
+            cache_dir: Optional directory for on-disk copies of cached search
+                results (results are cached in memory only when None)
             rate_limit_delay: Delay between API requests (seconds)
             enable_local_storage: Whether to use local file caching
         """
         self._engine = FilingSearchEngine()
         self._downloader = FilingDownloader()
-        self._router = SmartFeedRouter()
+        self._cache = (
+            QueryCache(settings.query_cache_size, cache_dir=cache_dir)
+            if cache_dir
+            else default_query_cache()
+        )
+        self._router = SmartFeedRouter(cache=self._cache)
         self._config = {
             "cache_dir": cache_dir,
             "rate_limit_delay": rate_limit_delay,
@@ -139,12 +147,22 @@ class SecEdgarClient:
         except Exception as e:
             # Fallback to traditional search engine if smart routing fails
             logger.warning(f"Smart routing failed, using traditional search: {e}")
-            filings = self._engine.search_by_ticker(
-                ticker=ticker,
-                form_types=[form_type] if form_type else None,
-                start_date=start_date,
-                end_date=end_date,
-                limit=limit,
+            form_types = [form_type] if form_type else None
+            filings = self._cache.get_or_search(
+                {
+                    "tickers": ticker,
+                    "form_types": form_types,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "limit": limit,
+                },
+                lambda: self._engine.search(
+                    ticker=ticker,
+                    form_types=form_types,
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=limit,
+                ),
             )
 
             # Create metadata for fallback
@@ -162,7 +180,7 @@ class SecEdgarClient:
                 },
             }
 
-        return SearchResults(filings, metadata)
+        return SearchResults(filings.to_arrow(), metadata)
 
     def search_multiple_forms(
         self,
@@ -185,23 +203,28 @@ class SecEdgarClient:
         Returns:
             SearchResults with filings from all requested form types
         """
-        all_filings = []
-
-        for form_type in form_types:
-            filings = self._engine.search_by_ticker(
+        per_form_limit = limit // len(form_types)  # Distribute limit across form types
+        results = self._cache.get_or_search(
+            {
+                "tickers": ticker,
+                "form_types": form_types,
+                "start_date": start_date,
+                "end_date": end_date,
+                "limit": per_form_limit,
+                "per_form": True,
+            },
+            lambda: self._engine.search(
                 ticker=ticker,
-                form_types=[form_type],
+                form_types=form_types,
                 start_date=start_date,
                 end_date=end_date,
-                limit=limit // len(form_types),  # Distribute limit across form types
-            )
-            all_filings.extend(filings)
+                limit=per_form_limit,
+                per_form=True,
+            ),
+        )
 
         # Sort by date and apply overall limit
-        all_filings.sort(
-            key=lambda f: f.filing_date_parsed or datetime.min, reverse=True
-        )
-        all_filings = all_filings[:limit]
+        results = results.sort_by_date()[:limit]
 
         metadata = {
             "search_timestamp": datetime.now().isoformat(),
@@ -212,7 +235,7 @@ class SecEdgarClient:
             "query_end_date": end_date,
         }
 
-        return SearchResults(all_filings, metadata)
+        return SearchResults(results.to_arrow(), metadata)
 
     def search_portfolio(
         self,
@@ -238,27 +261,26 @@ class SecEdgarClient:
         if isinstance(form_types, str):
             form_types = [form_types]
 
-        all_filings = []
-        successful_tickers = []
-        failed_tickers = []
-
-        for ticker in tickers:
-            try:
-                for form_type in form_types:
-                    filings = self._engine.search_by_ticker(
-                        ticker=ticker,
-                        form_types=[form_type],
-                        start_date=start_date,
-                        end_date=end_date,
-                        limit=per_ticker_limit,
-                    )
-                    all_filings.extend(filings)
-
-                if ticker not in successful_tickers:
-                    successful_tickers.append(ticker)
-
-            except Exception as e:
-                failed_tickers.append({"ticker": ticker, "error": str(e)})
+        # One pass over the index for the whole portfolio
+        results, unknown = self._engine.search_batch(
+            tickers,
+            form_types=form_types,
+            start_date=start_date,
+            end_date=end_date,
+            limit=per_ticker_limit,
+            per_form=True,
+        )
+        successful_tickers = [
+            ticker for ticker in tickers if ticker.strip().upper() not in unknown
+        ]
+        failed_tickers = [
+            {
+                "ticker": ticker,
+                "error": f"Ticker '{ticker}' not found in SEC company mapping",
+            }
+            for ticker in tickers
+            if ticker.strip().upper() in unknown
+        ]
 
         metadata = {
             "search_timestamp": datetime.now().isoformat(),
@@ -272,7 +294,7 @@ class SecEdgarClient:
             "success_rate": len(successful_tickers) / len(tickers) if tickers else 0,
         }
 
-        return SearchResults(all_filings, metadata)
+        return SearchResults(results.to_arrow(), metadata)
 
     async def _search_async(
         self,
@@ -389,6 +411,19 @@ class SecEdgarClient:
         """Async implementation of filings summary"""
         return await self._engine.get_filing_types_for_ticker(ticker)
 
+    def cache_stats(self) -> CacheStats:
+        """
+        Get hit, miss and eviction counters of the search result cache
+
+        Returns:
+            CacheStats snapshot
+        """
+        return self._cache.stats()
+
+    def clear_cache(self) -> None:
+        """Drop all cached search results"""
+        self._cache.clear()
+
 
 # Global client instance for simple module-level functions
 _client = None
@@ -0,0 +1,388 @@
+"""
+Container-based document store for extracted filings.
+
+Writing every exhibit of every filing as its own file produces millions of
+tiny files per quarter. A ``DocumentContainer`` instead appends a filing's
+documents to one zip archive per CIK (or per quarter): binaries are stored
+uncompressed, text is deflated. A sidecar JSON-lines index
+(``<container>.idx.jsonl``) records the local header offset and sizes of
+every member plus each filing's extraction manifest, so a single document
+is read with one seek and no unpacking:
+
+    ```python
+    from py_sec_edgar.core.document_store import DocumentContainer
+
+    container = DocumentContainer(settings.document_store_dir / "by-cik" / "320193.zip")
+    html = container.read("0000320193-24-000123", sequence="1")
+    ```
+
+The index line for a filing is appended only after all of its members are
+written, so it doubles as the commit marker: a filing is present only if
+its index record is.
+
+Batch writers keep containers open with a ``ContainerPool``: the zip central
+directory is then written once per batch instead of once per filing, and
+the offset index stays in memory, with each filing's lines appended to the
+sidecar as it is committed.
+"""
+
+import json
+import logging
+import os
+import struct
+import warnings
+import zipfile
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx.jsonl"
+
+# Already compressed or binary formats gain nothing from deflate
+BINARY_EXTENSIONS = {
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".png",
+    ".bmp",
+    ".pdf",
+    ".zip",
+    ".gz",
+    ".xlsx",
+    ".xls",
+    ".docx",
+    ".doc",
+    ".pptx",
+}
+
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+
+class DocumentStoreError(Exception):
+    """Exception raised when a container or document cannot be read."""
+
+    pass
+
+
+def container_path(
+    store_root: str | Path,
+    cik: str | int,
+    date_filed: str | None = None,
+    layout: str = "cik",
+) -> Path:
+    """
+    Container file that holds a filing's documents.
+
+    Args:
+        store_root: Document store root directory
+        cik: Company CIK
+        date_filed: Filing date (YYYYMMDD or YYYY-MM-DD), used by the
+            quarter layout
+        layout: "cik" (one container per company) or "quarter"
+
+    Returns:
+        Path of the zip container
+    """
+    store_root = Path(store_root)
+    if layout == "quarter":
+        digits = str(date_filed or "").replace("-", "")
+        if len(digits) < 6 or not digits[:6].isdigit():
+            raise ValueError(
+                f"Quarter layout requires a filing date, got {date_filed!r}"
+            )
+        year, month = int(digits[:4]), int(digits[4:6])
+        return store_root / "by-quarter" / str(year) / f"QTR{(month - 1) // 3 + 1}.zip"
+    if layout == "cik":
+        return store_root / "by-cik" / f"{int(cik)}.zip"
+    raise ValueError(f"Unknown container layout: {layout}")
+
+
+class DocumentContainer:
+    """A zip container of filing documents with a sidecar offset index."""
+
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path: Container zip path (created on first append)
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + INDEX_SUFFIX)
+        self._zip: zipfile.ZipFile | None = None
+        self._index_file = None
+        self._documents: dict[str, list[dict]] | None = None
+        self._filings: dict[str, dict] | None = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self) -> None:
+        """
+        Keep the archive open for a batch of appends.
+
+        Reopening a large zip for every filing re-reads its central
+        directory and rewrites it on close; batch writers should use the
+        container as a context manager (or a ContainerPool) instead. The
+        offset index is loaded once and kept current by append_filing.
+        """
+        if self._zip is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self._filings is None:
+                self._load_index()
+            self._zip = zipfile.ZipFile(self.path, "a", allowZip64=True)
+            self._index_file = open(self.index_path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        """Write the central directory and close the archive."""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+
+    def append_filing(
+        self, accession_number: str, documents: list[tuple[str, bytes]], manifest: dict
+    ) -> list[dict]:
+        """
+        Append one filing's documents and record them in the index.
+
+        Args:
+            accession_number: Filing accession number
+            documents: (member name, content) pairs
+            manifest: Extraction manifest; its "documents" entries must carry
+                the member name in "path"
+
+        Returns:
+            Index entries written for the documents
+        """
+        owns_zip = self._zip is None
+        self.open()
+        entries = []
+        try:
+            now = datetime.now().timetuple()[:6]
+            for name, data in documents:
+                info = zipfile.ZipInfo(name, date_time=now)
+                info.compress_type = (
+                    zipfile.ZIP_STORED
+                    if Path(name).suffix.lower() in BINARY_EXTENSIONS
+                    else zipfile.ZIP_DEFLATED
+                )
+                with warnings.catch_warnings():
+                    # Re-extracted filings append a newer copy of a member;
+                    # the index always points at the latest one.
+                    warnings.simplefilter("ignore", UserWarning)
+                    self._zip.writestr(info, data)
+                entries.append(
+                    {
+                        "kind": "document",
+                        "accession_number": accession_number,
+                        "name": name,
+                        "offset": info.header_offset,
+                        "compress_type": info.compress_type,
+                        "compress_size": info.compress_size,
+                        "file_size": info.file_size,
+                        "crc": info.CRC,
+                    }
+                )
+            self._zip.fp.flush()
+
+            sequences = {
+                doc.get("path"): doc.get("sequence")
+                for doc in manifest.get("documents", [])
+            }
+            for entry in entries:
+                entry["sequence"] = sequences.get(entry["name"])
+
+            f = self._index_file
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+            f.write(
+                json.dumps(
+                    {
+                        "kind": "filing",
+                        "accession_number": accession_number,
+                        "manifest": manifest,
+                    },
+                    default=str,
+                )
+                + "\n"
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        finally:
+            if owns_zip:
+                self.close()
+
+        self._documents[accession_number] = entries
+        self._filings[accession_number] = manifest
+        return entries
+
+    def _load_index(self) -> None:
+        """Read the sidecar index; later records supersede earlier ones."""
+        documents: dict[str, list[dict]] = {}
+        filings: dict[str, dict] = {}
+        pending: dict[str, list[dict]] = {}
+
+        if self.index_path.exists():
+            with open(self.index_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn final line from an interrupted append
+                        continue
+                    accession = record.get("accession_number")
+                    if record.get("kind") == "document":
+                        pending.setdefault(accession, []).append(record)
+                    elif record.get("kind") == "filing":
+                        # Only committed filings become visible
+                        documents[accession] = pending.pop(accession, [])
+                        filings[accession] = record["manifest"]
+
+        self._documents = documents
+        self._filings = filings
+
+    def get_manifest(self, accession_number: str) -> dict | None:
+        """Extraction manifest of a committed filing, or None."""
+        if self._filings is None:
+            self._load_index()
+        return self._filings.get(accession_number)
+
+    def filings(self) -> list[str]:
+        """Accession numbers of all committed filings."""
+        if self._filings is None:
+            self._load_index()
+        return list(self._filings)
+
+    def list_documents(self, accession_number: str | None = None) -> list[dict]:
+        """
+        Index entries of stored documents.
+
+        Args:
+            accession_number: Restrict to one filing
+
+        Returns:
+            List of index entry dictionaries
+        """
+        if self._documents is None:
+            self._load_index()
+        if accession_number is not None:
+            return list(self._documents.get(accession_number, []))
+        return [entry for entries in self._documents.values() for entry in entries]
+
+    def find(
+        self,
+        accession_number: str,
+        sequence: str | int | None = None,
+        filename: str | None = None,
+    ) -> dict | None:
+        """Find a document entry by sequence, original filename or member name."""
+        manifest = self.get_manifest(accession_number) or {}
+        for entry in self.list_documents(accession_number):
+            if sequence is not None and str(entry.get("sequence")) == str(sequence):
+                return entry
+            if filename is not None:
+                if entry["name"].endswith(filename):
+                    return entry
+                for doc in manifest.get("documents", []):
+                    if (
+                        doc.get("filename") == filename
+                        and doc.get("path") == entry["name"]
+                    ):
+                        return entry
+        return None
+
+    def read(
+        self,
+        accession_number: str,
+        sequence: str | int | None = None,
+        filename: str | None = None,
+    ) -> bytes:
+        """
+        Read one document without unpacking the container.
+
+        Args:
+            accession_number: Filing accession number
+            sequence: Document sequence number within the submission
+            filename: Original document filename (alternative to sequence)
+
+        Returns:
+            Document content as bytes
+
+        Raises:
+            DocumentStoreError: If the document is not in the container
+        """
+        entry = self.find(accession_number, sequence=sequence, filename=filename)
+        if entry is None:
+            raise DocumentStoreError(
+                f"Document not found in {self.path}: {accession_number} "
+                f"(sequence={sequence}, filename={filename})"
+            )
+        return self.read_entry(entry)
+
+    def read_entry(self, entry: dict) -> bytes:
+        """Read the member described by an index entry with a single seek."""
+        with open(self.path, "rb") as f:
+            f.seek(entry["offset"])
+            header = f.read(_LOCAL_HEADER.size)
+            fields = _LOCAL_HEADER.unpack(header)
+            if fields[0] != _LOCAL_HEADER_SIGNATURE:
+                raise DocumentStoreError(f"Bad local header for {entry['name']}")
+            name_length, extra_length = fields[-2], fields[-1]
+            f.seek(name_length + extra_length, os.SEEK_CUR)
+            data = f.read(entry["compress_size"])
+
+        if entry["compress_type"] == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(data, -zlib.MAX_WBITS)
+        if zlib.crc32(data) != entry["crc"]:
+            raise DocumentStoreError(f"CRC mismatch for {entry['name']}")
+        return data
+
+
+class ContainerPool:
+    """
+    Open DocumentContainers shared by a batch of extractions.
+
+    At most ``max_open`` containers stay open; the least recently used one
+    is closed (writing its central directory) when another is needed.
+    """
+
+    def __init__(self, max_open: int = 64):
+        """
+        Args:
+            max_open: Containers kept open at once (bounds file handles)
+        """
+        self.max_open = max_open
+        self._open: OrderedDict[Path, DocumentContainer] = OrderedDict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get(self, path: str | Path) -> DocumentContainer:
+        """The open container at ``path``, opening it if needed."""
+        path = Path(path)
+        container = self._open.get(path)
+        if container is None:
+            while len(self._open) >= self.max_open:
+                self._open.popitem(last=False)[1].close()
+            container = DocumentContainer(path)
+            container.open()
+            self._open[path] = container
+        self._open.move_to_end(path)
+        return container
+
+    def close(self) -> None:
+        """Close every open container."""
+        while self._open:
+            self._open.popitem(last=False)[1].close()
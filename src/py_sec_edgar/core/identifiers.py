@@ -0,0 +1,319 @@
+"""
+Compiled ticker / CIK / company name / exchange index.
+
+Three reference files map tickers to CIKs: ``company_tickers.json``,
+``company_tickers_exchange.json`` (refreshed by ``TickerExchangeService``)
+and ``cik_tickers.csv``. ``load_identifier_index`` compiles them into one
+Parquet file, ``settings.identifier_index_filepath``, with one row per
+(ticker, CIK) pair and the source it came from. The file is rebuilt only
+when the size or modification time of a source changes, recorded in the
+Parquet schema metadata, so a normal load reads a few hundred kilobytes of
+columnar data and never parses JSON or CSV:
+
+    ```python
+    from py_sec_edgar.core.identifiers import load_identifier_index
+
+    identifiers = load_identifier_index()
+    identifiers.cik_for_ticker("AAPL")  # 320193
+    identifiers.tickers_for_cik(1652044)  # ["GOOGL", "GOOG"]
+    ```
+
+The mapping is many-to-many: a company can list several share classes and
+a ticker can appear under an old and a new CIK. Single-valued lookups
+return the first match in source order, so ``company_tickers.json`` wins
+over the exchange file and the exchange file over the CSV.
+"""
+
+import json
+import logging
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from pyarrow import parquet as pq
+
+from ..settings import settings
+from .path_utils import atomic_write
+
+logger = logging.getLogger(__name__)
+
+IDENTIFIER_SCHEMA = pa.schema(
+    [
+        ("ticker", pa.string()),
+        ("cik", pa.int32()),
+        ("name", pa.string()),
+        ("exchange", pa.string()),
+        ("source", pa.string()),
+    ]
+)
+
+_SOURCES_KEY = b"sources"
+
+# Bumped whenever the compiled layout changes, forcing a rebuild
+FORMAT_VERSION = 1
+
+_cached: "IdentifierIndex | None" = None
+
+
+def identifier_sources() -> dict[str, Path]:
+    """Reference files compiled into the index, by source kind."""
+    exchange = settings.sec_data_directory / "company_tickers_exchange.json"
+    if not exchange.exists():
+        exchange = settings.ref_dir / "company_tickers_exchange.json"
+    return {
+        "company_tickers": settings.company_tickers_json,
+        "company_tickers_exchange": exchange,
+        "cik_tickers": settings.cik_tickers_csv,
+    }
+
+
+def _signature(sources: dict[str, Path]) -> dict:
+    """Format version plus (mtime, size) of every existing source."""
+    files = {}
+    for path in sources.values():
+        if path.exists():
+            stat = path.stat()
+            files[str(path)] = [stat.st_mtime_ns, stat.st_size]
+    return {"version": FORMAT_VERSION, "files": files}
+
+
+def _read_company_tickers(path: Path) -> list[tuple]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return [
+        (entry.get("ticker"), entry.get("cik_str"), entry.get("title"), None)
+        for entry in data.values()
+    ]
+
+
+def _read_company_tickers_exchange(path: Path) -> list[tuple]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    fields = [field.lower() for field in data.get("fields", [])]
+    rows = []
+    for entry in data.get("data", []):
+        record = dict(zip(fields, entry, strict=False))
+        rows.append(
+            (
+                record.get("ticker"),
+                record.get("cik"),
+                record.get("name"),
+                record.get("exchange"),
+            )
+        )
+    return rows
+
+
+def _read_cik_tickers_csv(path: Path) -> list[tuple]:
+    table = pa_csv.read_csv(
+        path,
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=["SYMBOL", "COMPANY_NAME", "CIK"],
+            column_types={"SYMBOL": pa.string(), "CIK": pa.float64()},
+        ),
+    )
+    return list(
+        zip(
+            table["SYMBOL"].to_pylist(),
+            table["CIK"].to_pylist(),
+            table["COMPANY_NAME"].to_pylist(),
+            [None] * table.num_rows,
+            strict=True,
+        )
+    )
+
+
+# Source kinds and their readers, highest priority first
+_READERS = {
+    "company_tickers": _read_company_tickers,
+    "company_tickers_exchange": _read_company_tickers_exchange,
+    "cik_tickers": _read_cik_tickers_csv,
+}
+
+
+def build_identifier_table(sources: dict[str, Path] | None = None) -> pa.Table:
+    """
+    Compile the reference files into an ``IDENTIFIER_SCHEMA`` table.
+
+    Rows without a ticker or CIK are dropped and tickers are upper-cased. A
+    (ticker, CIK) pair listed by several sources keeps the name of the
+    highest-priority one; lower-priority sources fill in a missing name or
+    exchange.
+
+    Args:
+        sources: Source kind ("company_tickers", "company_tickers_exchange"
+            or "cik_tickers") to file; kinds may be left out, and an empty
+            mapping gives an empty table. Defaults to ``identifier_sources()``.
+
+    Raises:
+        ValueError: If a source kind is unknown
+    """
+    if sources is None:
+        sources = identifier_sources()
+    unknown = set(sources) - set(_READERS)
+    if unknown:
+        raise ValueError(f"Unknown identifier source kinds: {sorted(unknown)}")
+
+    rows: dict[tuple[str, int], list] = {}
+    for kind, reader in _READERS.items():
+        path = sources.get(kind)
+        if path is None or not path.exists():
+            continue
+        try:
+            entries = reader(path)
+        except (OSError, ValueError, KeyError, pa.ArrowException) as e:
+            logger.warning(f"Skipping unreadable identifier source {path}: {e}")
+            continue
+        for ticker, cik, name, exchange in entries:
+            if not ticker or cik is None or cik != cik:  # NaN CIKs in the CSV
+                continue
+            key = (str(ticker).strip().upper(), int(cik))
+            row = rows.get(key)
+            if row is None:
+                rows[key] = [*key, name, exchange, path.name]
+            else:
+                # Lower-priority sources only fill in what is missing
+                row[2] = row[2] or name
+                row[3] = row[3] or exchange
+
+    columns = list(zip(*rows.values(), strict=True)) if rows else [[]] * 5
+    return pa.table(
+        [
+            pa.array(column, type=f.type)
+            for column, f in zip(columns, IDENTIFIER_SCHEMA, strict=True)
+        ],
+        schema=IDENTIFIER_SCHEMA,
+    )
+
+
+class IdentifierIndex:
+    """
+    In-memory ticker ↔ CIK ↔ name ↔ exchange lookups.
+
+    Built from the compiled table; every lookup is a dict access.
+    """
+
+    def __init__(self, table: pa.Table, signature: dict | None = None):
+        self.table = table
+        self.signature = signature or {}
+        self._ciks_by_ticker: dict[str, list[int]] = {}
+        self._tickers_by_cik: dict[int, list[str]] = {}
+        self._names: dict[int, str] = {}
+        self._exchanges: dict[str, str] = {}
+        for ticker, cik, name, exchange in zip(
+            table["ticker"].to_pylist(),
+            table["cik"].to_pylist(),
+            table["name"].to_pylist(),
+            table["exchange"].to_pylist(),
+            strict=True,
+        ):
+            self._ciks_by_ticker.setdefault(ticker, []).append(cik)
+            self._tickers_by_cik.setdefault(cik, []).append(ticker)
+            if name:
+                self._names.setdefault(cik, name)
+            if exchange:
+                self._exchanges.setdefault(ticker, exchange)
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker.strip().upper() in self._ciks_by_ticker
+
+    def ciks_for_ticker(self, ticker: str) -> list[int]:
+        """Every CIK listed for a ticker, highest-priority source first."""
+        return list(self._ciks_by_ticker.get(ticker.strip().upper(), []))
+
+    def cik_for_ticker(self, ticker: str) -> int | None:
+        ciks = self._ciks_by_ticker.get(ticker.strip().upper())
+        return ciks[0] if ciks else None
+
+    def tickers_for_cik(self, cik: int | str) -> list[str]:
+        """Every ticker listed for a CIK, highest-priority source first."""
+        return list(self._tickers_by_cik.get(int(cik), []))
+
+    def ticker_for_cik(self, cik: int | str) -> str | None:
+        tickers = self._tickers_by_cik.get(int(cik))
+        return tickers[0] if tickers else None
+
+    def name_for_cik(self, cik: int | str) -> str | None:
+        return self._names.get(int(cik))
+
+    def exchange_for_ticker(self, ticker: str) -> str | None:
+        return self._exchanges.get(ticker.strip().upper())
+
+    def ciks_for_tickers(self, tickers: list[str]) -> list[int]:
+        """Distinct CIKs of several tickers, in order of first appearance."""
+        ciks = {}
+        for ticker in tickers:
+            for cik in self._ciks_by_ticker.get(str(ticker).strip().upper(), []):
+                ciks[cik] = None
+        return list(ciks)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        The mapping as a DataFrame with the ``cik_tickers.csv`` column names.
+
+        Drop-in replacement for ``pd.read_csv(settings.cik_tickers_csv)`` in
+        code that filters on ``SYMBOL`` and collects ``CIK``.
+        """
+        return pd.DataFrame(
+            {
+                "SYMBOL": self.table["ticker"].to_pandas(),
+                "CIK": self.table["cik"].to_pandas(),
+                "COMPANY_NAME": self.table["name"].to_pandas(),
+                "EXCHANGE": self.table["exchange"].to_pandas(),
+            }
+        )
+
+
+def _write_identifier_table(table: pa.Table, path: Path, signature: dict) -> None:
+    metadata = {_SOURCES_KEY: json.dumps(signature).encode()}
+    table = table.replace_schema_metadata(metadata)
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink, compression="zstd")
+    atomic_write(path, sink.getvalue().to_pybytes())
+
+
+def load_identifier_index(rebuild: bool = False) -> IdentifierIndex:
+    """
+    The shared identifier index, compiling it when a source changed.
+
+    The result is cached in the process and reused until a source file
+    changes on disk.
+
+    Args:
+        rebuild: Recompile from the sources even when the file is current
+
+    Returns:
+        IdentifierIndex over every source that exists
+    """
+    global _cached
+    sources = identifier_sources()
+    signature = _signature(sources)
+    if not rebuild and _cached is not None and _cached.signature == signature:
+        return _cached
+
+    path = settings.identifier_index_filepath
+    table = None
+    if not rebuild and path.exists():
+        try:
+            stored = pq.read_schema(path).metadata or {}
+            if json.loads(stored.get(_SOURCES_KEY, b"{}")) == signature:
+                table = pq.read_table(path)
+        except (OSError, ValueError, pa.ArrowException) as e:
+            logger.warning(f"Rebuilding unreadable identifier index {path}: {e}")
+
+    if table is None:
+        table = build_identifier_table(sources)
+        if signature["files"]:
+            _write_identifier_table(table, path, signature)
+        logger.info(
+            f"Compiled identifier index: {table.num_rows} ticker/CIK pairs, "
+            f"{pc.count_distinct(table['cik']).as_py()} companies"
+        )
+
+    _cached = IdentifierIndex(table.replace_schema_metadata(None), signature)
+    return _cached
@@ -0,0 +1,106 @@
+"""
+Process-pool helpers for batch jobs over filings and index files.
+
+Batch operations (text conversion, section indexing, XBRL/form parsing,
+index conversion) all follow the same pattern: apply a picklable top-level
+function to many independent inputs, report progress, and keep going when
+a single input fails. ``run_parallel`` implements that pattern once.
+"""
+
+import logging
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any
+
+from rich.progress import Progress
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TaskResult:
+    """Outcome of one item processed by run_parallel."""
+
+    item: Any
+    value: Any = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was processed without raising."""
+        return self.error is None
+
+
+def default_workers() -> int:
+    """Default process count: all CPUs but one (at least one)."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def run_parallel(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int | None = None,
+    description: str = "Processing",
+    show_progress: bool = False,
+) -> list[TaskResult]:
+    """
+    Apply ``func`` to every item in a process pool.
+
+    Exceptions are captured per item so one bad filing or index file never
+    aborts the batch. With ``max_workers=1`` (or a single item) the work runs
+    in-process, which keeps tests and debugging simple.
+
+    Args:
+        func: Picklable (module-level) function taking one item
+        items: Inputs to process
+        max_workers: Process count (defaults to CPUs - 1)
+        description: Label for log messages and the progress bar
+        show_progress: Display a rich progress bar
+
+    Returns:
+        List of TaskResult in input order
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    workers = min(max_workers or default_workers(), len(items))
+    results: list[TaskResult | None] = [None] * len(items)
+
+    progress = Progress(disable=not show_progress)
+    with progress:
+        task = progress.add_task(description, total=len(items))
+
+        if workers <= 1:
+            for index, item in enumerate(items):
+                results[index] = _run_one(func, item)
+                progress.advance(task)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(func, item): index
+                    for index, item in enumerate(items)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        results[index] = TaskResult(items[index], future.result())
+                    except Exception as e:
+                        logger.error(f"{description} failed for {items[index]}: {e}")
+                        results[index] = TaskResult(items[index], error=str(e))
+                    progress.advance(task)
+
+    failed = sum(1 for result in results if not result.ok)
+    logger.info(f"{description}: {len(items) - failed} succeeded, {failed} failed")
+    return results
+
+
+def _run_one(func: Callable[[Any], Any], item: Any) -> TaskResult:
+    """Run a single item in-process with error capture."""
+    try:
+        return TaskResult(item, func(item))
+    except Exception as e:
+        logger.error(f"Processing failed for {item}: {e}")
+        return TaskResult(item, error=str(e))
@@ -15,6 +15,7 @@ All path operations now follow modern pathlib patterns with proper error handlin
 """
 
 import logging
+import os
 import tempfile
 from pathlib import Path
 
@@ -186,6 +187,46 @@ class EdgarPathManager:
         except (OSError, FileNotFoundError):
             return None
 
+    def atomic_write(
+        self, filepath: str | Path, data: str | bytes, encoding: str = "utf-8"
+    ) -> Path:
+        """
+        Write a file atomically (temporary file in the same directory + rename).
+
+        Readers never observe a partially written file: either the previous
+        version or the complete new one is visible.
+
+        Args:
+            filepath: Destination file path
+            data: Text or bytes to write
+            encoding: Encoding used when data is text
+
+        Returns:
+            Path object for the written file
+        """
+        file_path = Path(filepath)
+        self.ensure_directory(file_path.parent)
+
+        payload = data.encode(encoding) if isinstance(data, str) else data
+        fd, temp_name = tempfile.mkstemp(
+            prefix=f".{file_path.name}.", suffix=".tmp", dir=str(file_path.parent)
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_name, file_path)
+        except BaseException:
+            try:
+                os.remove(temp_name)
+            except OSError:
+                pass
+            raise
+
+        self.logger.debug(f"Atomically wrote file: {file_path}")
+        return file_path
+
     def list_files(self, directory: str | Path, pattern: str = "*") -> list[Path]:
         """
         List files in directory with pattern matching.
@@ -241,3 +282,10 @@ def safe_remove(filepath: str | Path) -> bool:
 def file_exists(filepath: str | Path) -> bool:
     """Check if file exists."""
     return path_manager.file_exists(filepath)
+
+
+def atomic_write(
+    filepath: str | Path, data: str | bytes, encoding: str = "utf-8"
+) -> Path:
+    """Write file atomically via temporary file and rename."""
+    return path_manager.atomic_write(filepath, data, encoding)
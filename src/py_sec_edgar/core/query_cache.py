@@ -0,0 +1,280 @@
+"""
+LRU cache of search results keyed on the query and the index version.
+
+A search is deterministic for a given filing index and ticker mapping,
+and both change only when they are rebuilt. ``QueryCache`` stores each
+result table under the normalized query (tickers, form types, dates,
+limit) plus ``index_version()``, the size and modification time of the
+index manifest, the merged index and the identifier sources. Rebuilding
+the index changes the version, so stale results are never returned and
+simply age out of the LRU:
+
+    ```python
+    from py_sec_edgar.core.query_cache import default_query_cache
+
+    cache = default_query_cache()
+    results = cache.get_or_search(
+        {"tickers": "AAPL", "form_types": ["10-K"], "limit": 5},
+        lambda: engine.search("AAPL", ["10-K"], limit=5),
+    )
+    cache.stats()  # CacheStats(hits=0, misses=1, ...)
+    ```
+
+With a ``cache_dir`` every result is also written there as Parquet, so
+separate processes (CLI invocations, API workers) share results.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from datetime import date
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+from pyarrow import parquet as pq
+
+from ..feeds.index_dataset import MANIFEST_NAME
+from ..settings import settings
+from .identifiers import identifier_sources
+from .path_utils import atomic_write
+from .search_results import SearchResults
+
+logger = logging.getLogger(__name__)
+
+# Query fields whose order and case do not change the results
+_SET_FIELDS = {"tickers", "form_types"}
+
+_default: "QueryCache | None" = None
+
+
+@dataclass
+class CacheStats:
+    """Counters of a QueryCache."""
+
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0  # hits served from cache_dir, included in hits
+    evictions: int = 0
+    entries: int = 0
+    max_entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _stat(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def index_version_files() -> list[Path]:
+    """Files whose size and modification time make up ``index_version``."""
+    return [
+        settings.idx_dataset_dir / MANIFEST_NAME,
+        settings.merged_idx_filepath,
+        *identifier_sources().values(),
+    ]
+
+
+def index_version(paths: list[Path] | None = None) -> str:
+    """
+    Version token of the data searches read.
+
+    Every index update rewrites the dataset manifest (or the merged index),
+    and ticker mapping updates rewrite an identifier source, so the token
+    changes whenever a cached result could be stale.
+
+    Args:
+        paths: Files to stat (``index_version_files()`` when None)
+    """
+    return json.dumps([_stat(path) for path in paths or index_version_files()])
+
+
+def normalize_query(query: dict[str, Any]) -> str:
+    """
+    Canonical form of a query.
+
+    Tickers and form types may be a list or a comma-separated string; they
+    are upper-cased, de-duplicated and sorted. Dates become ISO strings.
+    """
+    normalized = {}
+    for name, value in query.items():
+        if name in _SET_FIELDS and value is not None:
+            values = value.split(",") if isinstance(value, str) else value
+            value = sorted({str(v).strip().upper() for v in values} - {""})
+        elif isinstance(value, date):
+            value = value.isoformat()
+        normalized[name] = value
+    return json.dumps(normalized, sort_keys=True, default=str)
+
+
+class QueryCache:
+    """
+    Size-bounded LRU of search result tables.
+
+    Entries are immutable Arrow tables; every lookup returns a new
+    ``SearchResults`` over the cached table, so callers can filter or
+    extend their copy freely.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        cache_dir: str | Path | None = None,
+        version: Callable[[], str] | None = None,
+    ):
+        """
+        Args:
+            max_entries: Results kept in memory, and on disk with cache_dir
+            cache_dir: Directory for Parquet copies of the results (memory
+                only when None)
+            version: Token of the searched data, part of every key
+                (``index_version`` of the files resolved now when None)
+        """
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if version is None:
+            version = partial(index_version, index_version_files())
+        self._version = version
+        self._entries: OrderedDict[str, pa.Table] = OrderedDict()
+        self._stats = CacheStats(max_entries=max_entries)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, query: dict[str, Any]) -> str:
+        """Cache key of a query against the current index version."""
+        text = f"{self._version()}\n{normalize_query(query)}"
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def get(self, query: dict[str, Any]) -> pa.Table | None:
+        """Cached result table of a query, or None."""
+        return self._get(self.key(query))
+
+    def put(self, query: dict[str, Any], table: pa.Table) -> None:
+        """Cache the result table of a query."""
+        self._put(self.key(query), table)
+
+    def get_or_search(
+        self, query: dict[str, Any], search: Callable[[], SearchResults]
+    ) -> SearchResults:
+        """
+        Cached results of a query, running ``search`` on a miss.
+
+        Exceptions from ``search`` propagate and nothing is cached.
+        """
+        key = self.key(query)
+        table = self._get(key)
+        if table is None:
+            table = search().to_arrow()
+            self._put(key, table)
+        return SearchResults(table)
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the hit, miss and eviction counters."""
+        with self._lock:
+            return replace(self._stats, entries=len(self._entries))
+
+    def clear(self) -> None:
+        """Drop every entry, in memory and on disk, and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = CacheStats(max_entries=self.max_entries)
+        for path in self._disk_files():
+            path.unlink(missing_ok=True)
+
+    def _get(self, key: str) -> pa.Table | None:
+        with self._lock:
+            table = self._entries.get(key)
+            if table is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return table
+
+        table = self._read(key)
+        with self._lock:
+            if table is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+                self._stats.disk_hits += 1
+                self._store(key, table)
+        return table
+
+    def _put(self, key: str, table: pa.Table) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._store(key, table)
+        self._write(key, table)
+
+    def _store(self, key: str, table: pa.Table) -> None:
+        self._entries[key] = table
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    # On-disk copies
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.parquet"
+
+    def _disk_files(self) -> list[Path]:
+        if self.cache_dir is None or not self.cache_dir.is_dir():
+            return []
+        return list(self.cache_dir.glob("*.parquet"))
+
+    def _read(self, key: str) -> pa.Table | None:
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            table = pq.read_table(path)
+            os.utime(path)  # Recently used, for pruning
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Ignoring unreadable query cache file {path}: {e}")
+            return None
+        return table
+
+    def _write(self, key: str, table: pa.Table) -> None:
+        if self.cache_dir is None:
+            return
+        try:
+            sink = pa.BufferOutputStream()
+            pq.write_table(table, sink)
+            atomic_write(self._path(key), sink.getvalue().to_pybytes())
+            self._prune()
+        except OSError as e:
+            logger.warning(f"Could not write query cache file: {e}")
+
+    def _prune(self) -> None:
+        """Delete the least recently used files beyond max_entries."""
+        files = self._disk_files()
+        if len(files) <= self.max_entries:
+            return
+        files.sort(key=lambda path: _stat(path) or [0, 0])
+        for path in files[: len(files) - self.max_entries]:
+            path.unlink(missing_ok=True)
+
+
+def default_query_cache() -> QueryCache:
+    """The in-memory cache shared by the client and the smart router."""
+    global _default
+    if _default is None:
+        _default = QueryCache(settings.query_cache_size)
+    return _default
@@ -2,6 +2,12 @@
 Enhanced SearchResults collection for py-sec-edgar programmatic interface
 
 Provides rich operations, filtering, and export capabilities for filing search results.
+
+Results are backed by an Arrow table with the ``RESULT_SCHEMA`` columns.
+Filters, sorts and summaries run as Arrow compute kernels and exports
+convert the table directly, so large result sets never need one Python
+object per filing. ``FilingInfo`` objects are only created when results
+are iterated or indexed.
 """
 
 import asyncio
@@ -11,6 +17,10 @@ from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Union
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
 try:
     import pandas as pd
 
@@ -21,6 +31,85 @@ except ImportError:
 from .downloader import FilingDownloader
 from .models import FilingInfo
 
+# Scalar FilingInfo fields, in FilingInfo.to_dict order
+RESULT_SCHEMA = pa.schema(
+    [
+        ("cik", pa.string()),
+        ("ticker", pa.string()),
+        ("company_name", pa.string()),
+        ("form_type", pa.string()),
+        ("filing_date", pa.date32()),
+        ("accession_number", pa.string()),
+        ("document_url", pa.string()),
+        ("submission_url", pa.string()),
+        ("sec_website_url", pa.string()),
+        ("filename", pa.string()),
+        ("size", pa.int64()),
+        ("report_date", pa.string()),
+        ("file_number", pa.string()),
+        ("fiscal_year_end", pa.string()),
+        ("state_of_incorporation", pa.string()),
+        ("sic", pa.string()),
+    ]
+)
+
+# FilingInfo fields that default to "" rather than None
+_TEXT_FIELDS = [
+    "cik",
+    "ticker",
+    "company_name",
+    "form_type",
+    "accession_number",
+    "document_url",
+    "submission_url",
+    "sec_website_url",
+    "filename",
+]
+
+# FilingInfo fields not stored in the table
+_OBJECT_FIELDS = ["business_address", "mailing_address", "metadata"]
+
+
+def results_table(columns: dict[str, Any]) -> pa.Table:
+    """
+    Build a ``RESULT_SCHEMA`` table from the columns that are known.
+
+    Missing columns are filled with nulls and present ones are cast to the
+    schema type.
+    """
+    length = len(next(iter(columns.values()))) if columns else 0
+    arrays = []
+    for f in RESULT_SCHEMA:
+        if f.name in columns:
+            column = columns[f.name]
+            if not isinstance(column, (pa.Array, pa.ChunkedArray)):
+                column = pa.array(column, type=f.type)
+            arrays.append(column.cast(f.type))
+        else:
+            arrays.append(pa.nulls(length, type=f.type))
+    return pa.table(arrays, schema=RESULT_SCHEMA)
+
+
+def filings_to_table(filings: list[FilingInfo]) -> pa.Table:
+    """``RESULT_SCHEMA`` table of FilingInfo objects."""
+    columns: dict[str, list] = {
+        name: [getattr(f, name) for f in filings]
+        for name in RESULT_SCHEMA.names
+        if name != "filing_date"
+    }
+    columns["filing_date"] = [
+        parsed.date() if (parsed := f.filing_date_parsed) else None for f in filings
+    ]
+    return results_table(columns)
+
+
+def _filing_from_row(row: dict[str, Any]) -> FilingInfo:
+    filed = row["filing_date"]
+    row["filing_date"] = filed.isoformat() if filed else ""
+    for name in _TEXT_FIELDS:
+        row[name] = row[name] or ""
+    return FilingInfo(**row)
+
 
 class SearchResults:
     """
@@ -31,66 +120,112 @@ class SearchResults:
     """
 
     def __init__(
-        self, filings: list[FilingInfo], metadata: dict[str, Any] | None = None
+        self,
+        filings: list[FilingInfo] | pa.Table,
+        metadata: dict[str, Any] | None = None,
     ):
         """
         Initialize SearchResults collection.
 
         Args:
-            filings: List of FilingInfo objects
+            filings: List of FilingInfo objects, or a ``RESULT_SCHEMA`` table
+                whose rows become FilingInfo objects on first access
             metadata: Optional metadata about the search operation
         """
-        self._filings = filings
+        if isinstance(filings, pa.Table):
+            self._table: pa.Table | None = filings
+            self._filings: list[FilingInfo] | None = None
+        else:
+            self._table = None
+            self._filings = filings
         self._metadata = metadata or {}
-        self._downloader = FilingDownloader()
+        self._downloader_instance: FilingDownloader | None = None
 
     # Collection interface
     def __len__(self) -> int:
         """Return number of filings in results."""
-        return len(self._filings)
+        if self._filings is not None:
+            return len(self._filings)
+        return self._table.num_rows
 
     def __iter__(self) -> Iterator[FilingInfo]:
         """Iterate over filings."""
-        return iter(self._filings)
+        return iter(self.filings)
 
     def __getitem__(self, index: int | slice) -> Union[FilingInfo, "SearchResults"]:
         """Get filing by index or slice."""
         if isinstance(index, int):
-            return self._filings[index]
+            if self._filings is not None:
+                return self._filings[index]
+            position = range(self._table.num_rows)[index]  # Raises IndexError
+            return _filing_from_row(self._table.slice(position, 1).to_pylist()[0])
         elif isinstance(index, slice):
-            return SearchResults(self._filings[index], self._metadata.copy())
+            return self._take(range(len(self))[index])
         else:
             raise TypeError("Index must be int or slice")
 
     def __bool__(self) -> bool:
         """Return True if results contain any filings."""
-        return len(self._filings) > 0
+        return len(self) > 0
 
     # Properties
+    @property
+    def _downloader(self) -> FilingDownloader:
+        """Downloader for batch operations, created on first use."""
+        if self._downloader_instance is None:
+            self._downloader_instance = FilingDownloader()
+        return self._downloader_instance
+
     @property
     def filings(self) -> list[FilingInfo]:
-        """Get list of filings."""
+        """Get list of filings, creating the FilingInfo objects on first access."""
+        if self._filings is None:
+            self._filings = [_filing_from_row(row) for row in self._table.to_pylist()]
         return self._filings
 
+    @property
+    def table(self) -> pa.Table:
+        """Get the results as a ``RESULT_SCHEMA`` Arrow table."""
+        if self._table is None:
+            self._table = filings_to_table(self._filings)
+        return self._table
+
     @property
     def metadata(self) -> dict[str, Any]:
         """Get search metadata."""
         return self._metadata
 
+    def _distinct(self, column: str) -> list[str]:
+        values = pc.unique(self.table[column]).to_pylist()
+        return [value for value in values if value]
+
     @property
     def tickers(self) -> list[str]:
         """Get unique ticker symbols in results."""
-        return list(set(f.ticker for f in self._filings if f.ticker))
+        return self._distinct("ticker")
 
     @property
     def companies(self) -> list[str]:
         """Get unique company names in results."""
-        return list(set(f.company_name for f in self._filings if f.company_name))
+        return self._distinct("company_name")
 
     @property
     def form_types(self) -> list[str]:
         """Get unique form types in results."""
-        return list(set(f.form_type for f in self._filings if f.form_type))
+        return self._distinct("form_type")
+
+    def _take(self, indices: pa.Array | range) -> "SearchResults":
+        """New SearchResults with the rows at ``indices``, in that order."""
+        if isinstance(indices, range):
+            indices = pa.array(indices, type=pa.int64())
+        result = SearchResults(self.table.take(indices), self._metadata.copy())
+        if self._filings is not None:
+            # Keep existing objects, which may carry fields the table lacks
+            result._filings = [self._filings[i] for i in indices.to_pylist()]
+        return result
+
+    def _where(self, mask: pa.ChunkedArray | pa.Array) -> "SearchResults":
+        return self._take(pc.indices_nonzero(mask))
 
     # Filtering methods
     def filter_by_ticker(self, tickers: str | list[str]) -> "SearchResults":
@@ -107,8 +242,8 @@ class SearchResults:
             tickers = [tickers]
         tickers = [t.upper() for t in tickers]
 
-        filtered = [f for f in self._filings if f.ticker.upper() in tickers]
-        return SearchResults(filtered, self._metadata.copy())
+        column = pc.utf8_upper(self.table["ticker"])
+        return self._where(pc.is_in(column, value_set=pa.array(tickers)))
 
     def filter_by_form_type(self, form_types: str | list[str]) -> "SearchResults":
         """
@@ -124,8 +259,8 @@ class SearchResults:
             form_types = [form_types]
         form_types = [ft.upper() for ft in form_types]
 
-        filtered = [f for f in self._filings if f.form_type.upper() in form_types]
-        return SearchResults(filtered, self._metadata.copy())
+        column = pc.utf8_upper(self.table["form_type"])
+        return self._where(pc.is_in(column, value_set=pa.array(form_types)))
 
     def filter_by_date_range(
         self, start_date: str | date | None = None, end_date: str | date | None = None
@@ -133,6 +268,8 @@ class SearchResults:
         """
         Filter results by filing date range.
 
+        Filings without a parseable date are dropped.
+
         Args:
             start_date: Earliest filing date (inclusive)
             end_date: Latest filing date (inclusive)
@@ -140,31 +277,18 @@ class SearchResults:
         Returns:
             New SearchResults with filtered filings
         """
-        filtered = []
-
-        for filing in self._filings:
-            filing_date = filing.filing_date_parsed
-            if not filing_date:
-                continue
+        column = self.table["filing_date"]
+        mask = pc.is_valid(column)
+        if start_date:
+            if isinstance(start_date, str):
+                start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
+            mask = pc.and_(mask, pc.greater_equal(column, pa.scalar(start_date)))
+        if end_date:
+            if isinstance(end_date, str):
+                end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
+            mask = pc.and_(mask, pc.less_equal(column, pa.scalar(end_date)))
 
-            # Convert to date objects for comparison
-            filing_date_only = filing_date.date()
-
-            if start_date:
-                if isinstance(start_date, str):
-                    start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-                if filing_date_only < start_date:
-                    continue
-
-            if end_date:
-                if isinstance(end_date, str):
-                    end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
-                if filing_date_only > end_date:
-                    continue
-
-            filtered.append(filing)
-
-        return SearchResults(filtered, self._metadata.copy())
+        return self._where(mask)
 
     def filter_local_only(self) -> "SearchResults":
         """
@@ -175,7 +299,7 @@ class SearchResults:
         """
         # This would need to check if files exist locally
         # For now, return all filings (assuming downloader handles local checking)
-        return SearchResults(self._filings.copy(), self._metadata.copy())
+        return self._take(range(len(self)))
 
     # Sorting methods
     def sort_by_date(self, descending: bool = True) -> "SearchResults":
@@ -188,12 +312,16 @@ class SearchResults:
         Returns:
             New SearchResults with sorted filings
         """
-        sorted_filings = sorted(
-            self._filings,
-            key=lambda f: f.filing_date_parsed or datetime.min,
-            reverse=descending,
+        indices = pc.sort_indices(
+            self.table,
+            # Filings without a date sort as the oldest
+            sort_keys=[
+                ("filing_date", "descending", "at_end")
+                if descending
+                else ("filing_date", "ascending", "at_start")
+            ],
         )
-        return SearchResults(sorted_filings, self._metadata.copy())
+        return self._take(indices)
 
     def sort_by_ticker(self, descending: bool = False) -> "SearchResults":
         """
@@ -205,10 +333,15 @@ class SearchResults:
         Returns:
             New SearchResults with sorted filings
         """
-        sorted_filings = sorted(
-            self._filings, key=lambda f: f.ticker or "", reverse=descending
+        indices = pc.sort_indices(
+            self.table,
+            sort_keys=[
+                ("ticker", "descending", "at_end")
+                if descending
+                else ("ticker", "ascending", "at_start")
+            ],
         )
-        return SearchResults(sorted_filings, self._metadata.copy())
+        return self._take(indices)
 
     # Export methods
     def to_dict(self) -> dict[str, Any]:
@@ -221,12 +354,12 @@ class SearchResults:
         return {
             "metadata": {
                 **self._metadata,
-                "total_results": len(self._filings),
+                "total_results": len(self),
                 "companies_found": len(self.tickers),
                 "form_types": self.form_types,
                 "export_timestamp": datetime.now().isoformat(),
             },
-            "filings": [f.to_dict() for f in self._filings],
+            "filings": [f.to_dict() for f in self.filings],
         }
 
     def to_json(self, indent: int | None = 2) -> str:
@@ -241,6 +374,15 @@ class SearchResults:
         """
         return json.dumps(self.to_dict(), indent=indent, default=str)
 
+    def to_arrow(self) -> pa.Table:
+        """
+        Convert results to an Arrow table without copying.
+
+        Returns:
+            Table with the ``RESULT_SCHEMA`` columns
+        """
+        return self.table
+
     def to_dataframe(self) -> "pd.DataFrame":
         """
         Convert results to pandas DataFrame.
@@ -257,25 +399,21 @@ class SearchResults:
                 "Install with: pip install pandas"
             )
 
-        if not self._filings:
+        if not len(self):
             return pd.DataFrame()
 
-        # Convert filings to list of dictionaries
-        data = []
-        for filing in self._filings:
-            filing_dict = filing.to_dict()
-            # Flatten nested dictionaries for DataFrame compatibility
-            if "metadata" in filing_dict and isinstance(filing_dict["metadata"], dict):
-                filing_dict.update(filing_dict.pop("metadata"))
-            data.append(filing_dict)
+        df = self.table.to_pandas(date_as_object=False)
+        df["report_date"] = pd.to_datetime(df["report_date"], errors="coerce")
 
-        df = pd.DataFrame(data)
-
-        # Convert date strings to datetime
-        if "filing_date" in df.columns:
-            df["filing_date"] = pd.to_datetime(df["filing_date"], errors="coerce")
-        if "report_date" in df.columns:
-            df["report_date"] = pd.to_datetime(df["report_date"], errors="coerce")
+        # Addresses and metadata only exist on FilingInfo objects
+        if self._filings is not None:
+            for name in _OBJECT_FIELDS[:2]:
+                if any(getattr(f, name) for f in self._filings):
+                    df[name] = [getattr(f, name) for f in self._filings]
+            if any(f.metadata for f in self._filings):
+                # Flatten nested dictionaries for DataFrame compatibility
+                extra = pd.DataFrame([f.metadata for f in self._filings])
+                df = df.join(extra.drop(columns=df.columns, errors="ignore"))
 
         return df
 
@@ -283,12 +421,22 @@ class SearchResults:
         """
         Export results to CSV file.
 
+        Written straight from the Arrow table; pandas is only used when
+        keyword arguments for ``pandas.DataFrame.to_csv`` are given.
+
         Args:
             filepath: Output file path
             **kwargs: Additional arguments passed to pandas.to_csv()
         """
-        df = self.to_dataframe()
-        df.to_csv(filepath, index=False, **kwargs)
+        if (
+            kwargs
+            or self._filings is not None
+            and any(getattr(f, name) for f in self._filings for name in _OBJECT_FIELDS)
+        ):
+            df = self.to_dataframe()
+            df.to_csv(filepath, index=False, **kwargs)
+        else:
+            pa_csv.write_csv(self.table, str(filepath))
 
     def to_excel(
         self, filepath: str | Path, include_metadata: bool = True, **kwargs
@@ -340,15 +488,16 @@ class SearchResults:
         """
         semaphore = asyncio.Semaphore(max_concurrent)
         results = []
+        filings = self.filings
 
         async def download_single(index: int, filing: FilingInfo) -> str:
             async with semaphore:
                 if progress_callback:
-                    progress_callback(index + 1, len(self._filings), filing)
+                    progress_callback(index + 1, len(filings), filing)
                 content = await self._downloader.download_filing_async(filing)
                 return content
 
-        tasks = [download_single(i, filing) for i, filing in enumerate(self._filings)]
+        tasks = [download_single(i, filing) for i, filing in enumerate(filings)]
 
         results = await asyncio.gather(*tasks)
         return results
@@ -366,14 +515,27 @@ class SearchResults:
             List of downloaded content strings
         """
         results = []
-        for i, filing in enumerate(self._filings):
+        filings = self.filings
+        for i, filing in enumerate(filings):
             if progress_callback:
-                progress_callback(i + 1, len(self._filings), filing)
+                progress_callback(i + 1, len(filings), filing)
             content = self._downloader.download_filing(filing)
             results.append(content)
         return results
 
     # Summary and statistics
+    def _value_counts(self, column: str) -> dict[str, int]:
+        counts = pc.value_counts(self.table[column])
+        return {
+            value: count
+            for value, count in zip(
+                counts.field("values").to_pylist(),
+                counts.field("counts").to_pylist(),
+                strict=True,
+            )
+            if value
+        }
+
     def get_summary(self) -> dict[str, Any]:
         """
         Get summary statistics for the search results.
@@ -381,7 +543,7 @@ class SearchResults:
         Returns:
             Dictionary with summary information
         """
-        if not self._filings:
+        if not len(self):
             return {
                 "total_filings": 0,
                 "companies": 0,
@@ -390,27 +552,23 @@ class SearchResults:
             }
 
         # Get date range
-        dates = [f.filing_date_parsed for f in self._filings if f.filing_date_parsed]
         date_range = None
-        if dates:
-            min_date = min(dates).date()
-            max_date = max(dates).date()
-            date_range = {"start": min_date.isoformat(), "end": max_date.isoformat()}
+        bounds = pc.min_max(self.table["filing_date"])
+        if bounds["min"].is_valid:
+            date_range = {
+                "start": bounds["min"].as_py().isoformat(),
+                "end": bounds["max"].as_py().isoformat(),
+            }
 
+        tickers = self.tickers
         return {
-            "total_filings": len(self._filings),
-            "companies": len(self.tickers),
-            "unique_tickers": self.tickers,
+            "total_filings": len(self),
+            "companies": len(tickers),
+            "unique_tickers": tickers,
             "form_types": self.form_types,
             "date_range": date_range,
-            "filings_by_ticker": {
-                ticker: len([f for f in self._filings if f.ticker == ticker])
-                for ticker in self.tickers
-            },
-            "filings_by_form_type": {
-                form_type: len([f for f in self._filings if f.form_type == form_type])
-                for form_type in self.form_types
-            },
+            "filings_by_ticker": self._value_counts("ticker"),
+            "filings_by_form_type": self._value_counts("form_type"),
         }
 
     # Utility methods
@@ -421,14 +579,19 @@ class SearchResults:
         Args:
             other: Another SearchResults object to merge
         """
-        self._filings.extend(other._filings)
+        if self._filings is not None or other._filings is not None:
+            self._filings = self.filings + other.filings
+        if self._table is not None and other._table is not None:
+            self._table = pa.concat_tables([self._table, other._table])
+        else:
+            self._table = None
         # Merge metadata
         if other._metadata:
             self._metadata.update(other._metadata)
 
     def __repr__(self) -> str:
         """String representation of SearchResults."""
-        return f"SearchResults({len(self._filings)} filings, {len(self.tickers)} companies)"
+        return f"SearchResults({len(self)} filings, {len(self.tickers)} companies)"
 
     def __str__(self) -> str:
         """Human-readable string representation."""
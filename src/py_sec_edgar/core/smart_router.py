@@ -14,7 +14,8 @@ from datetime import date, datetime, timedelta
 from enum import Enum
 from typing import Any
 
-from ..core.models import FilingInfo
+from ..core.query_cache import QueryCache, default_query_cache
+from ..core.search_results import SearchResults
 from ..search_engine import FilingSearchEngine
 
 logger = logging.getLogger(__name__)
@@ -50,9 +51,15 @@ class SmartFeedRouter:
     - Quarterly Feed: Date range > 3 months back or very broad ranges
     """
 
-    def __init__(self):
-        """Initialize the smart feed router."""
+    def __init__(self, cache: QueryCache | None = None):
+        """
+        Initialize the smart feed router.
+
+        Args:
+            cache: Cache for search results (the shared in-memory cache by default)
+        """
         self._search_engine = FilingSearchEngine()
+        self._cache = cache if cache is not None else default_query_cache()
 
         # Configure feed coverage windows
         self.rss_window_days = 3
@@ -246,7 +253,7 @@ class SmartFeedRouter:
         limit: int = 10,
         start_date: str | None = None,
         end_date: str | None = None,
-    ) -> tuple[list[FilingInfo], FeedRoute]:
+    ) -> tuple[SearchResults, FeedRoute]:
         """
         Execute a smart search using the optimal feed based on date range.
 
@@ -268,12 +275,8 @@ class SmartFeedRouter:
         try:
             # For now, all routes use the unified search engine
             # The routing logic provides intelligent metadata about data freshness expectations
-            filings = self._search_engine.search_by_ticker(
-                ticker=ticker,
-                form_types=[form_type] if form_type else None,
-                start_date=start_date,
-                end_date=end_date,
-                limit=limit,
+            filings = self._cached_search(
+                ticker, form_type, limit, start_date, end_date
             )
 
             logger.info(
@@ -294,14 +297,38 @@ class SmartFeedRouter:
             )
 
             # Basic fallback search
-            filings = self._search_engine.search_by_ticker(
+            filings = self._cached_search(
+                ticker, form_type, limit, start_date, end_date
+            )
+            return filings, fallback_route
+
+    def _cached_search(
+        self,
+        ticker: str | list[str],
+        form_type: str | None,
+        limit: int,
+        start_date: str | None,
+        end_date: str | None,
+    ) -> SearchResults:
+        """Search engine results, reused until the index changes."""
+        form_types = [form_type] if form_type else None
+        query = {
+            "tickers": ticker,
+            "form_types": form_types,
+            "start_date": start_date,
+            "end_date": end_date,
+            "limit": limit,
+        }
+        return self._cache.get_or_search(
+            query,
+            lambda: self._search_engine.search(
                 ticker=ticker,
-                form_types=[form_type] if form_type else None,
+                form_types=form_types,
                 start_date=start_date,
                 end_date=end_date,
                 limit=limit,
-            )
-            return filings, fallback_route
+            ),
+        )
 
     # Future optimization: Implement specific feed methods for RSS, Daily, Monthly routing
     # For now, all routes use the unified search engine with intelligent metadata
@@ -351,7 +378,7 @@ def smart_search(
     limit: int = 10,
     start_date: str | None = None,
     end_date: str | None = None,
-) -> tuple[list[FilingInfo], FeedRoute]:
+) -> tuple[SearchResults, FeedRoute]:
     """
     Perform a smart search using optimal feed routing.
 
@@ -20,11 +20,18 @@ import logging
 from datetime import datetime
 from urllib.parse import urljoin
 
+import pyarrow as pa
+import pyarrow.compute as pc
+
 from ..settings import settings
 from .path_utils import safe_join
 
 logger = logging.getLogger(__name__)
 
+# edgar/data/CIK/ACCESSION-NUMBER.txt, the layout of index filenames
+_FILING_PATH = r"^edgar/data/\d+/[0-9-]+\.txt$"
+_ACCESSION_DIGITS = r"^edgar/data/\d+/(\d{10})(\d{2})(\d{6,})$"
+
 
 class EdgarUrlGenerator:
     """
@@ -341,6 +348,56 @@ class EdgarUrlGenerator:
 
         return directory_url
 
+    def generate_filing_url_columns(
+        self, filenames: pa.Array | pa.ChunkedArray
+    ) -> dict[str, pa.Array | pa.ChunkedArray]:
+        """
+        Vectorized filing URLs for a whole column of index filenames.
+
+        Computes the same values as ``generate_filing_document_url``,
+        ``generate_submission_filing_url`` and ``generate_sec_website_url``
+        with Arrow string kernels, plus the accession number that
+        ``FilingInfo.from_search_result`` derives from the document URL.
+
+        Args:
+            filenames: Relative filenames from SEC (e.g., "edgar/data/320193/...")
+
+        Returns:
+            Dictionary of document_url, submission_url, sec_website_url and
+            accession_number columns
+        """
+        # urljoin semantics: a base without a trailing slash loses its last segment
+        prefix = urljoin(settings.edgar_archives_url, ".")
+        path = pc.replace_substring_regex(filenames.cast(pa.string()), r"^/+", "")
+        empty = pc.equal(path, "")
+        matched = pc.match_substring_regex(path, _FILING_PATH)
+        directory = pc.replace_substring_regex(
+            pc.replace_substring(path, "-", ""), r"\.txt$", ""
+        )
+
+        submission = pc.if_else(
+            empty, "", pc.binary_join_element_wise(prefix, path, "")
+        )
+        sec_website = pc.if_else(
+            matched, pc.binary_join_element_wise(prefix, directory, ""), submission
+        )
+        document = pc.if_else(
+            matched,
+            pc.binary_join_element_wise(prefix, directory, "/", ""),
+            submission,
+        )
+        accession = pc.if_else(
+            pc.and_(matched, pc.match_substring_regex(directory, _ACCESSION_DIGITS)),
+            pc.replace_substring_regex(directory, _ACCESSION_DIGITS, r"\1-\2-\3"),
+            "",
+        )
+        return {
+            "document_url": document,
+            "submission_url": submission,
+            "sec_website_url": sec_website,
+            "accession_number": accession,
+        }
+
     def generate_rss_url(
         self,
         count: int = 40,
@@ -455,6 +512,13 @@ def generate_filing_document_url(filename: str, form_type: str = None) -> str:
     return url_generator.generate_filing_document_url(filename, form_type)
 
 
+def generate_filing_url_columns(
+    filenames: pa.Array | pa.ChunkedArray,
+) -> dict[str, pa.Array | pa.ChunkedArray]:
+    """Generate document, submission and SEC website URL columns for filenames."""
+    return url_generator.generate_filing_url_columns(filenames)
+
+
 def generate_rss_url(
     count: int = 40,
     form_type: str | None = None,
@@ -0,0 +1,47 @@
+"""
+Derived corpus layers built from extracted filings.
+
+These modules turn the raw documents written by :mod:`py_sec_edgar.extract`
+into reusable, cached artifacts (plain text, section offsets, search
+indexes, structured data) so downstream analysis never reparses HTML.
+"""
+
+from .forms import build_forms_tables, load_form_table
+from .fulltext import FullTextIndex, FullTextSearchError, search_text
+from .sections import build_section_index, get_section, load_section_index
+from .similarity import (
+    build_similarity_index,
+    compare_with_previous,
+    find_near_duplicates,
+)
+from .tables import build_table_cache, get_tables
+from .text import (
+    build_filing_text,
+    build_text_layer,
+    get_document_text,
+    html_to_text,
+)
+from .xbrl import build_facts_store, load_facts, parse_xbrl_facts
+
+__all__ = [
+    "build_forms_tables",
+    "load_form_table",
+    "FullTextIndex",
+    "FullTextSearchError",
+    "search_text",
+    "build_section_index",
+    "get_section",
+    "load_section_index",
+    "build_similarity_index",
+    "compare_with_previous",
+    "find_near_duplicates",
+    "build_table_cache",
+    "get_tables",
+    "build_filing_text",
+    "build_text_layer",
+    "get_document_text",
+    "html_to_text",
+    "build_facts_store",
+    "load_facts",
+    "parse_xbrl_facts",
+]
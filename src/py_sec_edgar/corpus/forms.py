@@ -0,0 +1,588 @@
+"""
+Bulk parser for Form 4 ownership and 13F-HR information table XML.
+
+Form 4 and 13F-HR filings arrive as hundreds of thousands of small
+submissions whose useful content is a single XML document. This engine
+reads the complete submission files directly (no extraction step), checks
+the form type from the SGML header, parses the ``<XML>`` blocks with lxml
+and emits two normalized tables:
+
+- ``transactions``: one row per Form 4 non-derivative/derivative transaction
+- ``holdings``: one row per 13F-HR information table entry
+
+Submissions are parsed in chunks across a process pool; each worker writes
+its chunk's rows as new files under
+``settings.corpus_dir/forms/<table>/year=YYYY/qtr=Q/``, typed by
+``TRANSACTION_SCHEMA`` / ``HOLDING_SCHEMA`` so partitions always agree,
+and records the chunk's accessions under ``forms/processed/`` so later runs
+skip every submission already parsed, including those without rows.
+
+    ```python
+    from py_sec_edgar.corpus.forms import build_forms_tables, load_form_table
+
+    build_forms_tables(settings.filings_data_dir, max_workers=8)
+    insider_buys = load_form_table(
+        "transactions", filters=[("transaction_code", "==", "P")]
+    )
+    ```
+"""
+
+import logging
+import os
+import re
+import uuid
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from lxml import etree
+
+from ..core.parallel import run_parallel
+from ..settings import settings
+
+logger = logging.getLogger(__name__)
+
+FORM_4_TYPES = ("4", "4/A")
+FORM_13F_TYPES = ("13F-HR", "13F-HR/A")
+
+# SEC switched 13F <value> from thousands to whole dollars on 2023-01-03
+_13F_DOLLAR_VALUE_START = "2023-01-03"
+
+_XML_BLOCK = re.compile(rb"<XML>\s*(.*?)\s*</XML>", re.DOTALL | re.IGNORECASE)
+_HEADER_VALUE = {
+    "accession_number": re.compile(rb"ACCESSION NUMBER:\s*(\S+)"),
+    "form_type": re.compile(rb"CONFORMED SUBMISSION TYPE:\s*(\S+)"),
+    "date_filed": re.compile(rb"FILED AS OF DATE:\s*(\d{8})"),
+    "period_of_report": re.compile(rb"CONFORMED PERIOD OF REPORT:\s*(\d{8})"),
+    "company_name": re.compile(rb"COMPANY CONFORMED NAME:\s*([^\r\n]+)"),
+    "cik": re.compile(rb"CENTRAL INDEX KEY:\s*(\d+)"),
+}
+_HEADER_READ_BYTES = 8192
+
+TRANSACTION_SCHEMA = pa.schema(
+    [
+        ("accession_number", pa.string()),
+        ("form_type", pa.string()),
+        ("date_filed", pa.string()),
+        ("period_of_report", pa.string()),
+        ("issuer_cik", pa.string()),
+        ("issuer_name", pa.string()),
+        ("issuer_ticker", pa.string()),
+        ("owner_cik", pa.string()),
+        ("owner_name", pa.string()),
+        ("owner_count", pa.int64()),
+        ("is_director", pa.bool_()),
+        ("is_officer", pa.bool_()),
+        ("is_ten_percent_owner", pa.bool_()),
+        ("officer_title", pa.string()),
+        ("table", pa.string()),
+        ("security_title", pa.string()),
+        ("transaction_date", pa.string()),
+        ("transaction_code", pa.string()),
+        ("shares", pa.float64()),
+        ("price_per_share", pa.float64()),
+        ("acquired_disposed", pa.string()),
+        ("shares_owned_after", pa.float64()),
+        ("direct_indirect", pa.string()),
+        ("conversion_or_exercise_price", pa.float64()),
+        ("exercise_date", pa.string()),
+        ("expiration_date", pa.string()),
+        ("underlying_security_title", pa.string()),
+        ("underlying_shares", pa.float64()),
+    ]
+)
+
+HOLDING_SCHEMA = pa.schema(
+    [
+        ("accession_number", pa.string()),
+        ("form_type", pa.string()),
+        ("date_filed", pa.string()),
+        ("period_of_report", pa.string()),
+        ("filer_cik", pa.string()),
+        ("filer_name", pa.string()),
+        ("name_of_issuer", pa.string()),
+        ("title_of_class", pa.string()),
+        ("cusip", pa.string()),
+        ("figi", pa.string()),
+        ("value", pa.float64()),
+        ("value_usd", pa.float64()),
+        ("shares", pa.float64()),
+        ("share_type", pa.string()),
+        ("put_call", pa.string()),
+        ("investment_discretion", pa.string()),
+        ("other_manager", pa.string()),
+        ("voting_sole", pa.float64()),
+        ("voting_shared", pa.float64()),
+        ("voting_none", pa.float64()),
+    ]
+)
+
+TABLE_SCHEMAS = {"transactions": TRANSACTION_SCHEMA, "holdings": HOLDING_SCHEMA}
+
+PARTITION_SCHEMA = pa.schema([("year", pa.int32()), ("qtr", pa.int32())])
+
+# Manifest of parsed accessions, kept next to the tables
+PROCESSED_DIR = "processed"
+
+
+def default_forms_store_path() -> Path:
+    """Default root of the Form 4 / 13F tables."""
+    return settings.corpus_dir / "forms"
+
+
+def _format_date(value: str | None) -> str | None:
+    """YYYYMMDD -> YYYY-MM-DD (other formats pass through)."""
+    if value and len(value) == 8 and value.isdigit():
+        return f"{value[:4]}-{value[4:6]}-{value[6:]}"
+    return value or None
+
+
+def _read_header(path: str | Path) -> dict:
+    """Read form type, dates and filer from the start of a submission."""
+    with open(path, "rb") as f:
+        head = f.read(_HEADER_READ_BYTES)
+    header = {}
+    for key, pattern in _HEADER_VALUE.items():
+        match = pattern.search(head)
+        if match:
+            header[key] = match.group(1).decode("latin-1").strip()
+    return header
+
+
+def _strip_namespaces(root) -> None:
+    """Drop XML namespaces in place so paths work across schema versions."""
+    for element in root.iter():
+        if isinstance(element.tag, str) and "}" in element.tag:
+            element.tag = etree.QName(element).localname
+    etree.cleanup_namespaces(root)
+
+
+def _parse_xml(block: bytes):
+    """Parse one <XML> block, tolerating minor errors."""
+    parser = etree.XMLParser(recover=True, huge_tree=True, remove_blank_text=True)
+    root = etree.fromstring(block, parser)
+    if root is not None:
+        _strip_namespaces(root)
+    return root
+
+
+def _text(element, path: str) -> str | None:
+    """Stripped text at a path, or None."""
+    value = element.findtext(path)
+    if value is None:
+        return None
+    value = value.strip()
+    return value or None
+
+
+def _number(element, path: str) -> float | None:
+    """Numeric value at a path, or None."""
+    value = _text(element, path)
+    if value is None:
+        return None
+    try:
+        return float(value.replace(",", "").replace("$", ""))
+    except ValueError:
+        return None
+
+
+def _flag(element, path: str) -> bool:
+    """Form 4 boolean ("1"/"true")."""
+    return (_text(element, path) or "").lower() in ("1", "true")
+
+
+def parse_ownership_document(root, header: dict) -> list[dict]:
+    """
+    Flatten a Form 4 ``ownershipDocument`` into transaction rows.
+
+    Args:
+        root: Parsed ownershipDocument element (namespaces stripped)
+        header: Submission header values
+
+    Returns:
+        List of transaction row dictionaries
+    """
+    owners = root.findall("reportingOwner")
+    # Joint filings list several owners; rows carry the first one
+    owner = owners[0] if owners else etree.Element("reportingOwner")
+    base = {
+        "accession_number": header.get("accession_number"),
+        "form_type": header.get("form_type"),
+        "date_filed": _format_date(header.get("date_filed")),
+        "period_of_report": _text(root, "periodOfReport"),
+        "issuer_cik": _text(root, "issuer/issuerCik"),
+        "issuer_name": _text(root, "issuer/issuerName"),
+        "issuer_ticker": _text(root, "issuer/issuerTradingSymbol"),
+        "owner_cik": _text(owner, "reportingOwnerId/rptOwnerCik"),
+        "owner_name": _text(owner, "reportingOwnerId/rptOwnerName"),
+        "owner_count": len(owners),
+        "is_director": _flag(owner, "reportingOwnerRelationship/isDirector"),
+        "is_officer": _flag(owner, "reportingOwnerRelationship/isOfficer"),
+        "is_ten_percent_owner": _flag(
+            owner, "reportingOwnerRelationship/isTenPercentOwner"
+        ),
+        "officer_title": _text(owner, "reportingOwnerRelationship/officerTitle"),
+    }
+    if base["issuer_cik"]:
+        base["issuer_cik"] = str(int(base["issuer_cik"]))
+    if base["owner_cik"]:
+        base["owner_cik"] = str(int(base["owner_cik"]))
+
+    rows = []
+    for table, tag in (
+        ("non_derivative", "nonDerivativeTable/nonDerivativeTransaction"),
+        ("derivative", "derivativeTable/derivativeTransaction"),
+    ):
+        for transaction in root.iterfind(tag):
+            rows.append(
+                {
+                    **base,
+                    "table": table,
+                    "security_title": _text(transaction, "securityTitle/value"),
+                    "transaction_date": _text(transaction, "transactionDate/value"),
+                    "transaction_code": _text(
+                        transaction, "transactionCoding/transactionCode"
+                    ),
+                    "shares": _number(
+                        transaction, "transactionAmounts/transactionShares/value"
+                    ),
+                    "price_per_share": _number(
+                        transaction, "transactionAmounts/transactionPricePerShare/value"
+                    ),
+                    "acquired_disposed": _text(
+                        transaction,
+                        "transactionAmounts/transactionAcquiredDisposedCode/value",
+                    ),
+                    "shares_owned_after": _number(
+                        transaction,
+                        "postTransactionAmounts/sharesOwnedFollowingTransaction/value",
+                    ),
+                    "direct_indirect": _text(
+                        transaction, "ownershipNature/directOrIndirectOwnership/value"
+                    ),
+                    "conversion_or_exercise_price": _number(
+                        transaction, "conversionOrExercisePrice/value"
+                    ),
+                    "exercise_date": _text(transaction, "exerciseDate/value"),
+                    "expiration_date": _text(transaction, "expirationDate/value"),
+                    "underlying_security_title": _text(
+                        transaction, "underlyingSecurity/underlyingSecurityTitle/value"
+                    ),
+                    "underlying_shares": _number(
+                        transaction, "underlyingSecurity/underlyingSecurityShares/value"
+                    ),
+                }
+            )
+    return rows
+
+
+def parse_information_table(root, header: dict) -> list[dict]:
+    """
+    Flatten a 13F-HR ``informationTable`` into holding rows.
+
+    ``value_usd`` normalizes the reported value to dollars (filings before
+    2023-01-03 report thousands).
+
+    Args:
+        root: Parsed informationTable element (namespaces stripped)
+        header: Submission header values
+
+    Returns:
+        List of holding row dictionaries
+    """
+    date_filed = _format_date(header.get("date_filed"))
+    multiplier = 1 if (date_filed or "") >= _13F_DOLLAR_VALUE_START else 1000
+    base = {
+        "accession_number": header.get("accession_number"),
+        "form_type": header.get("form_type"),
+        "date_filed": date_filed,
+        "period_of_report": _format_date(header.get("period_of_report")),
+        "filer_cik": str(int(header["cik"])) if header.get("cik") else None,
+        "filer_name": header.get("company_name"),
+    }
+
+    rows = []
+    for entry in root.iterfind("infoTable"):
+        value = _number(entry, "value")
+        rows.append(
+            {
+                **base,
+                "name_of_issuer": _text(entry, "nameOfIssuer"),
+                "title_of_class": _text(entry, "titleOfClass"),
+                "cusip": _text(entry, "cusip"),
+                "figi": _text(entry, "figi"),
+                "value": value,
+                "value_usd": value * multiplier if value is not None else None,
+                "shares": _number(entry, "shrsOrPrnAmt/sshPrnamt"),
+                "share_type": _text(entry, "shrsOrPrnAmt/sshPrnamtType"),
+                "put_call": _text(entry, "putCall"),
+                "investment_discretion": _text(entry, "investmentDiscretion"),
+                "other_manager": _text(entry, "otherManager"),
+                "voting_sole": _number(entry, "votingAuthority/Sole"),
+                "voting_shared": _number(entry, "votingAuthority/Shared"),
+                "voting_none": _number(entry, "votingAuthority/None"),
+            }
+        )
+    return rows
+
+
+def parse_submission(path: str | Path) -> dict[str, list[dict]]:
+    """
+    Parse one complete submission file if it is a Form 4 or 13F-HR.
+
+    Only the header is read for other form types.
+
+    Args:
+        path: Complete submission (.txt) file
+
+    Returns:
+        {"transactions": [...], "holdings": [...]}
+    """
+    tables = {"transactions": [], "holdings": []}
+    header = _read_header(path)
+    form_type = (header.get("form_type") or "").upper()
+    if form_type not in FORM_4_TYPES + FORM_13F_TYPES:
+        return tables
+
+    with open(path, "rb") as f:
+        content = f.read()
+
+    for block in _XML_BLOCK.findall(content):
+        root = _parse_xml(block)
+        if root is None:
+            continue
+        if root.tag == "ownershipDocument":
+            tables["transactions"].extend(parse_ownership_document(root, header))
+        elif root.tag == "informationTable":
+            tables["holdings"].extend(parse_information_table(root, header))
+    return tables
+
+
+def _parse_submission_chunk(args: tuple) -> dict[str, int]:
+    """
+    Process-pool entry point: parse a chunk of submissions and write its rows.
+
+    Each worker writes its own files, so the parent never holds the rows.
+    Submissions that parsed, with or without rows, are then recorded in the
+    processed manifest; failed ones are counted and retried on the next run.
+    """
+    paths, store_dir = args
+    tables = {"transactions": [], "holdings": []}
+    processed, failed = [], 0
+    for path in paths:
+        try:
+            parsed = parse_submission(path)
+        except Exception as e:
+            logger.error(f"Failed to parse {path}: {e}")
+            failed += 1
+            continue
+        processed.append(Path(path).stem)
+        for name, rows in parsed.items():
+            tables[name].extend(rows)
+    counts = {
+        name: _write_table(rows, Path(store_dir) / name, TABLE_SCHEMAS[name])
+        for name, rows in tables.items()
+    }
+    _record_processed(processed, Path(store_dir))
+    return {**counts, "failed": failed}
+
+
+def iter_submission_files(root: str | Path):
+    """
+    Yield complete submission files under a CIK/<accession>.txt data root.
+
+    Args:
+        root: Filing data root (e.g. settings.filings_data_dir)
+
+    Yields:
+        Path of each .txt submission file
+    """
+    root = Path(root)
+    if not root.exists():
+        return
+    with os.scandir(root) as cik_entries:
+        for cik_entry in cik_entries:
+            if not cik_entry.is_dir():
+                continue
+            with os.scandir(cik_entry.path) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(".txt"):
+                        yield Path(entry.path)
+
+
+def _partition_key(date_filed: str | None) -> tuple[int, int]:
+    """(year, quarter) of a YYYY-MM-DD filing date; (0, 0) when unknown."""
+    if date_filed and len(date_filed) >= 7 and date_filed[:4].isdigit():
+        month = date_filed[5:7]
+        if month.isdigit() and 1 <= int(month) <= 12:
+            return int(date_filed[:4]), (int(month) - 1) // 3 + 1
+    return 0, 0
+
+
+def _write_table(rows: list[dict], table_dir: Path, schema: pa.Schema) -> int:
+    """Write rows as one new file per year/qtr partition."""
+    partitions: dict[tuple[int, int], list[dict]] = {}
+    for row in rows:
+        partitions.setdefault(_partition_key(row["date_filed"]), []).append(row)
+
+    name = f"part-{uuid.uuid4().hex}.parquet"
+    for (year, qtr), part in partitions.items():
+        part_path = table_dir / f"year={year}" / f"qtr={qtr}" / name
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = part_path.with_suffix(".parquet.tmp")
+        pq.write_table(
+            pa.Table.from_pylist(part, schema=schema), temp_path, compression="snappy"
+        )
+        os.replace(temp_path, part_path)
+    return len(rows)
+
+
+def _record_processed(accessions: list[str], store_dir: Path) -> None:
+    """Add accessions to the processed manifest as one new file."""
+    if not accessions:
+        return
+    manifest_dir = store_dir / PROCESSED_DIR
+    manifest_dir.mkdir(parents=True, exist_ok=True)
+    path = manifest_dir / f"part-{uuid.uuid4().hex}.txt"
+    temp_path = path.with_suffix(".txt.tmp")
+    temp_path.write_text("".join(f"{a}\n" for a in accessions), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def _processed_accessions(store_dir: Path) -> set[str]:
+    """Accession numbers of every submission parsed by an earlier run."""
+    done = set()
+    for path in (store_dir / PROCESSED_DIR).glob("part-*.txt"):
+        done.update(path.read_text(encoding="utf-8").split())
+    return done
+
+
+def _table_dataset(table_dir: Path, schema: pa.Schema) -> ds.Dataset:
+    """
+    Dataset over a table's partition files, read with the table schema.
+
+    Every partition file is read as that schema, so columns that are null
+    throughout one file still get their declared types.
+    """
+    return ds.dataset(
+        sorted(str(path) for path in table_dir.rglob("*.parquet")),
+        schema=pa.unify_schemas([schema, PARTITION_SCHEMA]),
+        format="parquet",
+        partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+        partition_base_dir=str(table_dir),
+    )
+
+
+def _drop_accessions(table_dir: Path, schema: pa.Schema, accessions: set[str]) -> None:
+    """Remove rows of filings that are about to be parsed again."""
+    if not table_dir.exists() or not accessions:
+        return
+    values = pa.array(sorted(accessions), type=pa.string())
+    for path in sorted(table_dir.rglob("*.parquet")):
+        stored = pq.read_table(path, columns=["accession_number"])
+        if not pc.any(pc.is_in(stored["accession_number"], value_set=values)).as_py():
+            continue
+        table = pq.read_table(path).select(schema.names).cast(schema)
+        table = table.filter(
+            pc.invert(pc.is_in(table["accession_number"], value_set=values))
+        )
+        if table.num_rows == 0:
+            path.unlink()
+            continue
+        temp_path = path.with_suffix(".parquet.tmp")
+        pq.write_table(table, temp_path, compression="snappy")
+        os.replace(temp_path, path)
+
+
+def build_forms_tables(
+    root: str | Path | list[str | Path],
+    store_dir: str | Path | None = None,
+    max_workers: int | None = None,
+    chunk_size: int = 250,
+    force: bool = False,
+    show_progress: bool = False,
+) -> dict:
+    """
+    Parse Form 4 and 13F-HR submissions into partitioned Parquet tables.
+
+    Args:
+        root: Filing data root laid out as CIK/<accession>.txt, or an
+            explicit list of submission files
+        store_dir: Output root (defaults to settings.corpus_dir/forms)
+        max_workers: Process count (defaults to CPUs - 1)
+        chunk_size: Submissions per worker task
+        force: Re-parse submissions recorded as processed by earlier runs
+        show_progress: Display a progress bar
+
+    Returns:
+        Summary with submissions, transactions, holdings and failed counts
+    """
+    store_dir = Path(store_dir or default_forms_store_path())
+    if isinstance(root, (str, Path)):
+        paths = [str(path) for path in iter_submission_files(root)]
+    else:
+        paths = [str(path) for path in root]
+
+    if force:
+        accessions = {Path(path).stem for path in paths}
+        for name, schema in TABLE_SCHEMAS.items():
+            _drop_accessions(store_dir / name, schema, accessions)
+    else:
+        done = _processed_accessions(store_dir)
+        paths = [path for path in paths if Path(path).stem not in done]
+
+    chunks = [
+        (paths[i : i + chunk_size], str(store_dir))
+        for i in range(0, len(paths), chunk_size)
+    ]
+    results = run_parallel(
+        _parse_submission_chunk,
+        chunks,
+        max_workers=max_workers,
+        description="Parsing Form 4 / 13F-HR",
+        show_progress=show_progress,
+    )
+
+    return {
+        "submissions": len(paths),
+        "transactions": sum(r.value["transactions"] for r in results if r.ok),
+        "holdings": sum(r.value["holdings"] for r in results if r.ok),
+        "failed": sum(r.value["failed"] if r.ok else len(r.item[0]) for r in results),
+    }
+
+
+def load_form_table(
+    table: str,
+    store_dir: str | Path | None = None,
+    filters: list | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Read the transactions or holdings table.
+
+    Args:
+        table: "transactions" (Form 4) or "holdings" (13F-HR)
+        store_dir: Output root (defaults to settings.corpus_dir/forms)
+        filters: pyarrow filters, e.g. [("year", "=", 2024)]
+        columns: Columns to read
+
+    Returns:
+        DataFrame (empty if the table does not exist)
+    """
+    if table not in TABLE_SCHEMAS:
+        raise ValueError(f"Unknown form table: {table}")
+    schema = TABLE_SCHEMAS[table]
+    table_dir = Path(store_dir or default_forms_store_path()) / table
+    if not table_dir.exists():
+        return pd.DataFrame(columns=schema.names)
+    return (
+        _table_dataset(table_dir, schema)
+        .to_table(
+            columns=columns,
+            filter=pq.filters_to_expression(filters) if filters else None,
+        )
+        .to_pandas()
+    )
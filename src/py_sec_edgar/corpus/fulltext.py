@@ -0,0 +1,331 @@
+"""
+Local full-text search over extracted filings (SQLite FTS5).
+
+Indexes the plain-text layer of every extracted document together with
+accession number, CIK, form type, document type and filing date. The index
+lives in a single SQLite database (``settings.corpus_dir/fulltext.db``) and
+is updated incrementally: a filing is re-indexed only when its source
+submission hash changes.
+
+Queries use FTS5 syntax, so phrases, boolean operators and prefix matches
+work out of the box:
+
+    ```python
+    from py_sec_edgar.corpus import FullTextIndex
+
+    with FullTextIndex() as index:
+        index.update(settings.filings_data_dir)
+        hits = index.search('"supply chain" AND tariff*', form_type="10-K")
+    ```
+"""
+
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from ..extract import iter_extracted_filings, load_manifest
+from ..settings import settings
+from .sections import normalize_accession
+from .text import build_text_layer, get_document_text, is_text_document
+
+logger = logging.getLogger(__name__)
+
+# Pages of index segments merged at the end of each update
+_MERGE_PAGES = 500
+
+_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS documents USING fts5(
+    content,
+    tokenize = 'porter unicode61'
+);
+CREATE TABLE IF NOT EXISTS document_meta (
+    rowid INTEGER PRIMARY KEY,
+    accession_number TEXT NOT NULL,
+    cik TEXT,
+    form_type TEXT,
+    doc_type TEXT,
+    sequence TEXT,
+    filename TEXT,
+    filing_date TEXT,
+    path TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_meta_accession ON document_meta(accession_number);
+CREATE INDEX IF NOT EXISTS idx_meta_cik ON document_meta(cik);
+CREATE INDEX IF NOT EXISTS idx_meta_form ON document_meta(form_type);
+CREATE INDEX IF NOT EXISTS idx_meta_date ON document_meta(filing_date);
+CREATE TABLE IF NOT EXISTS indexed_filings (
+    accession_number TEXT PRIMARY KEY,
+    directory TEXT,
+    source_sha256 TEXT,
+    document_count INTEGER,
+    indexed_at TEXT
+);
+"""
+
+
+class FullTextSearchError(Exception):
+    """Exception raised for invalid full-text queries or index errors."""
+
+    pass
+
+
+def default_fulltext_db_path() -> Path:
+    """Default location of the full-text index database."""
+    return settings.corpus_dir / "fulltext.db"
+
+
+def _format_date(value: str | None) -> str | None:
+    """Normalize YYYYMMDD / YYYY-MM-DD dates to YYYY-MM-DD."""
+    if not value:
+        return None
+    digits = str(value).replace("-", "")[:8]
+    if len(digits) == 8 and digits.isdigit():
+        return f"{digits[:4]}-{digits[4:6]}-{digits[6:]}"
+    return str(value)
+
+
+class FullTextIndex:
+    """SQLite FTS5 index over the plain-text layer of extracted filings."""
+
+    def __init__(self, db_path: str | Path | None = None):
+        """
+        Open (and create if needed) a full-text index.
+
+        Args:
+            db_path: Database file (defaults to settings.corpus_dir/fulltext.db)
+        """
+        self.db_path = Path(db_path or default_fulltext_db_path())
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def is_indexed(self, accession_number: str, source_sha256: str | None) -> bool:
+        """Whether a filing is indexed from the given source version."""
+        row = self.conn.execute(
+            "SELECT source_sha256 FROM indexed_filings WHERE accession_number = ?",
+            (normalize_accession(accession_number),),
+        ).fetchone()
+        return row is not None and row["source_sha256"] == source_sha256
+
+    def remove_filing(self, accession_number: str) -> None:
+        """Remove all documents of a filing from the index."""
+        accession_number = normalize_accession(accession_number)
+        rowids = [
+            (row["rowid"],)
+            for row in self.conn.execute(
+                "SELECT rowid FROM document_meta WHERE accession_number = ?",
+                (accession_number,),
+            )
+        ]
+        self.conn.executemany("DELETE FROM documents WHERE rowid = ?", rowids)
+        self.conn.execute(
+            "DELETE FROM document_meta WHERE accession_number = ?", (accession_number,)
+        )
+        self.conn.execute(
+            "DELETE FROM indexed_filings WHERE accession_number = ?",
+            (accession_number,),
+        )
+
+    def index_filing(self, filing_directory: str | Path, force: bool = False) -> int:
+        """
+        Add or refresh one extracted filing.
+
+        Args:
+            filing_directory: Extracted filing directory with a manifest
+            force: Re-index even if the source hash is unchanged
+
+        Returns:
+            Number of documents indexed (0 when skipped)
+        """
+        filing_directory = Path(filing_directory)
+        manifest = load_manifest(filing_directory)
+        if not manifest or manifest.get("status") != "complete":
+            return 0
+
+        accession_number = normalize_accession(
+            manifest.get("accession_number") or filing_directory.name
+        )
+        source_sha256 = (manifest.get("source") or {}).get("sha256")
+        if not force and self.is_indexed(accession_number, source_sha256):
+            return 0
+
+        filing_date = _format_date(manifest.get("date_filed"))
+        count = 0
+        with self.conn:
+            self.remove_filing(accession_number)
+            for document in manifest.get("documents", []):
+                if not document.get("path") or not is_text_document(document["path"]):
+                    continue
+                text = get_document_text(
+                    filing_directory, sequence=document.get("sequence")
+                )
+                if not text:
+                    continue
+                cursor = self.conn.execute(
+                    "INSERT INTO documents(content) VALUES (?)", (text,)
+                )
+                self.conn.execute(
+                    "INSERT INTO document_meta(rowid, accession_number, cik, "
+                    "form_type, doc_type, sequence, filename, filing_date, path) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        cursor.lastrowid,
+                        accession_number,
+                        str(int(manifest["cik"])) if manifest.get("cik") else None,
+                        manifest.get("form_type"),
+                        document.get("type"),
+                        str(document.get("sequence")),
+                        document.get("filename"),
+                        filing_date,
+                        str(filing_directory / document["path"]),
+                    ),
+                )
+                count += 1
+            self.conn.execute(
+                "INSERT INTO indexed_filings VALUES (?, ?, ?, ?, ?)",
+                (
+                    accession_number,
+                    str(filing_directory),
+                    source_sha256,
+                    count,
+                    datetime.now().isoformat(timespec="seconds"),
+                ),
+            )
+        return count
+
+    def update(
+        self,
+        root: str | Path,
+        max_workers: int | None = None,
+        force: bool = False,
+        show_progress: bool = False,
+    ) -> dict:
+        """
+        Incrementally index every extracted filing under a data root.
+
+        The text layer is built first in a process pool; indexing itself is
+        a single writer so SQLite never sees concurrent writes.
+
+        Args:
+            root: Filing data root laid out as CIK/FOLDER
+            max_workers: Process count for text conversion
+            force: Re-index filings even if unchanged
+            show_progress: Display a progress bar for text conversion
+
+        Returns:
+            Summary with filings, indexed, skipped and documents counts
+        """
+        build_text_layer(root, max_workers=max_workers, show_progress=show_progress)
+
+        summary = {"filings": 0, "indexed": 0, "skipped": 0, "documents": 0}
+        for directory in iter_extracted_filings(root):
+            summary["filings"] += 1
+            count = self.index_filing(directory, force=force)
+            if count:
+                summary["indexed"] += 1
+                summary["documents"] += count
+            else:
+                summary["skipped"] += 1
+
+        # Bounded incremental merge; a full rebuild is left to optimize()
+        self.conn.execute(
+            "INSERT INTO documents(documents, rank) VALUES ('merge', ?)",
+            (_MERGE_PAGES,),
+        )
+        self.conn.commit()
+        return summary
+
+    def optimize(self) -> None:
+        """
+        Merge the whole FTS5 index into a single b-tree.
+
+        Rewrites the entire index, so it is a maintenance step to run after
+        large loads rather than after every update.
+        """
+        self.conn.execute("INSERT INTO documents(documents) VALUES ('optimize')")
+        self.conn.commit()
+
+    def search(
+        self,
+        query: str,
+        cik: str | int | None = None,
+        form_type: str | None = None,
+        doc_type: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        """
+        Search indexed documents.
+
+        Args:
+            query: FTS5 query, e.g. ``"going concern" AND NOT restatement``
+            cik: Restrict to one company
+            form_type: Restrict to a filing form type (e.g. "10-K")
+            doc_type: Restrict to a document type (e.g. "EX-21.1")
+            date_from: Earliest filing date (YYYY-MM-DD)
+            date_to: Latest filing date (YYYY-MM-DD)
+            limit: Maximum number of hits
+
+        Returns:
+            List of hit dicts ordered by relevance, with a highlighted snippet
+
+        Raises:
+            FullTextSearchError: If the query is not valid FTS5 syntax
+        """
+        sql = [
+            "SELECT m.accession_number, m.cik, m.form_type, m.doc_type, m.sequence,",
+            "m.filename, m.filing_date, m.path, bm25(documents) AS score,",
+            "snippet(documents, 0, '[', ']', ' … ', 12) AS snippet",
+            "FROM documents JOIN document_meta m ON m.rowid = documents.rowid",
+            "WHERE documents MATCH ?",
+        ]
+        params: list = [query]
+        if cik is not None:
+            sql.append("AND m.cik = ?")
+            params.append(str(int(cik)))
+        if form_type:
+            sql.append("AND m.form_type = ?")
+            params.append(form_type.upper())
+        if doc_type:
+            sql.append("AND m.doc_type = ?")
+            params.append(doc_type.upper())
+        if date_from:
+            sql.append("AND m.filing_date >= ?")
+            params.append(_format_date(date_from))
+        if date_to:
+            sql.append("AND m.filing_date <= ?")
+            params.append(_format_date(date_to))
+        sql.append("ORDER BY score LIMIT ?")
+        params.append(limit)
+
+        try:
+            rows = self.conn.execute(" ".join(sql), params).fetchall()
+        except sqlite3.OperationalError as e:
+            raise FullTextSearchError(f"Invalid full-text query {query!r}: {e}")
+        return [dict(row) for row in rows]
+
+    def stats(self) -> dict:
+        """Return filing and document counts for the index."""
+        filings = self.conn.execute("SELECT COUNT(*) FROM indexed_filings").fetchone()
+        documents = self.conn.execute("SELECT COUNT(*) FROM document_meta").fetchone()
+        return {"filings": filings[0], "documents": documents[0]}
+
+
+def search_text(query: str, db_path: str | Path | None = None, **filters) -> list[dict]:
+    """Convenience wrapper: search the default full-text index."""
+    with FullTextIndex(db_path) as index:
+        return index.search(query, **filters)
@@ -0,0 +1,365 @@
+"""
+Item section index for 10-K and 10-Q filings.
+
+Locates "Item N" headings (and "Part I/II" for 10-Q) in the plain-text layer
+of each filing's primary document and persists their byte offsets to a
+Parquet index. Retrieving a section is then an index lookup plus a single
+seek/read of the cached text file:
+
+    ```python
+    from py_sec_edgar.corpus import build_section_index, get_section
+
+    build_section_index(settings.filings_data_dir, max_workers=8)
+    risk_factors = get_section("0000320193-24-000123", "1A")
+    mdna = get_section("0000320193-24-000081", "2", part="I")  # 10-Q MD&A
+    ```
+
+Table-of-contents entries are skipped by keeping, for every item, the
+heading occurrence that spans the most text before the next heading.
+
+Rows store the filing directory and the text path relative to it. When the
+cached text is gone (re-extraction clears it), ``get_section`` converts the
+document again; the offsets stay valid while the document hash matches.
+"""
+
+import logging
+import os
+import re
+from pathlib import Path
+
+import pandas as pd
+
+from ..core.parallel import run_parallel
+from ..extract import iter_extracted_filings, load_manifest
+from ..settings import settings
+from .text import get_document_text, is_text_document, text_layer_path
+
+logger = logging.getLogger(__name__)
+
+SECTION_FORM_PREFIXES = ("10-K", "10-Q")
+
+SECTION_COLUMNS = [
+    "accession_number",
+    "cik",
+    "form_type",
+    "date_filed",
+    "document_sha256",
+    "filing_directory",
+    "text_path",
+    "part",
+    "item",
+    "title",
+    "start_byte",
+    "end_byte",
+]
+
+# Headings must start the line; long lines are body text that merely
+# mentions an item ("as described in Item 1A ...").
+_ITEM_HEADING = re.compile(
+    r"^item\s+(\d{1,2}[a-c]?)\s*(?:[.:\-–—]|\s|$)\s*(.*)$", re.IGNORECASE
+)
+_PART_HEADING = re.compile(r"^part\s+(iv|iii|ii|i)\b", re.IGNORECASE)
+_MAX_HEADING_LENGTH = 200
+
+
+def default_section_index_path() -> Path:
+    """Default location of the persisted section index."""
+    return settings.corpus_dir / "sections.parquet"
+
+
+def normalize_accession(accession: str) -> str:
+    """Return an accession number in 0000000000-00-000000 form."""
+    digits = re.sub(r"\D", "", str(accession))
+    if len(digits) != 18:
+        return str(accession)
+    return f"{digits[:10]}-{digits[10:12]}-{digits[12:]}"
+
+
+def is_sectioned_form(form_type: str | None) -> bool:
+    """Whether a form type uses Item sections (10-K and 10-Q families)."""
+    return bool(form_type) and form_type.upper().startswith(SECTION_FORM_PREFIXES)
+
+
+def segment_sections(text: str, form_type: str = "10-K") -> list[dict]:
+    """
+    Find Item sections in filing text.
+
+    Args:
+        text: Plain text of the primary document
+        form_type: Form type; 10-Q items are qualified by their Part
+
+    Returns:
+        List of dicts with part, item, title, start_byte and end_byte
+        (UTF-8 byte offsets into ``text``), ordered by position
+    """
+    use_parts = bool(form_type) and form_type.upper().startswith("10-Q")
+
+    headings = []
+    current_part = None
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        stripped = line.strip()
+        if stripped and len(stripped) <= _MAX_HEADING_LENGTH:
+            part_match = _PART_HEADING.match(stripped)
+            if part_match:
+                current_part = part_match.group(1).upper()
+                headings.append((offset, current_part, None, stripped))
+            else:
+                item_match = _ITEM_HEADING.match(stripped)
+                if item_match:
+                    item = item_match.group(1).upper()
+                    title = item_match.group(2).strip(" .:-\t")
+                    part = current_part if use_parts else None
+                    headings.append((offset, part, item, title))
+        offset += len(line.encode("utf-8"))
+    total_bytes = offset
+
+    # Span of each heading runs to the next heading of any kind
+    best: dict[tuple, tuple] = {}
+    for index, (start, part, item, title) in enumerate(headings):
+        if item is None:
+            continue
+        end = headings[index + 1][0] if index + 1 < len(headings) else total_bytes
+        key = (part, item)
+        if key not in best or end - start > best[key][1] - best[key][0]:
+            best[key] = (start, end, title)
+
+    # A chosen section ends at the next Part heading or chosen Item heading
+    chosen_starts = {start for start, _, _ in best.values()}
+    boundaries = [
+        start
+        for start, _, item, _ in headings
+        if item is None or start in chosen_starts
+    ]
+    sections = []
+    for (part, item), (start, _, title) in sorted(
+        best.items(), key=lambda entry: entry[1][0]
+    ):
+        end = next((b for b in boundaries if b > start), total_bytes)
+        sections.append(
+            {
+                "part": part,
+                "item": item,
+                "title": title,
+                "start_byte": start,
+                "end_byte": end,
+            }
+        )
+    return sections
+
+
+def _primary_document(manifest: dict) -> dict | None:
+    """Pick the main 10-K/10-Q document from a manifest."""
+    form_type = (manifest.get("form_type") or "").upper()
+    candidates = [
+        doc
+        for doc in manifest.get("documents", [])
+        if doc.get("path") and doc.get("sha256") and is_text_document(doc["path"])
+    ]
+    for doc in candidates:
+        if doc.get("type", "").upper() == form_type:
+            return doc
+    return candidates[0] if candidates else None
+
+
+def index_filing_sections(filing_directory: str | Path) -> list[dict]:
+    """
+    Segment the primary document of one extracted filing.
+
+    Args:
+        filing_directory: Extracted filing directory with a manifest
+
+    Returns:
+        Section index rows (see SECTION_COLUMNS); empty for other form types.
+        A filing without Item headings gets one row with a null item, so it
+        is recorded as indexed and not segmented again.
+    """
+    filing_directory = Path(filing_directory)
+    manifest = load_manifest(filing_directory)
+    if not manifest:
+        return []
+
+    document = _primary_document(manifest)
+    form_type = manifest.get("form_type") or (document or {}).get("type")
+    if document is None or not is_sectioned_form(form_type):
+        return []
+
+    text = get_document_text(filing_directory, sequence=document["sequence"]) or ""
+    text_path = text_layer_path(filing_directory, document["sha256"])
+    filing = {
+        "accession_number": normalize_accession(
+            manifest.get("accession_number") or filing_directory.name
+        ),
+        "cik": str(manifest.get("cik") or ""),
+        "form_type": form_type,
+        "date_filed": str(manifest.get("date_filed") or ""),
+        "document_sha256": document["sha256"],
+        "filing_directory": str(filing_directory.resolve()),
+        "text_path": text_path.relative_to(filing_directory).as_posix(),
+    }
+    sections = segment_sections(text, form_type) or [
+        {"part": None, "item": None, "title": None, "start_byte": 0, "end_byte": 0}
+    ]
+    return [{**filing, **section} for section in sections]
+
+
+def load_section_index(index_path: str | Path | None = None) -> pd.DataFrame:
+    """
+    Load the persisted section index.
+
+    Args:
+        index_path: Index file (defaults to settings.corpus_dir/sections.parquet)
+
+    Returns:
+        DataFrame with SECTION_COLUMNS (empty if no index exists)
+    """
+    index_path = Path(index_path or default_section_index_path())
+    if not index_path.exists():
+        return pd.DataFrame(columns=SECTION_COLUMNS)
+    return pd.read_parquet(index_path)
+
+
+def _write_section_index(df: pd.DataFrame, index_path: Path) -> None:
+    """Write the section index atomically."""
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = index_path.with_suffix(".parquet.tmp")
+    df.to_parquet(temp_path, index=False)
+    os.replace(temp_path, index_path)
+
+
+def build_section_index(
+    root: str | Path,
+    index_path: str | Path | None = None,
+    max_workers: int | None = None,
+    force: bool = False,
+    show_progress: bool = False,
+) -> dict:
+    """
+    Build or update the section index for all extracted 10-K/10-Q filings.
+
+    Filings whose primary document hash is already indexed are skipped
+    unless ``force`` is set, so reruns only segment new or changed filings.
+
+    Args:
+        root: Filing data root laid out as CIK/FOLDER
+        index_path: Index file (defaults to settings.corpus_dir/sections.parquet)
+        max_workers: Process count (defaults to CPUs - 1)
+        force: Re-segment filings that are already indexed
+        show_progress: Display a progress bar
+
+    Returns:
+        Summary with filings, indexed, skipped, failed and sections counts
+    """
+    index_path = Path(index_path or default_section_index_path())
+    existing = load_section_index(index_path)
+    indexed_hashes = set() if force else set(existing["document_sha256"])
+
+    directories = []
+    skipped = 0
+    for directory in iter_extracted_filings(root):
+        manifest = load_manifest(directory)
+        if not manifest or not is_sectioned_form(manifest.get("form_type")):
+            skipped += 1
+            continue
+        document = _primary_document(manifest)
+        if document is None or document["sha256"] in indexed_hashes:
+            skipped += 1
+            continue
+        directories.append(str(directory))
+
+    results = run_parallel(
+        index_filing_sections,
+        directories,
+        max_workers=max_workers,
+        description="Indexing sections",
+        show_progress=show_progress,
+    )
+
+    new_rows = [row for result in results if result.ok for row in result.value]
+    if new_rows:
+        new_df = pd.DataFrame(new_rows, columns=SECTION_COLUMNS)
+        keep = ~existing["accession_number"].isin(new_df["accession_number"])
+        frames = [df for df in (existing[keep], new_df) if not df.empty]
+        _write_section_index(pd.concat(frames, ignore_index=True), index_path)
+
+    return {
+        "filings": len(directories) + skipped,
+        "indexed": sum(1 for result in results if result.ok),
+        "skipped": skipped,
+        "failed": sum(1 for result in results if not result.ok),
+        "sections": sum(1 for row in new_rows if row["item"] is not None),
+    }
+
+
+def get_section(
+    accession: str,
+    item: str,
+    part: str | None = None,
+    index_path: str | Path | None = None,
+) -> str | None:
+    """
+    Return the text of one Item section of a filing.
+
+    Args:
+        accession: Accession number (with or without dashes)
+        item: Item number, e.g. "1A", "7", "8"
+        part: Part for 10-Q filings ("I" or "II"); defaults to the first match
+        index_path: Index file (defaults to settings.corpus_dir/sections.parquet)
+
+    Returns:
+        Section text, or None if the section is not indexed
+    """
+    index_path = Path(index_path or default_section_index_path())
+    if not index_path.exists():
+        return None
+
+    filters = [
+        ("accession_number", "==", normalize_accession(accession)),
+        ("item", "==", str(item).upper().replace("ITEM", "").strip()),
+    ]
+    if part:
+        filters.append(("part", "==", str(part).upper().replace("PART", "").strip()))
+
+    matches = pd.read_parquet(index_path, filters=filters)
+    if matches.empty:
+        return None
+
+    row = matches.sort_values("start_byte").iloc[0]
+    text_path = _section_text_path(row)
+    if text_path is None:
+        return None
+    with open(text_path, "rb") as f:
+        f.seek(int(row["start_byte"]))
+        return f.read(int(row["end_byte"]) - int(row["start_byte"])).decode("utf-8")
+
+
+def _section_text_path(row: pd.Series) -> Path | None:
+    """
+    Path of the cached text an index row points into, converting it again
+    when the text layer was cleared.
+
+    Returns None when the filing's primary document changed since indexing,
+    since the offsets no longer apply.
+    """
+    filing_directory = Path(row["filing_directory"])
+    text_path = filing_directory / row["text_path"]
+    if text_path.exists():
+        return text_path
+
+    manifest = load_manifest(filing_directory) or {}
+    document = next(
+        (
+            doc
+            for doc in manifest.get("documents", [])
+            if doc.get("sha256") == row["document_sha256"]
+        ),
+        None,
+    )
+    if document is None:
+        logger.warning(
+            f"{row['accession_number']} changed since it was indexed; "
+            "rebuild the section index"
+        )
+        return None
+    get_document_text(filing_directory, sequence=document["sequence"])
+    return text_path if text_path.exists() else None
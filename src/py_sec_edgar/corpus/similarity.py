@@ -0,0 +1,697 @@
+"""
+Near-duplicate and change detection with MinHash LSH.
+
+Every text document and every 10-K/10-Q Item section of an extracted filing
+is reduced to a fixed-size MinHash signature of its word shingles. Shingle
+hashing and the min-wise permutations are vectorized with NumPy, so a
+signature costs a few array passes regardless of document length.
+Signatures are banded for locality-sensitive hashing and persisted to an
+index directory (``settings.corpus_dir/similarity``) of append-only
+segments. Each segment is a Parquet file of signature rows plus, for every
+band, the bucket keys sorted alongside their row ids; candidate lookup is a
+binary search per band instead of pairwise diffing:
+
+    ```python
+    from py_sec_edgar.corpus.similarity import (
+        build_similarity_index,
+        compare_with_previous,
+        find_near_duplicates,
+    )
+
+    build_similarity_index(settings.filings_data_dir, max_workers=8)
+
+    # How much did the risk factors change since last year's 10-K?
+    compare_with_previous("0000320193-24-000123", key="1A")
+
+    # Boilerplate exhibits shared with other filers
+    find_near_duplicates("0000320193-24-000123", scope="document", key="2")
+    ```
+
+Signature rows carry a ``scope`` ("document" or "section") and a ``key``:
+the document sequence number, or the Item number (``"I.2"`` for 10-Q items
+qualified by Part).
+"""
+
+import logging
+import os
+import re
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from ..core.parallel import run_parallel
+from ..extract import iter_extracted_filings, load_manifest
+from ..settings import settings
+from .sections import (
+    _primary_document,
+    is_sectioned_form,
+    normalize_accession,
+    segment_sections,
+)
+from .text import get_document_text, is_text_document
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 5
+NUM_PERM = 128
+# 16 bands of 8 rows: pairs above ~0.7 Jaccard collide in at least one band
+NUM_BANDS = 16
+ROWS_PER_BAND = NUM_PERM // NUM_BANDS
+DEFAULT_THRESHOLD = 0.8
+
+BAND_COLUMNS = [f"band_{band}" for band in range(NUM_BANDS)]
+SIGNATURE_COLUMNS = [
+    "accession_number",
+    "cik",
+    "form_type",
+    "date_filed",
+    "source_sha256",
+    "scope",
+    "key",
+    "doc_type",
+    "document_sha256",
+    "shingles",
+    "signature",
+    *BAND_COLUMNS,
+]
+_ID_COLUMNS = [column for column in SIGNATURE_COLUMNS if column != "signature"]
+
+_WORD = re.compile(r"\w+")
+_MIX = np.uint64(0x9E3779B97F4A7C15)
+_BLOCK_SIZE = 4096
+
+# Key-value metadata of a signatures segment listing the accessions it holds
+_ACCESSIONS_KEY = b"py_sec_edgar.accessions"
+
+
+def _splitmix64(values: np.ndarray) -> np.ndarray:
+    """SplitMix64 of each value; uint64 arithmetic wraps as intended."""
+    z = values.astype(np.uint64) * _MIX + _MIX
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+# Derived from the permutation index so that signatures are comparable
+# across runs, machines and NumPy versions
+_PERM_A = _splitmix64(np.arange(NUM_PERM)) | np.uint64(1)
+_PERM_B = _splitmix64(np.arange(NUM_PERM, 2 * NUM_PERM))
+
+
+def default_similarity_index_path() -> Path:
+    """Default location of the persisted signature index."""
+    return settings.corpus_dir / "similarity"
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """
+    Hash the distinct word shingles of a text.
+
+    Only the distinct words are hashed in Python; shingles are combined from
+    the per-token hashes with a rolling polynomial over a sliding window.
+
+    Args:
+        text: Plain text
+        size: Words per shingle
+
+    Returns:
+        Sorted array of unique uint64 shingle hashes (empty for blank text)
+    """
+    tokens = _WORD.findall(text.lower())
+    if not tokens:
+        return np.empty(0, dtype=np.uint64)
+
+    inverse, vocabulary = pd.factorize(pd.Series(tokens, dtype=object))
+    word_hashes = np.fromiter(
+        (zlib.crc32(word.encode("utf-8")) for word in vocabulary),
+        dtype=np.uint64,
+        count=len(vocabulary),
+    )
+    token_hashes = word_hashes[inverse]
+
+    window = min(size, len(token_hashes))
+    windows = np.lib.stride_tricks.sliding_window_view(token_hashes, window)
+    shingles = np.zeros(len(windows), dtype=np.uint64)
+    for column in range(window):
+        shingles = shingles * _MIX + windows[:, column]
+    return np.unique(shingles)
+
+
+def minhash_signature(hashes: np.ndarray) -> np.ndarray:
+    """
+    MinHash signature of a set of shingle hashes.
+
+    Args:
+        hashes: uint64 shingle hashes (see ``shingle_hashes``)
+
+    Returns:
+        uint32 array of NUM_PERM minimum permuted hashes
+    """
+    signature = np.full(NUM_PERM, np.iinfo(np.uint32).max, dtype=np.uint32)
+    for start in range(0, len(hashes), _BLOCK_SIZE):
+        block = hashes[start : start + _BLOCK_SIZE]
+        # Multiply-shift hashing: the high 32 bits of a*x + b (mod 2**64)
+        permuted = (np.outer(_PERM_A, block) + _PERM_B[:, None]) >> np.uint64(32)
+        np.minimum(signature, permuted.min(axis=1).astype(np.uint32), out=signature)
+    return signature
+
+
+def band_keys(signature: np.ndarray) -> np.ndarray:
+    """Collapse each LSH band of a signature into one int64 bucket key."""
+    bands = signature.reshape(NUM_BANDS, ROWS_PER_BAND).astype(np.uint64)
+    keys = np.zeros(NUM_BANDS, dtype=np.uint64)
+    for row in range(ROWS_PER_BAND):
+        keys = keys * _MIX + bands[:, row]
+    return keys.view(np.int64)
+
+
+def estimate_similarity(signature: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """
+    Estimated Jaccard similarity between one signature and many.
+
+    Args:
+        signature: uint32 signature of length NUM_PERM
+        others: (n, NUM_PERM) array of signatures
+
+    Returns:
+        float array of n similarity estimates in [0, 1]
+    """
+    return (np.atleast_2d(others) == signature).mean(axis=1)
+
+
+def _signature_row(text: str, **fields) -> dict | None:
+    """Signature index row for one text, or None if it has no words."""
+    hashes = shingle_hashes(text)
+    if hashes.size == 0:
+        return None
+    signature = minhash_signature(hashes)
+    return {
+        **fields,
+        "shingles": int(hashes.size),
+        "signature": signature.tobytes(),
+        **dict(zip(BAND_COLUMNS, band_keys(signature).tolist(), strict=True)),
+    }
+
+
+def filing_signatures(filing_directory: str | Path) -> list[dict]:
+    """
+    Compute signatures for one extracted filing.
+
+    Every text document gets a "document" row keyed by its sequence number;
+    10-K/10-Q filings additionally get a "section" row per Item of the
+    primary document.
+
+    Args:
+        filing_directory: Extracted filing directory with a manifest
+
+    Returns:
+        Signature index rows (see SIGNATURE_COLUMNS)
+    """
+    filing_directory = Path(filing_directory)
+    manifest = load_manifest(filing_directory)
+    if not manifest or manifest.get("status") != "complete":
+        return []
+
+    form_type = manifest.get("form_type")
+    filing = {
+        "accession_number": normalize_accession(
+            manifest.get("accession_number") or filing_directory.name
+        ),
+        "cik": str(int(manifest["cik"])) if manifest.get("cik") else "",
+        "form_type": form_type,
+        "date_filed": str(manifest.get("date_filed") or "").replace("-", ""),
+        "source_sha256": (manifest.get("source") or {}).get("sha256"),
+    }
+
+    rows = []
+    for document in manifest.get("documents", []):
+        if not document.get("path") or not is_text_document(document["path"]):
+            continue
+        text = get_document_text(filing_directory, sequence=document.get("sequence"))
+        row = text and _signature_row(
+            text,
+            **filing,
+            scope="document",
+            key=str(document.get("sequence")),
+            doc_type=document.get("type"),
+            document_sha256=document.get("sha256"),
+        )
+        if row:
+            rows.append(row)
+
+    primary = _primary_document(manifest)
+    if primary is not None and is_sectioned_form(form_type):
+        raw = (
+            get_document_text(filing_directory, sequence=primary["sequence"]) or ""
+        ).encode("utf-8")
+        for section in segment_sections(raw.decode("utf-8"), form_type):
+            text = raw[section["start_byte"] : section["end_byte"]].decode("utf-8")
+            key = section["item"]
+            if section["part"]:
+                key = f"{section['part']}.{key}"
+            row = _signature_row(
+                text,
+                **filing,
+                scope="section",
+                key=key,
+                doc_type=primary.get("type"),
+                document_sha256=primary.get("sha256"),
+            )
+            if row:
+                rows.append(row)
+    return rows
+
+
+def _segments(index_dir: Path) -> list[int]:
+    """Committed segment numbers, oldest first."""
+    if not index_dir.is_dir():
+        return []
+    return sorted(
+        int(path.stem.rpartition("-")[2])
+        for path in index_dir.glob("signatures-*.parquet")
+    )
+
+
+def _segment_path(index_dir: Path, kind: str, segment: int, suffix: str) -> Path:
+    """File of one segment: signatures, buckets or bucket_rows."""
+    return index_dir / f"{kind}-{segment:06d}{suffix}"
+
+
+def _segment_catalog(index_dir: Path) -> tuple[list[int], np.ndarray, list[set]]:
+    """
+    Segments, their first row ids and the accessions each one holds.
+
+    Everything comes from the Parquet footers; no rows are read. Row ids are
+    assigned consecutively across segments, so the returned array has one
+    more entry than there are segments: the next free row id.
+    """
+    segments = _segments(index_dir)
+    sizes, accessions = [], []
+    for segment in segments:
+        metadata = pq.read_metadata(
+            _segment_path(index_dir, "signatures", segment, ".parquet")
+        )
+        sizes.append(metadata.num_rows)
+        listed = (metadata.metadata or {}).get(_ACCESSIONS_KEY, b"")
+        accessions.append(set(listed.decode("utf-8").split()))
+    starts = np.concatenate([[0], np.cumsum(sizes, dtype=np.int64)])
+    return segments, starts, accessions
+
+
+def _live_rows(frame: pd.DataFrame, catalog: tuple) -> pd.DataFrame:
+    """Drop rows of filings that were indexed again in a later segment."""
+    _, starts, accessions = catalog
+    owners = np.searchsorted(starts, frame["row_id"].to_numpy(), side="right") - 1
+    superseded = np.zeros(len(frame), dtype=bool)
+    for later in range(1, len(accessions)):
+        superseded |= (owners < later) & frame["accession_number"].isin(
+            accessions[later]
+        ).to_numpy()
+    return frame[~superseded].reset_index(drop=True)
+
+
+def _read_rows(
+    index_dir: Path,
+    catalog: tuple,
+    columns: list[str],
+    filter: ds.Expression | None = None,
+) -> pd.DataFrame:
+    """
+    Live index rows matching a filter, read with the filter pushed down.
+
+    Args:
+        index_dir: Index directory
+        catalog: Result of ``_segment_catalog``
+        columns: Columns to return besides "row_id"
+        filter: Dataset filter expression (all rows if omitted)
+
+    Returns:
+        DataFrame with "row_id" and the requested columns
+    """
+    segments = catalog[0]
+    columns = ["row_id", *(c for c in columns if c != "row_id")]
+    if not segments:
+        return pd.DataFrame(columns=columns)
+    read_columns = list(dict.fromkeys([*columns, "accession_number"]))
+    dataset = ds.dataset(
+        [
+            str(_segment_path(index_dir, "signatures", segment, ".parquet"))
+            for segment in segments
+        ],
+        format="parquet",
+    )
+    frame = dataset.to_table(columns=read_columns, filter=filter).to_pandas()
+    return _live_rows(frame, catalog)[columns]
+
+
+def load_similarity_index(
+    index_path: str | Path | None = None, columns: list[str] | None = None
+) -> pd.DataFrame:
+    """
+    Load the live rows of the persisted signature index.
+
+    Rows of a filing that was indexed again in a later segment are dropped.
+
+    Args:
+        index_path: Index directory (defaults to settings.corpus_dir/similarity)
+        columns: Subset of SIGNATURE_COLUMNS to read; "row_id" is always
+            included
+
+    Returns:
+        DataFrame of signature rows (empty if no index exists)
+    """
+    index_dir = Path(index_path or default_similarity_index_path())
+    return _read_rows(
+        index_dir, _segment_catalog(index_dir), list(columns or SIGNATURE_COLUMNS)
+    )
+
+
+def _write_segment(index_dir: Path, segment: int, first_row: int, df: pd.DataFrame):
+    """
+    Append one segment: its signature rows plus a per-band sorted bucket table.
+
+    ``buckets`` holds every band's keys sorted within the band and
+    ``bucket_rows`` the matching row ids, both as (NUM_BANDS, n) arrays, so a
+    lookup is a binary search per band. The signatures file lists the
+    segment's accessions in its footer; it is written last and marks the
+    segment as committed.
+    """
+    index_dir.mkdir(parents=True, exist_ok=True)
+    row_ids = np.arange(first_row, first_row + len(df), dtype=np.int64)
+    df = df.assign(row_id=row_ids)[["row_id", *SIGNATURE_COLUMNS]]
+
+    bands = df[BAND_COLUMNS].to_numpy(dtype=np.int64).T
+    order = np.argsort(bands, axis=1, kind="stable")
+    for kind, array in (
+        ("buckets", np.take_along_axis(bands, order, axis=1)),
+        ("bucket_rows", row_ids[order]),
+    ):
+        path = _segment_path(index_dir, kind, segment, ".npy")
+        temp_path = path.with_suffix(".npy.tmp")
+        with open(temp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(array))
+        os.replace(temp_path, path)
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    accessions = "\n".join(sorted(set(df["accession_number"])))
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), _ACCESSIONS_KEY: accessions.encode("utf-8")}
+    )
+    path = _segment_path(index_dir, "signatures", segment, ".parquet")
+    temp_path = path.with_suffix(".parquet.tmp")
+    pq.write_table(table, temp_path)
+    os.replace(temp_path, path)
+
+
+def build_similarity_index(
+    root: str | Path,
+    index_path: str | Path | None = None,
+    max_workers: int | None = None,
+    force: bool = False,
+    show_progress: bool = False,
+) -> dict:
+    """
+    Build or update the signature index for all extracted filings.
+
+    Filings already indexed from the same source submission are skipped
+    unless ``force`` is set. New signatures are appended as a new segment;
+    existing segments are never rewritten, and rows of re-indexed filings
+    in older segments are ignored on read.
+
+    Args:
+        root: Filing data root laid out as CIK/FOLDER
+        index_path: Index directory (defaults to settings.corpus_dir/similarity)
+        max_workers: Process count (defaults to CPUs - 1)
+        force: Recompute signatures for filings that are already indexed
+        show_progress: Display a progress bar
+
+    Returns:
+        Summary with filings, indexed, skipped, failed and signatures counts
+    """
+    index_dir = Path(index_path or default_similarity_index_path())
+    existing = load_similarity_index(
+        index_dir, columns=["accession_number", "source_sha256"]
+    )
+    indexed = (
+        set()
+        if force
+        else set(
+            zip(existing["accession_number"], existing["source_sha256"], strict=True)
+        )
+    )
+
+    directories = []
+    skipped = 0
+    for directory in iter_extracted_filings(root):
+        manifest = load_manifest(directory) or {}
+        accession = normalize_accession(
+            manifest.get("accession_number") or Path(directory).name
+        )
+        source_sha256 = (manifest.get("source") or {}).get("sha256")
+        if (accession, source_sha256) in indexed:
+            skipped += 1
+            continue
+        directories.append(str(directory))
+
+    results = run_parallel(
+        filing_signatures,
+        directories,
+        max_workers=max_workers,
+        description="Computing signatures",
+        show_progress=show_progress,
+    )
+
+    new_rows = [row for result in results if result.ok for row in result.value]
+    if new_rows:
+        segments, starts, _ = _segment_catalog(index_dir)
+        _write_segment(
+            index_dir,
+            segments[-1] + 1 if segments else 1,
+            int(starts[-1]),
+            pd.DataFrame(new_rows, columns=SIGNATURE_COLUMNS),
+        )
+
+    return {
+        "filings": len(directories) + skipped,
+        "indexed": sum(1 for result in results if result.ok),
+        "skipped": skipped,
+        "failed": sum(1 for result in results if not result.ok),
+        "signatures": len(new_rows),
+    }
+
+
+def _read_signatures(index_dir: Path, row_ids: np.ndarray) -> np.ndarray:
+    """
+    Signatures of the given rows as an (n, NUM_PERM) array, in input order.
+
+    Each segment holding any of the rows is read once.
+    """
+    row_ids = np.asarray(row_ids, dtype=np.int64)
+    signatures = np.empty((len(row_ids), NUM_PERM), dtype=np.uint32)
+    if len(row_ids) == 0:
+        return signatures
+    segments, starts, _ = _segment_catalog(index_dir)
+    owners = np.searchsorted(starts, row_ids, side="right") - 1
+    for owner in np.unique(owners):
+        selected = np.flatnonzero(owners == owner)
+        column = pq.read_table(
+            _segment_path(index_dir, "signatures", segments[owner], ".parquet"),
+            columns=["signature"],
+            memory_map=True,
+        )["signature"]
+        values = column.take(row_ids[selected] - starts[owner]).to_pylist()
+        signatures[selected] = np.frombuffer(b"".join(values), dtype=np.uint32).reshape(
+            -1, NUM_PERM
+        )
+    return signatures
+
+
+def _bucket_candidates(
+    index_dir: Path, keys: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rows sharing at least one LSH bucket with each query.
+
+    Args:
+        index_dir: Index directory
+        keys: (q, NUM_BANDS) band keys of the queries
+
+    Returns:
+        Parallel arrays of query positions and candidate row ids, one entry
+        per distinct (query, row) pair
+    """
+    queries, rows = [], []
+    for segment in _segments(index_dir):
+        buckets = np.load(
+            _segment_path(index_dir, "buckets", segment, ".npy"), mmap_mode="r"
+        )
+        bucket_rows = np.load(
+            _segment_path(index_dir, "bucket_rows", segment, ".npy"), mmap_mode="r"
+        )
+        for band in range(NUM_BANDS):
+            starts = np.searchsorted(buckets[band], keys[:, band], side="left")
+            ends = np.searchsorted(buckets[band], keys[:, band], side="right")
+            for query in np.flatnonzero(ends > starts):
+                found = np.asarray(bucket_rows[band, starts[query] : ends[query]])
+                rows.append(found)
+                queries.append(np.full(len(found), query, dtype=np.int64))
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    pairs = np.unique(
+        np.column_stack([np.concatenate(queries), np.concatenate(rows)]), axis=0
+    )
+    return pairs[:, 0], pairs[:, 1]
+
+
+def _query_filter(accession: str, scope: str | None, key: str | None) -> ds.Expression:
+    """Filter selecting the rows of one filing, optionally by scope and key."""
+    expression = ds.field("accession_number") == normalize_accession(accession)
+    if scope:
+        expression &= ds.field("scope") == scope
+    if key is not None:
+        expression &= ds.field("key") == str(key).upper()
+    return expression
+
+
+def find_near_duplicates(
+    accession: str,
+    key: str | None = None,
+    scope: str | None = None,
+    threshold: float = DEFAULT_THRESHOLD,
+    index_path: str | Path | None = None,
+) -> pd.DataFrame:
+    """
+    Find documents or sections of other filings that nearly match a filing.
+
+    Only the query filing's rows are read, with the filter pushed down to
+    the segments. Candidates are looked up in the per-band bucket tables by
+    binary search, then just the candidate rows and their signatures are
+    read to estimate Jaccard similarity.
+
+    Args:
+        accession: Accession number of the query filing
+        key: Restrict the query to one document sequence or section item
+        scope: Restrict to "document" or "section" rows
+        threshold: Minimum estimated similarity
+        index_path: Index directory (defaults to settings.corpus_dir/similarity)
+
+    Returns:
+        DataFrame of matching rows with ``query_key`` and ``similarity``
+        columns, most similar first
+    """
+    index_dir = Path(index_path or default_similarity_index_path())
+    columns = [*_ID_COLUMNS, "query_key", "similarity"]
+    catalog = _segment_catalog(index_dir)
+    queries = _read_rows(
+        index_dir, catalog, _ID_COLUMNS, _query_filter(accession, scope, key)
+    )
+    if queries.empty:
+        return pd.DataFrame(columns=columns)
+
+    query_positions, row_ids = _bucket_candidates(
+        index_dir, queries[BAND_COLUMNS].to_numpy(dtype=np.int64)
+    )
+    # Only the candidate rows are read; superseded ones are dropped on read
+    rows = _read_rows(
+        index_dir,
+        catalog,
+        _ID_COLUMNS,
+        ds.field("row_id").isin(np.unique(row_ids)),
+    ).set_index("row_id")
+    live = np.isin(row_ids, rows.index.to_numpy())
+    query_positions, row_ids = query_positions[live], row_ids[live]
+    found = rows.loc[row_ids, _ID_COLUMNS].reset_index(drop=True)
+    keep = (
+        (found["accession_number"] != normalize_accession(accession))
+        & (found["scope"].to_numpy() == queries["scope"].to_numpy()[query_positions])
+    ).to_numpy()
+    query_positions, row_ids, found = (
+        query_positions[keep],
+        row_ids[keep],
+        found[keep].reset_index(drop=True),
+    )
+
+    query_ids = queries["row_id"].to_numpy(dtype=np.int64)
+    wanted = np.unique(np.concatenate([query_ids, row_ids]))
+    signatures = _read_signatures(index_dir, wanted)
+    similarity = (
+        signatures[np.searchsorted(wanted, row_ids)]
+        == signatures[np.searchsorted(wanted, query_ids)][query_positions]
+    ).mean(axis=1)
+
+    matched = similarity >= threshold
+    result = found[matched].reset_index(drop=True)
+    result["query_key"] = queries["key"].to_numpy()[query_positions[matched]]
+    result["similarity"] = similarity[matched]
+    return result.sort_values("similarity", ascending=False, ignore_index=True)[columns]
+
+
+def compare_with_previous(
+    accession: str,
+    key: str | None = None,
+    scope: str = "section",
+    index_path: str | Path | None = None,
+) -> pd.DataFrame:
+    """
+    Compare a filing with the same company's previous filing of the same form.
+
+    For every section (or document) of the filing, finds the most recent
+    earlier filing by the same CIK and form type that has the same key and
+    estimates how similar the two texts are. A similarity near 1.0 means the
+    section barely changed.
+
+    Args:
+        accession: Accession number of the filing
+        key: Restrict to one section item or document sequence
+        scope: "section" (default) or "document"
+        index_path: Index directory (defaults to settings.corpus_dir/similarity)
+
+    Returns:
+        DataFrame with key, previous_accession, previous_date_filed and
+        similarity columns (keys without a previous filing are omitted)
+    """
+    index_dir = Path(index_path or default_similarity_index_path())
+    columns = ["key", "previous_accession", "previous_date_filed", "similarity"]
+    catalog = _segment_catalog(index_dir)
+    queries = _read_rows(
+        index_dir, catalog, _ID_COLUMNS, _query_filter(accession, scope, key)
+    )
+    if queries.empty:
+        return pd.DataFrame(columns=columns)
+
+    first = queries.iloc[0]
+    earlier = _read_rows(
+        index_dir,
+        catalog,
+        ["accession_number", "date_filed", "key"],
+        (ds.field("cik") == first["cik"])
+        & (ds.field("form_type") == first["form_type"])
+        & (ds.field("scope") == scope)
+        & (ds.field("date_filed") < first["date_filed"]),
+    )
+    if earlier.empty:
+        return pd.DataFrame(columns=columns)
+
+    previous = earlier.sort_values("date_filed").drop_duplicates("key", keep="last")
+    pairs = queries.merge(previous, on="key", suffixes=("", "_previous"))
+    if pairs.empty:
+        return pd.DataFrame(columns=columns)
+
+    signatures = _read_signatures(
+        index_dir,
+        np.concatenate([pairs["row_id"], pairs["row_id_previous"]]),
+    )
+    current, prior = np.split(signatures, 2)
+    return pd.DataFrame(
+        {
+            "key": pairs["key"],
+            "previous_accession": pairs["accession_number_previous"],
+            "previous_date_filed": pairs["date_filed_previous"],
+            "similarity": (current == prior).mean(axis=1),
+        }
+    )
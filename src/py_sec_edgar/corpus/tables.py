@@ -0,0 +1,427 @@
+"""
+Financial table extraction for extracted HTML documents.
+
+Each HTML document is tokenized once with lxml's streaming parser. Every
+``<table>`` is flattened to a grid of cell text with EDGAR's layout
+artifacts removed: currency symbols, closing parentheses and percent signs
+that sit in their own cells are folded into the number they belong to, and
+spacer columns are dropped. Numeric cells are normalized: ``(1,234)`` is
+negative, dashes are empty, and the scale stated near the table ("in
+millions", "in thousands") is applied except on per-share and percentage
+rows.
+
+Tables are cached in long format next to the extracted filing at
+``<filing dir>/.tables/<document sha256>.parquet`` (one row per cell, keyed
+by table ordinal, row and column), so reruns read Parquet instead of
+re-parsing HTML:
+
+    ```python
+    from py_sec_edgar.corpus.tables import build_table_cache, get_tables
+
+    build_table_cache(settings.filings_data_dir, max_workers=8)
+    income_statement = get_tables(filing_dir, doc_type="10-K", numeric=True)[42]
+    ```
+"""
+
+import io
+import logging
+import os
+import re
+from collections import Counter
+from pathlib import Path
+
+import pandas as pd
+from lxml import etree
+
+from ..core.parallel import run_parallel
+from ..extract import iter_extracted_filings, load_manifest, sha256_file
+from .text import HTML_EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+TABLE_CACHE_DIRNAME = ".tables"
+
+TABLE_COLUMNS = ["table_index", "row", "column", "text", "number", "value"]
+
+_SCALES = {"thousands": 1e3, "millions": 1e6, "billions": 1e9}
+_SCALE_PATTERN = re.compile(
+    r"\bin\s+(?:\w+\s+){0,2}?(thousands|millions|billions)\b", re.IGNORECASE
+)
+_UNSCALED_ROW = re.compile(r"per\s+(?:common\s+)?share|ratio|percent", re.IGNORECASE)
+_NUMBER = re.compile(r"^\d*\.?\d+$")
+_DASHES = {"-", "—", "–", "−", "--"}
+_CURRENCY = {"$", "€", "£", "¥", "US$"}
+_SUFFIXES = {")", "%", ")%", "%)"}
+_CONTEXT_CHARS = 300
+
+_CONTEXT_TAGS = {"p", "div", "font", "b", "i", "span", "center", "h1", "h2", "h3"}
+_DROP_TAGS = {"script", "style", "head", "title", "noscript", "ix:header"}
+
+
+def table_cache_path(filing_directory: str | Path, sha256: str) -> Path:
+    """Cache path for the tables of a document with the given hash."""
+    return Path(filing_directory) / TABLE_CACHE_DIRNAME / f"{sha256}.parquet"
+
+
+def parse_number(text: str | None) -> float | None:
+    """
+    Parse a financial table cell as a number.
+
+    Handles thousands separators, currency symbols, percent signs and
+    parenthesized negatives: ``"$(1,234.5)"`` becomes ``-1234.5``.
+
+    Args:
+        text: Cell text
+
+    Returns:
+        Parsed value, or None for empty, dash or non-numeric cells
+    """
+    if not text:
+        return None
+    value = text.strip()
+    for symbol in _CURRENCY:
+        value = value.replace(symbol, "")
+    value = value.replace(",", "").replace("%", "").replace(" ", "")
+    if not value or value in _DASHES:
+        return None
+
+    negative = False
+    if value.startswith("(") and value.endswith(")"):
+        negative, value = True, value[1:-1]
+    elif value[0] in "-−–":
+        negative, value = True, value[1:]
+    if not _NUMBER.match(value):
+        return None
+    number = float(value)
+    return -number if negative else number
+
+
+def detect_scale(text: str) -> float:
+    """Scale stated in a table caption such as "(In millions, except ...)"."""
+    match = _SCALE_PATTERN.search(text)
+    return _SCALES[match.group(1).lower()] if match else 1.0
+
+
+def _cell_text(cell) -> str:
+    """Whitespace-normalized visible text of a cell."""
+    return " ".join("".join(cell.itertext()).replace("\u200b", "").split())
+
+
+def _table_grid(table) -> list[list[str]]:
+    """Flatten a table element to rows of cell text without layout artifacts."""
+    rows = []
+    for tr in table.iter("tr"):
+        texts, spans = [], []
+        for cell in tr:
+            if cell.tag not in ("td", "th"):
+                continue
+            try:
+                span = min(max(int(cell.get("colspan", 1)), 1), 50)
+            except ValueError:
+                span = 1
+            spans.append((len(texts), span))
+            texts.append(_cell_text(cell))
+            texts.extend([""] * (span - 1))
+
+        # Fold "$" / ")" / "%" cells into the neighbouring number
+        last = None
+        for index, text in enumerate(texts):
+            if text in _CURRENCY:
+                texts[index] = ""
+            elif text in _SUFFIXES and last is not None:
+                texts[last] += text
+                texts[index] = ""
+            elif text:
+                last = index
+        if any(texts):
+            rows.append((texts, spans))
+
+    if not rows:
+        return []
+
+    # Column headers span the "$", number and ")" cells of the rows below
+    # them; move each spanning cell onto the column that holds the data.
+    occupancy = Counter(
+        start
+        for texts, spans in rows
+        for start, span in spans
+        if span == 1 and texts[start]
+    )
+    for texts, spans in rows:
+        for start, span in spans:
+            if span > 1 and texts[start]:
+                target = max(range(start, start + span), key=lambda c: occupancy[c])
+                texts[start], texts[target] = "", texts[start]
+
+    width = max(len(texts) for texts, _ in rows)
+    grid = [texts + [""] * (width - len(texts)) for texts, _ in rows]
+    used = [column for column in range(width) if any(row[column] for row in grid)]
+    return [[row[column] for column in used] for row in grid]
+
+
+def _table_cells(table_index: int, grid: list[list[str]], context: str) -> list[tuple]:
+    """Long-format cell records for one table grid."""
+    caption = " ".join(" ".join(row) for row in grid[:3])
+    scale = detect_scale(caption if _SCALE_PATTERN.search(caption) else context)
+
+    cells = []
+    for row_index, row in enumerate(grid):
+        label = next((text for text in row if text), "")
+        # Header rows (years, dates) have no text label and are never scaled
+        unscaled = parse_number(label) is not None or _UNSCALED_ROW.search(label)
+        row_scale = 1.0 if unscaled else scale
+        for column, text in enumerate(row):
+            if not text:
+                continue
+            number = parse_number(text)
+            value = None
+            if number is not None:
+                value = number if text.endswith(("%", "%)")) else number * row_scale
+            cells.append((table_index, row_index, column, text, number, value))
+    return cells
+
+
+def extract_tables(source: str | Path | bytes, encoding: str = "utf-8") -> pd.DataFrame:
+    """
+    Extract every table of an HTML document in one streaming pass.
+
+    Elements are discarded as soon as they are processed, so memory stays
+    bounded by the largest single table rather than the document size.
+
+    Args:
+        source: HTML file path or content
+        encoding: Document encoding
+
+    Returns:
+        DataFrame with TABLE_COLUMNS, one row per non-empty cell
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    else:
+        source = str(source)
+
+    cells = []
+    table_index = 0
+    depth = 0
+    context = ""
+    parser = etree.iterparse(
+        source,
+        events=("start", "end"),
+        html=True,
+        recover=True,
+        encoding=encoding or "utf-8",
+        huge_tree=True,
+    )
+    for event, elem in parser:
+        tag = elem.tag if isinstance(elem.tag, str) else ""
+        if event == "start":
+            if tag == "table":
+                depth += 1
+            continue
+
+        if tag == "table":
+            depth -= 1
+            if depth:
+                # Nested tables are flattened into their outermost table
+                continue
+            grid = _table_grid(elem)
+            if grid:
+                cells.extend(_table_cells(table_index, grid, context))
+                table_index += 1
+            context = ""
+        elif depth or tag not in _CONTEXT_TAGS | _DROP_TAGS:
+            continue
+        elif tag in _CONTEXT_TAGS:
+            context = (context + " " + _cell_text(elem))[-_CONTEXT_CHARS:]
+
+        # Processed subtrees are no longer needed
+        elem.clear(keep_tail=True)
+        parent = elem.getparent()
+        while parent is not None and elem.getprevious() is not None:
+            del parent[0]
+
+    return pd.DataFrame(cells, columns=TABLE_COLUMNS)
+
+
+def _write_cache(df: pd.DataFrame, cache_path: Path) -> None:
+    """Write a table cache file atomically."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = cache_path.with_suffix(".parquet.tmp")
+    df.to_parquet(temp_path, index=False)
+    os.replace(temp_path, cache_path)
+
+
+def _document_tables(
+    filing_directory: Path, document: dict, encoding: str, force: bool = False
+) -> tuple[pd.DataFrame, bool]:
+    """Cached tables of one document, extracting them if needed."""
+    doc_path = filing_directory / document["path"]
+    sha256 = document.get("sha256") or sha256_file(doc_path)
+    cache_path = table_cache_path(filing_directory, sha256)
+    if cache_path.exists() and not force:
+        return pd.read_parquet(cache_path), False
+
+    df = extract_tables(doc_path, encoding)
+    _write_cache(df, cache_path)
+    return df, True
+
+
+def build_filing_tables(filing_directory: str | Path, force: bool = False) -> dict:
+    """
+    Extract and cache the tables of every HTML document in one filing.
+
+    Args:
+        filing_directory: Extracted filing directory with a manifest
+        force: Re-extract documents even if cached tables exist
+
+    Returns:
+        Dictionary with directory, extracted, cached, skipped and tables counts
+    """
+    filing_directory = Path(filing_directory)
+    manifest = load_manifest(filing_directory)
+    stats = {
+        "directory": str(filing_directory),
+        "extracted": 0,
+        "cached": 0,
+        "skipped": 0,
+        "tables": 0,
+    }
+    if not manifest:
+        logger.warning(f"No extraction manifest, skipping tables: {filing_directory}")
+        return stats
+
+    for document in manifest.get("documents", []):
+        path = document.get("path")
+        if not path or not path.lower().endswith(HTML_EXTENSIONS):
+            stats["skipped"] += 1
+            continue
+        if not (filing_directory / path).exists():
+            stats["skipped"] += 1
+            continue
+
+        df, extracted = _document_tables(
+            filing_directory, document, manifest.get("encoding", "utf-8"), force
+        )
+        stats["extracted" if extracted else "cached"] += 1
+        stats["tables"] += df["table_index"].nunique()
+
+    return stats
+
+
+def _build_filing_tables_task(args: tuple[str, bool]) -> dict:
+    """Process-pool entry point for build_filing_tables."""
+    directory, force = args
+    return build_filing_tables(directory, force=force)
+
+
+def build_table_cache(
+    root: str | Path,
+    max_workers: int | None = None,
+    force: bool = False,
+    show_progress: bool = False,
+) -> dict:
+    """
+    Extract and cache tables for every extracted filing under a data root.
+
+    Args:
+        root: Filing data root laid out as CIK/FOLDER
+        max_workers: Process count (defaults to CPUs - 1)
+        force: Re-extract documents even if cached tables exist
+        show_progress: Display a progress bar
+
+    Returns:
+        Summary with filings, extracted, cached, skipped, tables and failed
+        counts
+    """
+    tasks = [(str(directory), force) for directory in iter_extracted_filings(root)]
+    results = run_parallel(
+        _build_filing_tables_task,
+        tasks,
+        max_workers=max_workers,
+        description="Extracting tables",
+        show_progress=show_progress,
+    )
+
+    summary = {
+        "filings": len(results),
+        "extracted": 0,
+        "cached": 0,
+        "skipped": 0,
+        "tables": 0,
+        "failed": 0,
+    }
+    for result in results:
+        if not result.ok:
+            summary["failed"] += 1
+            continue
+        for key in ("extracted", "cached", "skipped", "tables"):
+            summary[key] += result.value[key]
+    return summary
+
+
+def cells_to_frame(cells: pd.DataFrame, numeric: bool = False) -> pd.DataFrame:
+    """
+    Pivot the long-format cells of one table into a grid.
+
+    Args:
+        cells: Cell records of a single table
+        numeric: Return scaled numeric values (non-numeric cells keep text)
+
+    Returns:
+        DataFrame indexed by row with one column per table column
+    """
+    values = cells["text"]
+    if numeric:
+        values = cells["value"].astype(object).where(cells["value"].notna(), values)
+    grid = pd.Series(values.to_numpy(), index=[cells["row"], cells["column"]])
+    return grid.unstack().rename_axis(index=None, columns=None)
+
+
+def get_tables(
+    filing_directory: str | Path,
+    sequence: str | int | None = None,
+    doc_type: str | None = None,
+    numeric: bool = False,
+) -> list[pd.DataFrame]:
+    """
+    Return the tables of a document, extracting and caching on demand.
+
+    Without ``sequence`` or ``doc_type`` the primary document (the first
+    HTML document in the submission) is used.
+
+    Args:
+        filing_directory: Extracted filing directory
+        sequence: Document sequence number within the submission
+        doc_type: Document type (e.g. "10-K", "EX-13")
+        numeric: Return scaled numeric values instead of cell text
+
+    Returns:
+        List of DataFrames in document order (empty if no HTML document
+        matches)
+    """
+    filing_directory = Path(filing_directory)
+    manifest = load_manifest(filing_directory)
+    if not manifest:
+        return []
+
+    for document in manifest.get("documents", []):
+        if sequence is not None and str(document.get("sequence")) != str(sequence):
+            continue
+        if (
+            doc_type is not None
+            and document.get("type", "").upper() != doc_type.upper()
+        ):
+            continue
+        path = document.get("path")
+        if not path or not path.lower().endswith(HTML_EXTENSIONS):
+            continue
+
+        df, _ = _document_tables(
+            filing_directory, document, manifest.get("encoding", "utf-8")
+        )
+        return [
+            cells_to_frame(cells, numeric=numeric)
+            for _, cells in df.groupby("table_index", sort=True)
+        ]
+
+    return []
@@ -0,0 +1,318 @@
+"""
+Plain-text layer for extracted filing documents.
+
+Converts extracted HTML (including inline XBRL) and plain-text documents to
+normalized text once, and caches the result next to the extracted filing at
+``<filing dir>/.text/<document sha256>.txt``. The cache is keyed by the
+document hash recorded in the extraction manifest, so a changed document is
+converted again automatically. Re-extracting a filing clears its directory,
+cache included; the text is rebuilt by the next ``build_text_layer`` run or
+on demand by ``get_document_text``.
+
+Example:
+    ```python
+    from py_sec_edgar.corpus import build_text_layer, get_document_text
+
+    build_text_layer(settings.filings_data_dir, max_workers=8)
+    text = get_document_text(filing_dir, doc_type="10-K")
+    ```
+"""
+
+import logging
+import os
+import re
+from pathlib import Path
+
+from lxml import etree
+
+from ..core.parallel import run_parallel
+from ..core.path_utils import atomic_write
+from ..extract import iter_extracted_filings, load_manifest, sha256_file
+
+logger = logging.getLogger(__name__)
+
+TEXT_LAYER_DIRNAME = ".text"
+
+HTML_EXTENSIONS = (".htm", ".html", ".xhtml")
+TEXT_EXTENSIONS = (".txt",)
+
+# Elements whose content is never visible text. ix:header carries the hidden
+# inline XBRL facts, contexts and units.
+_DROP_TAGS = ("script", "style", "head", "title", "noscript", "ix:header")
+
+_BLOCK_TAGS = (
+    "p", "div", "br", "tr", "li", "ul", "ol", "table", "section", "article",
+    "h1", "h2", "h3", "h4", "h5", "h6", "pre", "blockquote", "hr", "center",
+    "dt", "dd", "page",
+)  # fmt: skip
+_CELL_TAGS = ("td", "th")
+
+# lxml rejects str input that carries an encoding declaration, which XHTML
+# and inline XBRL documents start with
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
+_SPACES = re.compile(r"[ \t\f\v\xa0\u200b]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def html_to_text(markup: str | bytes, encoding: str | None = None) -> str:
+    """
+    Convert filing HTML to normalized plain text.
+
+    Uses libxml2's HTML parser directly, which is far faster than
+    BeautifulSoup/UnicodeDammit. Scripts, styles, the document head and
+    hidden inline XBRL headers are removed; other inline XBRL tags are
+    unwrapped so the tagged values remain in the text. Block elements become
+    line breaks and table cells are separated by tabs.
+
+    Args:
+        markup: HTML document as text or bytes
+        encoding: Encoding of bytes markup (detected by libxml2 when None)
+
+    Returns:
+        Plain text with collapsed whitespace
+    """
+    if not markup or not markup.strip():
+        return ""
+
+    try:
+        parser = etree.HTMLParser(
+            remove_comments=True,
+            remove_pis=True,
+            encoding=encoding if isinstance(markup, bytes) else None,
+        )
+    except LookupError:
+        # Encoding name libxml2 does not know; decode in Python instead
+        markup = markup.decode(encoding, errors="replace")
+        parser = etree.HTMLParser(remove_comments=True, remove_pis=True)
+    if isinstance(markup, str):
+        markup = _XML_DECLARATION.sub("", markup, count=1)
+    root = etree.fromstring(markup, parser)
+    if root is None:
+        return ""
+
+    for element in list(root.iter(*_DROP_TAGS)):
+        parent = element.getparent()
+        if parent is not None:
+            # Keep the tail text, which belongs to the surrounding content
+            previous = element.getprevious()
+            if element.tail:
+                if previous is not None:
+                    previous.tail = (previous.tail or "") + element.tail
+                else:
+                    parent.text = (parent.text or "") + element.tail
+            parent.remove(element)
+
+    for element in root.iter(*_BLOCK_TAGS):
+        element.tail = "\n" + (element.tail or "")
+    for element in root.iter(*_CELL_TAGS):
+        element.tail = "\t" + (element.tail or "")
+
+    return normalize_text("".join(root.itertext()))
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of spaces, strip lines and limit consecutive blank lines."""
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = (_SPACES.sub(" ", line).strip() for line in text.split("\n"))
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip() + "\n"
+
+
+def is_text_document(filename: str) -> bool:
+    """Whether a document is HTML or plain text and belongs in the text layer."""
+    return filename.lower().endswith(HTML_EXTENSIONS + TEXT_EXTENSIONS)
+
+
+def text_layer_path(filing_directory: str | Path, sha256: str) -> Path:
+    """Cache path for the text of a document with the given hash."""
+    return Path(filing_directory) / TEXT_LAYER_DIRNAME / f"{sha256}.txt"
+
+
+def convert_document(path: str | Path, encoding: str = "utf-8") -> str:
+    """
+    Convert one extracted document file to plain text.
+
+    Args:
+        path: Extracted document path
+        encoding: Encoding the document was written with
+
+    Returns:
+        Plain text content
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    if str(path).lower().endswith(HTML_EXTENSIONS):
+        return html_to_text(raw, encoding or "utf-8")
+
+    content = raw.decode(encoding or "utf-8", errors="replace")
+    # Older filings often wrap plain text in <PRE> or include light markup
+    if re.search(r"<(html|body|pre|p|div|table)\b", content[:2000], re.IGNORECASE):
+        return html_to_text(content)
+    return normalize_text(content)
+
+
+def build_filing_text(filing_directory: str | Path, force: bool = False) -> dict:
+    """
+    Build the text layer for one extracted filing.
+
+    Args:
+        filing_directory: Extracted filing directory with a manifest
+        force: Reconvert documents even if cached text exists
+
+    Returns:
+        Dictionary with directory, converted, cached and skipped counts
+    """
+    filing_directory = Path(filing_directory)
+    manifest = load_manifest(filing_directory)
+    stats = {
+        "directory": str(filing_directory),
+        "converted": 0,
+        "cached": 0,
+        "skipped": 0,
+    }
+
+    if not manifest:
+        logger.warning(
+            f"No extraction manifest, skipping text layer: {filing_directory}"
+        )
+        return stats
+
+    for document in manifest.get("documents", []):
+        if not document.get("path") or not is_text_document(document["path"]):
+            stats["skipped"] += 1
+            continue
+
+        doc_path = filing_directory / document["path"]
+        if not doc_path.exists():
+            stats["skipped"] += 1
+            continue
+
+        sha256 = document.get("sha256") or sha256_file(doc_path)
+        cache_path = text_layer_path(filing_directory, sha256)
+        if cache_path.exists() and not force:
+            stats["cached"] += 1
+            continue
+
+        text = convert_document(doc_path, manifest.get("encoding", "utf-8"))
+        atomic_write(cache_path, text)
+        stats["converted"] += 1
+
+    return stats
+
+
+def _build_filing_text_task(args: tuple[str, bool]) -> dict:
+    """Process-pool entry point for build_filing_text."""
+    directory, force = args
+    return build_filing_text(directory, force=force)
+
+
+def build_text_layer(
+    root: str | Path,
+    max_workers: int | None = None,
+    force: bool = False,
+    show_progress: bool = False,
+) -> dict:
+    """
+    Build the text layer for every extracted filing under a data root.
+
+    Args:
+        root: Filing data root laid out as CIK/FOLDER
+        max_workers: Process count (defaults to CPUs - 1)
+        force: Reconvert documents even if cached text exists
+        show_progress: Display a progress bar
+
+    Returns:
+        Summary with filings, converted, cached, skipped and failed counts
+    """
+    tasks = [(str(directory), force) for directory in iter_extracted_filings(root)]
+    results = run_parallel(
+        _build_filing_text_task,
+        tasks,
+        max_workers=max_workers,
+        description="Building text layer",
+        show_progress=show_progress,
+    )
+
+    summary = {
+        "filings": len(results),
+        "converted": 0,
+        "cached": 0,
+        "skipped": 0,
+        "failed": 0,
+    }
+    for result in results:
+        if not result.ok:
+            summary["failed"] += 1
+            continue
+        for key in ("converted", "cached", "skipped"):
+            summary[key] += result.value[key]
+    return summary
+
+
+def get_document_text(
+    filing_directory: str | Path,
+    sequence: str | int | None = None,
+    doc_type: str | None = None,
+) -> str | None:
+    """
+    Return the plain text of a document, converting and caching on demand.
+
+    Without ``sequence`` or ``doc_type`` the primary document (the first in
+    the submission) is returned.
+
+    Args:
+        filing_directory: Extracted filing directory
+        sequence: Document sequence number within the submission
+        doc_type: Document type (e.g. "10-K", "EX-21.1")
+
+    Returns:
+        Text content, or None if no matching text document exists
+    """
+    filing_directory = Path(filing_directory)
+    manifest = load_manifest(filing_directory)
+    if not manifest:
+        return None
+
+    for document in manifest.get("documents", []):
+        if sequence is not None and str(document.get("sequence")) != str(sequence):
+            continue
+        if (
+            doc_type is not None
+            and document.get("type", "").upper() != doc_type.upper()
+        ):
+            continue
+        if not document.get("path") or not is_text_document(document["path"]):
+            continue
+
+        doc_path = filing_directory / document["path"]
+        sha256 = document.get("sha256") or sha256_file(doc_path)
+        cache_path = text_layer_path(filing_directory, sha256)
+        if cache_path.exists():
+            return cache_path.read_text(encoding="utf-8")
+
+        text = convert_document(doc_path, manifest.get("encoding", "utf-8"))
+        atomic_write(cache_path, text)
+        return text
+
+    return None
+
+
+def iter_text_documents(filing_directory: str | Path):
+    """
+    Yield (document, text_path) pairs for cached text in one filing.
+
+    Args:
+        filing_directory: Extracted filing directory
+
+    Yields:
+        Manifest document dict and path to its cached text file
+    """
+    filing_directory = Path(filing_directory)
+    manifest = load_manifest(filing_directory) or {}
+    for document in manifest.get("documents", []):
+        sha256 = document.get("sha256")
+        if not sha256 or not document.get("path"):
+            continue
+        cache_path = text_layer_path(filing_directory, sha256)
+        if os.path.exists(cache_path):
+            yield document, cache_path
@@ -0,0 +1,511 @@
+"""
+Streaming XBRL fact extraction into a partitioned Parquet store.
+
+Reads the XBRL instance of each extracted filing, either the ``EX-101.INS``
+document or the inline XBRL (iXBRL) primary document, with ``iterparse``
+and clears elements as soon as they have been consumed, so memory stays
+flat regardless of filing size. Contexts and units are resolved after the
+pass (they may appear after the facts that reference them) and each fact
+becomes one row:
+
+    cik, accession_number, concept, period_type, period_start, period_end,
+    unit, value, decimals, dimensions, ...
+
+Rows are written one file per filing under
+``settings.corpus_dir/xbrl_facts/year=YYYY/qtr=Q/<accession>.parquet``, so
+workers in a process pool never contend on the same file and the store can
+be read with Hive partition pruning:
+
+    ```python
+    from py_sec_edgar.corpus import build_facts_store, load_facts
+
+    build_facts_store(settings.filings_data_dir, max_workers=8)
+    revenues = load_facts(filters=[("concept", "==", "us-gaap:Revenues")])
+    ```
+"""
+
+import json
+import logging
+import os
+import re
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from lxml import etree
+
+from ..core.parallel import run_parallel
+from ..extract import iter_extracted_filings, load_manifest
+from ..settings import settings
+from .sections import normalize_accession
+
+logger = logging.getLogger(__name__)
+
+XBRLI_NS = "http://www.xbrl.org/2003/instance"
+XBRLDI_NS = "http://xbrl.org/2006/xbrldi"
+IX_NAMESPACES = (
+    "http://www.xbrl.org/2013/inlineXBRL",
+    "http://www.xbrl.org/2008/inlineXBRL",
+)
+
+FACT_SCHEMA = pa.schema(
+    [
+        ("cik", pa.string()),
+        ("accession_number", pa.string()),
+        ("form_type", pa.string()),
+        ("date_filed", pa.string()),
+        ("concept", pa.string()),
+        ("context_id", pa.string()),
+        ("period_type", pa.string()),
+        ("period_start", pa.string()),
+        ("period_end", pa.string()),
+        ("unit", pa.string()),
+        ("value", pa.float64()),
+        ("value_text", pa.string()),
+        ("decimals", pa.string()),
+        ("dimensions", pa.string()),
+        ("inline", pa.bool_()),
+    ]
+)
+
+# Elements whose children are needed when their end event fires; nothing
+# beneath them may be cleared early.
+_PROTECTED_XBRLI = ("context", "unit")
+_PROTECTED_IX = ("nonFraction", "nonNumeric", "continuation", "footnote")
+
+_NUMBER_CLEANUP = re.compile(r"[^\d.\-]")
+
+
+def default_facts_store_path() -> Path:
+    """Default root of the partitioned XBRL facts store."""
+    return settings.corpus_dir / "xbrl_facts"
+
+
+def _split_tag(tag) -> tuple[str | None, str]:
+    """Split a Clark-notation tag into (namespace, local name)."""
+    if not isinstance(tag, str):
+        return None, ""
+    if tag.startswith("{"):
+        namespace, _, local = tag[1:].partition("}")
+        return namespace, local
+    return None, tag
+
+
+def _strip_prefix(qname: str) -> str:
+    """Drop a namespace prefix ("iso4217:USD" -> "USD")."""
+    return qname.strip().rpartition(":")[2]
+
+
+def _parse_context(elem) -> dict:
+    """Read period and dimensions from an xbrli:context element."""
+    context = {
+        "period_type": None,
+        "period_start": None,
+        "period_end": None,
+        "dimensions": {},
+    }
+    for child in elem.iter():
+        namespace, local = _split_tag(child.tag)
+        text = (child.text or "").strip()
+        if namespace == XBRLI_NS:
+            if local == "instant":
+                context.update(period_type="instant", period_end=text)
+            elif local == "startDate":
+                context.update(period_type="duration", period_start=text)
+            elif local == "endDate":
+                context["period_end"] = text
+            elif local == "forever":
+                context["period_type"] = "forever"
+        elif namespace == XBRLDI_NS:
+            dimension = child.get("dimension")
+            if local == "explicitMember" and dimension:
+                context["dimensions"][dimension] = text
+            elif local == "typedMember" and dimension:
+                context["dimensions"][dimension] = "".join(child.itertext()).strip()
+    return context
+
+
+def _parse_unit(elem) -> str:
+    """Render an xbrli:unit as "USD", "shares" or "USD/shares"."""
+    numerator, denominator, measures = [], [], []
+    for child in elem.iter():
+        namespace, local = _split_tag(child.tag)
+        if namespace != XBRLI_NS or local != "measure":
+            continue
+        parent_local = _split_tag(child.getparent().tag)[1]
+        measure = _strip_prefix(child.text or "")
+        if parent_local == "unitNumerator":
+            numerator.append(measure)
+        elif parent_local == "unitDenominator":
+            denominator.append(measure)
+        else:
+            measures.append(measure)
+    if numerator or denominator:
+        return "*".join(numerator) + "/" + "*".join(denominator)
+    return "*".join(measures)
+
+
+def _parse_inline_number(text: str, fmt: str | None, scale, sign) -> float | None:
+    """Convert an ix:nonFraction display value to a number."""
+    fmt = (fmt or "").lower()
+    text = text.strip()
+    if "zero" in fmt or text in ("-", "—", "–", ""):
+        number = 0.0
+    else:
+        if "comma-decimal" in fmt or "commadecimal" in fmt:
+            text = text.replace(".", "").replace(" ", "").replace(",", ".")
+        cleaned = _NUMBER_CLEANUP.sub("", text)
+        try:
+            number = float(cleaned)
+        except ValueError:
+            return None
+    if scale:
+        try:
+            number *= 10 ** int(scale)
+        except ValueError:
+            pass
+    if sign == "-":
+        number = -number
+    return number
+
+
+def _parse_float(text: str | None) -> float | None:
+    """Parse an instance document numeric value."""
+    try:
+        return float(text.strip()) if text and text.strip() else None
+    except ValueError:
+        return None
+
+
+class _FactCollector:
+    """Accumulates raw facts, contexts and units across one or more files."""
+
+    def __init__(self, include_text: bool = False):
+        self.include_text = include_text
+        self.contexts: dict[str, dict] = {}
+        self.units: dict[str, str] = {}
+        self.facts: list[dict] = []
+
+    def parse(self, path: str | Path) -> None:
+        """Stream one instance or inline XBRL document."""
+        depth = 0
+        for event, elem in etree.iterparse(
+            str(path),
+            events=("start", "end"),
+            recover=True,
+            huge_tree=True,
+            remove_comments=True,
+        ):
+            namespace, local = _split_tag(elem.tag)
+            protected = (namespace == XBRLI_NS and local in _PROTECTED_XBRLI) or (
+                namespace in IX_NAMESPACES and local in _PROTECTED_IX
+            )
+
+            if event == "start":
+                if protected:
+                    depth += 1
+                continue
+
+            if protected:
+                depth -= 1
+            self._handle_end(namespace, local, elem)
+
+            if depth == 0:
+                elem.clear(keep_tail=True)
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+    def _handle_end(self, namespace, local, elem) -> None:
+        """Record the element if it is a context, unit or fact."""
+        if namespace == XBRLI_NS and local == "context":
+            self.contexts[elem.get("id")] = _parse_context(elem)
+        elif namespace == XBRLI_NS and local == "unit":
+            self.units[elem.get("id")] = _parse_unit(elem)
+        elif namespace in IX_NAMESPACES:
+            if local == "nonFraction":
+                self.facts.append(
+                    {
+                        "concept": elem.get("name"),
+                        "context_id": elem.get("contextRef"),
+                        "unit_id": elem.get("unitRef"),
+                        "value": _parse_inline_number(
+                            "".join(elem.itertext()),
+                            elem.get("format"),
+                            elem.get("scale"),
+                            elem.get("sign"),
+                        ),
+                        "value_text": None,
+                        "decimals": elem.get("decimals"),
+                        "inline": True,
+                    }
+                )
+            elif local == "nonNumeric" and self.include_text:
+                self.facts.append(
+                    {
+                        "concept": elem.get("name"),
+                        "context_id": elem.get("contextRef"),
+                        "unit_id": None,
+                        "value": None,
+                        "value_text": "".join(elem.itertext()).strip(),
+                        "decimals": None,
+                        "inline": True,
+                    }
+                )
+        elif elem.get("contextRef") is not None:
+            unit_id = elem.get("unitRef")
+            if unit_id is None and not self.include_text:
+                return
+            prefix = elem.prefix
+            self.facts.append(
+                {
+                    "concept": f"{prefix}:{local}" if prefix else local,
+                    "context_id": elem.get("contextRef"),
+                    "unit_id": unit_id,
+                    "value": _parse_float(elem.text) if unit_id else None,
+                    "value_text": None if unit_id else (elem.text or "").strip(),
+                    "decimals": elem.get("decimals"),
+                    "inline": False,
+                }
+            )
+
+    def resolve(self) -> list[dict]:
+        """Join facts with their contexts and units."""
+        rows = []
+        for fact in self.facts:
+            context = self.contexts.get(fact["context_id"], {})
+            dimensions = context.get("dimensions") or {}
+            rows.append(
+                {
+                    "concept": fact["concept"],
+                    "context_id": fact["context_id"],
+                    "period_type": context.get("period_type"),
+                    "period_start": context.get("period_start"),
+                    "period_end": context.get("period_end"),
+                    "unit": self.units.get(fact["unit_id"])
+                    if fact["unit_id"]
+                    else None,
+                    "value": fact["value"],
+                    "value_text": fact["value_text"],
+                    "decimals": fact["decimals"],
+                    "dimensions": json.dumps(dimensions, sort_keys=True)
+                    if dimensions
+                    else None,
+                    "inline": fact["inline"],
+                }
+            )
+        return rows
+
+
+def parse_xbrl_facts(
+    paths: str | Path | list[str | Path], include_text: bool = False
+) -> list[dict]:
+    """
+    Stream XBRL facts from instance or inline XBRL documents.
+
+    Several paths are treated as one inline XBRL document set, sharing
+    contexts and units.
+
+    Args:
+        paths: EX-101.INS instance file, or one or more iXBRL documents
+        include_text: Also emit non-numeric facts (text blocks, dei fields)
+
+    Returns:
+        List of fact rows with resolved period, unit and dimensions
+    """
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+    collector = _FactCollector(include_text=include_text)
+    for path in paths:
+        collector.parse(path)
+    return collector.resolve()
+
+
+def _is_inline_xbrl(path: Path) -> bool:
+    """Check the document head for an inline XBRL namespace declaration."""
+    with open(path, "rb") as f:
+        head = f.read(65536)
+    return any(namespace.encode() in head for namespace in IX_NAMESPACES)
+
+
+def find_xbrl_documents(
+    filing_directory: str | Path, manifest: dict | None = None
+) -> tuple[list[Path], bool]:
+    """
+    Locate the XBRL instance documents of an extracted filing.
+
+    Args:
+        filing_directory: Extracted filing directory
+        manifest: Extraction manifest (loaded when omitted)
+
+    Returns:
+        (paths, inline) - the EX-101.INS file, or the iXBRL HTML documents
+    """
+    filing_directory = Path(filing_directory)
+    manifest = manifest or load_manifest(filing_directory) or {}
+    documents = [doc for doc in manifest.get("documents", []) if doc.get("path")]
+
+    for doc in documents:
+        if doc.get("type", "").upper() == "EX-101.INS":
+            return [filing_directory / doc["path"]], False
+
+    inline = [
+        filing_directory / doc["path"]
+        for doc in documents
+        if doc["path"].lower().endswith((".htm", ".html", ".xhtml"))
+        and (filing_directory / doc["path"]).exists()
+        and _is_inline_xbrl(filing_directory / doc["path"])
+    ]
+    return inline, True
+
+
+def _partition_values(date_filed: str | None) -> tuple[int, int]:
+    """Year and quarter partition values from a filing date."""
+    digits = str(date_filed or "").replace("-", "")
+    if len(digits) >= 6 and digits[:6].isdigit():
+        year, month = int(digits[:4]), int(digits[4:6])
+        return year, (month - 1) // 3 + 1
+    return 0, 0
+
+
+def facts_partition_path(
+    store_dir: str | Path, accession_number: str, date_filed: str | None
+) -> Path:
+    """Path of one filing's facts file inside the partitioned store."""
+    year, qtr = _partition_values(date_filed)
+    return (
+        Path(store_dir)
+        / f"year={year}"
+        / f"qtr={qtr}"
+        / f"{normalize_accession(accession_number)}.parquet"
+    )
+
+
+def extract_filing_facts(
+    filing_directory: str | Path,
+    store_dir: str | Path | None = None,
+    include_text: bool = False,
+    force: bool = False,
+) -> int:
+    """
+    Extract one filing's XBRL facts into the partitioned store.
+
+    Args:
+        filing_directory: Extracted filing directory with a manifest
+        store_dir: Facts store root (defaults to settings.corpus_dir/xbrl_facts)
+        include_text: Also store non-numeric facts
+        force: Rewrite facts that are already stored
+
+    Returns:
+        Number of facts written (0 when skipped or no XBRL present)
+    """
+    filing_directory = Path(filing_directory)
+    store_dir = Path(store_dir or default_facts_store_path())
+    manifest = load_manifest(filing_directory)
+    if not manifest:
+        return 0
+
+    accession_number = normalize_accession(
+        manifest.get("accession_number") or filing_directory.name
+    )
+    output_path = facts_partition_path(
+        store_dir, accession_number, manifest.get("date_filed")
+    )
+    if output_path.exists() and not force:
+        return 0
+
+    paths, _ = find_xbrl_documents(filing_directory, manifest)
+    if not paths:
+        return 0
+
+    rows = parse_xbrl_facts(paths, include_text=include_text)
+    if not rows:
+        return 0
+
+    cik = str(int(manifest["cik"])) if manifest.get("cik") else None
+    for row in rows:
+        row.update(
+            cik=cik,
+            accession_number=accession_number,
+            form_type=manifest.get("form_type"),
+            date_filed=manifest.get("date_filed"),
+        )
+
+    table = pa.Table.from_pylist(rows, schema=FACT_SCHEMA)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_suffix(".parquet.tmp")
+    pq.write_table(table, temp_path, compression="snappy")
+    os.replace(temp_path, output_path)
+    return len(rows)
+
+
+def _extract_filing_facts_task(args: tuple) -> int:
+    """Process-pool entry point for extract_filing_facts."""
+    directory, store_dir, include_text, force = args
+    return extract_filing_facts(directory, store_dir, include_text, force)
+
+
+def build_facts_store(
+    root: str | Path,
+    store_dir: str | Path | None = None,
+    max_workers: int | None = None,
+    include_text: bool = False,
+    force: bool = False,
+    show_progress: bool = False,
+) -> dict:
+    """
+    Extract XBRL facts for every extracted filing under a data root.
+
+    Args:
+        root: Filing data root laid out as CIK/FOLDER
+        store_dir: Facts store root (defaults to settings.corpus_dir/xbrl_facts)
+        max_workers: Process count (defaults to CPUs - 1)
+        include_text: Also store non-numeric facts
+        force: Rewrite facts that are already stored
+        show_progress: Display a progress bar
+
+    Returns:
+        Summary with filings, with_facts, facts and failed counts
+    """
+    store_dir = str(store_dir or default_facts_store_path())
+    tasks = [
+        (str(directory), store_dir, include_text, force)
+        for directory in iter_extracted_filings(root)
+    ]
+    results = run_parallel(
+        _extract_filing_facts_task,
+        tasks,
+        max_workers=max_workers,
+        description="Extracting XBRL facts",
+        show_progress=show_progress,
+    )
+    return {
+        "filings": len(results),
+        "with_facts": sum(1 for r in results if r.ok and r.value),
+        "facts": sum(r.value for r in results if r.ok),
+        "failed": sum(1 for r in results if not r.ok),
+    }
+
+
+def load_facts(
+    store_dir: str | Path | None = None,
+    filters: list | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Read facts from the partitioned store.
+
+    Args:
+        store_dir: Facts store root (defaults to settings.corpus_dir/xbrl_facts)
+        filters: pyarrow filters, e.g. [("year", "=", 2024), ("cik", "=", "320193")]
+        columns: Columns to read
+
+    Returns:
+        DataFrame of facts (empty if the store does not exist)
+    """
+    store_dir = Path(store_dir or default_facts_store_path())
+    if not store_dir.exists():
+        return pd.DataFrame(columns=FACT_SCHEMA.names)
+    return pd.read_parquet(store_dir, filters=filters, columns=columns)
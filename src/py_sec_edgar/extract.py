@@ -8,19 +8,98 @@ This module replaces the complex parse module dependencies with streamlined
 extraction capabilities for the current release.
 """
 
+import fnmatch
+import hashlib
+import io
+import json
 import logging
 import os
 import re
+import shutil
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
 
 import chardet
 
-from .core.path_utils import ensure_directory, safe_join
-from .utilities import file_size, format_filename, uudecode
+from .core.document_store import ContainerPool, DocumentContainer, container_path
+from .core.path_utils import atomic_write, ensure_directory, safe_join
+from .utilities import convert_bytes, format_filename, uudecode
 
 logger = logging.getLogger(__name__)
 
+# Written last (and atomically) into every extracted filing directory. Its
+# presence with status "complete" is the only signal that a directory holds a
+# full extraction of the current source file.
+MANIFEST_FILENAME = "_extraction_manifest.json"
+MANIFEST_VERSION = 1
 
-def extract(filing_json: dict, force: bool = False) -> dict:
+_HEADER_FIELDS = {
+    "accession_number": "ACCESSION NUMBER",
+    "form_type": "CONFORMED SUBMISSION TYPE",
+    "cik": "CENTRAL INDEX KEY",
+    "date_filed": "FILED AS OF DATE",
+}
+
+
+@dataclass
+class DocumentFilter:
+    """
+    Selects which documents of a submission are extracted.
+
+    Type and filename patterns are shell-style globs matched
+    case-insensitively, e.g. ``exclude_types=["GRAPHIC", "ZIP", "EX-101.*"]``
+    or ``include_filenames=["*.htm"]``. Include lists are only applied when
+    non-empty; excludes win over includes.
+    """
+
+    include_types: list[str] = field(default_factory=list)
+    exclude_types: list[str] = field(default_factory=list)
+    include_filenames: list[str] = field(default_factory=list)
+    exclude_filenames: list[str] = field(default_factory=list)
+    max_size_bytes: int | None = None
+
+    def skip_reason(self, doc_type: str, filename: str, size_bytes: int) -> str | None:
+        """
+        Why a document is skipped, or None if it should be extracted.
+
+        Args:
+            doc_type: Document TYPE from the submission (e.g. "EX-101.SCH")
+            filename: Document FILENAME
+            size_bytes: Size of the document block in the submission
+
+        Returns:
+            "type", "filename" or "size", or None to extract the document
+        """
+        doc_type = doc_type.upper()
+        if self.include_types and not _matches_any(doc_type, self.include_types):
+            return "type"
+        if _matches_any(doc_type, self.exclude_types):
+            return "type"
+
+        filename = filename.upper()
+        if self.include_filenames and not _matches_any(
+            filename, self.include_filenames
+        ):
+            return "filename"
+        if _matches_any(filename, self.exclude_filenames):
+            return "filename"
+
+        if self.max_size_bytes is not None and size_bytes > self.max_size_bytes:
+            return "size"
+        return None
+
+
+def _matches_any(value: str, patterns: list[str]) -> bool:
+    """Case-insensitive glob match against any pattern (value is upper-case)."""
+    return any(fnmatch.fnmatchcase(value, pattern.upper()) for pattern in patterns)
+
+
+def extract(
+    filing_json: dict,
+    force: bool = False,
+    document_filter: DocumentFilter | None = None,
+) -> dict:
     """
     Extract filing contents from complete submission files.
 
@@ -31,40 +110,124 @@ def extract(filing_json: dict, force: bool = False) -> dict:
         filing_json: Dictionary with filing information including:
             - extracted_filing_directory: Target directory
             - filing_filepath: Path to submission file
-        force: If True, re-extract even if directory already exists
+        force: If True, re-extract even if a complete extraction exists
+        document_filter: Only extract matching documents; skipped documents
+            are still listed in the manifest
+
+    A filing is skipped only when its directory holds a manifest with status
+    "complete" that matches the current source file. Directories left behind
+    by an interrupted run are cleared and extracted again. So are
+    directories extracted before manifests existed; run
+    ``verify_extractions(root, adopt=True)`` once beforehand to keep them.
 
     Returns:
         Dictionary with filing contents (legacy format)
     """
     filing_contents = {}
+    output_directory = filing_json["extracted_filing_directory"]
+    filepath = filing_json["filing_filepath"]
+
+    if not force and is_extraction_complete(
+        output_directory, filepath, document_filter
+    ):
+        logger.info(
+            f"Extraction already complete - skipping extraction: {output_directory}"
+        )
+        return filing_contents
 
-    if not os.path.exists(filing_json["extracted_filing_directory"]) or force:
-        if force and os.path.exists(filing_json["extracted_filing_directory"]):
+    if os.path.exists(output_directory):
+        if force:
             logger.info("FORCE: Re-extraction enabled - overwriting existing directory")
+        else:
+            logger.warning(
+                f"Incomplete or stale extraction found - re-extracting: {output_directory}"
+            )
+        shutil.rmtree(output_directory, ignore_errors=True)
 
-        logger.info("Extracting Filing Documents")
+    logger.info("Extracting Filing Documents")
 
-        try:
-            filing_contents = extract_complete_submission_filing(
-                filing_json["filing_filepath"],
-                output_directory=filing_json["extracted_filing_directory"],
-            )
-        except UnicodeDecodeError as e:
-            logger.error(f"Error Decoding: {e}")
-        except Exception as e:
-            logger.error(f"Extraction failed: {e}")
+    try:
+        filing_contents = extract_complete_submission_filing(
+            filepath,
+            output_directory=output_directory,
+            filing_meta=filing_json,
+            document_filter=document_filter,
+        )
+    except UnicodeDecodeError as e:
+        logger.error(f"Error Decoding: {e}")
+    except Exception as e:
+        logger.error(f"Extraction failed: {e}")
 
-        logger.info("Extraction Complete")
-    else:
+    logger.info("Extraction Complete")
+
+    return filing_contents
+
+
+def extract_to_container(
+    filing_json: dict,
+    store_root: str | Path | None = None,
+    layout: str = "cik",
+    force: bool = False,
+    document_filter: DocumentFilter | None = None,
+    containers: ContainerPool | None = None,
+) -> dict:
+    """
+    Extract a filing into a per-CIK or per-quarter document container.
+
+    Alternative to ``extract`` that avoids one file per document: all
+    documents are appended to a zip container with an offset index (see
+    core.document_store) and the manifest is kept in that index.
+
+    Args:
+        filing_json: Dictionary with filing information including:
+            - filing_filepath: Path to submission file
+            - CIK and Filename (and Date Filed for the quarter layout)
+        store_root: Document store root (defaults to settings.document_store_dir)
+        layout: "cik" or "quarter"
+        force: Re-extract even if the container already holds the filing
+        document_filter: Only extract matching documents
+        containers: Pool of open containers shared by a batch; without one
+            the container is opened and closed for this filing alone
+
+    Returns:
+        Dictionary with filing contents (legacy format); empty when skipped
+    """
+    from .settings import settings
+
+    filepath = filing_json["filing_filepath"]
+    accession_number = os.path.basename(filing_json["Filename"]).split(".")[0]
+    path = container_path(
+        store_root or settings.document_store_dir,
+        filing_json["CIK"],
+        filing_json.get("Date Filed"),
+        layout=layout,
+    )
+    container = containers.get(path) if containers else DocumentContainer(path)
+
+    if not force and _manifest_is_current(
+        container.get_manifest(accession_number), filepath, document_filter
+    ):
         logger.info(
-            f"WARNING: Extraction directory already exists - skipping extraction: {filing_json['extracted_filing_directory']}"
+            f"Extraction already complete - skipping: {accession_number} "
+            f"in {container.path}"
         )
+        return {}
 
-    return filing_contents
+    logger.info(f"Extracting Filing Documents into {container.path}")
+    return extract_complete_submission_filing(
+        filepath,
+        filing_meta=filing_json,
+        sink=ContainerSink(container, accession_number),
+        document_filter=document_filter,
+    )
 
 
 def extract_complete_submission_filing(
-    filepath: str, output_directory: str = None
+    filepath: str,
+    output_directory: str = None,
+    filing_meta: dict | None = None,
+    sink=None,
+    document_filter: DocumentFilter | None = None,
 ) -> dict:
     """
     Extract documents from SEC complete submission filing.
@@ -72,9 +235,19 @@ def extract_complete_submission_filing(
     Simplified version of complete submission processing that handles
     basic document extraction without advanced parsing features.
 
+    Document boundaries are located on the raw bytes; only documents that
+    pass ``document_filter`` are decoded and written. Skipped documents are
+    still listed in the manifest with a "skipped" reason.
+
     Args:
         filepath: Path to complete submission file
         output_directory: Directory to save extracted documents
+        filing_meta: Optional feed metadata used to fill manifest fields the
+            submission header does not provide
+        sink: Where documents are written. Defaults to a DirectorySink for
+            ``output_directory``; pass a ContainerSink to append documents
+            to a container instead of writing one file per document.
+        document_filter: Optional selection of documents to extract
 
     Returns:
         Dictionary with extracted documents (legacy format)
@@ -84,29 +257,48 @@ def extract_complete_submission_filing(
         return {}
 
     try:
-        # Load and decode file
         with open(filepath, "rb") as f:
             raw_bytes = f.read()
 
-        # Detect encoding
-        encoding_result = chardet.detect(raw_bytes)
-        encoding = encoding_result.get("encoding", "utf-8")
+        blocks = _scan_documents(raw_bytes)
+        for block in blocks:
+            block["skipped"] = (
+                document_filter.skip_reason(
+                    block["type"], block["filename"], block["end"] - block["start"]
+                )
+                if document_filter
+                else None
+            )
 
-        try:
-            content = raw_bytes.decode(encoding)
-        except UnicodeDecodeError:
-            logger.warning(f"Failed to decode with {encoding}, trying UTF-8")
-            content = raw_bytes.decode("utf-8", errors="replace")
+        # Detect encoding from the documents that will actually be decoded
+        encoding = _detect_encoding(
+            raw_bytes[block["start"] : block["end"]]
+            for block in blocks
+            if not block["skipped"]
+        )
 
-        # Create output directory if specified
-        if output_directory:
-            ensure_directory(output_directory)
+        if sink is None and output_directory:
+            sink = DirectorySink(output_directory)
 
-        # Extract documents using simplified regex approach
+        errors: list[str] = []
         filing_documents = _extract_documents_simple(
-            content, output_directory, encoding
+            raw_bytes, blocks=blocks, encoding=encoding, errors=errors, sink=sink
         )
 
+        if sink is not None:
+            manifest = _build_manifest(
+                filepath,
+                raw_bytes,
+                encoding,
+                filing_documents,
+                errors,
+                filing_meta or {},
+                sink,
+                len(blocks),
+                document_filter,
+            )
+            sink.commit(manifest)
+
         logger.info(f"Extracted {len(filing_documents)} documents")
         return filing_documents
 
@@ -115,82 +307,143 @@ def extract_complete_submission_filing(
         return {}
 
 
+_DOCUMENT_PATTERN = re.compile(
+    rb"<DOCUMENT>\s*<TYPE>([^<\n]+)\s*<SEQUENCE>([^<\n]+)\s*<FILENAME>([^<\n]+)(?:\s*<DESCRIPTION>([^<\n]+))?",
+    re.IGNORECASE | re.MULTILINE,
+)
+_DOCUMENT_START_PATTERN = re.compile(rb"<DOCUMENT>", re.IGNORECASE)
+_DOCUMENT_END_PATTERN = re.compile(rb"</DOCUMENT>", re.IGNORECASE)
+_TEXT_PATTERN = re.compile(
+    r"<(TEXT|text)>(.*?)</(TEXT|text)>", re.MULTILINE | re.DOTALL
+)
+
+
+def _scan_documents(raw_bytes: bytes) -> list[dict]:
+    """
+    Locate the document blocks of a submission without decoding it.
+
+    Returns:
+        List of dicts with type, sequence, filename, description and the
+        start/end byte offsets of each document's content
+    """
+    matches = list(_DOCUMENT_PATTERN.finditer(raw_bytes))
+    blocks = []
+    for i, match in enumerate(matches, start=1):
+        start = match.end()
+        if i < len(matches):
+            end = matches[i].start()
+        else:
+            end_match = _DOCUMENT_END_PATTERN.search(raw_bytes, start)
+            end = end_match.start() if end_match else len(raw_bytes)
+
+        doc_type, sequence, filename, description = (
+            value.decode("latin-1").strip() if value else "" for value in match.groups()
+        )
+        blocks.append(
+            {
+                "type": doc_type,
+                "sequence": sequence,
+                "filename": filename,
+                "description": description,
+                "start": start,
+                "end": end,
+            }
+        )
+    return blocks
+
+
+def _detect_encoding(chunks) -> str:
+    """Detect the encoding of a series of byte chunks, stopping when certain."""
+    detector = chardet.UniversalDetector()
+    for chunk in chunks:
+        detector.feed(chunk)
+        if detector.done:
+            break
+    detector.close()
+    return (detector.result or {}).get("encoding") or "utf-8"
+
+
 def _extract_documents_simple(
-    content: str, output_directory: str = None, encoding: str = "utf-8"
+    raw_bytes: bytes,
+    blocks: list[dict] | None = None,
+    output_directory: str = None,
+    encoding: str = "utf-8",
+    errors: list[str] | None = None,
+    sink=None,
 ) -> dict:
     """
     Simple document extraction using regex patterns.
 
     Args:
-        content: Complete submission content
+        raw_bytes: Complete submission content
+        blocks: Document blocks from _scan_documents; blocks with a
+            "skipped" reason are listed but never decoded or saved
         output_directory: Directory to save files (optional)
         encoding: Text encoding
+        errors: Optional list collecting per-document error messages
+        sink: Document sink (overrides output_directory)
 
     Returns:
         Dictionary with document information
     """
     filing_documents = {}
+    if sink is None and output_directory:
+        sink = DirectorySink(output_directory)
+    if blocks is None:
+        blocks = _scan_documents(raw_bytes)
 
-    # Document boundary patterns
-    document_pattern = re.compile(
-        r"<DOCUMENT>\s*<TYPE>([^<\n]+)\s*<SEQUENCE>([^<\n]+)\s*<FILENAME>([^<\n]+)(?:\s*<DESCRIPTION>([^<\n]+))?",
-        re.IGNORECASE | re.MULTILINE,
-    )
-
-    # Text content pattern
-    text_pattern = re.compile(
-        r"<(TEXT|text)>(.*?)</(TEXT|text)>", re.MULTILINE | re.DOTALL
-    )
-
-    # Find all document matches
-    doc_matches = list(document_pattern.finditer(content))
-
-    for i, match in enumerate(doc_matches, start=1):
+    for i, block in enumerate(blocks, start=1):
         try:
-            # Extract document metadata
-            doc_type = match.group(1).strip()
-            sequence = match.group(2).strip()
-            filename = match.group(3).strip()
-            description = match.group(4).strip() if match.group(4) else ""
-
-            # Find document content boundaries
-            start_pos = match.end()
-
-            # Find next document or end of content
-            if i < len(doc_matches):
-                end_pos = doc_matches[i].start()
-            else:
-                # Look for end document tag or end of content
-                end_match = re.search(
-                    r"</DOCUMENT>", content[start_pos:], re.IGNORECASE
+            doc_type = block["type"]
+            sequence = block["sequence"]
+            filename = block["filename"]
+            description = block["description"]
+            size_bytes = block["end"] - block["start"]
+
+            if block.get("skipped"):
+                filing_documents[i] = {
+                    "TYPE": doc_type,
+                    "SEQUENCE": sequence,
+                    "FILENAME": filename,
+                    "DESCRIPTION": description,
+                    "RELATIVE_FILEPATH": None,
+                    "DESCRIPTIVE_FILEPATH": filename,
+                    "FILE_SIZE": "N/A",
+                    "FILE_SIZE_BYTES": size_bytes,
+                    "SKIPPED": block["skipped"],
+                }
+                logger.debug(
+                    f"Skipped document {sequence} ({block['skipped']}): {filename}"
                 )
-                if end_match:
-                    end_pos = start_pos + end_match.start()
-                else:
-                    end_pos = len(content)
+                continue
 
-            # Extract document content
-            doc_content = content[start_pos:end_pos].strip()
+            raw_document = raw_bytes[block["start"] : block["end"]]
+            try:
+                doc_content = raw_document.decode(encoding).strip()
+            except UnicodeDecodeError:
+                logger.warning(f"Failed to decode {filename} with {encoding}")
+                doc_content = raw_document.decode("utf-8", errors="replace").strip()
 
             # Extract text content if present
-            text_match = text_pattern.search(doc_content)
+            text_match = _TEXT_PATTERN.search(doc_content)
             if text_match:
                 processed_content = text_match.group(2)
             else:
                 processed_content = doc_content
 
-            # Save document if output directory specified
+            # Save document if a sink is configured
             output_filepath = None
-            if output_directory and processed_content:
-                output_filepath = _save_document_simple(
+            if sink is not None and processed_content:
+                output_filepath = sink.save(
                     processed_content,
                     doc_type,
                     sequence,
                     filename,
                     description,
-                    output_directory,
                     encoding,
                 )
+                if output_filepath is None and errors is not None:
+                    errors.append(f"Failed to save document {sequence}: {filename}")
 
             # Create document entry
             filing_documents[i] = {
@@ -202,7 +455,9 @@ def _extract_documents_simple(
                 "DESCRIPTIVE_FILEPATH": os.path.basename(output_filepath)
                 if output_filepath
                 else filename,
-                "FILE_SIZE": file_size(output_filepath) if output_filepath else "N/A",
+                "FILE_SIZE": convert_bytes(sink.records[output_filepath]["size_bytes"])
+                if output_filepath
+                else "N/A",
                 "FILE_SIZE_BYTES": len(processed_content),
             }
 
@@ -210,6 +465,8 @@ def _extract_documents_simple(
 
         except Exception as e:
             logger.error(f"Error processing document {i}: {e}")
+            if errors is not None:
+                errors.append(f"Error processing document {i}: {e}")
             continue
 
     return filing_documents
@@ -260,16 +517,9 @@ def _save_document_simple(
 
         # Handle regular text files
         else:
-            # Create descriptive filename
-            doc_num = f"{int(sequence):04d}"
-
-            if description:
-                output_filename = f"{doc_num}-({doc_type}) {description} {filename}"
-            else:
-                output_filename = f"{doc_num}-({doc_type}) {filename}"
-
-            # Clean filename
-            output_filename = format_filename(output_filename)
+            output_filename = _document_filename(
+                doc_type, sequence, filename, description
+            )
             output_filepath = safe_join(output_directory, output_filename)
 
             # Save content
@@ -283,4 +533,559 @@ def _save_document_simple(
         return None
 
 
-# Legacy compatibility functions removed - functionality moved to parse module
+def _document_filename(
+    doc_type: str, sequence: str, filename: str, description: str
+) -> str:
+    """Descriptive output filename, e.g. "0001-(10-K) 10-K aapl-20240928.htm"."""
+    doc_num = f"{int(sequence):04d}"
+
+    if description:
+        output_filename = f"{doc_num}-({doc_type}) {description} {filename}"
+    else:
+        output_filename = f"{doc_num}-({doc_type}) {filename}"
+
+    # Clean filename
+    return format_filename(output_filename)
+
+
+class DirectorySink:
+    """Writes each document as its own file in a filing directory."""
+
+    def __init__(self, output_directory: str | Path):
+        self.output_directory = output_directory
+        self.records: dict[str, dict] = {}
+        ensure_directory(output_directory)
+
+    def save(
+        self,
+        content: str,
+        doc_type: str,
+        sequence: str,
+        filename: str,
+        description: str,
+        encoding: str,
+    ) -> str | None:
+        """Write one document; returns its path or None on failure."""
+        output_filepath = _save_document_simple(
+            content,
+            doc_type,
+            sequence,
+            filename,
+            description,
+            self.output_directory,
+            encoding,
+        )
+        if output_filepath is None or not os.path.exists(output_filepath):
+            return None
+        self.record(output_filepath)
+        return output_filepath
+
+    def record(self, output_filepath: str) -> None:
+        """List a written document for the manifest."""
+        self.records[output_filepath] = {
+            "path": os.path.basename(output_filepath),
+            "size_bytes": os.path.getsize(output_filepath),
+            "sha256": sha256_file(output_filepath),
+        }
+
+    def commit(self, manifest: dict) -> None:
+        """Write the manifest last, marking the filing complete."""
+        write_manifest(self.output_directory, manifest)
+
+
+class ContainerSink:
+    """
+    Buffers a filing's documents and appends them to a DocumentContainer.
+
+    Documents are held in memory until commit, so a filing is either fully
+    present in the container (with its manifest) or not at all.
+    """
+
+    def __init__(self, container: DocumentContainer, accession_number: str):
+        self.container = container
+        self.accession_number = accession_number
+        self.records: dict[str, dict] = {}
+        self._documents: list[tuple[str, bytes]] = []
+
+    def save(
+        self,
+        content: str,
+        doc_type: str,
+        sequence: str,
+        filename: str,
+        description: str,
+        encoding: str,
+    ) -> str | None:
+        """Buffer one document; returns its container location."""
+        try:
+            if content.lower().startswith("begin"):
+                decoded = io.BytesIO()
+                uudecode(io.BytesIO(content.encode(encoding)), out_file=decoded)
+                data = decoded.getvalue()
+                member = f"{self.accession_number}/{format_filename(filename)}"
+            else:
+                data = content.encode(encoding, errors="replace")
+                member = f"{self.accession_number}/" + _document_filename(
+                    doc_type, sequence, filename, description
+                )
+        except Exception as e:
+            logger.error(f"Failed to encode document {filename}: {e}")
+            return None
+
+        location = f"{self.container.path}::{member}"
+        self._documents.append((member, data))
+        self.records[location] = {
+            "path": member,
+            "size_bytes": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+        return location
+
+    def commit(self, manifest: dict) -> None:
+        """Append all buffered documents and the manifest to the container."""
+        self.container.append_filing(self.accession_number, self._documents, manifest)
+        self._documents = []
+
+
+def sha256_file(filepath: str | Path, chunk_size: int = 1024 * 1024) -> str:
+    """Return the hex SHA-256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _parse_submission_header(content: str) -> dict:
+    """Read accession, CIK, form type and filing date from the SGML header."""
+    header_end = content.find("<DOCUMENT>")
+    header = content[: header_end if header_end != -1 else 10000]
+
+    values = {}
+    for key, label in _HEADER_FIELDS.items():
+        match = re.search(rf"^\s*{label}:\s*(\S+)", header, re.MULTILINE)
+        if match:
+            values[key] = match.group(1).strip()
+    return values
+
+
+def _build_manifest(
+    filepath: str,
+    raw_bytes: bytes,
+    encoding: str,
+    filing_documents: dict,
+    errors: list[str],
+    filing_meta: dict,
+    sink,
+    expected_documents: int,
+    document_filter: DocumentFilter | None = None,
+) -> dict:
+    """
+    Assemble the extraction manifest for one filing.
+
+    ``expected_documents`` is the number of blocks _scan_documents found, so
+    a block it cannot parse (e.g. one without a <FILENAME>) does not leave
+    the filing incomplete on every run.
+    """
+    stat = os.stat(filepath)
+    header_end = raw_bytes.find(b"<DOCUMENT>")
+    header = _parse_submission_header(
+        raw_bytes[: header_end if header_end != -1 else 10000].decode(
+            encoding, errors="replace"
+        )
+    )
+
+    documents = []
+    for doc in filing_documents.values():
+        record = sink.records.get(doc.get("RELATIVE_FILEPATH")) or {}
+        document = {
+            "sequence": doc["SEQUENCE"],
+            "type": doc["TYPE"],
+            "filename": doc["FILENAME"],
+            "description": doc["DESCRIPTION"],
+            "path": record.get("path"),
+            "size_bytes": record.get("size_bytes"),
+            "sha256": record.get("sha256"),
+        }
+        if doc.get("SKIPPED"):
+            document["skipped"] = doc["SKIPPED"]
+        documents.append(document)
+
+    if expected_documents != len(documents):
+        errors.append(
+            f"Found {expected_documents} <DOCUMENT> blocks but extracted "
+            f"{len(documents)}"
+        )
+    unparsed = len(_DOCUMENT_START_PATTERN.findall(raw_bytes)) - expected_documents
+    if unparsed > 0:
+        logger.warning(f"{filepath}: {unparsed} <DOCUMENT> blocks without a header")
+
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "status": "complete" if not errors and documents else "incomplete",
+        "source": {
+            "path": os.path.abspath(filepath),
+            "sha256": hashlib.sha256(raw_bytes).hexdigest(),
+            "size_bytes": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        },
+        "accession_number": header.get("accession_number")
+        or filing_meta.get("accession_number"),
+        "cik": header.get("cik") or filing_meta.get("CIK"),
+        "form_type": header.get("form_type") or filing_meta.get("Form Type"),
+        "date_filed": header.get("date_filed") or filing_meta.get("Date Filed"),
+        "encoding": encoding,
+        "document_filter": asdict(document_filter) if document_filter else None,
+        "document_count": len(documents),
+        "total_bytes": sum(d["size_bytes"] or 0 for d in documents),
+        "extracted_at": datetime.now().isoformat(timespec="seconds"),
+        "documents": documents,
+        "errors": errors,
+    }
+
+
+def write_manifest(output_directory: str | Path, manifest: dict) -> Path:
+    """
+    Write an extraction manifest atomically.
+
+    The manifest must be the last file written for a filing so that a crash
+    at any earlier point leaves a directory without a complete manifest.
+
+    Args:
+        output_directory: Extracted filing directory
+        manifest: Manifest dictionary
+
+    Returns:
+        Path to the manifest file
+    """
+    return atomic_write(
+        Path(output_directory) / MANIFEST_FILENAME,
+        json.dumps(manifest, indent=2, default=str),
+    )
+
+
+def load_manifest(output_directory: str | Path) -> dict | None:
+    """
+    Load the extraction manifest for a filing directory.
+
+    Args:
+        output_directory: Extracted filing directory
+
+    Returns:
+        Manifest dictionary, or None if missing or unreadable
+    """
+    manifest_path = Path(output_directory) / MANIFEST_FILENAME
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Unreadable extraction manifest {manifest_path}: {e}")
+        return None
+
+
+def _source_matches(manifest: dict, source_filepath: str | Path | None) -> bool:
+    """Check that the manifest was produced from the current source file."""
+    if not source_filepath or not os.path.exists(source_filepath):
+        # Source may have been cleaned up after extraction; trust the manifest.
+        return True
+
+    source = manifest.get("source") or {}
+    stat = os.stat(source_filepath)
+    if stat.st_size != source.get("size_bytes"):
+        return False
+    if stat.st_mtime_ns == source.get("mtime_ns"):
+        return True
+    # Touched but possibly unchanged (e.g. re-download): fall back to content.
+    return sha256_file(source_filepath) == source.get("sha256")
+
+
+def is_extraction_complete(
+    output_directory: str | Path,
+    source_filepath: str | Path | None = None,
+    document_filter: DocumentFilter | None = None,
+) -> bool:
+    """
+    Cheaply check whether a filing directory holds a complete extraction.
+
+    Only the manifest and a stat of the source file are read; the source is
+    hashed only when its modification time changed but its size did not.
+
+    Args:
+        output_directory: Extracted filing directory
+        source_filepath: Complete submission file the directory was built from
+        document_filter: Document selection the extraction must have used
+
+    Returns:
+        True if the extraction is complete and matches the source file
+    """
+    return _manifest_is_current(
+        load_manifest(output_directory), source_filepath, document_filter
+    )
+
+
+def _manifest_is_current(
+    manifest: dict | None,
+    source_filepath: str | Path | None,
+    document_filter: DocumentFilter | None = None,
+) -> bool:
+    """Whether a manifest records a complete extraction of the current source."""
+    if not manifest or manifest.get("status") != "complete":
+        return False
+    if manifest.get("manifest_version") != MANIFEST_VERSION:
+        return False
+    # A different document selection needs a fresh extraction
+    requested = asdict(document_filter) if document_filter else None
+    if manifest.get("document_filter") != requested:
+        return False
+    return _source_matches(manifest, source_filepath)
+
+
+def verify_extraction(
+    output_directory: str | Path,
+    source_filepath: str | Path | None = None,
+    deep: bool = False,
+) -> dict:
+    """
+    Verify an extracted filing directory against its manifest.
+
+    Args:
+        output_directory: Extracted filing directory
+        source_filepath: Complete submission file (inferred when omitted)
+        deep: Re-hash every document instead of comparing sizes only
+
+    Returns:
+        Dictionary with directory, source, status and reason. Status is one of
+        "complete", "missing_manifest", "incomplete", "corrupt" or "stale".
+    """
+    output_directory = Path(output_directory)
+    manifest = load_manifest(output_directory)
+
+    if source_filepath is None:
+        source_filepath = _infer_source_filepath(output_directory, manifest)
+
+    result = {
+        "directory": str(output_directory),
+        "source": str(source_filepath) if source_filepath else None,
+        "status": "complete",
+        "reason": "",
+    }
+
+    if manifest is None:
+        result.update(status="missing_manifest", reason="No extraction manifest")
+        return result
+
+    if manifest.get("status") != "complete":
+        errors = manifest.get("errors") or []
+        result.update(
+            status="incomplete",
+            reason=errors[0] if errors else "Manifest status is not complete",
+        )
+        return result
+
+    if not _source_matches(manifest, source_filepath):
+        result.update(status="stale", reason="Source file changed since extraction")
+        return result
+
+    for document in manifest.get("documents", []):
+        if not document.get("path"):
+            continue
+        doc_path = output_directory / document["path"]
+        if not doc_path.exists():
+            result.update(status="corrupt", reason=f"Missing {document['path']}")
+            return result
+        if doc_path.stat().st_size != document.get("size_bytes"):
+            result.update(status="corrupt", reason=f"Size mismatch {document['path']}")
+            return result
+        if deep and sha256_file(doc_path) != document.get("sha256"):
+            result.update(status="corrupt", reason=f"Hash mismatch {document['path']}")
+            return result
+
+    return result
+
+
+def adopt_extraction(
+    output_directory: str | Path, source_filepath: str | Path | None = None
+) -> bool:
+    """
+    Write a manifest for a directory extracted before manifests existed.
+
+    The source submission is scanned (not decoded) and every document block
+    must already have its file in the directory; sizes and hashes are taken
+    from those files. A file truncated by a crash cannot be told apart from
+    a complete one, so only adopt directories from finished runs.
+
+    Args:
+        output_directory: Extracted filing directory without a manifest
+        source_filepath: Complete submission file (inferred when omitted)
+
+    Returns:
+        True if a complete manifest was written
+    """
+    output_directory = Path(output_directory)
+    if source_filepath is None:
+        source_filepath = _infer_source_filepath(output_directory)
+    if not source_filepath or not os.path.exists(source_filepath):
+        return False
+
+    with open(source_filepath, "rb") as f:
+        raw_bytes = f.read()
+    blocks = _scan_documents(raw_bytes)
+    encoding = _detect_encoding(
+        raw_bytes[block["start"] : block["end"]] for block in blocks
+    )
+
+    sink = DirectorySink(output_directory)
+    filing_documents = {}
+    for i, block in enumerate(blocks, start=1):
+        candidates = [
+            _document_filename(
+                block["type"],
+                block["sequence"],
+                block["filename"],
+                block["description"],
+            ),
+            block["filename"],
+            block["filename"] + ".uue",
+        ]
+        existing = [
+            output_directory / name
+            for name in candidates
+            if (output_directory / name).is_file()
+        ]
+        if not existing:
+            return False
+        sink.record(str(existing[0]))
+        filing_documents[i] = {
+            "TYPE": block["type"],
+            "SEQUENCE": block["sequence"],
+            "FILENAME": block["filename"],
+            "DESCRIPTION": block["description"],
+            "RELATIVE_FILEPATH": str(existing[0]),
+        }
+
+    manifest = _build_manifest(
+        str(source_filepath),
+        raw_bytes,
+        encoding,
+        filing_documents,
+        [],
+        {},
+        sink,
+        len(blocks),
+    )
+    if manifest["status"] != "complete":
+        return False
+    manifest["adopted"] = True
+    sink.commit(manifest)
+    return True
+
+
+def _infer_source_filepath(
+    output_directory: Path, manifest: dict | None = None
+) -> Path | None:
+    """Locate the submission file an extracted directory was built from."""
+    if manifest:
+        recorded = (manifest.get("source") or {}).get("path")
+        if recorded and os.path.exists(recorded):
+            return Path(recorded)
+
+    # FilingProcessor layout: CIK/<accession>.txt next to CIK/<accession digits>/
+    folder = output_directory.name
+    if len(folder) == 18 and folder.isdigit():
+        accession = f"{folder[:10]}-{folder[10:12]}-{folder[12:]}"
+        return output_directory.parent / f"{accession}.txt"
+    return None
+
+
+def iter_extracted_filings(root: str | Path):
+    """
+    Yield extracted filing directories under a CIK/FOLDER data root.
+
+    Args:
+        root: Filing data root (e.g. settings.filings_data_dir)
+
+    Yields:
+        Path for each directory that is, or looks like, an extracted filing
+    """
+    root = Path(root)
+    if not root.exists():
+        return
+
+    with os.scandir(root) as cik_entries:
+        for cik_entry in cik_entries:
+            if not cik_entry.is_dir():
+                continue
+            with os.scandir(cik_entry.path) as filing_entries:
+                for entry in filing_entries:
+                    if not entry.is_dir():
+                        continue
+                    path = Path(entry.path)
+                    if (len(entry.name) == 18 and entry.name.isdigit()) or (
+                        path / MANIFEST_FILENAME
+                    ).exists():
+                        yield path
+
+
+def verify_extractions(
+    root: str | Path, repair: bool = False, deep: bool = False, adopt: bool = False
+) -> list[dict]:
+    """
+    Verify (and optionally repair) every extracted filing under a data root.
+
+    Repair re-extracts any filing that is not complete, provided its source
+    submission file is still available; otherwise it is reported as
+    "unrepairable".
+
+    Directories extracted before manifests existed have none, so ``extract``
+    clears and redoes them on their first run. Pass ``adopt`` once to write
+    manifests for them instead (see adopt_extraction).
+
+    Args:
+        root: Filing data root laid out as CIK/FOLDER
+        repair: Re-extract filings that fail verification
+        deep: Re-hash every document during verification
+        adopt: Write manifests for manifest-less directories whose documents
+            are all present, instead of reporting them
+
+    Returns:
+        List of verification result dictionaries (see verify_extraction)
+    """
+    results = []
+
+    for directory in iter_extracted_filings(root):
+        result = verify_extraction(directory, deep=deep)
+
+        if (
+            adopt
+            and result["status"] == "missing_manifest"
+            and adopt_extraction(directory, result["source"])
+        ):
+            result = verify_extraction(directory, result["source"], deep=deep)
+            result["adopted"] = result["status"] == "complete"
+
+        if repair and result["status"] != "complete":
+            source = result["source"]
+            if source and os.path.exists(source):
+                logger.info(f"Repairing extraction ({result['status']}): {directory}")
+                # Keep the document selection the filing was extracted with
+                recorded = (load_manifest(directory) or {}).get("document_filter")
+                extract(
+                    {
+                        "extracted_filing_directory": str(directory),
+                        "filing_filepath": source,
+                    },
+                    force=True,
+                    document_filter=DocumentFilter(**recorded) if recorded else None,
+                )
+                repaired = verify_extraction(directory, source, deep=deep)
+                repaired["repaired"] = repaired["status"] == "complete"
+                result = repaired
+            else:
+                result["status"] = "unrepairable"
+                result["reason"] = "Source submission file not found"
+
+        results.append(result)
+
+    return results
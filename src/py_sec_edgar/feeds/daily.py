@@ -166,6 +166,7 @@ def update_daily_files(
     end_date: str | None = None,
     days_back: int | None = None,
     max_weekdays: int | None = 100,
+    merge_index: bool = True,
 ):
     """Update daily index files from SEC EDGAR archive.
 
@@ -176,6 +177,8 @@ def update_daily_files(
         end_date: YYYY-MM-DD inclusive; overrides days_back if paired with start_date.
         days_back: Rolling window from today when explicit dates are not provided.
         max_weekdays: Safety cap on number of weekdays to process.
+        merge_index: Ingest the daily master indexes into the search index
+            dataset as current-quarter deltas.
     """
 
     # Use task logger if provided, otherwise use module logger
@@ -296,6 +299,14 @@ def update_daily_files(
     log.info(f"  - Files updated: {files_updated}")
     log.info(f"  - Files unchanged: {files_unchanged}")
 
+    if merge_index:
+        from py_sec_edgar.feeds.index_dataset import update_daily_delta
+
+        try:
+            update_daily_delta()
+        except Exception as e:
+            log.error(f"Failed to ingest daily indexes into search index: {e}")
+
     return {
         "files_processed": files_processed,
         "files_downloaded": files_downloaded,
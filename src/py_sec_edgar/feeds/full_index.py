@@ -2,10 +2,12 @@ import asyncio
 import logging
 import os
 import sys
+from functools import partial
 
 from py_sec_edgar.core.path_utils import ensure_file_directory, safe_join
 
 from ..core.downloader import FilingDownloader
+from ..core.parallel import run_parallel
 from ..core.url_utils import generate_full_index_url
 
 # Now you can import
@@ -17,7 +19,8 @@ from ..logging_utils import (
 )
 from ..settings import settings
 from ..utilities import generate_folder_names_years_quarters
-from .idx import convert_idx_to_csv, merge_idx_files  # Re-enabled merge functionality
+from .idx import convert_idx_to_csv
+from .index_dataset import update_idx_dataset
 
 #######################
 # FULL-INDEX FILINGS FEEDS (TXT)
@@ -31,6 +34,7 @@ def update_full_index_feed(
     custom_start_date=None,
     custom_end_date=None,
     merge_index=True,
+    max_workers=None,
 ):
     """
     Update SEC EDGAR full index files.
@@ -41,6 +45,7 @@ def update_full_index_feed(
         custom_start_date: Custom start date (MM/DD/YYYY format), overrides settings
         custom_end_date: Custom end date (MM/DD/YYYY format), overrides settings
         merge_index: Whether to merge all CSV files into unified search index
+        max_workers: Worker processes for index conversion (defaults to CPUs - 1)
     """
     logger = logging.getLogger(__name__)
     logger.info("Starting full index feed update...")
@@ -139,20 +144,25 @@ def update_full_index_feed(
                 "ℹ️ Note: CSV conversion enables fast local searching and merging"
             )
             _convert_legacy_full_index_to_csv(
-                skip_if_exists=skip_if_exists, start_date=start_date, end_date=end_date
+                skip_if_exists=skip_if_exists,
+                start_date=start_date,
+                end_date=end_date,
+                max_workers=max_workers,
             )
 
         # Handle index merging if requested
-        if merge_index and save_idx_as_csv:
-            logger.info("🔗 Merging CSV files into unified search index...")
-            logger.info("ℹ️ Note: Merged index enables fast search across all quarters")
-            merge_success = merge_idx_files(force_rebuild=True)
-            if merge_success:
+        if merge_index:
+            logger.info("🔗 Updating partitioned search index...")
+            logger.info("ℹ️ Note: Only quarters whose master.idx changed are rewritten")
+            counts = update_idx_dataset(max_workers=max_workers)
+            if counts["failed"] == 0:
                 logger.info(
-                    "✅ Index merge completed successfully - search index is now current"
+                    "✅ Index update completed successfully - search index is now current"
                 )
             else:
-                logger.warning("⚠️ Index merge failed - search may use outdated data")
+                logger.warning(
+                    f"⚠️ {counts['failed']} index partitions failed - search may use outdated data"
+                )
 
     except Exception as e:
         logger.error(f"Failed to update full index feed: {e}")
@@ -204,14 +214,18 @@ def _download_file_sync(downloader: FilingDownloader, url: str, filepath: str) -
 
 
 def _convert_legacy_full_index_to_csv(
-    skip_if_exists=True, start_date=None, end_date=None
+    skip_if_exists=True, start_date=None, end_date=None, max_workers=None
 ):
     """Legacy CSV conversion for backward compatibility.
 
+    Files that need conversion are converted in a process pool, one index
+    file per task; a file that fails is logged and the rest continue.
+
     Args:
         skip_if_exists: If True, skip conversion if CSV already exists
         start_date: Custom start date, if None uses settings default
         end_date: Custom end date, if None uses settings default
+        max_workers: Worker processes (defaults to CPUs - 1)
     """
     logger = logging.getLogger(__name__)
 
@@ -226,58 +240,44 @@ def _convert_legacy_full_index_to_csv(
         str(settings.full_index_data_dir), "master.idx"
     )
 
-    files_converted = 0
-    files_skipped = 0
     total_files_to_check = (
         len(dates_quarters) * len(settings.index_files) + 1
     )  # +1 for master
 
     logger.info(f"📋 Checking {total_files_to_check} index files for CSV conversion...")
 
-    if os.path.exists(latest_full_index_master):
-        csv_path = str(latest_full_index_master).replace(".idx", ".csv")
+    candidates = [latest_full_index_master]
+    for year, qtr in dates_quarters:
+        for file in settings.index_files:
+            # Extract quarter number from QTR format (e.g., "QTR2" -> 2)
+            qtr_num = int(qtr.replace("QTR", ""))
+            url, filepath = generate_full_index_url(int(year), qtr_num, file)
+            candidates.append(filepath)
+
+    to_convert = []
+    files_skipped = 0
+    for filepath in candidates:
+        if not os.path.exists(filepath):
+            logger.debug(f"⚠️ IDX file not found: {filepath}")
+            continue
+        csv_path = str(filepath).replace(".idx", ".csv")
         if (
             not skip_if_exists
             or not os.path.exists(csv_path)
-            or os.path.getmtime(csv_path) < os.path.getmtime(latest_full_index_master)
+            or os.path.getmtime(csv_path) < os.path.getmtime(filepath)
         ):
-            logger.debug("🔄 Converting master index to CSV...")
-            convert_idx_to_csv(latest_full_index_master, skip_if_exists=False)
-            files_converted += 1
+            to_convert.append(filepath)
         else:
             files_skipped += 1
-            logger.debug("⏭️ Skipping master index - CSV already exists and is current")
+            logger.debug(f"⏭️ Skipping {filepath} - CSV already current")
 
-    files_processed = 0
-    for year, qtr in dates_quarters:
-        for file in settings.index_files:
-            files_processed += 1
-            # Extract quarter number from QTR format (e.g., "QTR2" -> 2)
-            qtr_num = int(qtr.replace("QTR", ""))
-            url, filepath = generate_full_index_url(int(year), qtr_num, file)
-            if os.path.exists(filepath):
-                csv_path = str(filepath).replace(".idx", ".csv")
-                if (
-                    not skip_if_exists
-                    or not os.path.exists(csv_path)
-                    or os.path.getmtime(csv_path) < os.path.getmtime(filepath)
-                ):
-                    logger.debug(f"🔄 Converting {year} Q{qtr_num} {file} to CSV...")
-                    convert_idx_to_csv(filepath, skip_if_exists=False)
-                    files_converted += 1
-
-                    # Log progress every 10 conversions
-                    if files_converted % 10 == 0:
-                        logger.info(
-                            f"📈 CSV conversion progress: {files_converted} files converted"
-                        )
-                else:
-                    files_skipped += 1
-                    logger.debug(
-                        f"⏭️ Skipping {year} Q{qtr_num} {file} - CSV already current"
-                    )
-            else:
-                logger.debug(f"⚠️ IDX file not found: {filepath}")
+    results = run_parallel(
+        partial(convert_idx_to_csv, skip_if_exists=False),
+        to_convert,
+        max_workers=max_workers,
+        description="Converting index files to CSV",
+    )
+    files_converted = sum(1 for result in results if result.ok)
 
     # Log comprehensive CSV conversion summary
     total_processed = files_converted + files_skipped
@@ -2,13 +2,91 @@ import logging
 import os
 from urllib.parse import urljoin
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
 from pyarrow import parquet as pq
 
+from ..core.identifiers import load_identifier_index
 from ..settings import settings
 from ..utilities import walk_dir_fullpath
 
+IDX_COLUMNS = ["CIK", "Company Name", "Form Type", "Date Filed", "Filename"]
+
+# The header block of a master/company/form .idx file is well under this size
+_IDX_HEADER_BYTES = 64 * 1024
+
+ACCESSION_PATTERN = r"(?P<accession>\d{10}-\d{2}-\d{6})"
+
+
+def accession_keys(filenames) -> np.ndarray:
+    """
+    Integer key per index row derived from the accession number in Filename.
+
+    The 18 digits of an accession number (0000320193-24-000123) fit in an
+    int64. Index filenames end in "<accession>.txt", so the digits are read
+    from a fixed-width slice with string kernels instead of a regex. Rows
+    without an accession number fall back to a hash of the filename with
+    the sign bit set, so the two key spaces never collide.
+
+    Args:
+        filenames: Filename column (pandas Series, Arrow array or sequence)
+
+    Returns:
+        int64 array aligned with ``filenames``
+    """
+    if isinstance(filenames, pa.ChunkedArray):
+        filenames = filenames.combine_chunks()
+    else:
+        filenames = pa.array(filenames, type=pa.string(), from_pandas=True)
+    tail = pc.utf8_slice_codeunits(filenames, -24, -4)
+    digits = pc.replace_substring(tail, "-", "")
+    valid = pc.and_(
+        pc.and_(
+            pc.equal(pc.count_substring(tail, "-"), 2),
+            pc.equal(pc.utf8_length(digits), 18),
+        ),
+        pc.utf8_is_digit(digits),
+    )
+    valid = pc.fill_null(valid, False)
+    keys = pc.cast(pc.if_else(valid, digits, "0"), pa.int64())
+    keys = keys.to_numpy(zero_copy_only=False).astype(np.int64, copy=True)
+
+    missing = ~valid.to_numpy(zero_copy_only=False)
+    if missing.any():
+        fallback = pd.util.hash_array(
+            np.asarray(filenames.filter(pc.invert(valid)), dtype=object)
+        )
+        keys[missing] = (fallback | np.uint64(1 << 63)).view(np.int64)
+    return keys
+
+
+def unique_row_positions(cik, keys) -> np.ndarray:
+    """
+    Positions of the first occurrence of each (CIK, accession key) pair.
+
+    One filing can be listed under several CIKs (filer and subject
+    company), so the CIK is part of the key. A stable lexsort keeps the
+    earliest row of every group, matching ``drop_duplicates(keep="first")``.
+
+    Returns:
+        Sorted positions of the rows to keep
+    """
+    cik = np.asarray(cik, dtype=np.int64)
+    keys = np.asarray(keys, dtype=np.int64)
+    if len(keys) == 0:
+        return np.arange(0)
+    order = np.lexsort((cik, keys))
+    sorted_keys, sorted_cik = keys[order], cik[order]
+    first = np.empty(len(order), dtype=bool)
+    first[0] = True
+    first[1:] = (sorted_keys[1:] != sorted_keys[:-1]) | (
+        sorted_cik[1:] != sorted_cik[:-1]
+    )
+    return np.sort(order[first])
+
 
 def merge_idx_files(force_rebuild=False, include_daily=False, include_rss=False):
     """
@@ -18,9 +96,15 @@ def merge_idx_files(force_rebuild=False, include_daily=False, include_rss=False)
     data may not be complete until the quarter ends. For the most current filings,
     use the search engine's real-time API features instead of idx file data.
 
+    Full index updates now maintain the partitioned dataset in
+    ``index_dataset`` instead, rewriting only changed quarters; this single
+    file remains the fallback for readers when no dataset exists.
+
     Args:
         force_rebuild: If True, rebuild even if merged file is current
-        include_daily: If True, include daily feed data (future enhancement)
+        include_daily: If True, include daily feed data (future enhancement;
+            the partitioned dataset already serves daily deltas, see
+            ``index_dataset.update_daily_delta``)
         include_rss: If True, include RSS feed data (future enhancement)
     """
     logger = logging.getLogger(__name__)
@@ -92,11 +176,12 @@ def merge_idx_files(force_rebuild=False, include_daily=False, include_rss=False)
     )
     df_merged = pd.concat(dfs, ignore_index=True)
 
-    # Remove duplicates and sort by date
+    # Remove duplicates on an integer (CIK, accession) key and sort by date
     initial_count = len(df_merged)
-    df_merged = df_merged.drop_duplicates(
-        subset=["CIK", "Form Type", "Date Filed", "Filename"]
+    keep = unique_row_positions(
+        df_merged["CIK"].to_numpy(), accession_keys(df_merged["Filename"])
     )
+    df_merged = df_merged.iloc[keep]
     df_merged = df_merged.sort_values("Date Filed", ascending=False)
     final_count = len(df_merged)
 
@@ -227,6 +312,123 @@ def convert_idx_to_csv(file_path, skip_if_exists=True) -> None:
         logger.debug(f"Conversion error traceback: {traceback.format_exc()}")
 
 
+def _idx_data_offset(file_path) -> int:
+    """
+    Byte offset of the first data row of an .idx file.
+
+    Data starts after the dashed separator line that follows the column
+    header line; only the first few kilobytes are read to find it.
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(_IDX_HEADER_BYTES)
+
+    header = head.find(b"CIK|Company Name|Form Type")
+    if header == -1:
+        header = head.find(b"Company Name")
+    if header != -1:
+        separator = head.find(b"\n----", header)
+        if separator != -1:
+            line_end = head.find(b"\n", separator + 1)
+            if line_end != -1:
+                return line_end + 1
+    raise ValueError(f"No index header found in {file_path}")
+
+
+def read_idx_table(file_path) -> pa.Table:
+    """
+    Read an EDGAR .idx file straight into an Arrow table.
+
+    The header block is skipped by byte offset and the pipe-delimited rows
+    are parsed by pyarrow's multithreaded CSV reader; trimming, CIK casting
+    and row validation run as Arrow compute kernels instead of per-row
+    Python. Rows are the same ones ``convert_idx_to_csv`` keeps.
+
+    Args:
+        file_path: Path to a master.idx (or other pipe-delimited) index file
+
+    Returns:
+        Table with IDX_COLUMNS; CIK is int64, the other columns are strings
+    """
+    offset = _idx_data_offset(file_path)
+    read_options = pa_csv.ReadOptions(column_names=IDX_COLUMNS)
+    parse_options = pa_csv.ParseOptions(
+        delimiter="|",
+        quote_char=False,
+        invalid_row_handler=lambda row: "skip",
+    )
+    convert_options = pa_csv.ConvertOptions(
+        column_types={column: pa.string() for column in IDX_COLUMNS},
+        strings_can_be_null=False,
+    )
+
+    with pa.memory_map(str(file_path)) as source:
+        source.seek(offset)
+        try:
+            table = pa_csv.read_csv(
+                source,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+            )
+        except pa.ArrowInvalid:
+            # Invalid UTF-8 in a company name: drop the bad bytes like the
+            # CSV converter does and parse again
+            source.seek(offset)
+            data = source.read().decode("utf-8", errors="ignore").encode("utf-8")
+            table = pa_csv.read_csv(
+                pa.BufferReader(data),
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+            )
+
+    columns = [pc.utf8_trim_whitespace(table[column]) for column in IDX_COLUMNS]
+    table = pa.table(columns, names=IDX_COLUMNS)
+    valid = pc.and_(
+        pc.match_substring_regex(table["CIK"], r"^\d+$"),
+        pc.and_(
+            pc.greater(pc.utf8_length(table["Company Name"]), 0),
+            pc.greater(pc.utf8_length(table["Form Type"]), 0),
+        ),
+    )
+    table = table.filter(valid)
+    return table.set_column(0, "CIK", pc.cast(table["CIK"], pa.int64()))
+
+
+def convert_idx_to_parquet(file_path, skip_if_exists=True):
+    """Convert an .idx file directly to Parquet, without a CSV intermediate.
+
+    Args:
+        file_path: Path to the .idx file
+        skip_if_exists: If True, skip conversion if a newer Parquet file exists
+
+    Returns:
+        Path of the Parquet file, or None if conversion failed
+    """
+    logger = logging.getLogger(__name__)
+    file_path = str(file_path)
+    parquet_path = file_path.replace(".idx", ".parquet")
+
+    if skip_if_exists and os.path.exists(parquet_path):
+        if os.path.getmtime(parquet_path) >= os.path.getmtime(file_path):
+            return parquet_path
+
+    try:
+        table = read_idx_table(file_path)
+        temp_path = parquet_path + ".tmp"
+        pq.write_table(table, temp_path, compression="snappy")
+        os.replace(temp_path, parquet_path)
+    except Exception as e:
+        logger.error(f"❌ Error converting {os.path.basename(file_path)}: {e}")
+        return None
+
+    logger.debug(
+        f"✅ Converted {os.path.basename(file_path)} → Parquet: "
+        f"{table.num_rows:,} records"
+    )
+    return parquet_path
+
+
 def load_local_idx_filing_list(ticker_list_filter=True, form_list_filter=True):
     """
     Load filing list from local IDX files.
@@ -245,15 +447,14 @@ def load_local_idx_filing_list(ticker_list_filter=True, form_list_filter=True):
         DataFrame with historical filing data from IDX files
     """
 
-    df_cik_tickers = pd.read_csv(str(settings.cik_tickers_csv))
+    df_cik_tickers = load_identifier_index().to_frame()
 
     logging.info("\\n\\n\\n\\tLoaded IDX files\\n\\n\\n")
 
-    df_merged_idx_filings = (
-        pq.read_table(str(settings.merged_idx_filepath))
-        .to_pandas()
-        .sort_values("Date Filed", ascending=False)
-    )
+    # Imported here: index_dataset builds on read_idx_table from this module
+    from .index_dataset import load_idx_frame
+
+    df_merged_idx_filings = load_idx_frame().sort_values("Date Filed", ascending=False)
     # df_merged_idx_filings = pd.read_csv(str(settings.merged_idx_filepath), index_col=0,  dtype={"CIK": int}, encoding='latin-1')
 
     if ticker_list_filter:
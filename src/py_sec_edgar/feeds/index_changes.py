@@ -0,0 +1,294 @@
+"""
+"New filings since last run" change feed over the partitioned index.
+
+Each consumer (a workflow, a notebook, a downstream loader) keeps its own
+durable watermark in ``_watermarks/<consumer>.json`` inside the dataset
+directory:
+
+    refdata/idx_dataset/
+        _manifest.json
+        _watermarks/full_index_workflow.json
+        year=2024/qtr=4/part-0.parquet
+
+A watermark records the latest filing date the consumer has seen, the
+index files seen on that date and a snapshot of the manifest
+hashes of every partition and daily delta. Computing the changes only
+reads the files whose hash differs from that snapshot, pushes the date
+filter down into the scan and drops rows already seen, so an incremental
+run costs work proportional to the new filings rather than the history.
+
+Rows are considered new when they are filed after the watermark date, or
+on that date but not yet seen. Corrections that the SEC later inserts
+into the quarterly index with an older filing date are not reported.
+
+    ```python
+    from py_sec_edgar.feeds.index_changes import ChangeFeed
+
+    feed = ChangeFeed("my-loader")
+    changes = feed.changes()
+    process(changes.table.to_pandas())
+    feed.acknowledge(changes)
+    ```
+"""
+
+import json
+import logging
+import re
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from ..core.path_utils import atomic_write
+from .idx import accession_keys, unique_row_positions
+from .index_dataset import (
+    _dataset_files,
+    _read_manifest,
+    default_idx_dataset_dir,
+    idx_dataset_exists,
+    open_idx_dataset,
+)
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_DIR = "_watermarks"
+
+# Columns the feed needs to compute and advance a watermark
+_KEY_COLUMNS = ["CIK", "Date Filed", "Filename", "Accession"]
+
+_CONSUMER_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+@dataclass
+class Watermark:
+    """Position of one consumer in the index."""
+
+    consumer: str
+    max_date: str | None = None  # latest filing date seen (ISO format)
+    max_accession: str | None = None  # highest accession number seen
+    boundary: list[str] = field(default_factory=list)  # filenames seen on max_date
+    files: dict[str, str] = field(default_factory=dict)  # manifest key -> hash
+    updated: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Watermark":
+        known = cls.__dataclass_fields__
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+@dataclass
+class IndexChanges:
+    """Rows added since a watermark, and the watermark that acknowledges them."""
+
+    table: pa.Table
+    watermark: Watermark
+    files_read: int = 0
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def to_pandas(self) -> pd.DataFrame:
+        return self.table.to_pandas(date_as_object=False)
+
+
+class ChangeFeed:
+    """
+    Per-consumer feed of index rows added since the consumer's last run.
+
+    ``changes()`` never moves the watermark; call ``acknowledge()`` with
+    its result once the rows have been processed, so a failed run sees the
+    same rows again next time.
+    """
+
+    def __init__(self, consumer: str, dataset_dir: str | Path | None = None):
+        if not _CONSUMER_NAME.match(consumer):
+            raise ValueError(
+                f"Invalid consumer name {consumer!r}: use letters, digits, "
+                "'_', '.' and '-'"
+            )
+        self.consumer = consumer
+        self.dataset_dir = Path(dataset_dir or default_idx_dataset_dir())
+
+    @property
+    def watermark_path(self) -> Path:
+        return self.dataset_dir / WATERMARK_DIR / f"{self.consumer}.json"
+
+    def watermark(self) -> Watermark:
+        """The stored watermark, or an empty one for a new consumer."""
+        path = self.watermark_path
+        if path.exists():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    return Watermark.from_dict(json.load(f))
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable watermark {path}: {e}")
+        return Watermark(consumer=self.consumer)
+
+    def changes(self, columns: list[str] | None = None) -> IndexChanges:
+        """
+        Rows added to the index since the stored watermark.
+
+        A consumer without a watermark receives the whole index; use
+        ``reset(since=...)`` first to start from a date instead.
+
+        Args:
+            columns: Columns to return (all when None)
+
+        Returns:
+            IndexChanges with the new rows sorted by (date, CIK) and the
+            watermark to pass to ``acknowledge``
+        """
+        if not idx_dataset_exists(self.dataset_dir):
+            raise FileNotFoundError(
+                f"No index dataset found at {self.dataset_dir}. "
+                "Run: py-sec-edgar feeds update-full-index"
+            )
+        current = self.watermark()
+        files = _dataset_files(self.dataset_dir, _read_manifest(self.dataset_dir))
+        changed = [
+            str(path)
+            for key, (digest, path) in files.items()
+            if current.files.get(key) != digest and path.exists()
+        ]
+
+        read_columns = None
+        if columns is not None:
+            read_columns = list(dict.fromkeys([*columns, *_KEY_COLUMNS]))
+
+        if changed:
+            dataset = ds.dataset(
+                changed,
+                format="parquet",
+                partitioning="hive",
+                partition_base_dir=str(self.dataset_dir),
+            )
+            filter = None
+            if current.max_date:
+                filter = ds.field("Date Filed") >= date.fromisoformat(current.max_date)
+            table = dataset.to_table(columns=read_columns, filter=filter)
+            table = self._drop_seen(table, current)
+        else:
+            schema = open_idx_dataset(self.dataset_dir).schema
+            table = schema.empty_table()
+            if read_columns is not None:
+                table = table.select(read_columns)
+
+        watermark = self._advance(current, table, files)
+        if columns is not None:
+            table = table.select(columns)
+        logger.info(
+            f"Change feed {self.consumer!r}: {table.num_rows} new rows from "
+            f"{len(changed)} of {len(files)} index files"
+        )
+        return IndexChanges(table=table, watermark=watermark, files_read=len(changed))
+
+    @staticmethod
+    def _drop_seen(table: pa.Table, current: Watermark) -> pa.Table:
+        """Drop rows on the boundary date already seen and cross-file duplicates."""
+        if current.max_date and current.boundary:
+            on_boundary = pc.equal(
+                table["Date Filed"], pa.scalar(date.fromisoformat(current.max_date))
+            )
+            seen = pc.is_in(table["Filename"], pa.array(current.boundary))
+            table = table.filter(pc.invert(pc.and_(on_boundary, seen)))
+        keep = unique_row_positions(table["CIK"], accession_keys(table["Filename"]))
+        if len(keep) < table.num_rows:
+            table = table.take(keep)
+        return table.sort_by([("Date Filed", "ascending"), ("CIK", "ascending")])
+
+    def _advance(
+        self,
+        current: Watermark,
+        table: pa.Table,
+        files: dict[str, tuple[str, Path]],
+    ) -> Watermark:
+        """Watermark covering ``current`` plus the rows in ``table``."""
+        max_date = current.max_date
+        boundary = list(current.boundary)
+        max_accession = current.max_accession
+        if table.num_rows:
+            latest = pc.max(table["Date Filed"]).as_py()
+            if latest is not None:
+                latest_rows = table.filter(
+                    pc.equal(table["Date Filed"], pa.scalar(latest))
+                )
+                filenames = latest_rows["Filename"].to_pylist()
+                if max_date and latest.isoformat() == max_date:
+                    boundary = sorted(set(boundary).union(filenames))
+                else:
+                    max_date, boundary = latest.isoformat(), sorted(filenames)
+            newest = pc.max(table["Accession"]).as_py()
+            if newest and (max_accession is None or newest > max_accession):
+                max_accession = newest
+        return Watermark(
+            consumer=self.consumer,
+            max_date=max_date,
+            max_accession=max_accession,
+            boundary=boundary,
+            files={key: digest for key, (digest, _) in files.items()},
+            updated=datetime.now().isoformat(timespec="seconds"),
+        )
+
+    def acknowledge(self, changes: IndexChanges | Watermark) -> Watermark:
+        """Persist the watermark of processed changes."""
+        watermark = changes.watermark if isinstance(changes, IndexChanges) else changes
+        self._save(watermark)
+        return watermark
+
+    def reset(self, since: date | None = None) -> Watermark:
+        """
+        Forget the consumer's position.
+
+        Args:
+            since: Report filings dated on or after this day on the next
+                run; the whole index when None
+        """
+        watermark = Watermark(consumer=self.consumer)
+        if since is not None:
+            watermark.max_date = (since - timedelta(days=1)).isoformat()
+        watermark.updated = datetime.now().isoformat(timespec="seconds")
+        self._save(watermark)
+        return watermark
+
+    def _save(self, watermark: Watermark) -> None:
+        atomic_write(self.watermark_path, json.dumps(asdict(watermark), indent=2))
+
+
+def list_consumers(dataset_dir: str | Path | None = None) -> list[Watermark]:
+    """Stored watermarks of every consumer, sorted by name."""
+    root = Path(dataset_dir or default_idx_dataset_dir()) / WATERMARK_DIR
+    return [
+        ChangeFeed(path.stem, root.parent).watermark()
+        for path in sorted(root.glob("*.json"))
+    ]
+
+
+def new_filings_since_last_run(
+    consumer: str,
+    columns: list[str] | None = None,
+    acknowledge: bool = True,
+    dataset_dir: str | Path | None = None,
+) -> pd.DataFrame:
+    """
+    Index rows added since ``consumer`` last called this function.
+
+    Args:
+        consumer: Name identifying the caller's watermark
+        columns: Columns to return (all when None)
+        acknowledge: Advance the watermark immediately; pass False and call
+            ``ChangeFeed.acknowledge`` after processing for at-least-once
+            delivery
+        dataset_dir: Dataset directory (defaults to settings.idx_dataset_dir)
+
+    Returns:
+        DataFrame of the new rows
+    """
+    feed = ChangeFeed(consumer, dataset_dir)
+    changes = feed.changes(columns=columns)
+    if acknowledge:
+        feed.acknowledge(changes)
+    return changes.to_pandas()
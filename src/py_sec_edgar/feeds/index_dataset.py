@@ -0,0 +1,649 @@
+"""
+Partitioned Parquet dataset of the EDGAR full index.
+
+Instead of one merged file rebuilt from every quarter on each update, the
+index is stored as a Hive-partitioned dataset with one partition per
+quarter:
+
+    refdata/idx_dataset/
+        _manifest.json
+        year=2024/qtr=3/part-0.parquet
+        year=2024/qtr=4/part-0.parquet
+
+``_manifest.json`` records the SHA-256 of the master.idx each partition
+was built from, so an update rewrites only the quarters whose source
+changed; a daily refresh of the current quarter is a single partition
+write.
+
+Partitions use ``INDEX_SCHEMA``: int32 CIK, dictionary-encoded company
+name and form type, date32 filing date and the accession number derived
+from the filename. Rows are sorted by (CIK, date) and written in small row
+groups, so min/max statistics let scans skip everything but the row
+groups of the requested companies or dates.
+
+Until a quarter's master.idx catches up, daily ``master.YYYYMMDD.idx``
+files are ingested by ``update_daily_delta`` as delta files inside the
+same quarter directory (``year=2024/qtr=4/daily-20241101.parquet``), so
+every dataset scan unions them with the quarterly data. Once the quarterly
+partition covers a day, its delta file is dropped.
+
+``_counts.parquet`` holds filing counts by (CIK, form type, year, quarter,
+day). Each update recounts only the partitions and deltas it rewrote, so
+per-company summaries read a few thousand rows instead of the index.
+
+Readers go through ``load_idx_index``, which scans the dataset with
+``pyarrow.dataset`` and falls back to the legacy ``merged_idx_filepath``
+when no dataset has been built yet:
+
+    ```python
+    from py_sec_edgar.feeds.index_dataset import load_idx_index, update_idx_dataset
+
+    update_idx_dataset()
+    df = load_idx_index(filter=ds.field("CIK") == 320193).to_pandas()
+    ```
+"""
+
+import json
+import logging
+import os
+import re
+from datetime import date, datetime
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from pyarrow import parquet as pq
+
+from ..core.parallel import run_parallel
+from ..core.path_utils import atomic_write
+from ..extract import sha256_file
+from ..settings import settings
+from .idx import ACCESSION_PATTERN, accession_keys, read_idx_table, unique_row_positions
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "_manifest.json"
+COUNTS_NAME = "_counts.parquet"
+PARTITION_FILE = "part-0.parquet"
+DAILY_PREFIX = "daily-"
+PARTITION_COLUMNS = ["year", "qtr"]
+
+# Bumped whenever INDEX_SCHEMA changes; partitions written with another
+# version are rebuilt on the next update
+SCHEMA_VERSION = 2
+
+INDEX_SCHEMA = pa.schema(
+    [
+        ("CIK", pa.int32()),
+        ("Company Name", pa.dictionary(pa.int32(), pa.string())),
+        ("Form Type", pa.dictionary(pa.int32(), pa.string())),
+        ("Date Filed", pa.date32()),
+        ("Filename", pa.string()),
+        ("Accession", pa.string()),
+    ]
+)
+
+# Small enough that a single company's filings span one or two row groups
+ROW_GROUP_SIZE = 32_768
+
+COUNTS_SCHEMA = pa.schema(
+    [
+        ("CIK", pa.int32()),
+        ("Form Type", pa.string()),
+        ("year", pa.int16()),
+        ("qtr", pa.int8()),
+        ("Date Filed", pa.date32()),
+        ("count", pa.int32()),
+        ("source", pa.string()),  # manifest key of the counted file
+    ]
+)
+
+_QUARTER_DIR = re.compile(r"^QTR([1-4])$")
+_DAILY_MASTER = re.compile(r"^master\.(\d{8})\.idx$")
+
+
+def default_idx_dataset_dir() -> Path:
+    """Default location of the partitioned index dataset."""
+    return settings.idx_dataset_dir
+
+
+def partition_path(dataset_dir: str | Path, year: int, qtr: int) -> Path:
+    """Parquet file holding one quarter of the index."""
+    return Path(dataset_dir) / f"year={int(year)}" / f"qtr={int(qtr)}" / PARTITION_FILE
+
+
+def daily_partition_path(dataset_dir: str | Path, day: date) -> Path:
+    """Delta file holding one daily index inside its quarter's directory."""
+    qtr = (day.month - 1) // 3 + 1
+    return (
+        Path(dataset_dir)
+        / f"year={day.year}"
+        / f"qtr={qtr}"
+        / f"{DAILY_PREFIX}{day:%Y%m%d}.parquet"
+    )
+
+
+def _partition_key(year: int, qtr: int) -> str:
+    return f"{int(year)}/QTR{int(qtr)}"
+
+
+def _read_manifest(dataset_dir: Path) -> dict:
+    path = dataset_dir / MANIFEST_NAME
+    manifest = {"partitions": {}, "daily": {}, "counts": {}}
+    if path.exists():
+        try:
+            with open(path, encoding="utf-8") as f:
+                manifest.update(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable index manifest {path}: {e}")
+    return manifest
+
+
+def load_manifest(
+    dataset_dir: str | Path | None = None, section: str = "partitions"
+) -> dict:
+    """
+    Dataset manifest entries with source path, sha256 and row count.
+
+    Args:
+        dataset_dir: Dataset directory (defaults to settings.idx_dataset_dir)
+        section: "partitions" (keyed "YEAR/QTRn"), "daily" (keyed
+            "YYYYMMDD") or "counts" (hash of each file in the count cube)
+    """
+    return _read_manifest(Path(dataset_dir or default_idx_dataset_dir()))[section]
+
+
+def _save_manifest(dataset_dir: Path, manifest: dict) -> None:
+    atomic_write(
+        dataset_dir / MANIFEST_NAME,
+        json.dumps(manifest, indent=2, sort_keys=True),
+    )
+
+
+def quarterly_idx_files(
+    full_index_dir: str | Path | None = None, filename: str = "master.idx"
+) -> list[tuple[int, int, Path]]:
+    """
+    Quarterly index files laid out as YEAR/QTRn/<filename>.
+
+    Args:
+        full_index_dir: full-index directory (defaults to settings)
+        filename: Index file to use for each quarter
+
+    Returns:
+        (year, quarter, path) tuples sorted by year and quarter
+    """
+    root = Path(full_index_dir or settings.full_index_data_dir)
+    quarters = []
+    for path in root.glob(f"*/QTR*/{filename}"):
+        match = _QUARTER_DIR.match(path.parent.name)
+        if match and path.parent.parent.name.isdigit():
+            quarters.append((int(path.parent.parent.name), int(match.group(1)), path))
+    return sorted(quarters)
+
+
+def typed_index_table(table: pa.Table) -> pa.Table:
+    """
+    Convert a ``read_idx_table`` result to ``INDEX_SCHEMA``.
+
+    Dates are accepted as YYYY-MM-DD (quarterly indexes) or YYYYMMDD (daily
+    indexes). Duplicate (CIK, accession) rows are dropped and the rest
+    sorted by (CIK, date).
+    """
+    keep = unique_row_positions(table["CIK"], accession_keys(table["Filename"]))
+    if len(keep) < table.num_rows:
+        table = table.take(keep)
+    digits = pc.replace_substring(table["Date Filed"], "-", "")
+    dates = pc.strptime(digits, format="%Y%m%d", unit="s", error_is_null=True)
+    accession = pc.struct_field(
+        pc.extract_regex(table["Filename"], ACCESSION_PATTERN), [0]
+    )
+    typed = pa.table(
+        [
+            pc.cast(table["CIK"], pa.int32()),
+            pc.dictionary_encode(table["Company Name"]),
+            pc.dictionary_encode(table["Form Type"]),
+            pc.cast(dates, pa.date32()),
+            table["Filename"],
+            accession,
+        ],
+        schema=INDEX_SCHEMA,
+    )
+    return typed.sort_by([("CIK", "ascending"), ("Date Filed", "ascending")])
+
+
+def write_partition(
+    table: pa.Table, dataset_dir: str | Path, year: int, qtr: int
+) -> Path:
+    """Replace one quarter's partition atomically."""
+    return _write_dataset_file(table, partition_path(dataset_dir, year, qtr))
+
+
+def _write_dataset_file(table: pa.Table, path: Path) -> Path:
+    """
+    Write a dataset file atomically.
+
+    The temporary file starts with a dot so concurrent dataset scans,
+    which skip hidden files, never see a half-written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    pq.write_table(
+        table,
+        temp_path,
+        compression="snappy",
+        row_group_size=ROW_GROUP_SIZE,
+        write_statistics=True,
+    )
+    os.replace(temp_path, path)
+    return path
+
+
+def _update_partition(task: tuple) -> dict | None:
+    """
+    Rebuild one quarter's partition if its source changed (pool worker).
+
+    Hashing runs in the worker too, so a bootstrap of many quarters hashes
+    and parses them in parallel.
+
+    Returns:
+        New manifest entry, or None when the partition is current
+    """
+    year, qtr, source, dataset_dir, entry, force = task
+    digest = sha256_file(source)
+    if (
+        not force
+        and entry.get("sha256") == digest
+        and entry.get("schema") == SCHEMA_VERSION
+        and partition_path(dataset_dir, year, qtr).exists()
+    ):
+        return None
+
+    table = typed_index_table(read_idx_table(source))
+    write_partition(table, dataset_dir, year, qtr)
+    max_date = pc.max(table["Date Filed"]).as_py()
+    return {
+        "source": str(source),
+        "sha256": digest,
+        "rows": table.num_rows,
+        "max_date": max_date.isoformat() if max_date else None,
+        "schema": SCHEMA_VERSION,
+        "updated": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def update_idx_dataset(
+    full_index_dir: str | Path | None = None,
+    dataset_dir: str | Path | None = None,
+    force: bool = False,
+    max_workers: int | None = None,
+    show_progress: bool = False,
+) -> dict:
+    """
+    Bring the partitioned index dataset up to date with the local .idx files.
+
+    Quarters are processed in a process pool, one quarter per task. Only
+    quarters whose master.idx hash differs from the manifest, whose
+    partition was written with an older ``SCHEMA_VERSION``, or whose
+    partition file is missing are re-parsed and rewritten; a quarter that
+    fails is logged and left as it was.
+
+    Args:
+        full_index_dir: full-index directory holding YEAR/QTRn/master.idx
+        dataset_dir: Dataset directory (defaults to settings.idx_dataset_dir)
+        force: Rewrite every partition regardless of the manifest
+        max_workers: Worker processes (defaults to CPUs - 1)
+        show_progress: Display a progress bar
+
+    Returns:
+        Counts of written, skipped and failed partitions
+    """
+    dataset_dir = Path(dataset_dir or default_idx_dataset_dir())
+    manifest = _read_manifest(dataset_dir)
+    partitions = manifest["partitions"]
+    tasks = [
+        (
+            year,
+            qtr,
+            source,
+            dataset_dir,
+            partitions.get(_partition_key(year, qtr), {}),
+            force,
+        )
+        for year, qtr, source in quarterly_idx_files(full_index_dir)
+    ]
+
+    results = run_parallel(
+        _update_partition,
+        tasks,
+        max_workers=max_workers,
+        description="Updating index partitions",
+        show_progress=show_progress,
+    )
+
+    counts = {"written": 0, "skipped": 0, "failed": 0}
+    for result in results:
+        year, qtr = result.item[:2]
+        if not result.ok:
+            counts["failed"] += 1
+        elif result.value is None:
+            counts["skipped"] += 1
+        else:
+            partitions[_partition_key(year, qtr)] = result.value
+            counts["written"] += 1
+
+    if counts["written"]:
+        _fold_daily_deltas(dataset_dir, manifest)
+    # Datasets built before the count cube existed get one on the next update
+    if counts["written"] or (partitions and not (dataset_dir / COUNTS_NAME).exists()):
+        _update_counts(dataset_dir, manifest)
+        _save_manifest(dataset_dir, manifest)
+    logger.info(
+        f"Index dataset: {counts['written']} partitions written, "
+        f"{counts['skipped']} unchanged, {counts['failed']} failed"
+    )
+    return counts
+
+
+def daily_idx_files(
+    daily_index_dir: str | Path | None = None,
+) -> list[tuple[date, Path]]:
+    """Daily master.YYYYMMDD.idx files laid out as YEAR/QTRn/, sorted by day."""
+    root = Path(daily_index_dir or settings.daily_index_data_dir)
+    days = []
+    for path in root.glob("*/QTR*/master.*.idx"):
+        match = _DAILY_MASTER.match(path.name)
+        if match:
+            try:
+                days.append((datetime.strptime(match.group(1), "%Y%m%d").date(), path))
+            except ValueError:
+                continue
+    return sorted(days)
+
+
+def _covered_by_quarter(partitions: dict, day: date) -> bool:
+    """True when the quarterly partition already includes filings of ``day``."""
+    entry = partitions.get(_partition_key(day.year, (day.month - 1) // 3 + 1), {})
+    max_date = entry.get("max_date")
+    return bool(max_date) and date.fromisoformat(max_date) >= day
+
+
+def _fold_daily_deltas(dataset_dir: Path, manifest: dict) -> int:
+    """Drop delta files whose day the quarterly partitions now cover."""
+    folded = 0
+    for key in list(manifest["daily"]):
+        day = datetime.strptime(key, "%Y%m%d").date()
+        if _covered_by_quarter(manifest["partitions"], day):
+            daily_partition_path(dataset_dir, day).unlink(missing_ok=True)
+            del manifest["daily"][key]
+            folded += 1
+    if folded:
+        logger.info(f"Folded {folded} daily index deltas into quarterly partitions")
+    return folded
+
+
+def update_daily_delta(
+    daily_index_dir: str | Path | None = None,
+    dataset_dir: str | Path | None = None,
+    force: bool = False,
+) -> dict:
+    """
+    Ingest daily master indexes not yet covered by the quarterly partitions.
+
+    Each daily file becomes one delta file in its quarter's directory, so
+    searches see filings up to the last business day without a rebuild.
+    Days already present in the quarterly master.idx are not ingested, and
+    deltas they cover are dropped.
+
+    Args:
+        daily_index_dir: daily-index directory holding YEAR/QTRn/master.*.idx
+        dataset_dir: Dataset directory (defaults to settings.idx_dataset_dir)
+        force: Rewrite delta files regardless of the manifest
+
+    Returns:
+        Counts of written, skipped, covered (by quarterly data), folded and
+        failed daily files
+    """
+    dataset_dir = Path(dataset_dir or default_idx_dataset_dir())
+    manifest = _read_manifest(dataset_dir)
+    daily = manifest["daily"]
+    counts = {"written": 0, "skipped": 0, "covered": 0, "folded": 0, "failed": 0}
+
+    for day, source in daily_idx_files(daily_index_dir):
+        if _covered_by_quarter(manifest["partitions"], day):
+            counts["covered"] += 1
+            continue
+        key = f"{day:%Y%m%d}"
+        path = daily_partition_path(dataset_dir, day)
+        try:
+            digest = sha256_file(source)
+            entry = daily.get(key, {})
+            if (
+                not force
+                and entry.get("sha256") == digest
+                and entry.get("schema") == SCHEMA_VERSION
+                and path.exists()
+            ):
+                counts["skipped"] += 1
+                continue
+
+            table = typed_index_table(read_idx_table(source))
+            _write_dataset_file(table, path)
+        except Exception as e:
+            logger.error(f"❌ Failed to ingest daily index {source}: {e}")
+            counts["failed"] += 1
+            continue
+
+        daily[key] = {
+            "source": str(source),
+            "sha256": digest,
+            "rows": table.num_rows,
+            "schema": SCHEMA_VERSION,
+            "updated": datetime.now().isoformat(timespec="seconds"),
+        }
+        counts["written"] += 1
+
+    counts["folded"] = _fold_daily_deltas(dataset_dir, manifest)
+    if counts["written"] or counts["folded"]:
+        _update_counts(dataset_dir, manifest)
+        _save_manifest(dataset_dir, manifest)
+    logger.info(
+        f"Daily index deltas: {counts['written']} written, "
+        f"{counts['skipped']} unchanged, {counts['covered']} already in "
+        f"quarterly data, {counts['failed']} failed"
+    )
+    return counts
+
+
+def _dataset_files(dataset_dir: Path, manifest: dict) -> dict[str, tuple[str, Path]]:
+    """Every file in the manifest as key -> (content hash, path)."""
+    files = {}
+    for key, entry in manifest["partitions"].items():
+        year, qtr = key.split("/QTR")
+        files[key] = (
+            f"{entry.get('sha256')}:{entry.get('schema')}",
+            partition_path(dataset_dir, int(year), int(qtr)),
+        )
+    for key, entry in manifest["daily"].items():
+        day = datetime.strptime(key, "%Y%m%d").date()
+        files[f"daily/{key}"] = (
+            f"{entry.get('sha256')}:{entry.get('schema')}",
+            daily_partition_path(dataset_dir, day),
+        )
+    return files
+
+
+def count_filings(table: pa.Table, source: str = "") -> pa.Table:
+    """Filing counts of an index table by (CIK, form type, day)."""
+    grouped = table.group_by(["CIK", "Form Type", "Date Filed"]).aggregate(
+        [("CIK", "count")]
+    )
+    dates = grouped["Date Filed"]
+    return pa.table(
+        [
+            pc.cast(grouped["CIK"], pa.int32()),
+            pc.cast(grouped["Form Type"], pa.string()),
+            pc.cast(pc.year(dates), pa.int16()),
+            pc.cast(pc.quarter(dates), pa.int8()),
+            dates,
+            pc.cast(grouped["CIK_count"], pa.int32()),
+            pa.array([source] * grouped.num_rows, pa.string()),
+        ],
+        schema=COUNTS_SCHEMA,
+    )
+
+
+def _update_counts(dataset_dir: Path, manifest: dict) -> None:
+    """
+    Bring the count cube in line with the manifest.
+
+    Rows of files that were rewritten or removed since the cube was last
+    built are replaced; everything else is kept as it is.
+    """
+    files = _dataset_files(dataset_dir, manifest)
+    built = manifest["counts"]
+    path = dataset_dir / COUNTS_NAME
+    if path.exists():
+        stale = [key for key, (digest, _) in files.items() if built.get(key) != digest]
+        dropped = stale + [key for key in built if key not in files]
+        if not dropped:
+            return
+        cube = pq.read_table(path, schema=COUNTS_SCHEMA)
+        cube = cube.filter(pc.invert(pc.is_in(cube["source"], pa.array(dropped))))
+    else:
+        stale = list(files)
+        cube = COUNTS_SCHEMA.empty_table()
+
+    columns = ["CIK", "Form Type", "Date Filed"]
+    tables = [cube]
+    for key in stale:
+        file_path = files[key][1]
+        if file_path.exists():
+            tables.append(count_filings(pq.read_table(file_path, columns=columns), key))
+    cube = pa.concat_tables(tables).sort_by(
+        [("CIK", "ascending"), ("Date Filed", "ascending")]
+    )
+    _write_dataset_file(cube, path)
+    manifest["counts"] = {key: digest for key, (digest, _) in files.items()}
+    logger.info(f"Filing counts: recounted {len(stale)} index files")
+
+
+def load_filing_counts(
+    filter: ds.Expression | None = None, dataset_dir: str | Path | None = None
+) -> pa.Table:
+    """
+    Filing counts by (CIK, form type, year, quarter, day).
+
+    The cube is built on the first call when the dataset predates it.
+
+    Args:
+        filter: Row filter expression, e.g. ``ds.field("CIK") == 320193``
+        dataset_dir: Dataset directory (defaults to settings.idx_dataset_dir)
+
+    Returns:
+        Arrow table with ``COUNTS_SCHEMA`` columns
+    """
+    dataset_dir = Path(dataset_dir or default_idx_dataset_dir())
+    path = dataset_dir / COUNTS_NAME
+    if not path.exists():
+        if not idx_dataset_exists(dataset_dir):
+            raise FileNotFoundError(
+                f"No index dataset found at {dataset_dir}. "
+                "Run: py-sec-edgar feeds update-full-index"
+            )
+        manifest = _read_manifest(dataset_dir)
+        _update_counts(dataset_dir, manifest)
+        _save_manifest(dataset_dir, manifest)
+    return ds.dataset(str(path), format="parquet").to_table(filter=filter)
+
+
+def form_type_counts(cik: int, dataset_dir: str | Path | None = None) -> dict[str, int]:
+    """Number of filings per form type for one company, most frequent first."""
+    cube = load_filing_counts(ds.field("CIK") == int(cik), dataset_dir)
+    totals = cube.group_by("Form Type").aggregate([("count", "sum")])
+    totals = totals.sort_by([("count_sum", "descending"), ("Form Type", "ascending")])
+    return dict(
+        zip(
+            totals["Form Type"].to_pylist(),
+            totals["count_sum"].to_pylist(),
+            strict=True,
+        )
+    )
+
+
+def idx_dataset_exists(dataset_dir: str | Path | None = None) -> bool:
+    """True when at least one index partition or daily delta has been written."""
+    dataset_dir = Path(dataset_dir or default_idx_dataset_dir())
+    return dataset_dir.is_dir() and any(dataset_dir.glob("year=*/qtr=*/*.parquet"))
+
+
+def idx_index_available() -> bool:
+    """True when either the partitioned dataset or the merged index exists."""
+    return idx_dataset_exists() or settings.merged_idx_filepath.exists()
+
+
+def open_idx_dataset(dataset_dir: str | Path | None = None) -> ds.Dataset:
+    """Open the partitioned index as a ``pyarrow.dataset`` (hive partitioning)."""
+    return ds.dataset(
+        str(dataset_dir or default_idx_dataset_dir()),
+        format="parquet",
+        partitioning="hive",
+    )
+
+
+def load_idx_index(
+    columns: list[str] | None = None,
+    filter: ds.Expression | None = None,
+    dataset_dir: str | Path | None = None,
+) -> pa.Table:
+    """
+    Read the full index, from the partitioned dataset when it exists.
+
+    Falls back to the single merged Parquet file built by
+    ``merge_idx_files`` so installations that have not rebuilt their index
+    keep working.
+
+    Args:
+        columns: Columns to read (all when None)
+        filter: Row filter expression, pushed down to the scan
+        dataset_dir: Dataset directory (defaults to settings.idx_dataset_dir)
+
+    Returns:
+        Arrow table of index rows
+    """
+    return open_idx_index(dataset_dir).to_table(columns=columns, filter=filter)
+
+
+def open_idx_index(dataset_dir: str | Path | None = None) -> ds.Dataset:
+    """
+    The full index as a lazy ``pyarrow.dataset``, without reading any rows.
+
+    Opens the partitioned dataset when it exists and the merged Parquet
+    file otherwise. In the merged file ``Date Filed`` is a string, so
+    callers building date predicates should check ``dataset.schema``.
+    """
+    if idx_dataset_exists(dataset_dir):
+        return open_idx_dataset(dataset_dir)
+    merged_path = settings.merged_idx_filepath
+    if not merged_path.exists():
+        raise FileNotFoundError(
+            f"No index dataset or merged index found at {merged_path}. "
+            "Run: py-sec-edgar feeds update-full-index"
+        )
+    return ds.dataset(str(merged_path), format="parquet")
+
+
+def load_idx_frame(
+    columns: list[str] | None = None,
+    filter: ds.Expression | None = None,
+    dataset_dir: str | Path | None = None,
+) -> pd.DataFrame:
+    """
+    ``load_idx_index`` as a DataFrame.
+
+    Dictionary columns become categoricals and ``Date Filed`` arrives as
+    datetime64, so callers can filter by date without ``pd.to_datetime``.
+    """
+    return load_idx_index(columns, filter, dataset_dir).to_pandas(date_as_object=False)
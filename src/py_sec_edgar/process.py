@@ -41,8 +41,10 @@ import logging
 import os
 from urllib.parse import urljoin
 
+from .core.document_store import ContainerPool
 from .core.path_utils import safe_join
-from .extract import extract
+from .extract import DocumentFilter, extract, extract_to_container
+from .settings import settings
 from .utilities import download
 
 logger = logging.getLogger(__name__)
@@ -61,6 +63,12 @@ class FilingProcessor:
         edgar_Archives_url (str): Base URL for SEC EDGAR Archives.
         download_enabled (bool): Whether to download filing files.
         extract_enabled (bool): Whether to extract filing documents.
+        index_text_enabled (bool): Whether to add extracted filings to the
+            local full-text index.
+        container_layout (str | None): Document container layout ("cik" or
+            "quarter"), or None to write one file per document.
+        document_filter (DocumentFilter | None): Documents to extract; others
+            are only listed in the extraction manifest.
 
     Example:
         ```python
@@ -79,6 +87,9 @@ class FilingProcessor:
         edgar_Archives_url: str,
         download: bool = True,
         extract: bool = False,
+        index_text: bool | None = None,
+        container_layout: str | None = None,
+        document_filter: DocumentFilter | None = None,
     ) -> None:
         """Initialize the FilingProcessor with configuration options.
 
@@ -87,6 +98,12 @@ class FilingProcessor:
             edgar_Archives_url: Base URL for SEC EDGAR Archives.
             download: Enable automatic filing downloads.
             extract: Enable automatic filing extraction.
+            index_text: Add extracted filings to the local full-text index
+                (settings.index_text_on_extract when None).
+            container_layout: Extract into document containers ("cik" or
+                "quarter") instead of one file per document.
+            document_filter: Only extract documents matching this filter
+                (e.g. skip GRAPHIC, ZIP and EX-101 documents).
         """
         logger.info("Initializing FilingProcessor...")
 
@@ -95,6 +112,27 @@ class FilingProcessor:
 
         self.download_enabled = download
         self.extract_enabled = extract
+        self.index_text_enabled = (
+            settings.index_text_on_extract if index_text is None else index_text
+        )
+        self.container_layout = container_layout
+        self.document_filter = document_filter
+        self.containers = ContainerPool() if container_layout else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the document containers kept open across filings.
+
+        Containers written with ``container_layout`` stay open for the whole
+        batch, so their zip central directories are written here, once.
+        """
+        if self.containers is not None:
+            self.containers.close()
 
     def generate_filepaths(self, sec_filing: dict) -> dict:
         """Generate standardized file paths for SEC filing storage.
@@ -192,11 +230,43 @@ class FilingProcessor:
             logger.info(
                 f"Extracting filing: {filing_filepaths.get('filing_filepath', 'N/A')}"
             )
-            filing_content = extract(filing_filepaths)
+            if self.container_layout:
+                filing_content = extract_to_container(
+                    filing_filepaths,
+                    layout=self.container_layout,
+                    document_filter=self.document_filter,
+                    containers=self.containers,
+                )
+            else:
+                filing_content = extract(
+                    filing_filepaths, document_filter=self.document_filter
+                )
+                if self.index_text_enabled:
+                    self.index_text(filing_filepaths)
             self.post_process(filing_content)
         else:
             logger.info("⚠️  Extract disabled - skipping file extraction")
 
+    def index_text(self, filing_filepaths: dict) -> None:
+        """Add an extracted filing to the local full-text search index.
+
+        Filings whose source is already indexed are skipped, so this is cheap
+        to call on every run.
+
+        Args:
+            filing_filepaths: Filing dictionary from generate_filepaths.
+        """
+        from .corpus.fulltext import FullTextIndex
+
+        try:
+            with FullTextIndex() as index:
+                count = index.index_filing(
+                    filing_filepaths["extracted_filing_directory"]
+                )
+            logger.info(f"Indexed {count} documents for full-text search")
+        except Exception as e:
+            logger.error(f"Full-text indexing failed: {e}")
+
     def post_process(self, filing_contents: dict) -> None:
         """Hook for custom post-processing of extracted filing contents.
 
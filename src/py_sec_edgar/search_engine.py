@@ -5,23 +5,40 @@ Core search functionality for py-sec-edgar with modern async patterns and
 comprehensive error handling. Built on proven ticker → CIK → filings workflow.
 """
 
-import json
 from datetime import date
 from pathlib import Path
-from typing import Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 
 from py_sec_edgar.settings import settings
 
 from .core.downloader import FilingDownloader
+from .core.identifiers import IdentifierIndex, load_identifier_index
 from .core.models import FilingInfo
-from .core.url_utils import (
-    generate_filing_document_url,
-    generate_sec_website_url,
-    generate_submission_filing_url,
+from .core.search_results import SearchResults, results_table
+from .core.url_utils import generate_filing_url_columns
+from .feeds.index_dataset import (
+    form_type_counts,
+    idx_dataset_exists,
+    idx_index_available,
+    load_idx_frame,
+    open_idx_index,
 )
 
+# Columns a search reads from the index
+_QUERY_COLUMNS = ["CIK", "Form Type", "Date Filed", "Filename"]
+
+
+def _with_datetime_dates(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse ``Date Filed`` when it comes from the legacy string-typed index."""
+    if not pd.api.types.is_datetime64_any_dtype(df["Date Filed"]):
+        df = df.assign(**{"Date Filed": pd.to_datetime(df["Date Filed"])})
+    return df
+
 
 class FilingSearchError(Exception):
     """Custom exception for filing search operations"""
@@ -29,6 +46,13 @@ class FilingSearchError(Exception):
     pass
 
 
+def _ticker_not_found(ticker: str) -> FilingSearchError:
+    return FilingSearchError(
+        f"Ticker '{ticker}' not found in SEC company mapping. "
+        "Verify the ticker symbol is correct and the company files with the SEC."
+    )
+
+
 class FilingSearchEngine:
     """Professional SEC Filing Search Engine for Real-Time and Historical Data.
 
@@ -78,13 +102,18 @@ class FilingSearchEngine:
         client: High-level programmatic interface
     """
 
-    def __init__(self) -> None:
+    def __init__(self, preload_index: bool = False) -> None:
         """Initialize the SEC Filing Search Engine.
 
         Sets up data source paths, initializes caches, and verifies that
         required reference data files are available. Will raise FilingSearchError
         if critical data files are missing.
 
+        Args:
+            preload_index: Keep the whole index in memory, sorted by CIK, for
+                long-running processes doing many lookups. By default each
+                search is a lazy Parquet scan that reads only matching rows.
+
         Raises:
             FilingSearchError: If company_tickers.json or filing index data is missing.
 
@@ -93,12 +122,18 @@ class FilingSearchEngine:
             to optimize performance for applications that may not need all data.
         """
         self.ticker_map_path = settings.ref_dir / "company_tickers.json"
-        self.filing_index_path = settings.merged_idx_filepath
+        self.filing_index_path = (
+            settings.idx_dataset_dir
+            if idx_dataset_exists()
+            else settings.merged_idx_filepath
+        )
         self.edgar_base_url = settings.edgar_archives_url
 
         # Cache for loaded data
-        self._company_tickers: dict | None = None
+        self._identifiers: IdentifierIndex | None = None
+        self._preload_index = preload_index
         self._filing_index: pd.DataFrame | None = None
+        self._cik_index: np.ndarray | None = None
 
         # Verify data sources exist
         self._check_data_sources()
@@ -110,7 +145,7 @@ class FilingSearchEngine:
         if not self.ticker_map_path.exists():
             missing_files.append(str(self.ticker_map_path))
 
-        if not self.filing_index_path.exists():
+        if not idx_index_available():
             missing_files.append(str(self.filing_index_path))
 
         if missing_files:
@@ -119,28 +154,130 @@ class FilingSearchEngine:
                 "To download required data, run: uv run py-sec-edgar feeds update-full-index"
             )
 
-    def _load_company_tickers(self) -> dict[str, Any]:
-        """Load SEC company ticker mapping data"""
-        if self._company_tickers is not None:
-            return self._company_tickers
+    def _load_identifiers(self) -> IdentifierIndex:
+        """Load the compiled ticker/CIK identifier index"""
+        if self._identifiers is not None:
+            return self._identifiers
 
         try:
-            with open(self.ticker_map_path) as f:
-                self._company_tickers = json.load(f)
-            return self._company_tickers
+            self._identifiers = load_identifier_index()
+            return self._identifiers
         except Exception as e:
             raise FilingSearchError(f"Failed to load company tickers: {e}") from e
 
     def _load_filing_index(self) -> pd.DataFrame:
-        """Load SEC filing index data"""
+        """Load SEC filing index data, sorted by CIK"""
         if self._filing_index is not None:
             return self._filing_index
 
         try:
-            self._filing_index = pd.read_parquet(self.filing_index_path)
-            return self._filing_index
+            df = load_idx_frame().sort_values("CIK", kind="stable", ignore_index=True)
         except Exception as e:
             raise FilingSearchError(f"Failed to load filing index: {e}") from e
+        self._filing_index = df
+        self._cik_index = df["CIK"].to_numpy()
+        return self._filing_index
+
+    def _filings_for_cik(self, cik: int) -> pd.DataFrame:
+        """
+        Index rows of one company.
+
+        The index is kept sorted by CIK, so the rows are a contiguous slice
+        found by binary search instead of a scan of every filing.
+        """
+        df = self._load_filing_index()
+        # Match the column dtype so numpy does not upcast the whole column
+        bounds = np.array([cik, cik + 1], dtype=self._cik_index.dtype)
+        start, stop = np.searchsorted(self._cik_index, bounds)
+        return df.iloc[start:stop]
+
+    def _filings_for_ciks(self, ciks: list[int]) -> pd.DataFrame:
+        """Index rows of several companies, one binary search per CIK."""
+        df = self._load_filing_index()
+        needles = np.unique(np.asarray(ciks, dtype=self._cik_index.dtype))
+        starts = np.searchsorted(self._cik_index, needles)
+        lengths = np.searchsorted(self._cik_index, needles + 1) - starts
+        # Concatenated row ranges [start, start + length) of every CIK
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        return df.iloc[offsets + np.arange(lengths.sum())]
+
+    def _query_index(
+        self,
+        ciks: list[int],
+        form_types: list[str] | None = None,
+        start_date: str | date | None = None,
+        end_date: str | date | None = None,
+    ) -> pd.DataFrame:
+        """
+        Index rows of the given companies matching the form and date filters.
+
+        Unless the index is preloaded, this is a ``pyarrow.dataset`` scan:
+        the CIK, form and date predicates are pushed down to Parquet
+        row-group statistics and only the result columns are read, so a
+        one-off search never loads the index into memory.
+        """
+        forms = [ft.upper() for ft in form_types] if form_types else None
+        start = pd.to_datetime(start_date) if start_date else None
+        end = pd.to_datetime(end_date) if end_date else None
+
+        if self._preload_index:
+            df = self._filings_for_ciks(ciks)[_QUERY_COLUMNS]
+        else:
+            try:
+                dataset = open_idx_index()
+            except FileNotFoundError as e:
+                raise FilingSearchError(f"Failed to load filing index: {e}") from e
+            # The legacy merged index stores dates as YYYY-MM-DD strings
+            as_text = pa.types.is_string(dataset.schema.field("Date Filed").type)
+
+            def bound(value: pd.Timestamp) -> str | date:
+                return value.strftime("%Y-%m-%d") if as_text else value.date()
+
+            field = ds.field("CIK")
+            expr = field == ciks[0] if len(ciks) == 1 else field.isin(ciks)
+            if forms:
+                expr &= ds.field("Form Type").isin(forms)
+            if start is not None:
+                expr &= ds.field("Date Filed") >= bound(start)
+            if end is not None:
+                expr &= ds.field("Date Filed") <= bound(end)
+            table = dataset.to_table(columns=_QUERY_COLUMNS, filter=expr)
+            return _with_datetime_dates(table.to_pandas(date_as_object=False))
+
+        df = _with_datetime_dates(df)
+        if forms:
+            df = df[df["Form Type"].isin(forms)]
+        if start is not None:
+            df = df[df["Date Filed"] >= start]
+        if end is not None:
+            df = df[df["Date Filed"] <= end]
+        return df
+
+    @staticmethod
+    def _results_from_frame(df: pd.DataFrame) -> SearchResults:
+        """
+        Arrow-backed results from query rows with ticker and company columns.
+
+        URLs and accession numbers are derived for the whole column at once;
+        FilingInfo objects are only created when the results are accessed.
+        """
+        table = pa.Table.from_pandas(
+            df[["ticker", "company_name", *_QUERY_COLUMNS]], preserve_index=False
+        )
+        filenames = table["Filename"]
+        return SearchResults(
+            results_table(
+                {
+                    "cik": table["CIK"],
+                    "ticker": table["ticker"],
+                    "company_name": table["company_name"],
+                    "form_type": pc.utf8_upper(table["Form Type"]),
+                    "filing_date": table["Date Filed"],
+                    "filename": filenames,
+                    **generate_filing_url_columns(filenames),
+                }
+            )
+        )
 
     def get_cik_for_ticker(self, ticker: str) -> tuple[str, str]:
         """
@@ -156,18 +293,14 @@ class FilingSearchEngine:
             FilingSearchError: If ticker not found
         """
         ticker = ticker.upper().strip()
-        company_data = self._load_company_tickers()
+        identifiers = self._load_identifiers()
 
-        for entry in company_data.values():
-            if entry["ticker"].upper() == ticker:
-                cik = str(entry["cik_str"]).lstrip("0")
-                company_name = entry.get("title", "Unknown Company")
-                return cik, company_name
+        cik = identifiers.cik_for_ticker(ticker)
+        if cik is not None:
+            company_name = identifiers.name_for_cik(cik) or "Unknown Company"
+            return str(cik), company_name
 
-        raise FilingSearchError(
-            f"Ticker '{ticker}' not found in SEC company mapping. "
-            "Verify the ticker symbol is correct and the company files with the SEC."
-        )
+        raise _ticker_not_found(ticker)
 
     def search_by_cik(
         self,
@@ -190,34 +323,11 @@ class FilingSearchEngine:
         Returns:
             List of FilingInfo objects sorted by filing date (newest first)
         """
-        df = self._load_filing_index()
-
-        # Filter by CIK
-        cik_int = int(cik)
-        df_filtered = df[df["CIK"] == cik_int].copy()
+        df_filtered = self._query_index([int(cik)], form_types, start_date, end_date)
 
         if len(df_filtered) == 0:
             return []
 
-        # Filter by form types if specified
-        if form_types:
-            form_types_upper = [ft.upper() for ft in form_types]
-            df_filtered = df_filtered[df_filtered["Form Type"].isin(form_types_upper)]
-
-        # Filter by date range if specified
-        if start_date or end_date:
-            df_filtered["Date Filed"] = pd.to_datetime(df_filtered["Date Filed"])
-
-            if start_date:
-                if isinstance(start_date, str):
-                    start_date = pd.to_datetime(start_date)
-                df_filtered = df_filtered[df_filtered["Date Filed"] >= start_date]
-
-            if end_date:
-                if isinstance(end_date, str):
-                    end_date = pd.to_datetime(end_date)
-                df_filtered = df_filtered[df_filtered["Date Filed"] <= end_date]
-
         # Sort by date (newest first) and apply limit
         df_filtered = df_filtered.sort_values("Date Filed", ascending=False)
         df_filtered = df_filtered.head(limit)
@@ -226,33 +336,59 @@ class FilingSearchEngine:
         company_name = "Unknown Company"
         ticker = "UNKNOWN"
         try:
-            company_data = self._load_company_tickers()
-            for entry in company_data.values():
-                if str(entry["cik_str"]).lstrip("0") == cik:
-                    company_name = entry.get("title", "Unknown Company")
-                    ticker = entry.get("ticker", "UNKNOWN")
-                    break
+            identifiers = self._load_identifiers()
+            company_name = identifiers.name_for_cik(cik) or company_name
+            ticker = identifiers.ticker_for_cik(cik) or ticker
         except Exception:
             pass  # Use defaults if lookup fails
 
-        # Convert to FilingInfo objects
-        results = []
-        for _, row in df_filtered.iterrows():
-            filing_info = FilingInfo.from_search_result(
-                ticker=ticker,
-                company_name=company_name,
-                cik=cik,
-                form_type=row["Form Type"],
-                filing_date=str(row["Date Filed"]).split()[0],  # Date only, no time
-                document_url=generate_filing_document_url(
-                    row["Filename"], row["Form Type"]
-                ),
-                filename=row["Filename"],
-                # Enhanced URL fields
-                submission_url=generate_submission_filing_url(row["Filename"]),
-                sec_website_url=generate_sec_website_url(row["Filename"]),
+        return self._results_from_frame(
+            df_filtered.assign(ticker=ticker, company_name=company_name)
+        ).filings
+
+    def search(
+        self,
+        ticker: str | list[str],
+        form_types: list[str] | None = None,
+        start_date: str | date | None = None,
+        end_date: str | date | None = None,
+        limit: int = 50,
+        per_form: bool = False,
+    ) -> SearchResults:
+        """
+        Search filings by ticker symbol(s), returning Arrow-backed results
+
+        Same as ``search_by_ticker`` but without creating a FilingInfo object
+        per filing, which keeps large result sets cheap to filter and export.
+
+        Args:
+            ticker: Stock ticker symbol (e.g., 'AAPL') or list of tickers, or comma-separated string
+            form_types: List of SEC form types to include (e.g., ['10-K', '10-Q'])
+            start_date: Earliest filing date to include
+            end_date: Latest filing date to include
+            limit: Maximum number of results to return per ticker
+            per_form: Apply ``limit`` per ticker and form type instead
+
+        Returns:
+            SearchResults sorted by filing date (newest first)
+
+        Raises:
+            FilingSearchError: If ticker not found or search fails
+        """
+        tickers = self._parse_tickers(ticker)
+        results, unknown = self.search_batch(
+            tickers, form_types, start_date, end_date, limit=limit, per_form=per_form
+        )
+
+        if len(tickers) == 1:
+            if unknown:
+                raise _ticker_not_found(tickers[0])
+            return results
+
+        if not results:
+            raise FilingSearchError(
+                f"No filings found for any of the provided tickers: {', '.join(tickers)}"
             )
-            results.append(filing_info)
 
         return results
 
@@ -263,6 +399,7 @@ class FilingSearchEngine:
         start_date: str | date | None = None,
         end_date: str | date | None = None,
         limit: int = 50,
+        per_form: bool = False,
     ) -> list[FilingInfo]:
         """
         Search filings by ticker symbol(s) with filtering options
@@ -273,6 +410,7 @@ class FilingSearchEngine:
             start_date: Earliest filing date to include
             end_date: Latest filing date to include
             limit: Maximum number of results to return per ticker
+            per_form: Apply ``limit`` per ticker and form type instead
 
         Returns:
             List of FilingInfo objects sorted by filing date (newest first)
@@ -280,13 +418,15 @@ class FilingSearchEngine:
         Raises:
             FilingSearchError: If ticker not found or search fails
         """
-        # Handle different input formats
+        return self.search(
+            ticker, form_types, start_date, end_date, limit=limit, per_form=per_form
+        ).filings
+
+    @staticmethod
+    def _parse_tickers(ticker: str | list[str]) -> list[str]:
+        """Upper-cased tickers from a symbol, comma-separated string or list"""
         if isinstance(ticker, str):
-            # Check if comma-separated
-            if "," in ticker:
-                tickers = [t.strip().upper() for t in ticker.split(",") if t.strip()]
-            else:
-                tickers = [ticker.upper().strip()]
+            tickers = [t.strip().upper() for t in ticker.split(",") if t.strip()]
         elif isinstance(ticker, list):
             tickers = [t.upper().strip() for t in ticker]
         else:
@@ -294,88 +434,73 @@ class FilingSearchEngine:
 
         if not tickers:
             raise FilingSearchError("No valid tickers provided")
+        return tickers
 
-        # For single ticker, use original logic
-        if len(tickers) == 1:
-            return self._search_single_ticker(
-                tickers[0], form_types, start_date, end_date, limit
-            )
-
-        # For multiple tickers, search each and combine results
-        all_results = []
-        failed_tickers = []
-
-        for single_ticker in tickers:
-            try:
-                results = self._search_single_ticker(
-                    single_ticker, form_types, start_date, end_date, limit
-                )
-                all_results.extend(results)
-            except FilingSearchError:
-                # Continue with other tickers if one fails
-                failed_tickers.append(single_ticker)
-                continue
-
-        if not all_results:
-            if failed_tickers:
-                raise FilingSearchError(
-                    f"No filings found for any of the provided tickers: {', '.join(tickers)}"
-                )
-            else:
-                raise FilingSearchError(
-                    f"No filings found for any of the provided tickers: {', '.join(tickers)}"
-                )
-
-        # Sort combined results by filing date (newest first)
-        all_results.sort(key=lambda x: x.filing_date, reverse=True)
-
-        return all_results
-
-    def _search_single_ticker(
+    def search_batch(
         self,
-        ticker: str,
+        tickers: list[str],
         form_types: list[str] | None = None,
         start_date: str | date | None = None,
         end_date: str | date | None = None,
         limit: int = 50,
-    ) -> list[FilingInfo]:
+        per_form: bool = False,
+    ) -> tuple[SearchResults, list[str]]:
         """
-        Search filings for a single ticker (internal method)
+        Search filings for many tickers in one pass over the index
+
+        All tickers are resolved up front and the index is queried once for
+        every CIK and form type together. ``limit`` is then applied per
+        ticker with a group-wise top-N on filing date, so screening a large
+        universe costs one scan instead of one per ticker and form type.
 
         Args:
-            ticker: Single stock ticker symbol (e.g., 'AAPL')
-            form_types: List of SEC form types to include
+            tickers: Stock ticker symbols
+            form_types: List of SEC form types to include (e.g., ['10-K', '10-Q'])
             start_date: Earliest filing date to include
             end_date: Latest filing date to include
-            limit: Maximum number of results to return
+            limit: Maximum number of results per ticker
+            per_form: Apply ``limit`` per ticker and form type instead
 
         Returns:
-            List of FilingInfo objects for the ticker
+            tuple: (SearchResults sorted by filing date (newest first),
+            tickers not found in the SEC company mapping)
         """
-        try:
-            # Get CIK for ticker
-            cik, company_name = self.get_cik_for_ticker(ticker)
-
-            # Search by CIK
-            results = self.search_by_cik(
-                cik=cik,
-                form_types=form_types,
-                start_date=start_date,
-                end_date=end_date,
-                limit=limit,
-            )
-
-            # Update company info in results
-            for result in results:
-                result.ticker = ticker.upper()
-                result.company_name = company_name
-
-            return results
+        identifiers = self._load_identifiers()
+        companies: dict[str, tuple[int, str]] = {}
+        unknown: list[str] = []
+        for ticker in tickers:
+            ticker = ticker.strip().upper()
+            cik = identifiers.cik_for_ticker(ticker)
+            if cik is None:
+                unknown.append(ticker)
+            elif ticker not in companies:
+                name = identifiers.name_for_cik(cik) or "Unknown Company"
+                companies[ticker] = (cik, name)
+
+        if not companies:
+            return SearchResults([]), unknown
+
+        ciks = sorted({cik for cik, _ in companies.values()})
+        df = self._query_index(ciks, form_types, start_date, end_date)
+        if len(df) == 0:
+            return SearchResults([]), unknown
+
+        resolved = pd.DataFrame(
+            {
+                "ticker": list(companies),
+                "CIK": np.array([cik for cik, _ in companies.values()]).astype(
+                    df["CIK"].dtype
+                ),
+                "company_name": [name for _, name in companies.values()],
+            }
+        )
+        # Tickers sharing a CIK (share classes) each get the company's filings
+        df = df.merge(resolved, on="CIK")
+        df = df.sort_values("Date Filed", ascending=False, kind="stable")
+        keys = ["ticker", "Form Type"] if per_form else ["ticker"]
+        df = df.groupby(keys, sort=False, observed=True).head(limit)
 
-        except Exception as e:
-            if isinstance(e, FilingSearchError):
-                raise
-            raise FilingSearchError(f"Failed to search for {ticker}: {e}") from e
+        return self._results_from_frame(df), unknown
 
     # UNUSED: get_latest_filing method - not currently called but useful utility for getting most recent filing
     # def get_latest_filing(
@@ -413,15 +538,17 @@ class FilingSearchEngine:
         """
         try:
             cik, _ = self.get_cik_for_ticker(ticker)
-            df = self._load_filing_index()
+            if idx_dataset_exists():
+                return form_type_counts(int(cik))
 
-            cik_int = int(cik)
-            company_filings = df[df["CIK"] == cik_int]
+            company_filings = self._query_index([int(cik)])
 
             if len(company_filings) == 0:
                 return {}
 
-            return company_filings["Form Type"].value_counts().to_dict()
+            # Categorical form types also count categories with no filings
+            counts = company_filings["Form Type"].value_counts()
+            return counts[counts > 0].to_dict()
 
         except Exception as e:
             raise FilingSearchError(
@@ -81,6 +81,21 @@ class SECEdgarSettings(BaseSettings):
         """Data directory."""
         return self.edgar_data_dir / "data"
 
+    @property
+    def filings_data_dir(self) -> Path:
+        """Downloaded and extracted filings directory (CIK/FOLDER layout)."""
+        return self.base_dir / "data" / "Archives" / "edgar" / "data"
+
+    @property
+    def corpus_dir(self) -> Path:
+        """Derived corpus indexes (sections, full-text, structured data)."""
+        return self.sec_data_directory / "corpus"
+
+    @property
+    def document_store_dir(self) -> Path:
+        """Container-based document store (zip per CIK or quarter)."""
+        return self.sec_data_directory / "document_store"
+
     @property
     def monthly_data_dir(self) -> Path:
         """Monthly data directory."""
@@ -112,6 +127,11 @@ class SECEdgarSettings(BaseSettings):
         """CIK tickers CSV file path."""
         return self.ref_dir / "cik_tickers.csv"
 
+    @property
+    def identifier_index_filepath(self) -> Path:
+        """Compiled ticker/CIK/name/exchange index (see core.identifiers)."""
+        return self.ref_dir / "identifiers.parquet"
+
     @property
     def ticker_list_filepath(self) -> Path:
         """Ticker list CSV file path."""
@@ -122,6 +142,16 @@ class SECEdgarSettings(BaseSettings):
         """Merged index file path."""
         return self.ref_dir / "merged_idx_files.pq"
 
+    @property
+    def idx_dataset_dir(self) -> Path:
+        """Hive-partitioned (year=/qtr=) Parquet dataset of the full index."""
+        return self.ref_dir / "idx_dataset"
+
+    @property
+    def query_cache_dir(self) -> Path:
+        """On-disk search result cache shared by CLI invocations."""
+        return self.ref_dir / "query_cache"
+
     # SEC URLs
     edgar_archives_url: str = Field(
         default="https://www.sec.gov/Archives/", description="SEC EDGAR Archives URL"
@@ -168,12 +198,23 @@ class SECEdgarSettings(BaseSettings):
 
     timeout: int = Field(default=30, description="Request timeout in seconds")
 
+    # Search settings
+    query_cache_size: int = Field(
+        default=256,
+        description="Search results kept in the query cache (0 disables caching)",
+    )
+
     # Filing processing settings
     forms_list: list[str] | str = Field(
         default=["10-K", "10-Q", "8-K", "DEF 14A", "13F-HR", "SC 13G", "SC 13D"],
         description="List of filing forms to process",
     )
 
+    index_text_on_extract: bool = Field(
+        default=True,
+        description="Add filings to the local full-text index as they are extracted",
+    )
+
     default_tickers: list[str] | str = Field(
         default=["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA"],
         description="Default ticker symbols to process",
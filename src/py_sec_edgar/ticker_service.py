@@ -58,6 +58,7 @@ from datetime import datetime, timedelta
 import aiofiles
 import aiohttp
 
+from .core.identifiers import IdentifierIndex, load_identifier_index
 from .settings import settings
 
 logger = logging.getLogger(__name__)
@@ -108,7 +109,7 @@ class TickerExchangeService:
         self.cache_file = settings.sec_data_directory / "company_tickers_exchange.json"
         self.cache_duration = timedelta(hours=24)  # Cache for 24 hours
         self._ticker_data: dict | None = None
-        self._cik_to_ticker: dict[str, str] | None = None
+        self._identifiers: IdentifierIndex | None = None
         self._last_updated: datetime | None = None
 
     async def fetch_and_cache_tickers(self, force_refresh: bool = False) -> bool:
@@ -203,55 +204,36 @@ class TickerExchangeService:
         return datetime.now() - self._last_updated < self.cache_duration
 
     def _build_cik_mapping(self):
-        """Build CIK to ticker mapping for fast lookups."""
-        if not self._ticker_data:
-            return
-
-        self._cik_to_ticker = {}
-
-        # The SEC data format is: {"fields": [...], "data": [[...], ...]}
-        data_entries = self._ticker_data.get("data", [])
-        fields = self._ticker_data.get("fields", [])
-
-        # Find the indices for CIK and ticker fields
-        cik_index = None
-        ticker_index = None
-
-        for i, field in enumerate(fields):
-            if field.lower() == "cik":
-                cik_index = i
-            elif field.lower() in ["ticker", "symbol"]:
-                ticker_index = i
+        """Point CIK lookups at the shared identifier index.
 
-        if cik_index is None or ticker_index is None:
-            logger.warning("Could not find CIK or ticker fields in data")
+        The index recompiles itself when the cache file changed, so a fresh
+        download is picked up without building a separate mapping here.
+        """
+        if not self._ticker_data:
             return
 
-        # Build the mapping
-        for entry in data_entries:
-            if len(entry) > max(cik_index, ticker_index):
-                cik = str(entry[cik_index]).zfill(10)  # Pad CIK to 10 digits
-                ticker = entry[ticker_index]
-                if cik and ticker:
-                    self._cik_to_ticker[cik] = ticker
+        self._identifiers = load_identifier_index()
+        logger.info(f"Identifier index has {len(self._identifiers)} ticker entries")
 
-        logger.info(
-            f"Built CIK-to-ticker mapping with {len(self._cik_to_ticker)} entries"
-        )
+    async def _ensure_identifiers(self) -> None:
+        """Load the identifier index, refreshing the cache file when stale."""
+        if self._last_updated is None and self.cache_file.exists():
+            self._last_updated = datetime.fromtimestamp(self.cache_file.stat().st_mtime)
+        if not self._is_cache_valid():
+            await self.fetch_and_cache_tickers()
+        if self._identifiers is None:
+            self._identifiers = load_identifier_index()
 
     async def get_ticker_by_cik(self, cik: str) -> str | None:
         """Get ticker symbol by CIK."""
-        # Ensure data is loaded
-        if self._cik_to_ticker is None:
-            await self.ensure_data_loaded()
+        if self._identifiers is None:
+            await self._ensure_identifiers()
 
-        if self._cik_to_ticker is None:
+        try:
+            return self._identifiers.ticker_for_cik(cik)
+        except ValueError:
             return None
 
-        # Normalize CIK (pad to 10 digits)
-        normalized_cik = str(cik).zfill(10)
-        return self._cik_to_ticker.get(normalized_cik)
-
     async def get_all_ticker_data(self) -> dict | None:
         """Get all ticker data."""
         await self.ensure_data_loaded()
@@ -283,7 +265,7 @@ class TickerExchangeService:
             "entries_count": len(self._ticker_data.get("data", []))
             if self._ticker_data
             else 0,
-            "cik_mapping_count": len(self._cik_to_ticker) if self._cik_to_ticker else 0,
+            "cik_mapping_count": len(self._identifiers) if self._identifiers else 0,
         }
 
 
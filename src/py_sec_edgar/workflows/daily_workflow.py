@@ -13,7 +13,11 @@ import pandas as pd
 
 import py_sec_edgar.feeds.daily
 
+from ..cli.common import extraction_options, parse_document_filter
+from ..core.identifiers import load_identifier_index
 from ..core.url_utils import generate_filing_url
+from ..extract import DocumentFilter
+from ..feeds.index_changes import ChangeFeed
 
 # Use centralized logging configuration (DRY solution)
 from ..logging_utils import setup_workflow_logging
@@ -34,6 +38,8 @@ def run_daily_workflow_with_dates(
     end_date: str | None = None,
     download: bool = True,
     extract: bool = False,
+    container_layout: str | None = None,
+    document_filter: DocumentFilter | None = None,
 ) -> dict:
     """Enhanced daily workflow that supports start/end date ranges.
 
@@ -44,6 +50,9 @@ def run_daily_workflow_with_dates(
         end_date: End date in YYYY-MM-DD format
         download: Whether to download files
         extract: Whether to extract file contents
+        container_layout: Extract into "cik" or "quarter" document containers
+            instead of one file per document
+        document_filter: Only extract documents matching this filter
 
     Returns:
         Summary dictionary with processing results
@@ -69,7 +78,7 @@ def run_daily_workflow_with_dates(
 
     # Used to convert CIK to Tickers
     logger.info("Loading CIK to ticker mapping...")
-    df_cik_tickers = pd.read_csv(str(settings.cik_tickers_csv))
+    df_cik_tickers = load_identifier_index().to_frame()
     logger.info(f"Loaded {len(df_cik_tickers)} CIK-ticker mappings")
 
     # Convert date strings to datetime objects for processing
@@ -193,26 +202,31 @@ def run_daily_workflow_with_dates(
         edgar_Archives_url=settings.edgar_archives_url,
         download=download,
         extract=extract,
+        container_layout=container_layout,
+        document_filter=document_filter,
     )
 
     logger.info(f"Starting to process {len(df_filings)} daily filings...")
     processed_count = 0
 
-    for i, sec_filing in df_filings.iterrows():
-        logger.info(
-            f"Processing filing {i + 1}/{len(df_filings)}: {sec_filing['Form Type']} for CIK {sec_filing['CIK']}"
-        )
-        # Log filing details in a clean format
-        logger.info(
-            f"📄 {sec_filing['Company Name']} | {sec_filing['Form Type']} | "
-            f"Filed: {sec_filing['Date Filed'].strftime('%Y-%m-%d')} | File: {sec_filing['Filename'].split('/')[-1]}"
-        )
+    with filing_broker:
+        for i, sec_filing in df_filings.iterrows():
+            logger.info(
+                f"Processing filing {i + 1}/{len(df_filings)}: {sec_filing['Form Type']} for CIK {sec_filing['CIK']}"
+            )
+            # Log filing details in a clean format
+            logger.info(
+                f"📄 {sec_filing['Company Name']} | {sec_filing['Form Type']} | "
+                f"Filed: {sec_filing['Date Filed'].strftime('%Y-%m-%d')} | File: {sec_filing['Filename'].split('/')[-1]}"
+            )
 
-        try:
-            filing_broker.process(sec_filing)
-            processed_count += 1
-        except Exception as e:
-            logger.warning(f"Failed to process filing {sec_filing['Filename']}: {e}")
+            try:
+                filing_broker.process(sec_filing)
+                processed_count += 1
+            except Exception as e:
+                logger.warning(
+                    f"Failed to process filing {sec_filing['Filename']}: {e}"
+                )
 
     logger.info("Daily filings processing completed!")
 
@@ -248,7 +262,28 @@ def run_daily_workflow_with_dates(
     default=False,
     help="Extract filing contents (default: False)",
 )
-def main(ticker_list, form_list, custom_forms, days_back, download, extract):
+@extraction_options
+@click.option(
+    "--consumer",
+    default=None,
+    help="Only process filings added to the index since this consumer's last run "
+    "(filings excluded by the ticker or form filters are acknowledged as seen)",
+)
+def main(
+    ticker_list,
+    form_list,
+    custom_forms,
+    days_back,
+    download,
+    extract,
+    container_layout,
+    include_types,
+    exclude_types,
+    include_filenames,
+    exclude_filenames,
+    max_document_bytes,
+    consumer,
+):
     logger.info("Starting SEC EDGAR daily data processing...")
     logger.info(
         f"Parameters: ticker_list={ticker_list}, form_list={form_list}, custom_forms={custom_forms}, days_back={days_back}, download={download}, extract={extract}"
@@ -264,49 +299,58 @@ def main(ticker_list, form_list, custom_forms, days_back, download, extract):
 
     # Used to convert CIK to Tickers
     logger.info("Loading CIK to ticker mapping...")
-    df_cik_tickers = pd.read_csv(str(settings.cik_tickers_csv))
+    df_cik_tickers = load_identifier_index().to_frame()
     logger.info(f"Loaded {len(df_cik_tickers)} CIK-ticker mappings")
 
-    # Load daily IDX files for the specified date range
-    logger.info("Loading daily IDX files...")
-    daily_filings = []
-
-    for days_ago in range(days_back):
-        target_date = datetime.now() - timedelta(days=days_ago)
-        daily_files = py_sec_edgar.core.url_utils.generate_daily_index_urls(target_date)
-
-        for url, filepath in daily_files:
-            if os.path.exists(filepath) and "master" in filepath:
-                logger.info(f"Processing daily file: {filepath}")
-                try:
-                    # Read the daily master file
-                    df_daily = pd.read_csv(
-                        filepath,
-                        sep="|",
-                        names=[
-                            "CIK",
-                            "Company Name",
-                            "Form Type",
-                            "Date Filed",
-                            "Filename",
-                        ],
-                        skiprows=11,
-                    )  # Skip header lines in SEC daily files
-                    df_daily["Date Filed"] = pd.to_datetime(df_daily["Date Filed"])
-                    daily_filings.append(df_daily)
-                    logger.info(f"Loaded {len(df_daily)} filings from {filepath}")
-                except Exception as e:
-                    logger.warning(f"Failed to load {filepath}: {e}")
-
-    if not daily_filings:
-        logger.error("No daily filing data found")
-        return 1
+    changes = None
+    if consumer:
+        # update_daily_files has folded the daily indexes into the dataset
+        changes = ChangeFeed(consumer).changes()
+        df_merged_daily = changes.to_pandas().sort_values("Date Filed", ascending=False)
+        logger.info(f"Loaded {len(df_merged_daily)} new filing records for {consumer}")
+    else:
+        # Load daily IDX files for the specified date range
+        logger.info("Loading daily IDX files...")
+        daily_filings = []
+
+        for days_ago in range(days_back):
+            target_date = datetime.now() - timedelta(days=days_ago)
+            daily_files = py_sec_edgar.core.url_utils.generate_daily_index_urls(
+                target_date
+            )
 
-    # Combine all daily filings
-    df_merged_daily = pd.concat(daily_filings, ignore_index=True).sort_values(
-        "Date Filed", ascending=False
-    )
-    logger.info(f"Combined daily data: {len(df_merged_daily)} filing records")
+            for url, filepath in daily_files:
+                if os.path.exists(filepath) and "master" in filepath:
+                    logger.info(f"Processing daily file: {filepath}")
+                    try:
+                        # Read the daily master file
+                        df_daily = pd.read_csv(
+                            filepath,
+                            sep="|",
+                            names=[
+                                "CIK",
+                                "Company Name",
+                                "Form Type",
+                                "Date Filed",
+                                "Filename",
+                            ],
+                            skiprows=11,
+                        )  # Skip header lines in SEC daily files
+                        df_daily["Date Filed"] = pd.to_datetime(df_daily["Date Filed"])
+                        daily_filings.append(df_daily)
+                        logger.info(f"Loaded {len(df_daily)} filings from {filepath}")
+                    except Exception as e:
+                        logger.warning(f"Failed to load {filepath}: {e}")
+
+        if not daily_filings:
+            logger.error("No daily filing data found")
+            return 1
+
+        # Combine all daily filings
+        df_merged_daily = pd.concat(daily_filings, ignore_index=True).sort_values(
+            "Date Filed", ascending=False
+        )
+        logger.info(f"Combined daily data: {len(df_merged_daily)} filing records")
 
     # If you specified tickers in settings
     # Then load the file and filter out only the companies specified
@@ -353,25 +397,40 @@ def main(ticker_list, form_list, custom_forms, days_back, download, extract):
         settings.base_dir / "data" / "Archives" / "edgar" / "data" / "CIK" / "FOLDER"
     )
     logger.info(f"Filing data directory template: {filing_data_dir}")
+    document_filter = parse_document_filter(
+        include_types,
+        exclude_types,
+        include_filenames,
+        exclude_filenames,
+        max_document_bytes,
+    )
     filing_broker = FilingProcessor(
         filing_data_dir=filing_data_dir,
         edgar_Archives_url=settings.edgar_archives_url,
         download=download,
         extract=extract,
+        container_layout=container_layout,
+        document_filter=document_filter,
     )
 
     logger.info(f"Starting to process {len(df_filings)} daily filings...")
-    for i, sec_filing in df_filings.iterrows():
-        logger.info(
-            f"Processing filing {i + 1}/{len(df_filings)}: {sec_filing['Form Type']} for CIK {sec_filing['CIK']}"
-        )
-        # Log filing details in a clean format
-        logger.info(
-            f"📄 {sec_filing['Company Name']} | {sec_filing['Form Type']} | "
-            f"Filed: {sec_filing['Date Filed'].strftime('%Y-%m-%d')} | File: {sec_filing['Filename'].split('/')[-1]}"
-        )
+    with filing_broker:
+        for i, sec_filing in df_filings.iterrows():
+            logger.info(
+                f"Processing filing {i + 1}/{len(df_filings)}: {sec_filing['Form Type']} for CIK {sec_filing['CIK']}"
+            )
+            # Log filing details in a clean format
+            logger.info(
+                f"📄 {sec_filing['Company Name']} | {sec_filing['Form Type']} | "
+                f"Filed: {sec_filing['Date Filed'].strftime('%Y-%m-%d')} | File: {sec_filing['Filename'].split('/')[-1]}"
+            )
+
+            filing_broker.process(sec_filing)
 
-        filing_broker.process(sec_filing)
+    # Filings dropped by the ticker and form filters are acknowledged as seen
+    # too, so a later run with other filters will not be offered them again
+    if changes is not None:
+        ChangeFeed(consumer).acknowledge(changes)
 
     logger.info("All daily filings processed successfully!")
     return 0
@@ -395,6 +454,8 @@ class DailyConfig:
     end_date: str | None = None
     download: bool = True
     extract: bool = False
+    container_layout: str | None = None  # "cik" or "quarter" document containers
+    document_filter: DocumentFilter | None = None  # documents to extract
     log_level: str = "INFO"
 
 
@@ -422,6 +483,8 @@ def run_daily_workflow(config: DailyConfig) -> dict[str, Any]:
         end_date=config.end_date,
         download=config.download,
         extract=config.extract,
+        container_layout=config.container_layout,
+        document_filter=config.document_filter,
     )
 
     return result
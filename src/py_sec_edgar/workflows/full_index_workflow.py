@@ -27,13 +27,16 @@ from typing import Any
 
 import click
 import pandas as pd
-import pyarrow.parquet as pq
 
 import py_sec_edgar.feeds.full_index
 from py_sec_edgar.core.url_utils import generate_filing_url, quarter_to_month_range
 
 # Removed external API task submission - running locally only
 # from .cli.task_submitter import maybe_enqueue_task
+from ..core.identifiers import load_identifier_index
+from ..extract import DocumentFilter
+from ..feeds.index_changes import ChangeFeed
+from ..feeds.index_dataset import load_idx_frame
 from ..process import FilingProcessor
 from ..settings import settings
 from ..utilities import cik_column_to_list
@@ -63,8 +66,11 @@ class FullIndexConfig:
     quarter: str | None = None  # specific quarter to process (e.g., "2025Q3")
     download: bool = True  # whether to download filings
     extract: bool = False  # whether to extract filing contents
+    container_layout: str | None = None  # "cik" or "quarter" document containers
+    document_filter: DocumentFilter | None = None  # documents to extract
     start_date: date | None = None  # start date for filtering filings
     end_date: date | None = None  # end date for filtering filings
+    consumer: str | None = None  # only filings new since this consumer's last run
 
 
 def set_log_level(level: str) -> None:
@@ -88,18 +94,14 @@ def set_log_level(level: str) -> None:
 
 def _load_cik_tickers() -> pd.DataFrame:
     logger.info("Loading CIK to ticker mapping...")
-    df = pd.read_csv(str(settings.cik_tickers_csv))
+    df = load_identifier_index().to_frame()
     logger.info(f"Loaded {len(df)} CIK-ticker mappings")
     return df
 
 
 def _load_full_index_table() -> pd.DataFrame:
     logger.info("Loading merged IDX files...")
-    df = (
-        pq.read_table(str(settings.merged_idx_filepath))
-        .to_pandas()
-        .sort_values("Date Filed", ascending=False)
-    )
+    df = load_idx_frame().sort_values("Date Filed", ascending=False)
     logger.info(f"Loaded {len(df)} filing records")
     return df
 
@@ -286,7 +288,13 @@ def run_full_index_workflow(config: FullIndexConfig) -> dict[str, Any]:
 
     # 2) Load base data
     df_cik_tickers = _load_cik_tickers()
-    df_idx = _load_full_index_table()
+    changes = None
+    if config.consumer:
+        changes = ChangeFeed(config.consumer).changes()
+        df_idx = changes.to_pandas().sort_values("Date Filed", ascending=False)
+        logger.info(f"Loaded {len(df_idx)} new filing records for {config.consumer}")
+    else:
+        df_idx = _load_full_index_table()
 
     # 3) Apply quarter filter if specified
     if config.quarter:
@@ -342,26 +350,36 @@ def run_full_index_workflow(config: FullIndexConfig) -> dict[str, Any]:
             edgar_Archives_url=settings.edgar_archives_url,
             download=config.download,
             extract=config.extract,
+            container_layout=config.container_layout,
+            document_filter=config.document_filter,
         )
 
         logger.info(f"Starting to process {len(df_filings)} filings...")
-        for i, sec_filing in df_filings.iterrows():
-            logger.info(
-                f"Processing filing {processed + 1}/{len(df_filings)}: {sec_filing['Form Type']} for CIK {sec_filing['CIK']}"
-            )
-            # Log filing details in a clean format
-            logger.info(
-                f"FILING: {sec_filing['Company Name']} | {sec_filing['Form Type']} | "
-                f"Filed: {sec_filing['Date Filed']} | File: {sec_filing['Filename'].split('/')[-1]}"
-            )
-            filing_broker.process(sec_filing)
-            processed += 1
+        with filing_broker:
+            for i, sec_filing in df_filings.iterrows():
+                logger.info(
+                    f"Processing filing {processed + 1}/{len(df_filings)}: {sec_filing['Form Type']} for CIK {sec_filing['CIK']}"
+                )
+                # Log filing details in a clean format
+                logger.info(
+                    f"FILING: {sec_filing['Company Name']} | {sec_filing['Form Type']} | "
+                    f"Filed: {sec_filing['Date Filed']} | File: {sec_filing['Filename'].split('/')[-1]}"
+                )
+                filing_broker.process(sec_filing)
+                processed += 1
+
+        # Filings dropped by the quarter, form, ticker or date filters count
+        # as seen too and are not offered to this consumer again; a limited
+        # run leaves the watermark alone so the remainder is picked up next time
+        if changes is not None and not config.limit:
+            ChangeFeed(config.consumer).acknowledge(changes)
 
     summary: dict[str, Any] = {
         "total_candidates": total_candidates,
         "processed_count": processed,
         "limited": bool(config.limit and config.limit > 0),
         "dry_run": config.dry_run,
+        "consumer": config.consumer,
     }
     logger.info(f"Workflow complete. Summary: {summary}")
     return summary
@@ -428,6 +446,13 @@ def _validate_ticker_list_path(path: str | None) -> str | None:
     default="INFO",
     show_default=True,
 )
+@click.option(
+    "--consumer",
+    type=str,
+    default=None,
+    help="Only process filings added to the index since this consumer's last run. "
+    "Filings excluded by the quarter, ticker and form filters are acknowledged as seen.",
+)
 @click.option(
     "--json-output/--no-json-output",
     default=False,
@@ -458,6 +483,7 @@ def run_command(
     limit: int,
     dry_run: bool,
     log_level: str,
+    consumer: str | None,
     json_output: bool,
     use_queue: bool,
     queue_priority: str,
@@ -472,6 +498,7 @@ def run_command(
         limit=limit if limit and limit > 0 else None,
         dry_run=dry_run,
         log_level=log_level,
+        consumer=consumer,
     )
     # Simplified: removed external API task submission, running locally only
     # enqueued = maybe_enqueue_task(
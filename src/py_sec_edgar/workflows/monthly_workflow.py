@@ -26,6 +26,7 @@ import pandas as pd
 import py_sec_edgar.feeds.monthly
 
 from ..core.download_service import UnifiedDownloadService
+from ..core.identifiers import load_identifier_index
 from ..core.url_utils import generate_filing_url, generate_monthly_index_url
 from ..process import FilingProcessor
 from ..settings import settings
@@ -87,7 +88,7 @@ def main(ticker_list, form_list, months_back):
 
     # Used to convert CIK to Tickers
     logger.info("Loading CIK to ticker mapping...")
-    df_cik_tickers = pd.read_csv(str(settings.cik_tickers_csv))
+    df_cik_tickers = load_identifier_index().to_frame()
     logger.info(f"Loaded {len(df_cik_tickers)} CIK-ticker mappings")
 
     # Load monthly XBRL RSS files for the specified date range
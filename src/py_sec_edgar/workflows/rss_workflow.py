@@ -21,6 +21,8 @@ import pandas as pd
 import py_sec_edgar.feeds.rss
 from py_sec_edgar.core.url_utils import generate_filing_url
 
+from ..cli.common import extraction_options, parse_document_filter
+from ..core.identifiers import load_identifier_index
 from ..process import FilingProcessor
 from ..settings import settings
 from ..utilities import cik_column_to_list
@@ -45,6 +47,7 @@ from ..utilities import cik_column_to_list
     default=False,
     help="Extract filing contents (default: False)",
 )
+@extraction_options
 @click.option(
     "--list-only",
     is_flag=True,
@@ -82,6 +85,12 @@ def main(
     form_type,
     download,
     extract,
+    container_layout,
+    include_types,
+    exclude_types,
+    include_filenames,
+    exclude_filenames,
+    max_document_bytes,
     list_only,
     save_to_file,
     load_from_file,
@@ -269,7 +278,7 @@ def main(
 
     # Used to convert CIK to Tickers
     logger.info("Loading CIK to ticker mapping...")
-    df_cik_tickers = pd.read_csv(str(settings.cik_tickers_csv))
+    df_cik_tickers = load_identifier_index().to_frame()
     logger.info(f"Loaded {len(df_cik_tickers)} CIK-ticker mappings")
 
     # Ensure proper data types and column names
@@ -401,31 +410,41 @@ def main(
         settings.base_dir / "data" / "Archives" / "edgar" / "data" / "CIK" / "FOLDER"
     )
     logger.info(f"Filing data directory template: {filing_data_dir}")
+    document_filter = parse_document_filter(
+        include_types,
+        exclude_types,
+        include_filenames,
+        exclude_filenames,
+        max_document_bytes,
+    )
     filing_broker = FilingProcessor(
         filing_data_dir=filing_data_dir,
         edgar_Archives_url=settings.edgar_archives_url,
         download=download,
         extract=extract,
+        container_layout=container_layout,
+        document_filter=document_filter,
     )
 
     logger.info(f"Starting to process {len(df_filings)} RSS filings...")
-    for i, sec_filing in df_filings.iterrows():
-        logger.info(
-            f"Processing filing {i + 1}/{len(df_filings)}: {sec_filing.get('Form Type', 'Unknown')} for CIK {sec_filing.get('CIK', 'Unknown')}"
-        )
+    with filing_broker:
+        for i, sec_filing in df_filings.iterrows():
+            logger.info(
+                f"Processing filing {i + 1}/{len(df_filings)}: {sec_filing.get('Form Type', 'Unknown')} for CIK {sec_filing.get('CIK', 'Unknown')}"
+            )
 
-        # Generate the resolved file paths to show actual directory
-        filing_filepaths = filing_broker.generate_filepaths(sec_filing)
-        resolved_dir = filing_filepaths["cik_directory"]
-        logger.info(f"Filing CIK directory: {resolved_dir}")
+            # Generate the resolved file paths to show actual directory
+            filing_filepaths = filing_broker.generate_filepaths(sec_filing)
+            resolved_dir = filing_filepaths["cik_directory"]
+            logger.info(f"Filing CIK directory: {resolved_dir}")
 
-        # Show detailed filing info if requested
-        if show_entries:
-            logger.info(f"   Company: {sec_filing.get('Company Name', 'N/A')}")
-            logger.info(f"   Form: {sec_filing.get('Form Type', 'N/A')}")
-            logger.info(f"   URL: {sec_filing.get('url', 'N/A')}")
+            # Show detailed filing info if requested
+            if show_entries:
+                logger.info(f"   Company: {sec_filing.get('Company Name', 'N/A')}")
+                logger.info(f"   Form: {sec_filing.get('Form Type', 'N/A')}")
+                logger.info(f"   URL: {sec_filing.get('url', 'N/A')}")
 
-        filing_broker.process(sec_filing)
+            filing_broker.process(sec_filing)
 
     logger.info("All RSS filings processed successfully!")
     return 0
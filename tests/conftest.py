@@ -0,0 +1,64 @@
+"""
+Shared fixtures for py-sec-edgar tests.
+"""
+
+import pytest
+
+SAMPLE_SUBMISSION = """<SEC-DOCUMENT>0000320193-24-000123.txt : 20241101
+<SEC-HEADER>0000320193-24-000123.hdr.sgml : 20241101
+ACCESSION NUMBER:		0000320193-24-000123
+CONFORMED SUBMISSION TYPE:	10-K
+PUBLIC DOCUMENT COUNT:		2
+FILED AS OF DATE:		20241101
+FILER:
+	COMPANY DATA:
+		CENTRAL INDEX KEY:			0000320193
+</SEC-HEADER>
+<DOCUMENT>
+<TYPE>10-K
+<SEQUENCE>1
+<FILENAME>aapl-20240928.htm
+<DESCRIPTION>10-K
+<TEXT>
+<html><body><p>Annual report</p>
+<table><tr><td>Item 1.</td><td>Business</td></tr>
+<tr><td>Item 1A.</td><td>Risk Factors</td></tr>
+<tr><td>Item 7.</td><td>MD&amp;A</td></tr></table>
+<p>PART I</p><p>Item 1. Business</p><p>We design smartphones.</p>
+<p>Item 1A. Risk Factors</p><p>Competition is intense.</p>
+<p>PART II</p><p>Item 7. Management's Discussion and Analysis</p>
+<p>Net sales increased.</p></body></html>
+</TEXT>
+</DOCUMENT>
+<DOCUMENT>
+<TYPE>EX-21.1
+<SEQUENCE>2
+<FILENAME>ex211.htm
+<TEXT>
+<html><body><p>Subsidiaries</p></body></html>
+</TEXT>
+</DOCUMENT>
+</SEC-DOCUMENT>
+"""
+
+
+@pytest.fixture
+def filing_json(tmp_path):
+    """Create a submission file laid out like FilingProcessor output."""
+    cik_dir = tmp_path / "320193"
+    cik_dir.mkdir()
+    source = cik_dir / "0000320193-24-000123.txt"
+    source.write_text(SAMPLE_SUBMISSION, encoding="utf-8")
+    return {
+        "filing_filepath": str(source),
+        "extracted_filing_directory": str(cik_dir / "000032019324000123"),
+    }
+
+
+@pytest.fixture
+def extracted_filing(filing_json):
+    """Extract the sample submission and return its filing directory."""
+    from py_sec_edgar.extract import extract
+
+    extract(filing_json)
+    return filing_json["extracted_filing_directory"]
@@ -14,6 +14,12 @@ from unittest.mock import Mock, patch
 # Basic unit tests for core models
 from py_sec_edgar.core.models import FilingInfo, CompanyInfo, SearchResult
 
+from py_sec_edgar.core.identifiers import (
+    IdentifierIndex,
+    build_identifier_table,
+    load_identifier_index,
+)
+
 # Basic integration tests for public interfaces
 from py_sec_edgar.search_engine import FilingSearchEngine, FilingSearchError
 
@@ -99,6 +105,106 @@ class TestSearchEngineBasics:
             assert "Missing required data files" in str(e)
             assert "uv run py-sec-edgar feeds update-full-index" in str(e)
 
+    def _sample_index(self):
+        import pandas as pd
+
+        return pd.DataFrame(
+            {
+                "CIK": [789019, 320193, 1045810, 320193],
+                "Company Name": ["MSFT", "AAPL", "NVDA", "AAPL"],
+                "Form Type": ["10-Q", "10-K", "4", "8-K"],
+                "Date Filed": pd.to_datetime(
+                    ["2024-10-30", "2024-11-01", "2024-10-02", "2024-11-05"]
+                ),
+                "Filename": [
+                    f"edgar/data/{i}/000000000{i}-24-000001.txt" for i in "1234"
+                ],
+            }
+        )
+
+    def test_search_by_cik_uses_sorted_slices(self):
+        """Test that CIK lookups slice the preloaded CIK-sorted index."""
+        index = self._sample_index()
+        with (
+            patch.object(FilingSearchEngine, "_check_data_sources"),
+            patch("py_sec_edgar.search_engine.load_idx_frame", return_value=index),
+        ):
+            engine = FilingSearchEngine(preload_index=True)
+            engine._identifiers = IdentifierIndex(build_identifier_table({}))
+            filings = engine.search_by_cik("320193")
+
+        assert [f.form_type for f in filings] == ["8-K", "10-K"]
+        assert engine.search_by_cik("1") == []
+        assert len(engine._filings_for_cik(1045810)) == 1
+
+    def test_search_by_cik_scans_lazily(self, tmp_path):
+        """Test that searches push filters into a dataset scan."""
+        import pyarrow as pa
+
+        from py_sec_edgar.feeds import index_dataset
+
+        table = pa.Table.from_pandas(self._sample_index(), preserve_index=False)
+        table = table.set_column(3, "Date Filed", table["Date Filed"].cast(pa.date32()))
+        index_dataset.write_partition(table, tmp_path, 2024, 4)
+
+        with (
+            patch.object(FilingSearchEngine, "_check_data_sources"),
+            patch(
+                "py_sec_edgar.search_engine.open_idx_index",
+                side_effect=lambda: index_dataset.open_idx_dataset(tmp_path),
+            ),
+            patch("py_sec_edgar.search_engine.load_idx_frame") as load_all,
+        ):
+            engine = FilingSearchEngine()
+            engine._identifiers = IdentifierIndex(build_identifier_table({}))
+            filings = engine.search_by_cik("320193", form_types=["10-k"])
+            recent = engine.search_by_cik("320193", start_date="2024-11-02")
+
+        load_all.assert_not_called()
+        assert [f.filing_date for f in filings] == ["2024-11-01"]
+        assert [f.form_type for f in recent] == ["8-K"]
+
+    def test_search_batch_limits_per_ticker(self):
+        """Test that a batch search applies limits per ticker in one query."""
+        import pyarrow as pa
+
+        from py_sec_edgar.core.identifiers import IDENTIFIER_SCHEMA
+
+        identifiers = pa.table(
+            {
+                "ticker": ["AAPL", "MSFT", "NVDA"],
+                "cik": [320193, 789019, 1045810],
+                "name": ["Apple Inc.", "Microsoft Corp", "NVIDIA Corp"],
+                "exchange": [None, None, None],
+                "source": ["company_tickers.json"] * 3,
+            },
+            schema=IDENTIFIER_SCHEMA,
+        )
+        index = self._sample_index()
+        with (
+            patch.object(FilingSearchEngine, "_check_data_sources"),
+            patch("py_sec_edgar.search_engine.load_idx_frame", return_value=index),
+        ):
+            engine = FilingSearchEngine(preload_index=True)
+            engine._identifiers = IdentifierIndex(identifiers)
+            with patch.object(
+                engine, "_query_index", wraps=engine._query_index
+            ) as query:
+                filings, unknown = engine.search_batch(
+                    ["aapl", "MSFT", "XXXX"], limit=1
+                )
+                per_form, _ = engine.search_batch(["AAPL"], limit=1, per_form=True)
+
+        assert query.call_count == 2
+        assert unknown == ["XXXX"]
+        assert [(f.ticker, f.form_type) for f in filings] == [
+            ("AAPL", "8-K"),
+            ("MSFT", "10-Q"),
+        ]
+        assert filings[0].company_name == "Apple Inc."
+        assert [f.form_type for f in per_form] == ["8-K", "10-K"]
+        assert len(engine._filings_for_ciks([1045810, 320193, 1])) == 3
+
     def test_filing_search_error(self):
         """Test custom exception creation."""
         error = FilingSearchError("Test error message")
@@ -106,6 +212,230 @@ class TestSearchEngineBasics:
         assert isinstance(error, Exception)
 
 
+class TestSearchResults:
+    """Test the Arrow-backed SearchResults collection."""
+
+    def test_table_backed_results(self, tmp_path):
+        """Test that filters and exports work without creating FilingInfo objects."""
+        from datetime import date
+
+        import pyarrow as pa
+
+        from py_sec_edgar.core.search_results import SearchResults, results_table
+        from py_sec_edgar.core.url_utils import (
+            generate_filing_url_columns,
+            generate_sec_website_url,
+        )
+
+        filenames = [
+            "edgar/data/320193/0000320193-24-000123.txt",
+            "edgar/data/789019/0000789019-24-000045.txt",
+            "edgar/data/320193/0000320193-23-000077.txt",
+        ]
+        table = results_table(
+            {
+                "cik": ["320193", "789019", "320193"],
+                "ticker": ["AAPL", "MSFT", "AAPL"],
+                "form_type": ["10-K", "10-Q", "10-K"],
+                "filing_date": [
+                    date(2024, 11, 1),
+                    date(2024, 10, 30),
+                    date(2023, 11, 3),
+                ],
+                "filename": filenames,
+                **generate_filing_url_columns(pa.array(filenames)),
+            }
+        )
+        results = SearchResults(table)
+
+        annual = results.filter_by_form_type("10-k").sort_by_date(descending=False)
+        assert results._filings is None and annual._filings is None
+        assert annual.get_summary()["filings_by_ticker"] == {"AAPL": 2}
+        assert len(results.filter_by_date_range("2024-01-01", "2024-10-31")) == 1
+
+        df = results.to_dataframe()
+        assert df["filing_date"].dtype.kind == "M"
+        results.to_csv(tmp_path / "results.csv")
+        assert (tmp_path / "results.csv").read_text().count("\n") == 4
+        assert results._filings is None
+
+        first = annual[0]
+        assert first.filing_date == "2023-11-03"
+        assert first.accession_number == "0000320193-23-000077"
+        assert first.sec_website_url == generate_sec_website_url(filenames[2])
+        assert [f.ticker for f in results[1:]] == ["MSFT", "AAPL"]
+
+
+class TestQueryCache:
+    """Test the LRU cache of search results."""
+
+    def _search(self, calls, ticker):
+        from py_sec_edgar.core.models import FilingInfo
+        from py_sec_edgar.core.search_results import SearchResults
+
+        def search():
+            calls.append(ticker)
+            return SearchResults(
+                [
+                    FilingInfo(
+                        cik="320193",
+                        ticker=ticker,
+                        form_type="10-K",
+                        filing_date="2024-11-01",
+                        accession_number="0000320193-24-000123",
+                    )
+                ]
+            )
+
+        return search
+
+    def test_lru_hits_and_version_invalidation(self):
+        """Test hit/miss counters, eviction and invalidation on index change."""
+        from py_sec_edgar.core.query_cache import QueryCache
+
+        version = ["v1"]
+        cache = QueryCache(max_entries=2, version=lambda: version[0])
+        calls = []
+
+        first = cache.get_or_search(
+            {"tickers": "aapl,msft", "limit": 5}, self._search(calls, "AAPL")
+        )
+        again = cache.get_or_search(
+            {"tickers": ["MSFT", "AAPL"], "limit": 5}, self._search(calls, "AAPL")
+        )
+        assert calls == ["AAPL"]
+        assert again[0].ticker == first[0].ticker == "AAPL"
+        assert again is not first
+
+        cache.get_or_search({"tickers": "MSFT"}, self._search(calls, "MSFT"))
+        cache.get_or_search({"tickers": "NVDA"}, self._search(calls, "NVDA"))
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (1, 3, 1)
+        assert stats.entries == 2
+
+        version[0] = "v2"  # Index rebuilt
+        cache.get_or_search({"tickers": "NVDA"}, self._search(calls, "NVDA"))
+        assert calls == ["AAPL", "MSFT", "NVDA", "NVDA"]
+
+    def test_disk_cache_shared_between_instances(self, tmp_path):
+        """Test that results written to cache_dir are reused by a new cache."""
+        from py_sec_edgar.core.query_cache import QueryCache
+
+        calls = []
+        query = {"tickers": "AAPL", "form_types": ["10-K"], "limit": 5}
+        QueryCache(cache_dir=tmp_path, version=lambda: "v1").get_or_search(
+            query, self._search(calls, "AAPL")
+        )
+
+        cache = QueryCache(cache_dir=tmp_path, version=lambda: "v1")
+        results = cache.get_or_search(query, self._search(calls, "AAPL"))
+        assert calls == ["AAPL"]
+        assert results[0].filing_date == "2024-11-01"
+        assert cache.stats().disk_hits == 1
+
+        cache.clear()
+        assert not list(tmp_path.glob("*.parquet"))
+
+
+class TestIdentifierIndex:
+    """Test the compiled ticker/CIK/name/exchange index."""
+
+    def _write_sources(self, tmp_path):
+        import json
+
+        tickers = tmp_path / "company_tickers.json"
+        tickers.write_text(
+            json.dumps(
+                {
+                    "0": {"cik_str": 1652044, "ticker": "GOOGL", "title": "Alphabet"},
+                    "1": {"cik_str": 1652044, "ticker": "GOOG", "title": "Alphabet"},
+                }
+            )
+        )
+        exchange = tmp_path / "company_tickers_exchange.json"
+        exchange.write_text(
+            json.dumps(
+                {
+                    "fields": ["cik", "name", "ticker", "exchange"],
+                    "data": [
+                        [1652044, "Alphabet Inc.", "GOOGL", "Nasdaq"],
+                        [320193, "Apple Inc.", "AAPL", "Nasdaq"],
+                    ],
+                }
+            )
+        )
+        csv = tmp_path / "cik_tickers.csv"
+        csv.write_text(
+            "\ufeffSYMBOL,COMPANY_NAME,CIK\nAAPL,Apple Inc.,320193\nXYZ,No Cik,\n",
+            encoding="utf-8",
+        )
+        return {
+            "company_tickers": tickers,
+            "company_tickers_exchange": exchange,
+            "cik_tickers": csv,
+        }
+
+    def test_many_to_many_lookups(self, tmp_path):
+        """Test lookups across sources in priority order."""
+        index = IdentifierIndex(build_identifier_table(self._write_sources(tmp_path)))
+
+        assert len(index) == 3
+        assert index.tickers_for_cik("0001652044") == ["GOOGL", "GOOG"]
+        assert index.cik_for_ticker("googl") == 1652044
+        assert index.name_for_cik(1652044) == "Alphabet"
+        assert index.exchange_for_ticker("GOOGL") == "Nasdaq"
+        assert index.ciks_for_tickers(["AAPL", "GOOG", "XYZ"]) == [320193, 1652044]
+        assert "XYZ" not in index
+        assert set(index.to_frame()["SYMBOL"]) == {"GOOGL", "GOOG", "AAPL"}
+
+    def test_explicit_sources(self, tmp_path):
+        """Test that only the given sources are read."""
+        sources = self._write_sources(tmp_path)
+
+        assert build_identifier_table({}).num_rows == 0
+        table = build_identifier_table({"cik_tickers": sources["cik_tickers"]})
+        assert table["ticker"].to_pylist() == ["AAPL"]
+        assert table["source"].to_pylist() == ["cik_tickers.csv"]
+        with pytest.raises(ValueError):
+            build_identifier_table({"tickers": sources["cik_tickers"]})
+
+    def test_compiled_file_is_reused_until_a_source_changes(self, tmp_path):
+        """Test that the persisted index is rebuilt only for changed sources."""
+        from unittest.mock import PropertyMock
+
+        from py_sec_edgar.core import identifiers
+        from py_sec_edgar.settings import SECEdgarSettings
+
+        sources = self._write_sources(tmp_path)
+        compiled = tmp_path / "identifiers.parquet"
+        with (
+            patch.object(identifiers, "identifier_sources", return_value=sources),
+            patch.object(identifiers, "_cached", None),
+            patch.object(
+                SECEdgarSettings,
+                "identifier_index_filepath",
+                new_callable=PropertyMock,
+                return_value=compiled,
+            ),
+            patch.object(
+                identifiers,
+                "build_identifier_table",
+                wraps=identifiers.build_identifier_table,
+            ) as build,
+        ):
+            assert load_identifier_index().cik_for_ticker("AAPL") == 320193
+            assert compiled.exists()
+            identifiers._cached = None
+            load_identifier_index()
+            assert build.call_count == 1
+
+            sources["cik_tickers"].write_text(
+                "SYMBOL,COMPANY_NAME,CIK\nNEW,New Co,99\n", encoding="utf-8"
+            )
+            assert load_identifier_index().cik_for_ticker("NEW") == 99
+            assert build.call_count == 2
+
+
 class TestUtilityFunctions:
     """Test utility functions that don't require external data."""
 
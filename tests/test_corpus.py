@@ -0,0 +1,663 @@
+"""
+Tests for derived corpus layers built from extracted filings.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from py_sec_edgar.corpus.forms import build_forms_tables, load_form_table
+from py_sec_edgar.corpus.fulltext import FullTextIndex, FullTextSearchError
+from py_sec_edgar.corpus.sections import (
+    build_section_index,
+    get_section,
+    load_section_index,
+    segment_sections,
+)
+from py_sec_edgar.corpus.similarity import (
+    build_similarity_index,
+    compare_with_previous,
+    estimate_similarity,
+    find_near_duplicates,
+    load_similarity_index,
+    minhash_signature,
+    shingle_hashes,
+)
+from py_sec_edgar.corpus.tables import (
+    TABLE_CACHE_DIRNAME,
+    build_table_cache,
+    extract_tables,
+    get_tables,
+    parse_number,
+)
+from py_sec_edgar.corpus.text import (
+    TEXT_LAYER_DIRNAME,
+    build_text_layer,
+    get_document_text,
+    html_to_text,
+)
+from py_sec_edgar.corpus.xbrl import build_facts_store, load_facts, parse_xbrl_facts
+from py_sec_edgar.extract import extract
+
+
+class TestTextLayer:
+    """Test HTML-to-text conversion and the cached text layer."""
+
+    def test_html_to_text_strips_markup_and_hidden_xbrl(self):
+        """Test that scripts, styles and ix:header are removed."""
+        html = (
+            "<html><head><title>T</title><style>p {}</style></head><body>"
+            "<div style='display:none'><ix:header><ix:hidden>secret</ix:hidden>"
+            "</ix:header></div><p>Revenue was "
+            "<ix:nonFraction name='us-gaap:Revenues'>1,000</ix:nonFraction> million"
+            "</p><script>alert(1)</script><p>Next&nbsp;paragraph</p></body></html>"
+        )
+        text = html_to_text(html)
+
+        assert "Revenue was 1,000 million\n" in text
+        assert "Next paragraph" in text
+        assert "secret" not in text
+        assert "alert" not in text
+        assert "p {}" not in text
+
+    @pytest.mark.parametrize("as_bytes", [False, True])
+    def test_html_to_text_accepts_xml_declaration(self, as_bytes):
+        """Test XHTML/inline XBRL documents that start with <?xml ...?>."""
+        xhtml = (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<html xmlns="http://www.w3.org/1999/xhtml"><body>'
+            "<p>Caf\u00e9 revenue</p></body></html>"
+        )
+        markup = xhtml.encode("utf-8") if as_bytes else xhtml
+
+        assert html_to_text(markup, "utf-8") == "Caf\u00e9 revenue\n"
+
+    def test_build_text_layer_caches_by_hash(self, extracted_filing, tmp_path):
+        """Test that the text layer is built once and then reused."""
+        summary = build_text_layer(tmp_path, max_workers=1)
+        assert summary["filings"] == 1
+        assert summary["converted"] == 2
+
+        text_files = list((Path(extracted_filing) / TEXT_LAYER_DIRNAME).glob("*.txt"))
+        assert len(text_files) == 2
+
+        summary = build_text_layer(tmp_path, max_workers=1)
+        assert summary["converted"] == 0
+        assert summary["cached"] == 2
+
+    def test_get_document_text_by_type(self, extracted_filing):
+        """Test reading a single document's text on demand."""
+        assert get_document_text(extracted_filing, doc_type="EX-21.1") == (
+            "Subsidiaries\n"
+        )
+        assert get_document_text(extracted_filing).startswith("Annual report")
+
+
+class TestSectionIndex:
+    """Test 10-K/10-Q item segmentation and section lookup."""
+
+    def test_segment_sections_skips_table_of_contents(self):
+        """Test that body headings win over table-of-contents entries."""
+        text = (
+            "Item 1. Business\nItem 1A. Risk Factors\nItem 7. MD&A\n"
+            "PART I\nItem 1. Business\nWe design smartphones.\n"
+            "Item 1A. Risk Factors\nCompetition is intense.\n"
+            "PART II\nItem 7. MD&A\nNet sales increased.\n"
+        )
+        sections = {s["item"]: s for s in segment_sections(text, "10-K")}
+
+        assert set(sections) == {"1", "1A", "7"}
+        raw = text.encode("utf-8")
+        risk = sections["1A"]
+        assert raw[risk["start_byte"] : risk["end_byte"]].decode() == (
+            "Item 1A. Risk Factors\nCompetition is intense.\n"
+        )
+        assert sections["1A"]["title"] == "Risk Factors"
+
+    def test_segment_sections_qualifies_10q_items_by_part(self):
+        """Test that 10-Q items are keyed by Part."""
+        text = (
+            "PART I\nItem 2. MD&A\nResults improved.\n"
+            "PART II\nItem 1A. Risk Factors\nNo changes.\nItem 2. Repurchases\nNone.\n"
+        )
+        keys = {(s["part"], s["item"]) for s in segment_sections(text, "10-Q")}
+        assert keys == {("I", "2"), ("II", "1A"), ("II", "2")}
+
+    def test_build_index_and_get_section(self, extracted_filing, tmp_path):
+        """Test building the persisted index and slicing a section."""
+        index_path = tmp_path / "corpus" / "sections.parquet"
+        summary = build_section_index(tmp_path, index_path=index_path, max_workers=1)
+        assert summary["indexed"] == 1
+        assert summary["sections"] == 3
+
+        section = get_section("000032019324000123", "1A", index_path=index_path)
+        assert section.startswith("Item 1A. Risk Factors")
+        assert "Competition is intense." in section
+        assert "Net sales" not in section
+
+        summary = build_section_index(tmp_path, index_path=index_path, max_workers=1)
+        assert summary["indexed"] == 0
+        assert len(load_section_index(index_path)) == 3
+
+    def test_get_section_after_text_layer_is_cleared(self, filing_json, tmp_path):
+        """Test that re-extraction does not break indexed sections."""
+        extract(filing_json)
+        index_path = tmp_path / "corpus" / "sections.parquet"
+        build_section_index(tmp_path, index_path=index_path, max_workers=1)
+        assert not Path(load_section_index(index_path)["text_path"][0]).is_absolute()
+
+        extract(filing_json, force=True)
+        assert not (
+            Path(filing_json["extracted_filing_directory"]) / TEXT_LAYER_DIRNAME
+        ).exists()
+
+        section = get_section("0000320193-24-000123", "1A", index_path=index_path)
+        assert section.startswith("Item 1A. Risk Factors")
+
+    def test_filing_without_items_is_indexed_once(self, filing_json, tmp_path):
+        """Test that a filing with no Item headings is not re-segmented."""
+        source = Path(filing_json["filing_filepath"])
+        source.write_text(source.read_text().replace("Item", "Chapter"))
+        extract(filing_json)
+        index_path = tmp_path / "corpus" / "sections.parquet"
+
+        summary = build_section_index(tmp_path, index_path=index_path, max_workers=1)
+        assert summary["indexed"] == 1
+        assert summary["sections"] == 0
+
+        summary = build_section_index(tmp_path, index_path=index_path, max_workers=1)
+        assert summary["indexed"] == 0
+        assert summary["skipped"] == 1
+        assert get_section("0000320193-24-000123", "1A", index_path=index_path) is None
+
+
+class TestFullTextIndex:
+    """Test the SQLite FTS5 full-text index."""
+
+    def test_index_and_search_with_filters(self, extracted_filing, tmp_path):
+        """Test phrase, boolean and metadata-filtered queries."""
+        with FullTextIndex(tmp_path / "fulltext.db") as index:
+            summary = index.update(tmp_path, max_workers=1)
+            assert summary["indexed"] == 1
+            assert summary["documents"] == 2
+
+            hits = index.search('"competition is intense"')
+            assert len(hits) == 1
+            assert hits[0]["accession_number"] == "0000320193-24-000123"
+            assert hits[0]["doc_type"] == "10-K"
+            assert hits[0]["filing_date"] == "2024-11-01"
+            assert "[" in hits[0]["snippet"]
+
+            assert len(index.search("subsidiaries OR smartphones")) == 2
+            assert index.search("subsidiaries", doc_type="10-K") == []
+            assert len(index.search("subsidiaries", cik="0000320193")) == 1
+            assert index.search("smartphones", date_from="2025-01-01") == []
+
+    def test_update_is_incremental(self, extracted_filing, tmp_path):
+        """Test that unchanged filings are not re-indexed."""
+        with FullTextIndex(tmp_path / "fulltext.db") as index:
+            index.update(tmp_path, max_workers=1)
+            summary = index.update(tmp_path, max_workers=1)
+            assert summary["indexed"] == 0
+            assert index.stats() == {"filings": 1, "documents": 2}
+
+            index.optimize()
+            assert len(index.search("subsidiaries OR smartphones")) == 2
+
+    def test_invalid_query_raises(self, tmp_path):
+        """Test that malformed FTS5 syntax raises FullTextSearchError."""
+        with FullTextIndex(tmp_path / "fulltext.db") as index:
+            with pytest.raises(FullTextSearchError):
+                index.search('"unterminated')
+
+
+INSTANCE_XML = """<?xml version="1.0" encoding="utf-8"?>
+<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance"
+    xmlns:xbrldi="http://xbrl.org/2006/xbrldi"
+    xmlns:iso4217="http://www.xbrl.org/2003/iso4217"
+    xmlns:us-gaap="http://fasb.org/us-gaap/2024">
+  <us-gaap:Revenues contextRef="FY24" unitRef="usd" decimals="-6">391035000000</us-gaap:Revenues>
+  <us-gaap:Revenues contextRef="FY24_iPhone" unitRef="usd" decimals="-6">201183000000</us-gaap:Revenues>
+  <xbrli:context id="FY24">
+    <xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier></xbrli:entity>
+    <xbrli:period><xbrli:startDate>2023-10-01</xbrli:startDate><xbrli:endDate>2024-09-28</xbrli:endDate></xbrli:period>
+  </xbrli:context>
+  <xbrli:context id="FY24_iPhone">
+    <xbrli:entity>
+      <xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier>
+      <xbrli:segment><xbrldi:explicitMember dimension="srt:ProductOrServiceAxis">aapl:IPhoneMember</xbrldi:explicitMember></xbrli:segment>
+    </xbrli:entity>
+    <xbrli:period><xbrli:startDate>2023-10-01</xbrli:startDate><xbrli:endDate>2024-09-28</xbrli:endDate></xbrli:period>
+  </xbrli:context>
+  <xbrli:unit id="usd"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>
+</xbrli:xbrl>
+"""
+
+INLINE_XBRL = """<html xmlns="http://www.w3.org/1999/xhtml"
+    xmlns:ix="http://www.xbrl.org/2013/inlineXBRL"
+    xmlns:xbrli="http://www.xbrl.org/2003/instance"
+    xmlns:iso4217="http://www.xbrl.org/2003/iso4217">
+<body>
+<div style="display:none"><ix:header><ix:resources>
+  <xbrli:context id="c1"><xbrli:entity><xbrli:identifier scheme="http://www.sec.gov/CIK">0000320193</xbrli:identifier></xbrli:entity>
+  <xbrli:period><xbrli:instant>2024-09-28</xbrli:instant></xbrli:period></xbrli:context>
+  <xbrli:unit id="u1"><xbrli:divide>
+    <xbrli:unitNumerator><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unitNumerator>
+    <xbrli:unitDenominator><xbrli:measure>xbrli:shares</xbrli:measure></xbrli:unitDenominator>
+  </xbrli:divide></xbrli:unit>
+  <xbrli:unit id="u2"><xbrli:measure>iso4217:USD</xbrli:measure></xbrli:unit>
+</ix:resources></ix:header></div>
+<p>EPS <ix:nonFraction name="us-gaap:EarningsPerShareBasic" contextRef="c1" unitRef="u1" decimals="2">6.11</ix:nonFraction></p>
+<p>Loss <ix:nonFraction name="us-gaap:OtherNonoperatingIncomeExpense" contextRef="c1" unitRef="u2" scale="6" sign="-" format="ixt:num-dot-decimal">(1,234.5)</ix:nonFraction></p>
+<p><ix:nonNumeric name="dei:DocumentType" contextRef="c1">10-K</ix:nonNumeric></p>
+</body></html>
+"""
+
+
+class TestSimilarityIndex:
+    """Test MinHash signatures and LSH near-duplicate lookups."""
+
+    def test_signature_estimates_jaccard(self):
+        """Test that signature agreement tracks shingle-set Jaccard similarity."""
+        words = [f"term{i}" for i in range(400)]
+        original = " ".join(words)
+        edited = " ".join(words[:300] + [f"new{i}" for i in range(100)])
+
+        a, b = shingle_hashes(original), shingle_hashes(edited)
+        exact = len(set(a) & set(b)) / len(set(a) | set(b))
+        estimate = estimate_similarity(minhash_signature(a), minhash_signature(b))[0]
+
+        assert abs(estimate - exact) < 0.15
+        assert estimate_similarity(minhash_signature(a), minhash_signature(a))[0] == 1
+
+    def test_near_duplicates_and_previous_filing(
+        self, filing_json, extracted_filing, tmp_path
+    ):
+        """Test LSH lookups across two years of the same company's 10-K."""
+        submission = Path(filing_json["filing_filepath"]).read_text(encoding="utf-8")
+        prior = submission.replace("24-000123", "23-000106").replace(
+            "20241101", "20231103"
+        )
+        source = tmp_path / "320193" / "0000320193-23-000106.txt"
+        source.write_text(prior, encoding="utf-8")
+        extract(
+            {
+                "filing_filepath": str(source),
+                "extracted_filing_directory": str(
+                    tmp_path / "320193" / "000032019323000106"
+                ),
+            }
+        )
+
+        index_path = tmp_path / "corpus" / "similarity"
+        summary = build_similarity_index(tmp_path, index_path=index_path, max_workers=1)
+        assert summary["indexed"] == 2
+
+        duplicates = find_near_duplicates(
+            "0000320193-24-000123", key="2", scope="document", index_path=index_path
+        )
+        assert list(duplicates["accession_number"]) == ["0000320193-23-000106"]
+        assert duplicates["similarity"].iloc[0] == 1.0
+
+        changes = compare_with_previous(
+            "0000320193-24-000123", key="1a", index_path=index_path
+        )
+        assert list(changes["previous_accession"]) == ["0000320193-23-000106"]
+        assert changes["similarity"].iloc[0] == 1.0
+        assert compare_with_previous(
+            "0000320193-23-000106", index_path=index_path
+        ).empty
+
+        summary = build_similarity_index(tmp_path, index_path=index_path, max_workers=1)
+        assert summary["skipped"] == 2
+
+    def test_updates_append_segments(self, filing_json, extracted_filing, tmp_path):
+        """Test that updates append a segment and supersede re-indexed rows."""
+        index_path = tmp_path / "corpus" / "similarity"
+        build_similarity_index(tmp_path, index_path=index_path, max_workers=1)
+        first = index_path / "signatures-000001.parquet"
+        written = first.stat().st_mtime_ns
+
+        submission = Path(filing_json["filing_filepath"]).read_text(encoding="utf-8")
+        source = tmp_path / "320193" / "0000320193-23-000106.txt"
+        source.write_text(
+            submission.replace("24-000123", "23-000106").replace(
+                "20241101", "20231103"
+            ),
+            encoding="utf-8",
+        )
+        extract(
+            {
+                "filing_filepath": str(source),
+                "extracted_filing_directory": str(
+                    tmp_path / "320193" / "000032019323000106"
+                ),
+            }
+        )
+        summary = build_similarity_index(tmp_path, index_path=index_path, max_workers=1)
+        assert summary == {**summary, "indexed": 1, "skipped": 1}
+        assert first.stat().st_mtime_ns == written
+        assert (index_path / "signatures-000002.parquet").exists()
+        stored = len(load_similarity_index(index_path, columns=["accession_number"]))
+
+        build_similarity_index(
+            tmp_path, index_path=index_path, max_workers=1, force=True
+        )
+        index = load_similarity_index(index_path, columns=["accession_number"])
+        # Forced rows land in a third segment; the earlier copies are ignored
+        assert len(index) == stored
+        assert index["row_id"].min() >= stored
+        duplicates = find_near_duplicates(
+            "0000320193-24-000123", key="2", scope="document", index_path=index_path
+        )
+        assert list(duplicates["accession_number"]) == ["0000320193-23-000106"]
+
+
+STATEMENT_HTML = b"""<html><body>
+<p>CONSOLIDATED STATEMENTS OF OPERATIONS</p>
+<p>(In millions, except per share amounts)</p>
+<table>
+<tr><td></td><td colspan="3">2024</td><td colspan="3">2023</td></tr>
+<tr><td>Net sales</td><td>$</td><td>391,035</td><td></td>
+<td>$</td><td>383,285</td><td></td></tr>
+<tr><td>Other income/(expense), net</td><td></td><td>(269</td><td>)</td>
+<td></td><td>(565</td><td>)</td></tr>
+<tr><td>Diluted earnings per share</td><td>$</td><td>6.08</td><td></td>
+<td>$</td><td>6.13</td><td></td></tr>
+<tr><td>Gross margin</td><td></td><td>46.2</td><td>%</td>
+<td></td><td>&#8212;</td><td></td></tr>
+</table>
+</body></html>"""
+
+
+class TestTableExtraction:
+    """Test streaming HTML table extraction and the table cache."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("1,234", 1234.0),
+            ("$(1,234.5)", -1234.5),
+            ("(269)", -269.0),
+            ("46.2%", 46.2),
+            ("—", None),
+            ("Net sales", None),
+        ],
+    )
+    def test_parse_number(self, text, expected):
+        """Test numeric normalization of financial cells."""
+        assert parse_number(text) == expected
+
+    def test_extract_tables_normalizes_layout_and_scale(self):
+        """Test that split $ / ) cells are folded and the scale is applied."""
+        cells = extract_tables(STATEMENT_HTML)
+        assert cells["table_index"].unique().tolist() == [0]
+
+        grid = cells.pivot(index="row", columns="column", values="text")
+        assert grid.loc[2].tolist() == ["Other income/(expense), net", "(269)", "(565)"]
+
+        values = cells.set_index(["row", "column"])["value"]
+        assert values[(0, 1)] == 2024
+        assert values[(1, 1)] == 391_035e6
+        assert values[(2, 2)] == -565e6
+        assert values[(3, 1)] == 6.08
+        assert values[(4, 1)] == 46.2
+
+    def test_get_tables_caches_by_document_hash(self, extracted_filing, tmp_path):
+        """Test on-demand extraction, the Parquet cache and the batch build."""
+        tables = get_tables(extracted_filing, doc_type="10-K")
+        assert len(tables) == 1
+        assert tables[0].iloc[1].tolist() == ["Item 1A.", "Risk Factors"]
+
+        manifest = json.loads(
+            (Path(extracted_filing) / "_extraction_manifest.json").read_text()
+        )
+        sha256 = manifest["documents"][0]["sha256"]
+        assert (
+            Path(extracted_filing) / TABLE_CACHE_DIRNAME / f"{sha256}.parquet"
+        ).exists()
+
+        summary = build_table_cache(tmp_path, max_workers=1)
+        assert summary["cached"] == 1
+        assert summary["extracted"] == 1
+        assert summary["tables"] == 1
+
+
+class TestXbrlFacts:
+    """Test streaming XBRL fact extraction."""
+
+    def test_parse_instance_resolves_contexts_and_units(self, tmp_path):
+        """Test that facts before their contexts are resolved after the pass."""
+        path = tmp_path / "aapl-20240928.xml"
+        path.write_text(INSTANCE_XML, encoding="utf-8")
+
+        facts = parse_xbrl_facts(path)
+
+        assert len(facts) == 2
+        total, iphone = facts
+        assert total["concept"] == "us-gaap:Revenues"
+        assert total["value"] == 391035000000
+        assert total["unit"] == "USD"
+        assert total["period_type"] == "duration"
+        assert total["period_start"] == "2023-10-01"
+        assert total["period_end"] == "2024-09-28"
+        assert total["dimensions"] is None
+        assert json.loads(iphone["dimensions"]) == {
+            "srt:ProductOrServiceAxis": "aapl:IPhoneMember"
+        }
+
+    def test_parse_inline_applies_scale_and_sign(self, tmp_path):
+        """Test ix:nonFraction scale/sign handling and ratio units."""
+        path = tmp_path / "aapl-20240928.htm"
+        path.write_text(INLINE_XBRL, encoding="utf-8")
+
+        facts = {f["concept"]: f for f in parse_xbrl_facts(path, include_text=True)}
+
+        assert facts["us-gaap:EarningsPerShareBasic"]["value"] == 6.11
+        assert facts["us-gaap:EarningsPerShareBasic"]["unit"] == "USD/shares"
+        assert facts["us-gaap:OtherNonoperatingIncomeExpense"]["value"] == (
+            -1234500000.0
+        )
+        assert facts["dei:DocumentType"]["value_text"] == "10-K"
+        assert facts["dei:DocumentType"]["period_type"] == "instant"
+
+    def test_build_facts_store_partitions_by_quarter(self, filing_json, tmp_path):
+        """Test the partitioned store built from an extracted filing."""
+        source = Path(filing_json["filing_filepath"])
+        submission = source.read_text(encoding="utf-8").replace(
+            "</SEC-DOCUMENT>",
+            "<DOCUMENT>\n<TYPE>EX-101.INS\n<SEQUENCE>3\n<FILENAME>aapl-20240928.xml\n"
+            f"<TEXT>\n<XBRL>\n{INSTANCE_XML}</XBRL>\n</TEXT>\n</DOCUMENT>\n"
+            "</SEC-DOCUMENT>",
+        )
+        source.write_text(submission, encoding="utf-8")
+        extract(filing_json)
+
+        store = tmp_path / "xbrl_facts"
+        summary = build_facts_store(tmp_path, store_dir=store, max_workers=1)
+        assert summary["with_facts"] == 1
+        assert summary["facts"] == 2
+        assert (store / "year=2024" / "qtr=4" / "0000320193-24-000123.parquet").exists()
+
+        facts = load_facts(store, filters=[("year", "=", 2024)])
+        assert len(facts) == 2
+        assert set(facts["cik"]) == {"320193"}
+
+        summary = build_facts_store(tmp_path, store_dir=store, max_workers=1)
+        assert summary["facts"] == 0
+
+
+FORM_4_SUBMISSION = """<SEC-DOCUMENT>0001209191-24-050000.txt : 20241105
+<SEC-HEADER>
+ACCESSION NUMBER:		0001209191-24-050000
+CONFORMED SUBMISSION TYPE:	4
+FILED AS OF DATE:		20241105
+</SEC-HEADER>
+<DOCUMENT>
+<TYPE>4
+<SEQUENCE>1
+<FILENAME>doc4.xml
+<TEXT>
+<XML>
+<?xml version="1.0"?>
+<ownershipDocument>
+  <periodOfReport>2024-11-01</periodOfReport>
+  <issuer><issuerCik>0000320193</issuerCik><issuerName>Apple Inc.</issuerName>
+    <issuerTradingSymbol>AAPL</issuerTradingSymbol></issuer>
+  <reportingOwner>
+    <reportingOwnerId><rptOwnerCik>0001214156</rptOwnerCik><rptOwnerName>COOK TIMOTHY D</rptOwnerName></reportingOwnerId>
+    <reportingOwnerRelationship><isDirector>1</isDirector><isOfficer>1</isOfficer>
+      <officerTitle>Chief Executive Officer</officerTitle></reportingOwnerRelationship>
+  </reportingOwner>
+  <nonDerivativeTable>
+    <nonDerivativeTransaction>
+      <securityTitle><value>Common Stock</value></securityTitle>
+      <transactionDate><value>2024-11-01</value></transactionDate>
+      <transactionCoding><transactionCode>S</transactionCode></transactionCoding>
+      <transactionAmounts>
+        <transactionShares><value>10000</value></transactionShares>
+        <transactionPricePerShare><value>225.50</value></transactionPricePerShare>
+        <transactionAcquiredDisposedCode><value>D</value></transactionAcquiredDisposedCode>
+      </transactionAmounts>
+      <postTransactionAmounts><sharesOwnedFollowingTransaction><value>3280000</value></sharesOwnedFollowingTransaction></postTransactionAmounts>
+      <ownershipNature><directOrIndirectOwnership><value>D</value></directOrIndirectOwnership></ownershipNature>
+    </nonDerivativeTransaction>
+  </nonDerivativeTable>
+</ownershipDocument>
+</XML>
+</TEXT>
+</DOCUMENT>
+</SEC-DOCUMENT>
+"""
+
+FORM_13F_SUBMISSION = """<SEC-DOCUMENT>0001067983-22-000010.txt : 20221114
+<SEC-HEADER>
+ACCESSION NUMBER:		0001067983-22-000010
+CONFORMED SUBMISSION TYPE:	13F-HR
+CONFORMED PERIOD OF REPORT:	20220930
+FILED AS OF DATE:		20221114
+FILER:
+	COMPANY DATA:
+		COMPANY CONFORMED NAME:			BERKSHIRE HATHAWAY INC
+		CENTRAL INDEX KEY:			0001067983
+</SEC-HEADER>
+<DOCUMENT>
+<TYPE>INFORMATION TABLE
+<SEQUENCE>2
+<FILENAME>infotable.xml
+<TEXT>
+<XML>
+<informationTable xmlns="http://www.sec.gov/edgar/document/thirteenf/informationtable">
+  <infoTable>
+    <nameOfIssuer>APPLE INC</nameOfIssuer><titleOfClass>COM</titleOfClass>
+    <cusip>037833100</cusip><value>138271</value>
+    <shrsOrPrnAmt><sshPrnamt>894802319</sshPrnamt><sshPrnamtType>SH</sshPrnamtType></shrsOrPrnAmt>
+    <investmentDiscretion>DFND</investmentDiscretion>
+    <votingAuthority><Sole>894802319</Sole><Shared>0</Shared><None>0</None></votingAuthority>
+  </infoTable>
+</informationTable>
+</XML>
+</TEXT>
+</DOCUMENT>
+</SEC-DOCUMENT>
+"""
+
+
+class TestStructuredForms:
+    """Test the Form 4 / 13F-HR bulk parser."""
+
+    def test_build_forms_tables(self, tmp_path):
+        """Test parsing submissions into partitioned transactions/holdings."""
+        for cik, name, content in (
+            ("1214156", "0001209191-24-050000.txt", FORM_4_SUBMISSION),
+            ("1067983", "0001067983-22-000010.txt", FORM_13F_SUBMISSION),
+            ("320193", "0000320193-24-000123.txt", "ACCESSION NUMBER: x\n"),
+        ):
+            (tmp_path / "data" / cik).mkdir(parents=True)
+            (tmp_path / "data" / cik / name).write_text(content, encoding="utf-8")
+
+        store = tmp_path / "forms"
+        summary = build_forms_tables(tmp_path / "data", store_dir=store, max_workers=1)
+        assert summary == {
+            "submissions": 3,
+            "transactions": 1,
+            "holdings": 1,
+            "failed": 0,
+        }
+
+        transactions = load_form_table("transactions", store_dir=store)
+        row = transactions.iloc[0]
+        assert row["issuer_cik"] == "320193"
+        assert row["issuer_ticker"] == "AAPL"
+        assert row["owner_name"] == "COOK TIMOTHY D"
+        assert bool(row["is_officer"])
+        assert row["transaction_code"] == "S"
+        assert row["shares"] == 10000
+        assert row["price_per_share"] == 225.5
+        assert row["year"] == 2024 and row["qtr"] == 4
+
+        holdings = load_form_table("holdings", store_dir=store)
+        row = holdings.iloc[0]
+        assert row["cusip"] == "037833100"
+        assert row["filer_cik"] == "1067983"
+        assert row["value_usd"] == 138271000
+        assert row["period_of_report"] == "2022-09-30"
+
+        # Submissions without rows are in the processed manifest as well
+        summary = build_forms_tables(tmp_path / "data", store_dir=store, max_workers=1)
+        assert summary["submissions"] == 0
+
+    def test_failed_submissions_counted(self, tmp_path):
+        """Test that per-submission failures reach the summary and are retried."""
+        (tmp_path / "data" / "1214156").mkdir(parents=True)
+        good = tmp_path / "data" / "1214156" / "0001209191-24-050000.txt"
+        good.write_text(FORM_4_SUBMISSION, encoding="utf-8")
+        missing = tmp_path / "data" / "1214156" / "0001209191-24-050001.txt"
+
+        store = tmp_path / "forms"
+        summary = build_forms_tables([good, missing], store_dir=store, max_workers=1)
+        assert summary == {
+            "submissions": 2,
+            "transactions": 1,
+            "holdings": 0,
+            "failed": 1,
+        }
+        summary = build_forms_tables([good, missing], store_dir=store, max_workers=1)
+        assert summary["submissions"] == 1
+
+    def test_partitions_with_null_columns_read_together(self, tmp_path):
+        """Test that an all-null column in one partition does not break reads."""
+        (tmp_path / "data" / "1067983").mkdir(parents=True)
+        (tmp_path / "data" / "1067983" / "0001067983-22-000010.txt").write_text(
+            FORM_13F_SUBMISSION, encoding="utf-8"
+        )
+        store = tmp_path / "forms"
+        build_forms_tables(tmp_path / "data", store_dir=store, max_workers=1)
+
+        filing_2024 = (
+            FORM_13F_SUBMISSION.replace("22-000010", "24-000020")
+            .replace("20221114", "20241114")
+            .replace("<cusip>", "<figi>BBG000B9XRY4</figi><cusip>")
+        )
+        (tmp_path / "data" / "1067983" / "0001067983-24-000020.txt").write_text(
+            filing_2024, encoding="utf-8"
+        )
+        build_forms_tables(tmp_path / "data", store_dir=store, max_workers=1)
+
+        holdings = load_form_table("holdings", store_dir=store)
+        assert sorted(holdings["figi"].fillna("")) == ["", "BBG000B9XRY4"]
+        assert (
+            len(
+                load_form_table(
+                    "holdings", store_dir=store, filters=[("year", "=", 2024)]
+                )
+            )
+            == 1
+        )
+
+        summary = build_forms_tables(
+            tmp_path / "data", store_dir=store, max_workers=1, force=True
+        )
+        assert summary["holdings"] == 2
+        assert len(load_form_table("holdings", store_dir=store)) == 2
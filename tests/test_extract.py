@@ -0,0 +1,321 @@
+"""
+Tests for filing extraction and extraction manifests.
+"""
+
+import json
+import os
+import zipfile
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from py_sec_edgar.cli.common import (
+    extraction_args,
+    extraction_options,
+    parse_document_filter,
+)
+from py_sec_edgar.core.document_store import (
+    ContainerPool,
+    DocumentContainer,
+    DocumentStoreError,
+)
+from py_sec_edgar.extract import (
+    MANIFEST_FILENAME,
+    DocumentFilter,
+    extract,
+    extract_to_container,
+    is_extraction_complete,
+    load_manifest,
+    verify_extraction,
+    verify_extractions,
+)
+
+
+class TestExtractionManifest:
+    """Test manifest creation and resumable extraction."""
+
+    def test_extract_writes_complete_manifest(self, filing_json):
+        """Test that a successful extraction records a complete manifest."""
+        contents = extract(filing_json)
+        assert len(contents) == 2
+
+        manifest = load_manifest(filing_json["extracted_filing_directory"])
+        assert manifest["status"] == "complete"
+        assert manifest["document_count"] == 2
+        assert manifest["accession_number"] == "0000320193-24-000123"
+        assert manifest["form_type"] == "10-K"
+        assert manifest["source"]["size_bytes"] == os.path.getsize(
+            filing_json["filing_filepath"]
+        )
+        assert all(doc["sha256"] for doc in manifest["documents"])
+
+    def test_complete_extraction_is_skipped(self, filing_json):
+        """Test that rerunning over a complete extraction does no work."""
+        extract(filing_json)
+        assert is_extraction_complete(
+            filing_json["extracted_filing_directory"], filing_json["filing_filepath"]
+        )
+        assert extract(filing_json) == {}
+
+    def test_half_extracted_directory_is_redone(self, filing_json):
+        """Test that a directory without a manifest is re-extracted."""
+        directory = Path(filing_json["extracted_filing_directory"])
+        directory.mkdir()
+        (directory / "partial.htm").write_text("<html>", encoding="utf-8")
+
+        contents = extract(filing_json)
+
+        assert len(contents) == 2
+        assert not (directory / "partial.htm").exists()
+        assert (directory / MANIFEST_FILENAME).exists()
+
+    def test_unparseable_document_block_does_not_block_completion(self, filing_json):
+        """Test that a block without a header is not counted as missing."""
+        source = Path(filing_json["filing_filepath"])
+        source.write_text(
+            source.read_text().replace(
+                "</SEC-DOCUMENT>",
+                "<DOCUMENT>\n<TYPE>GRAPHIC\n<TEXT>\n</TEXT>\n</DOCUMENT>\n"
+                "</SEC-DOCUMENT>",
+            )
+        )
+
+        extract(filing_json)
+
+        manifest = load_manifest(filing_json["extracted_filing_directory"])
+        assert manifest["status"] == "complete"
+        assert extract(filing_json) == {}
+
+    def test_changed_source_marks_extraction_stale(self, filing_json):
+        """Test that a modified source file invalidates the manifest."""
+        extract(filing_json)
+        with open(filing_json["filing_filepath"], "a", encoding="utf-8") as f:
+            f.write("\n")
+
+        result = verify_extraction(filing_json["extracted_filing_directory"])
+        assert result["status"] == "stale"
+        assert not is_extraction_complete(
+            filing_json["extracted_filing_directory"], filing_json["filing_filepath"]
+        )
+
+
+class TestDocumentFilter:
+    """Test include/exclude document selection during extraction."""
+
+    @pytest.mark.parametrize(
+        "document_filter,doc_type,filename,size,expected",
+        [
+            (
+                DocumentFilter(exclude_types=["EX-101.*"]),
+                "EX-101.SCH",
+                "a.xsd",
+                1,
+                "type",
+            ),
+            (
+                DocumentFilter(include_types=["10-K", "EX-21*"]),
+                "ex-21.1",
+                "a.htm",
+                1,
+                None,
+            ),
+            (DocumentFilter(include_types=["10-K"]), "GRAPHIC", "logo.jpg", 1, "type"),
+            (
+                DocumentFilter(exclude_filenames=["*.JPG"]),
+                "GRAPHIC",
+                "logo.jpg",
+                1,
+                "filename",
+            ),
+            (DocumentFilter(max_size_bytes=100), "10-K", "a.htm", 101, "size"),
+        ],
+    )
+    def test_skip_reason(self, document_filter, doc_type, filename, size, expected):
+        """Test type, filename and size rules."""
+        assert document_filter.skip_reason(doc_type, filename, size) == expected
+
+    def test_cli_options_build_filter(self):
+        """Test that extraction options round-trip into a DocumentFilter."""
+        received = []
+
+        @click.command()
+        @extraction_options
+        def command(**options):
+            received.append(options)
+
+        args = [
+            "--exclude-type",
+            "GRAPHIC",
+            "--exclude-type",
+            "EX-101.*",
+            "--max-document-bytes",
+            "1000",
+        ]
+        assert CliRunner().invoke(command, args).exit_code == 0
+        options = received[-1]
+        assert extraction_args(**options) == args
+        options.pop("container_layout")
+        assert parse_document_filter(**options) == DocumentFilter(
+            exclude_types=["GRAPHIC", "EX-101.*"], max_size_bytes=1000
+        )
+
+        assert CliRunner().invoke(command, []).exit_code == 0
+        options = received[-1]
+        options.pop("container_layout")
+        assert parse_document_filter(**options) is None
+
+    def test_skipped_documents_are_listed_but_not_written(self, filing_json):
+        """Test that filtered documents stay in the manifest without a file."""
+        directory = Path(filing_json["extracted_filing_directory"])
+        document_filter = DocumentFilter(exclude_types=["EX-*"])
+
+        extract(filing_json, document_filter=document_filter)
+
+        manifest = load_manifest(directory)
+        assert manifest["status"] == "complete"
+        assert manifest["document_count"] == 2
+        primary, exhibit = manifest["documents"]
+        assert primary["path"] and "skipped" not in primary
+        assert exhibit["skipped"] == "type"
+        assert exhibit["path"] is None
+        assert {p.name for p in directory.iterdir()} == {
+            MANIFEST_FILENAME,
+            primary["path"],
+        }
+        assert verify_extraction(directory)["status"] == "complete"
+
+        # Same selection is skipped; a different selection re-extracts
+        assert extract(filing_json, document_filter=document_filter) == {}
+        assert len(extract(filing_json)) == 2
+        assert "skipped" not in load_manifest(directory)["documents"][1]
+
+
+class TestVerifyExtractions:
+    """Test bulk verification and repair."""
+
+    def test_detects_and_repairs_corrupt_extraction(self, filing_json, tmp_path):
+        """Test that a deleted document is reported and repaired."""
+        extract(filing_json)
+        directory = Path(filing_json["extracted_filing_directory"])
+        manifest = json.loads((directory / MANIFEST_FILENAME).read_text())
+        (directory / manifest["documents"][0]["path"]).unlink()
+
+        results = verify_extractions(tmp_path)
+        assert [r["status"] for r in results] == ["corrupt"]
+
+        results = verify_extractions(tmp_path, repair=True)
+        assert results[0]["status"] == "complete"
+        assert results[0]["repaired"] is True
+
+    def test_adopts_extraction_without_manifest(self, filing_json, tmp_path):
+        """Test that a pre-manifest extraction is kept rather than redone."""
+        extract(filing_json)
+        directory = Path(filing_json["extracted_filing_directory"])
+        (directory / MANIFEST_FILENAME).unlink()
+        files = {p.name: p.stat().st_mtime_ns for p in directory.iterdir()}
+
+        results = verify_extractions(tmp_path, adopt=True)
+
+        assert results[0]["status"] == "complete"
+        assert results[0]["adopted"] is True
+        assert load_manifest(directory)["adopted"] is True
+        assert extract(filing_json) == {}
+        assert {
+            p.name: p.stat().st_mtime_ns
+            for p in directory.iterdir()
+            if p.name != MANIFEST_FILENAME
+        } == files
+
+    def test_partial_extraction_is_not_adopted(self, filing_json, tmp_path):
+        """Test that adoption requires every document file."""
+        Path(filing_json["extracted_filing_directory"]).mkdir()
+
+        results = verify_extractions(tmp_path, adopt=True)
+        assert results[0]["status"] == "missing_manifest"
+        assert "adopted" not in results[0]
+
+    def test_missing_source_is_unrepairable(self, filing_json, tmp_path):
+        """Test that repair reports filings whose source is gone."""
+        Path(filing_json["extracted_filing_directory"]).mkdir()
+        os.remove(filing_json["filing_filepath"])
+
+        results = verify_extractions(tmp_path, repair=True)
+        assert results[0]["status"] == "unrepairable"
+
+
+class TestContainerStore:
+    """Test extraction into document containers."""
+
+    def test_extract_to_container_and_read_single_document(self, filing_json, tmp_path):
+        """Test that documents land in one container and read back by seek."""
+        filing_json.update(
+            CIK="320193",
+            Filename="edgar/data/320193/0000320193-24-000123.txt",
+            **{"Date Filed": "2024-11-01"},
+        )
+        store = tmp_path / "store"
+
+        contents = extract_to_container(filing_json, store_root=store)
+        assert len(contents) == 2
+        assert not os.path.exists(filing_json["extracted_filing_directory"])
+
+        container = DocumentContainer(store / "by-cik" / "320193.zip")
+        assert container.filings() == ["0000320193-24-000123"]
+        manifest = container.get_manifest("0000320193-24-000123")
+        assert manifest["status"] == "complete"
+
+        exhibit = container.read("0000320193-24-000123", sequence="2")
+        assert b"Subsidiaries" in exhibit
+        assert container.read("0000320193-24-000123", filename="ex211.htm") == exhibit
+
+        # Container is still a standard zip archive
+        with zipfile.ZipFile(container.path) as zf:
+            assert len(zf.namelist()) == 2
+
+        assert extract_to_container(filing_json, store_root=store) == {}
+
+    def test_quarter_layout_and_missing_document(self, filing_json, tmp_path):
+        """Test the per-quarter layout and the not-found error."""
+        filing_json.update(
+            CIK="320193",
+            Filename="edgar/data/320193/0000320193-24-000123.txt",
+            **{"Date Filed": "2024-11-01"},
+        )
+        extract_to_container(filing_json, store_root=tmp_path, layout="quarter")
+
+        container = DocumentContainer(tmp_path / "by-quarter" / "2024" / "QTR4.zip")
+        with pytest.raises(DocumentStoreError):
+            container.read("0000320193-24-000123", sequence="99")
+
+    def test_container_pool_keeps_container_open_for_batch(self, filing_json, tmp_path):
+        """Test that a batch appends to one open container and closes it once."""
+        filing_json.update(CIK="320193", **{"Date Filed": "2024-11-01"})
+        second = dict(filing_json)
+        filing_json["Filename"] = "edgar/data/320193/0000320193-24-000123.txt"
+        second["Filename"] = "edgar/data/320193/0000320193-24-000124.txt"
+
+        with ContainerPool() as pool:
+            for filing in (filing_json, second):
+                extract_to_container(
+                    filing, store_root=tmp_path, layout="quarter", containers=pool
+                )
+            container = pool.get(tmp_path / "by-quarter" / "2024" / "QTR4.zip")
+            # Index kept in memory: a committed filing is visible without rereading
+            assert container.filings() == [
+                "0000320193-24-000123",
+                "0000320193-24-000124",
+            ]
+            assert (
+                extract_to_container(
+                    second, store_root=tmp_path, layout="quarter", containers=pool
+                )
+                == {}
+            )
+
+        reopened = DocumentContainer(container.path)
+        assert len(reopened.filings()) == 2
+        assert b"Subsidiaries" in reopened.read("0000320193-24-000124", sequence="2")
+        with zipfile.ZipFile(container.path) as zf:
+            assert len(zf.namelist()) == 4